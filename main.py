@@ -39,7 +39,11 @@ async def _stop_config_watcher(
 
 async def main() -> None:
     """启动顺序：日志 → Web → 业务配置与调度 → 配置热监视 → 阻塞至收到退出信号。"""
+    from src.core.loop_watchdog import get_loop_watchdog
+    from src.core.media_pipeline import get_media_pipeline
+    from src.core.metrics import get_loop_lag_probe
     from src.core.paths import CONFIG_YAML_FILE, resolve_config_sample_path
+    from src.core.session_pool import get_session_registry
     from src.jobs.lifecycle import (
         attach_uvicorn_noise_filter,
         build_uvicorn_server,
@@ -50,16 +54,20 @@ async def main() -> None:
         shutdown_web_server,
         start_uvicorn_background,
     )
+    from src.jobs.manual_runs import get_manual_runs
     from src.jobs.scheduler import TaskScheduler
+    from src.monitors.base import close_live_monitors, enable_persistent_monitors
     from src.settings.config import AppConfig, get_config
     from src.settings.watcher import ConfigWatcher
     from src.storage.cookie_cache import get_cookie_cache
     from src.storage.database import close_shared_connection, reconfigure_database
+    from src.web.auth import flush_sessions
 
     is_background = not sys.stdout.isatty()
     setup_logging(log_level="INFO", console_output=not is_background)
     logger = logging.getLogger(__name__)
     cookie_cache = get_cookie_cache()
+    session_registry = get_session_registry()
 
     try:
         config = get_config()
@@ -82,11 +90,20 @@ async def main() -> None:
     logger.info("Web: http://%s:%s", server.config.host, server.config.port)
 
     setup_main_file_logging()
+    # 事件循环唤醒延迟，供 /metrics 导出
+    loop_lag_probe = get_loop_lag_probe()
+    loop_lag_probe.start()
+    loop_watchdog = get_loop_watchdog()
+    await loop_watchdog.configure(config.loop_watchdog_enable, config.loop_watchdog_threshold_ms)
 
     config_watcher: ConfigWatcher | None = None
     try:
         await cookie_cache.reset_all()
         await reconfigure_database(config)
+        # 监控器按平台借用长连接会话，跨调度复用 DNS/TCP/TLS
+        session_registry.open()
+        # 监控实例跨调度常驻，旧数据保留在内存中随写库更新
+        enable_persistent_monitors()
 
         scheduler = TaskScheduler(config)
         scheduler.install_signal_handlers()
@@ -127,6 +144,16 @@ async def main() -> None:
         # start() 之后、进入 run_forever 之前若失败，此处仍会 stop 已启动的 watcher
         await _stop_config_watcher(config_watcher, logger)
         await _shutdown_step("Web服务器", shutdown_web_server(server, web_task), logger)
+        await _shutdown_step("手动运行任务", get_manual_runs().cancel_all(), logger)
+        await _shutdown_step("事件循环延迟探针", loop_lag_probe.stop(), logger)
+        await _shutdown_step("事件循环卡顿看门狗", loop_watchdog.stop(), logger)
+        await _shutdown_step("Web登录会话", asyncio.to_thread(flush_sessions), logger)
+        await _shutdown_step("常驻监控实例", close_live_monitors(), logger)
+        logger.debug("共享HTTP会话统计: %s", session_registry.stats())
+        await _shutdown_step("共享HTTP会话", session_registry.close(), logger)
+        media_pipeline = get_media_pipeline()
+        logger.debug("媒体流水线统计: %s", media_pipeline.metrics())
+        media_pipeline.shutdown()
         await _shutdown_step("数据库连接", close_shared_connection(), logger)
 
 
@@ -0,0 +1,160 @@
+"""监控状态变更事件总线：监控在状态变化（开播/下播、新动态、Cookie 失效等）时发布类型化事件，
+Web 端通过 SSE 订阅并按平台过滤；最近的事件保存在有界环形缓冲区中，供断线重连后补发。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CHANGE_FEED_BUFFER_SIZE = 500
+CHANGE_FEED_QUEUE_SIZE = 200
+
+# 事件类型
+LIVE_START = "live_start"
+LIVE_END = "live_end"
+NEW_POST = "new_post"
+TARGET_ADDED = "target_added"
+TARGET_UPDATED = "target_updated"
+COOKIE_EXPIRED = "cookie_expired"
+COOKIE_RESTORED = "cookie_restored"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """一条状态变更；key 为平台数据表主键（Cookie 事件为空）。"""
+
+    id: int
+    type: str
+    platform: str
+    key: str = ""
+    name: str = ""
+    data: dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "platform": self.platform,
+            "key": self.key,
+            "name": self.name,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass(eq=False)
+class ChangeSubscription:
+    """事件订阅；platforms 为空表示接收全部平台。"""
+
+    platforms: frozenset[str]
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=CHANGE_FEED_QUEUE_SIZE)
+    )
+    # 队列溢出后置位，消费端据此通知客户端整体重新加载
+    overflowed: bool = False
+
+    def accepts(self, event: ChangeEvent) -> bool:
+        return not self.platforms or event.platform in self.platforms
+
+    def _put(self, event: ChangeEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class ChangeFeed:
+    """进程内事件总线 + 环形缓冲区。事件 ID 单调递增，配合 ``epoch`` 识别进程重启。"""
+
+    def __init__(self, buffer_size: int = CHANGE_FEED_BUFFER_SIZE):
+        self.epoch = secrets.token_hex(4)
+        self._ids = itertools.count(1)
+        self._buffer: deque[ChangeEvent] = deque(maxlen=buffer_size)
+        self._subscribers: set[ChangeSubscription] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        return self._buffer[-1].id if self._buffer else 0
+
+    def publish(
+        self,
+        platform: str,
+        event_type: str,
+        *,
+        key: str = "",
+        name: str = "",
+        data: dict[str, Any] | None = None,
+    ) -> ChangeEvent:
+        with self._lock:
+            event = ChangeEvent(
+                id=next(self._ids),
+                type=event_type,
+                platform=platform,
+                key=str(key or ""),
+                name=str(name or ""),
+                data=dict(data or {}),
+                timestamp=time.time(),
+            )
+            self._buffer.append(event)
+            targets = [s for s in self._subscribers if s.accepts(event)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, event)
+            except RuntimeError:
+                # 订阅方事件循环已关闭
+                self.unsubscribe(subscription)
+        logger.debug("状态变更事件: %s %s %s", platform, event_type, key)
+        return event
+
+    def subscribe(self, platforms: Iterable[str] = ()) -> ChangeSubscription:
+        subscription = ChangeSubscription(
+            platforms=frozenset(platforms), loop=asyncio.get_running_loop()
+        )
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def replay(self, after_id: int, platforms: Iterable[str] = ()) -> list[ChangeEvent] | None:
+        """返回 ID 大于 after_id 的缓冲事件；缓冲区已覆盖掉缺口时返回 None（需整体重新加载）。"""
+        wanted = frozenset(platforms)
+        with self._lock:
+            events = list(self._buffer)
+        if events and after_id < events[0].id - 1:
+            return None
+        if after_id > (events[-1].id if events else 0):
+            # 来自其他进程（重启前）的 ID
+            return None
+        return [e for e in events if e.id > after_id and (not wanted or e.platform in wanted)]
+
+
+_change_feed: ChangeFeed | None = None
+
+
+def get_change_feed() -> ChangeFeed:
+    """获取进程级状态变更事件总线。"""
+    global _change_feed
+    if _change_feed is None:
+        _change_feed = ChangeFeed()
+    return _change_feed
@@ -0,0 +1,199 @@
+"""事件循环卡顿看门狗：定位在事件循环线程上执行同步操作（Pillow、文件读写、YAML 解析等）的代码。
+
+事件循环内的心跳协程每 ``LOOP_WATCHDOG_HEARTBEAT_SECONDS`` 秒更新一次时间戳；独立的守护线程
+发现心跳超过阈值未更新时，通过 ``sys._current_frames()`` 抓取事件循环线程此刻的调用栈和当前
+asyncio 任务——即正在阻塞事件循环的代码。心跳恢复后记录实际卡顿时长。
+
+由 ``app.loop_watchdog_enable`` 开关（默认关闭），阈值为 ``app.loop_watchdog_threshold_ms``；
+最近的卡顿记录在任务管理页展示。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LOOP_WATCHDOG_HEARTBEAT_SECONDS = 0.05
+LOOP_WATCHDOG_DEFAULT_THRESHOLD_MS = 200
+# 保留的卡顿记录数与每条记录保留的栈帧数
+LOOP_WATCHDOG_HISTORY_SIZE = 50
+LOOP_WATCHDOG_STACK_FRAMES = 30
+
+
+@dataclass(eq=False)
+class LoopStall:
+    """一次事件循环卡顿。"""
+
+    detected_at: float
+    task: str = ""
+    coroutine: str = ""
+    stack: list[str] = field(default_factory=list)
+    # 心跳恢复前为 None（仍在卡顿中）
+    duration: float | None = None
+
+    @property
+    def location(self) -> str:
+        """栈顶（最内层）所在位置，便于列表中快速识别。"""
+        for entry in reversed(self.stack):
+            first_line = entry.strip().splitlines()[0] if entry.strip() else ""
+            if first_line:
+                return first_line
+        return ""
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "detected_at": self.detected_at,
+            "duration_ms": round(self.duration * 1000, 1) if self.duration is not None else None,
+            "ongoing": self.duration is None,
+            "task": self.task,
+            "coroutine": self.coroutine,
+            "location": self.location,
+            "stack": list(self.stack),
+        }
+
+
+def _describe_current_task(loop: asyncio.AbstractEventLoop) -> tuple[str, str]:
+    """从其他线程读取事件循环当前执行的任务名与协程名（回调阻塞时为空）。"""
+    current_tasks = getattr(asyncio.tasks, "_current_tasks", None)
+    task = current_tasks.get(loop) if isinstance(current_tasks, dict) else None
+    if task is None:
+        return "", ""
+    coro = task.get_coro()
+    return task.get_name(), getattr(coro, "__qualname__", "") or repr(coro)
+
+
+class LoopWatchdog:
+    """事件循环卡顿看门狗（心跳协程 + 守护线程）。"""
+
+    def __init__(
+        self,
+        threshold_ms: int = LOOP_WATCHDOG_DEFAULT_THRESHOLD_MS,
+        heartbeat: float = LOOP_WATCHDOG_HEARTBEAT_SECONDS,
+        history_size: int = LOOP_WATCHDOG_HISTORY_SIZE,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.heartbeat = heartbeat
+        self._stalls: deque[LoopStall] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._open_stall: LoopStall | None = None
+        self._last_beat = time.monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.stall_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    @property
+    def threshold_ms(self) -> int:
+        return round(self.threshold * 1000)
+
+    def start(self) -> None:
+        """在当前事件循环上启动看门狗（重复调用无副作用）。"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._beat(), name="loop-watchdog")
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info("事件循环卡顿看门狗已启动，阈值 %d ms", self.threshold_ms)
+
+    async def stop(self) -> None:
+        task, self._heartbeat_task = self._heartbeat_task, None
+        self._stop.set()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            logger.info("事件循环卡顿看门狗已停止")
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            await asyncio.to_thread(thread.join, 1.0)
+
+    async def configure(self, enabled: bool, threshold_ms: int) -> None:
+        """按配置启停并更新阈值（热重载时调用）。"""
+        self.threshold = threshold_ms / 1000
+        if enabled:
+            self.start()
+        elif self.running:
+            await self.stop()
+
+    def stalls(self) -> list[LoopStall]:
+        """最近的卡顿记录，新的在前。"""
+        with self._lock:
+            return list(reversed(self._stalls))
+
+    async def _beat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.heartbeat
+            await asyncio.sleep(self.heartbeat)
+            lag = max(0.0, loop.time() - expected)
+            with self._lock:
+                self._last_beat = time.monotonic()
+                stall, self._open_stall = self._open_stall, None
+                if stall is not None:
+                    stall.duration = lag
+            if stall is not None:
+                logger.warning(
+                    "事件循环卡顿 %.0f ms（任务: %s）位置: %s",
+                    lag * 1000,
+                    stall.task or "-",
+                    stall.location or "-",
+                )
+
+    def _watch(self) -> None:
+        # 以阈值的 1/4 为周期检查，卡顿被发现时距开始不超过阈值的 1.25 倍
+        while not self._stop.wait(max(self.threshold / 4, 0.01)):
+            with self._lock:
+                if self._open_stall is not None:
+                    continue
+                if time.monotonic() - self._last_beat < self.threshold + self.heartbeat:
+                    continue
+            stall = self._capture()
+            with self._lock:
+                # 抓栈期间心跳可能已恢复，此时卡顿已结束，丢弃这次采样
+                if time.monotonic() - self._last_beat < self.threshold + self.heartbeat:
+                    continue
+                self._open_stall = stall
+                self._stalls.append(stall)
+                self.stall_count += 1
+
+    def _capture(self) -> LoopStall:
+        stall = LoopStall(detected_at=time.time())
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is not None:
+            stack = traceback.format_stack(frame)
+            stall.stack = [entry.rstrip() for entry in stack[-LOOP_WATCHDOG_STACK_FRAMES:]]
+        if self._loop is not None:
+            stall.task, stall.coroutine = _describe_current_task(self._loop)
+        return stall
+
+
+_loop_watchdog: LoopWatchdog | None = None
+
+
+def get_loop_watchdog() -> LoopWatchdog:
+    """获取进程级事件循环卡顿看门狗。"""
+    global _loop_watchdog
+    if _loop_watchdog is None:
+        _loop_watchdog = LoopWatchdog()
+    return _loop_watchdog
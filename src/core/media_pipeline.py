@@ -0,0 +1,159 @@
+"""媒体处理流水线：有界并发的异步下载队列 + 专用线程池执行图片解码/缩放/落盘/移动/删除。
+
+微博多图微博集中到达时，Pillow 缩放与文件写入若在事件循环中执行会阻塞 Web UI 与其他监控；
+这里统一把阻塞操作放入独立线程池，并记录队列深度与各阶段耗时供观测。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from src.core.metrics import StatsCounters
+from src.core.runtime import DaemonThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MEDIA_DOWNLOAD_CONCURRENCY = 4
+MEDIA_WORKER_THREADS = 2
+
+
+@dataclass
+class StageStats(StatsCounters):
+    """单个处理阶段的耗时统计（秒）。"""
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float, *, error: bool = False) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if error:
+            self.errors += 1
+
+    def derived(self) -> dict[str, float]:
+        return {
+            "avg_ms": round(self.total_seconds / self.count * 1000, 2) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "total_seconds": round(self.total_seconds, 4),
+        }
+
+
+class MediaPipeline:
+    """进程级媒体流水线：下载并发额度 + 阻塞任务线程池 + 指标。"""
+
+    def __init__(
+        self,
+        *,
+        download_concurrency: int = MEDIA_DOWNLOAD_CONCURRENCY,
+        worker_threads: int = MEDIA_WORKER_THREADS,
+    ):
+        self.download_concurrency = download_concurrency
+        self.worker_threads = worker_threads
+        self._executor: DaemonThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._download_slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+        self._stats: dict[str, StageStats] = {}
+        self._downloads_waiting = 0
+        self._downloads_active = 0
+        self._blocking_pending = 0
+
+    def _get_executor(self) -> DaemonThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = DaemonThreadPoolExecutor(
+                    max_workers=self.worker_threads,
+                    thread_name_prefix="webmoniter-media",
+                )
+            return self._executor
+
+    def _get_download_slots(self) -> asyncio.Semaphore:
+        # 信号量与事件循环绑定；测试或重启后循环变化时重建
+        loop = asyncio.get_running_loop()
+        if self._download_slots is None or self._slots_loop is not loop:
+            self._download_slots = asyncio.Semaphore(self.download_concurrency)
+            self._slots_loop = loop
+        return self._download_slots
+
+    def _observe(self, stage: str, seconds: float, *, error: bool = False) -> None:
+        self._stats.setdefault(stage, StageStats()).observe(seconds, error=error)
+
+    @contextlib.asynccontextmanager
+    async def download_slot(self, stage: str = "download") -> AsyncIterator[None]:
+        """占用一个下载并发额度；排队等待时间计入 ``<stage>_wait``，持有期间计入 ``stage``。"""
+        slots = self._get_download_slots()
+        queued_at = time.perf_counter()
+        self._downloads_waiting += 1
+        try:
+            await slots.acquire()
+        finally:
+            self._downloads_waiting -= 1
+        started_at = time.perf_counter()
+        self._observe(f"{stage}_wait", started_at - queued_at)
+        self._downloads_active += 1
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._downloads_active -= 1
+            slots.release()
+            self._observe(stage, time.perf_counter() - started_at, error=failed)
+
+    async def run_blocking(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        """在媒体线程池中执行阻塞函数（Pillow 解码缩放、文件写入、目录移动等）。"""
+        loop = asyncio.get_running_loop()
+        self._blocking_pending += 1
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._blocking_pending -= 1
+            self._observe(stage, time.perf_counter() - started_at, error=failed)
+
+    def metrics(self) -> dict[str, Any]:
+        """队列深度与各阶段耗时快照。"""
+        return {
+            "downloads_waiting": self._downloads_waiting,
+            "downloads_active": self._downloads_active,
+            "download_concurrency": self.download_concurrency,
+            "blocking_pending": self._blocking_pending,
+            "worker_threads": self.worker_threads,
+            "stages": {stage: stats.as_dict() for stage, stats in sorted(self._stats.items())},
+        }
+
+    def shutdown(self) -> None:
+        """关闭线程池（程序退出时调用），不等待未完成任务。"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pipeline: MediaPipeline | None = None
+
+
+def get_media_pipeline() -> MediaPipeline:
+    """获取进程级媒体流水线单例。"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = MediaPipeline()
+    return _pipeline
@@ -0,0 +1,382 @@
+"""进程内指标：计数器、直方图与抓取时采集的快照，按 Prometheus 文本格式导出。
+
+不依赖 prometheus_client；各模块在导入时通过 ``get_metrics_registry()`` 声明指标，
+热路径只做字典累加。快照类指标（队列深度、缓存统计等）以采集函数注册，``/metrics``
+被抓取时才计算；模块内的计数统计继承 ``StatsCounters``，由采集函数与诊断接口读取。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "webmoniter_"
+# 秒级耗时的默认分桶：覆盖 1ms 的数据库查询到分钟级的监控轮次
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+LOOP_LAG_PROBE_INTERVAL_SECONDS = 0.5
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"指标 {self.name} 需要标签 {self.labelnames}，收到 {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """只增不减的计数器。"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(_Metric):
+    """可增可减的当前值。"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: list[int]
+    count: int = 0
+    total: float = 0.0
+
+
+class Histogram(_Metric):
+    """累积分桶直方图（含 _bucket / _sum / _count 三组样本）。"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries([0] * len(self.buckets))
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series.bucket_counts[index] += 1
+        series.count += 1
+        series.total += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """计时上下文：退出时（含异常）记录耗时秒数。"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def samples(self) -> list[str]:
+        lines = []
+        bucket_names = (*self.labelnames, "le")
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, hits in zip(self.buckets, series.bucket_counts):
+                cumulative += hits
+                labels = _format_labels(bucket_names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(bucket_names, (*key, "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {series.count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{labels} {series.count}")
+        return lines
+
+
+class StatsCounters:
+    """
+    模块内计数统计的基类：子类以 ``@dataclass`` 声明计数字段，热路径直接累加属性。
+
+    ``as_dict()`` 按字段导出，``derived()`` 返回的派生值（比率、取整后的耗时等）覆盖同名字段。
+    """
+
+    def derived(self) -> dict[str, Any]:
+        return {}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), **self.derived()}
+
+
+@dataclass(frozen=True)
+class Sample:
+    """采集函数返回的快照样本。"""
+
+    name: str
+    kind: str
+    documentation: str
+    value: float
+    labels: tuple[tuple[str, str], ...] = ()
+
+
+Collector = Callable[[], Iterable[Sample] | Awaitable[Iterable[Sample]]]
+
+
+def gauge_sample(name: str, documentation: str, value: float, **labels: Any) -> Sample:
+    return Sample(
+        METRICS_PREFIX + name,
+        "gauge",
+        documentation,
+        value,
+        tuple((k, str(v)) for k, v in labels.items()),
+    )
+
+
+def counter_sample(name: str, documentation: str, value: float, **labels: Any) -> Sample:
+    return Sample(
+        METRICS_PREFIX + name,
+        "counter",
+        documentation,
+        value,
+        tuple((k, str(v)) for k, v in labels.items()),
+    )
+
+
+class MetricsRegistry:
+    """进程级指标注册表；同名指标重复声明时返回已有实例。"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def _declare(self, cls: type[_Metric], name: str, *args: Any, **kwargs: Any) -> Any:
+        full_name = METRICS_PREFIX + name
+        existing = self._metrics.get(full_name)
+        if existing is not None:
+            if not isinstance(existing, cls):
+                raise ValueError(f"指标 {full_name} 已声明为 {existing.kind}")
+            return existing
+        metric = self._metrics[full_name] = cls(full_name, *args, **kwargs)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._declare(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._declare(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._declare(Histogram, name, documentation, labelnames, buckets)
+
+    def register_collector(self, key: str, collector: Collector) -> None:
+        """注册（或替换）抓取时调用的采集函数，可为同步或异步函数。"""
+        self._collectors[key] = collector
+
+    async def _collect_samples(self) -> list[Sample]:
+        samples: list[Sample] = []
+        for key, collector in list(self._collectors.items()):
+            try:
+                result = collector()
+                if asyncio.iscoroutine(result):
+                    result = await result
+                samples.extend(result)
+            except Exception as e:
+                logger.warning("指标采集失败（%s）: %s", key, e)
+        return samples
+
+    async def render(self) -> str:
+        """按 Prometheus 文本格式（0.0.4）输出全部指标。"""
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            samples = metric.samples()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+
+        grouped: dict[str, list[Sample]] = {}
+        for sample in await self._collect_samples():
+            grouped.setdefault(sample.name, []).append(sample)
+        for name in sorted(grouped):
+            first = grouped[name][0]
+            lines.append(f"# HELP {name} {first.documentation}")
+            lines.append(f"# TYPE {name} {first.kind}")
+            for sample in grouped[name]:
+                names = (k for k, _ in sample.labels)
+                labels = _format_labels(names, (v for _, v in sample.labels))
+                lines.append(f"{name}{labels} {_format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+
+_registry: MetricsRegistry | None = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """获取进程级指标注册表单例。"""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+class LoopLagProbe:
+    """周期性 sleep 并测量实际唤醒延迟，作为事件循环阻塞程度的指标。"""
+
+    def __init__(self, interval: float = LOOP_LAG_PROBE_INTERVAL_SECONDS):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+        registry = get_metrics_registry()
+        self._lag = registry.histogram(
+            "event_loop_lag_seconds",
+            "Event loop wake-up delay measured by a periodic sleep probe.",
+            buckets=LOOP_LAG_BUCKETS,
+        )
+        self._last = registry.gauge(
+            "event_loop_lag_last_seconds", "Most recent event loop wake-up delay."
+        )
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="loop-lag-probe")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._lag.observe(lag)
+            self._last.set(lag)
+
+
+_loop_lag_probe: LoopLagProbe | None = None
+
+
+def get_loop_lag_probe() -> LoopLagProbe:
+    """获取进程级事件循环延迟探针。"""
+    global _loop_lag_probe
+    if _loop_lag_probe is None:
+        _loop_lag_probe = LoopLagProbe()
+    return _loop_lag_probe
@@ -33,6 +33,7 @@ COOKIE_CACHE_FILE = (DATA_DIR / "cookie_cache.json").resolve()
 SESSION_SECRET_FILE = (DATA_DIR / "session_secret").resolve()
 WEB_SESSION_FILE = (DATA_DIR / "web_sessions.json").resolve()
 WEIBO_IMG_DIR = DATA_DIR / "weibo"
+WEIBO_IMG_VARIANT_DIR = DATA_DIR / "cache" / "weibo_img"
 
 
 def resolve_config_sample_path() -> Path:
@@ -0,0 +1,206 @@
+"""按平台共享的 aiohttp 会话池：长连接复用、单主机连接上限与 Header/Cookie 热替换。
+
+由 main.py 中的运行时负责 ``open()`` / ``close()``；监控器通过 ``acquire()`` 借用会话，
+不再在每次调度时新建并销毁 ``ClientSession``。未启用时（QL 单次运行、测试等）调用方
+应自行创建并关闭会话。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+from src.core.metrics import StatsCounters, get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+SESSION_POOL_LIMIT = 50
+SESSION_POOL_LIMIT_PER_HOST = 8
+SESSION_POOL_KEEPALIVE_SEC = 60.0
+SESSION_POOL_DNS_TTL_SEC = 300
+
+_metrics = get_metrics_registry()
+HTTP_REQUEST_DURATION = _metrics.histogram(
+    "http_request_duration_seconds",
+    "Outgoing HTTP request latency on pooled sessions, until response headers arrive.",
+    ("platform", "host"),
+)
+HTTP_REQUEST_ERRORS = _metrics.counter(
+    "http_request_errors_total",
+    "Outgoing HTTP requests on pooled sessions that raised before a response.",
+    ("platform", "host"),
+)
+
+
+@dataclass
+class SessionPoolStats(StatsCounters):
+    """单个平台会话的连接统计。"""
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    sessions_created: int = 0
+
+    def derived(self) -> dict[str, float]:
+        total = self.new_connections + self.reused_connections
+        return {"reuse_ratio": round(self.reused_connections / total, 4) if total else 0.0}
+
+
+@dataclass
+class _PooledSession:
+    session: aiohttp.ClientSession
+    loop: asyncio.AbstractEventLoop
+    stats: SessionPoolStats = field(default_factory=SessionPoolStats)
+
+
+def _build_trace_config(platform: str, stats: SessionPoolStats) -> aiohttp.TraceConfig:
+    """通过 aiohttp 追踪钩子统计新建/复用连接与按主机的请求耗时。"""
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params) -> None:
+        stats.requests += 1
+        ctx.started_at = time.perf_counter()
+
+    async def on_request_end(session, ctx, params) -> None:
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - ctx.started_at, platform=platform, host=params.url.host or ""
+        )
+
+    async def on_request_exception(session, ctx, params) -> None:
+        HTTP_REQUEST_ERRORS.inc(platform=platform, host=params.url.host or "")
+
+    async def on_connection_create_end(session, ctx, params) -> None:
+        stats.new_connections += 1
+
+    async def on_connection_reuseconn(session, ctx, params) -> None:
+        stats.reused_connections += 1
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
+
+
+def _apply_headers(session: aiohttp.ClientSession, headers: Mapping[str, str | None]) -> None:
+    """热替换会话默认 Header；值为 None 时移除该 Header。"""
+    for key, value in headers.items():
+        if value is None:
+            session.headers.pop(key, None)
+        else:
+            session.headers[key] = value
+
+
+class SessionRegistry:
+    """进程级会话注册表，每个平台一个长生命周期的 ``ClientSession``。"""
+
+    def __init__(
+        self,
+        *,
+        limit: int = SESSION_POOL_LIMIT,
+        limit_per_host: int = SESSION_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = SESSION_POOL_KEEPALIVE_SEC,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions: dict[str, _PooledSession] = {}
+        self._stats: dict[str, SessionPoolStats] = {}
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """是否已由运行时启用；未启用时监控器应自行管理会话。"""
+        return self._active
+
+    def open(self) -> None:
+        self._active = True
+
+    async def acquire(
+        self,
+        platform: str,
+        *,
+        headers: Mapping[str, str | None] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        connector_factory: Callable[..., aiohttp.TCPConnector] | None = None,
+    ) -> aiohttp.ClientSession:
+        """借用指定平台的共享会话；已存在时仅热替换 Header，不重建连接池。"""
+        # 检查与创建之间没有 await，同一事件循环内无需额外加锁
+        loop = asyncio.get_running_loop()
+        pooled = self._sessions.get(platform)
+        if pooled is not None and (pooled.session.closed or pooled.loop is not loop):
+            # 会话已关闭或属于其他事件循环（如测试/重启场景），丢弃后重建
+            self._sessions.pop(platform, None)
+            pooled = None
+        if pooled is None:
+            pooled = self._create(platform, loop, timeout, connector_factory)
+            self._sessions[platform] = pooled
+        if headers:
+            _apply_headers(pooled.session, headers)
+        return pooled.session
+
+    def _create(
+        self,
+        platform: str,
+        loop: asyncio.AbstractEventLoop,
+        timeout: aiohttp.ClientTimeout | None,
+        connector_factory: Callable[..., aiohttp.TCPConnector] | None,
+    ) -> _PooledSession:
+        stats = self._stats.setdefault(platform, SessionPoolStats())
+        stats.sessions_created += 1
+        factory = connector_factory or aiohttp.TCPConnector
+        connector = factory(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=SESSION_POOL_DNS_TTL_SEC,
+        )
+        # Cookie 统一由 Header 下发，避免响应 Set-Cookie 在共享会话中跨调度累积
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout or aiohttp.ClientTimeout(total=10),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trace_configs=[_build_trace_config(platform, stats)],
+        )
+        logger.debug("已创建共享HTTP会话: %s", platform)
+        return _PooledSession(session=session, loop=loop, stats=stats)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """按平台返回连接池统计（请求数、新建/复用连接数、复用率）。"""
+        result: dict[str, dict[str, Any]] = {}
+        for platform, stats in self._stats.items():
+            item: dict[str, Any] = stats.as_dict()
+            pooled = self._sessions.get(platform)
+            item["open"] = bool(pooled and not pooled.session.closed)
+            result[platform] = item
+        return result
+
+    async def close(self) -> None:
+        """关闭全部共享会话并停用注册表。"""
+        self._active = False
+        sessions, self._sessions = list(self._sessions.items()), {}
+        for platform, pooled in sessions:
+            if pooled.session.closed:
+                continue
+            try:
+                await pooled.session.close()
+            except Exception as e:
+                logger.debug("关闭共享HTTP会话失败（%s）: %s", platform, e)
+
+
+_registry: SessionRegistry | None = None
+
+
+def get_session_registry() -> SessionRegistry:
+    """获取进程级会话注册表单例。"""
+    global _registry
+    if _registry is None:
+        _registry = SessionRegistry()
+    return _registry
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
 import os
 from collections.abc import Callable, Generator
@@ -17,17 +18,20 @@ from typing import Any
 
 import uvicorn
 
-from src.jobs.log_manager import LogManager
+from src.jobs.log_manager import LogManager, get_log_broadcaster
 from src.jobs.registry import (
     MONITOR_JOBS,
     TASK_JOBS,
     JobDescriptor,
     discover_and_import,
+    get_module_import_report,
+    load_job_module_async,
     monitor_job_enabled,
+    set_job_loaded_hook,
     task_job_enabled,
 )
 from src.jobs.scheduler import TaskScheduler, setup_logging
-from src.settings.config import AppConfig
+from src.settings.config import AppConfig, get_config
 from src.settings.db_sync import sync_config_to_db
 
 logger = logging.getLogger(__name__)
@@ -36,6 +40,9 @@ DEFAULT_BIND_HOST = "0.0.0.0"
 ENV_PORT = "PORT"
 DEFAULT_PORT = 8866
 WEB_SHUTDOWN_WAIT_SEC = 5.0
+# 启动首轮同时执行的任务数，其中浏览器（Selenium）任务同一时间只运行一个
+STARTUP_PASS_CONCURRENCY = 4
+STARTUP_BROWSER_CONCURRENCY = 1
 
 
 class BackgroundUvicornServer(uvicorn.Server):
@@ -61,9 +68,12 @@ class _InvalidHttpProbeLogFilter(logging.Filter):
 
 
 def setup_main_file_logging() -> None:
-    """在 root logger 上挂载 main 日志文件（须先调用 setup_logging）。"""
+    """在 root logger 上挂载 main 日志文件与 Web 实时日志流（须先调用 setup_logging）。"""
     file_handler = LogManager().setup_file_logging("main", log_level="INFO")
     logging.root.addHandler(file_handler)
+    broadcaster = get_log_broadcaster()
+    if broadcaster not in logging.root.handlers:
+        logging.root.addHandler(broadcaster)
 
 
 def attach_uvicorn_noise_filter() -> None:
@@ -146,16 +156,60 @@ async def cancel_web_task(web_task: asyncio.Task[Any]) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _overrun_kwargs(desc: JobDescriptor) -> dict[str, Any]:
+    return {
+        "overrun_policy": desc.overrun_policy,
+        "max_concurrent": desc.max_concurrent,
+        "jitter_seconds": desc.jitter_seconds,
+    }
+
+
+def _add_job(scheduler: TaskScheduler, desc: JobDescriptor, config: AppConfig) -> None:
+    kw = desc.get_trigger_kwargs(config)
+    add = scheduler.add_interval_job if desc.trigger == "interval" else scheduler.add_cron_job
+    add(func=desc.run_func, job_id=desc.job_id, **kw, **_overrun_kwargs(desc))
+
+
+def _rebuild_loaded_job(scheduler: TaskScheduler, desc: JobDescriptor) -> None:
+    """
+    占位描述被替换后按模块注册的描述重建调度任务。
+
+    占位任务只有 TaskSpec 中的触发参数，执行函数、overrun_policy、jitter_seconds 等
+    以模块注册的为准；手动运行或调度触发导致的加载同样需要重建。
+    """
+    config = get_config()
+    scheduler.remove_job(desc.job_id)
+    _add_job(scheduler, desc, config)
+    enabled = monitor_job_enabled if desc.trigger == "interval" else task_job_enabled
+    if not enabled(desc.job_id, config):
+        scheduler.pause_job(desc.job_id)
+
+
 def _add_interval_jobs(scheduler: TaskScheduler, config: AppConfig) -> None:
     for desc in MONITOR_JOBS:
-        kw = desc.get_trigger_kwargs(config)
-        scheduler.add_interval_job(func=desc.run_func, job_id=desc.job_id, **kw)
+        _add_job(scheduler, desc, config)
 
 
 def _add_cron_jobs(scheduler: TaskScheduler, config: AppConfig) -> None:
     for desc in TASK_JOBS:
-        kw = desc.get_trigger_kwargs(config)
-        scheduler.add_cron_job(func=desc.run_func, job_id=desc.job_id, **kw)
+        _add_job(scheduler, desc, config)
+
+
+def _log_module_import_report() -> None:
+    """启动时汇总任务模块导入耗时（按需加载），最慢的几个单独列出。"""
+    report = get_module_import_report()
+    deferred = sum(1 for desc in MONITOR_JOBS + TASK_JOBS if desc.deferred)
+    logger.info(
+        "任务模块导入: %d 个，共 %.2f 秒（新增 %d 个模块），%d 个未启用任务延迟加载",
+        len(report),
+        sum(r.seconds for r in report),
+        sum(r.new_modules for r in report),
+        deferred,
+    )
+    for record in report[:5]:
+        logger.debug(
+            "  %s: %.3f 秒，新增 %d 个模块", record.module, record.seconds, record.new_modules
+        )
 
 
 def _pause_monitors_disabled_in_config(scheduler: TaskScheduler, config: AppConfig) -> None:
@@ -170,27 +224,73 @@ def _pause_tasks_disabled_in_config(scheduler: TaskScheduler, config: AppConfig)
             scheduler.pause_job(desc.job_id)
 
 
+def _startup_priority(desc: JobDescriptor) -> int:
+    """启动首轮的优先级（小的先执行）：监控 < 普通定时任务 < 浏览器任务。"""
+    if desc.trigger == "interval":
+        return 0
+    return 2 if desc.uses_browser else 1
+
+
 async def _run_initial_pass(
     jobs: list[JobDescriptor],
     should_stop: Callable[[], bool] | None = None,
+    concurrency: int = STARTUP_PASS_CONCURRENCY,
 ) -> None:
+    """
+    启动首轮：按优先级并发执行各任务一次，监控先于定时任务开始。
+
+    同时最多执行 concurrency 个任务；浏览器（Selenium）任务另外串行，等待浏览器时不占用
+    并发名额。每个任务记录从首轮开始到其开始、完成的时间（time-to-first-tick）。
+    """
     logger.debug("正在启动时立即执行一次监控任务和定时任务...")
+    eligible = []
     for desc in jobs:
-        if not desc.run_on_startup:
+        if desc.run_on_startup:
+            eligible.append(desc)
+        else:
             logger.debug("%s: 配置为仅按触发器执行，跳过启动首轮", desc.job_id)
-            continue
-        if should_stop is not None and should_stop():
-            logger.info("收到停止信号，跳过剩余启动首轮任务")
-            break
-        try:
-            await desc.run_func()
-        except Exception as e:  # noqa: BLE001
-            logger.error("%s 启动时首次执行失败: %s", desc.job_id, e, exc_info=True)
+    eligible.sort(key=_startup_priority)
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    slots = asyncio.Semaphore(concurrency)
+    browser_slots = asyncio.Semaphore(STARTUP_BROWSER_CONCURRENCY)
+    stop_logged = False
+
+    async def run_one(desc: JobDescriptor) -> None:
+        nonlocal stop_logged
+        async with browser_slots if desc.uses_browser else contextlib.nullcontext():
+            async with slots:
+                if should_stop is not None and should_stop():
+                    if not stop_logged:
+                        stop_logged = True
+                        logger.info("收到停止信号，跳过剩余启动首轮任务")
+                    return
+                begin = loop.time() - started_at
+                try:
+                    await desc.run_func()
+                except Exception as e:  # noqa: BLE001
+                    logger.error("%s 启动时首次执行失败: %s", desc.job_id, e, exc_info=True)
+                end = loop.time() - started_at
+                logger.info(
+                    "启动首轮 %s: 第 %.1f 秒开始，第 %.1f 秒完成（耗时 %.1f 秒）",
+                    desc.job_id,
+                    begin,
+                    end,
+                    end - begin,
+                )
+
+    # 信号量按等待顺序放行，按优先级创建的任务即按优先级获得并发名额
+    await asyncio.gather(*(run_one(desc) for desc in eligible))
+    if eligible:
+        logger.info("启动首轮完成：%d 个任务，共 %.1f 秒", len(eligible), loop.time() - started_at)
 
 
 async def register_and_prime_jobs(scheduler: TaskScheduler, config: AppConfig) -> None:
     """发现模块、注册任务、暂停未启用监控，并对所有任务执行启动首轮。"""
-    discover_and_import()
+    discover_and_import(config)
+    _log_module_import_report()
+    set_job_loaded_hook(functools.partial(_rebuild_loaded_job, scheduler))
     _add_interval_jobs(scheduler, config)
     _add_cron_jobs(scheduler, config)
     _pause_monitors_disabled_in_config(scheduler, config)
@@ -226,6 +326,51 @@ def _reload_note_for_quiet_hours(old: AppConfig | None, new: AppConfig) -> list[
     return [f"免打扰时段({status}, {new.quiet_hours_start}-{new.quiet_hours_end})"]
 
 
+def _reload_note_for_adaptive_polling(old: AppConfig | None, new: AppConfig) -> list[str]:
+    if old is None:
+        return []
+    keys = (
+        "adaptive_polling_enable",
+        "adaptive_polling_max_interval_seconds",
+        "adaptive_polling_requests_per_second",
+    )
+    if all(getattr(old, key) == getattr(new, key) for key in keys):
+        return []
+    if not new.adaptive_polling_enable:
+        return ["自适应轮询(禁用)"]
+    return [
+        f"自适应轮询(启用, 最长{new.adaptive_polling_max_interval_seconds}s, "
+        f"{new.adaptive_polling_requests_per_second:g}次/秒)"
+    ]
+
+
+async def _apply_loop_watchdog(old: AppConfig | None, new: AppConfig) -> list[str]:
+    from src.core.loop_watchdog import get_loop_watchdog
+
+    if old is not None and (
+        old.loop_watchdog_enable == new.loop_watchdog_enable
+        and old.loop_watchdog_threshold_ms == new.loop_watchdog_threshold_ms
+    ):
+        return []
+    await get_loop_watchdog().configure(new.loop_watchdog_enable, new.loop_watchdog_threshold_ms)
+    if old is None:
+        return []
+    status = "启用" if new.loop_watchdog_enable else "禁用"
+    return [f"事件循环卡顿看门狗({status}, {new.loop_watchdog_threshold_ms}ms)"]
+
+
+async def _load_newly_enabled_jobs(new_config: AppConfig) -> list[str]:
+    """导入刚启用、尚未加载的任务模块；调度任务由加载回调按模块注册的参数重建。"""
+    out: list[str] = []
+    for desc in [*MONITOR_JOBS, *TASK_JOBS]:
+        enabled = monitor_job_enabled if desc.trigger == "interval" else task_job_enabled
+        if not desc.deferred or not enabled(desc.job_id, new_config):
+            continue
+        if await load_job_module_async(desc.job_id) is not None:
+            out.append(f"{desc.job_id}(已加载)")
+    return out
+
+
 def _apply_monitor_jobs_after_config_reload(
     scheduler: TaskScheduler, new_config: AppConfig
 ) -> list[str]:
@@ -265,14 +410,18 @@ async def on_scheduler_config_changed(
 ) -> None:
     """热重载：DB 与配置对齐，并按注册表更新 APScheduler。"""
     try:
+        from src.monitors.base import apply_config_to_live_monitors
         from src.storage.database import reconfigure_database
 
         await reconfigure_database(new_config)
         await sync_config_to_db(old_config, new_config)
-        updates: list[str] = []
+        await apply_config_to_live_monitors(new_config)
+        updates = await _load_newly_enabled_jobs(new_config)
         updates.extend(_apply_monitor_jobs_after_config_reload(scheduler, new_config))
         updates.extend(_apply_cron_jobs_after_config_reload(scheduler, new_config))
         updates.extend(_reload_note_for_quiet_hours(old_config, new_config))
+        updates.extend(_reload_note_for_adaptive_polling(old_config, new_config))
+        updates.extend(await _apply_loop_watchdog(old_config, new_config))
         if updates:
             logger.info("配置已更新: %s", _format_reload_summary(updates))
     except Exception as e:
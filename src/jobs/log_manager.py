@@ -1,10 +1,13 @@
 """日志管理模块 - 统一管理日志文件"""
 
+import asyncio
 import contextvars
 import logging
 import logging.handlers
 import re
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -104,6 +107,105 @@ class TaskLogFilter(logging.Filter):
         return current == self.job_id
 
 
+LOG_FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_FILE_DATEFMT = "%Y-%m-%d %H:%M:%S"
+LOG_STREAM_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class LogStreamEvent:
+    """推送给日志订阅者的一条记录（已按日志文件格式化，可能包含多行堆栈）。"""
+
+    date: str
+    job_id: str | None
+    lines: tuple[str, ...]
+
+
+@dataclass(eq=False)
+class LogSubscription:
+    """日志实时流订阅：task 为 None 时接收总日志，否则只接收该任务执行期间的日志。"""
+
+    task: str | None
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=LOG_STREAM_QUEUE_SIZE)
+    )
+    # 队列溢出后置位，由消费端通知前端重新拉取一次尾部
+    overflowed: bool = False
+
+    def _put(self, event: LogStreamEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class LogBroadcastHandler(logging.Handler):
+    """与 DailyRotatingFileHandler 并列挂在 root logger 上，把日志直接推送给 Web 实时流。
+
+    无订阅者时不做格式化；任务归属取自写入时的 ``_current_job_id``，与 TaskLogFilter 一致。
+    日期标签与按日轮转的文件名一致，供前端在跨天时清屏。
+    """
+
+    def __init__(self, date_format: str = "%Y%m%d"):
+        super().__init__()
+        self.date_format = date_format
+        self._subscribers: set[LogSubscription] = set()
+        self._subscribers_lock = threading.Lock()
+        self.setFormatter(logging.Formatter(LOG_FILE_FORMAT, datefmt=LOG_FILE_DATEFMT))
+
+    def subscribe(self, task: str | None = None) -> LogSubscription:
+        subscription = LogSubscription(task=task, loop=asyncio.get_running_loop())
+        with self._subscribers_lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        with self._subscribers_lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not self._subscribers:
+            return
+        job_id = _current_job_id.get()
+        with self._subscribers_lock:
+            targets = [s for s in self._subscribers if s.task is None or s.task == job_id]
+        if not targets:
+            return
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        event = LogStreamEvent(
+            date=datetime.fromtimestamp(record.created).strftime(self.date_format),
+            job_id=job_id,
+            lines=tuple(message.splitlines()),
+        )
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, event)
+            except RuntimeError:
+                # 订阅方事件循环已关闭
+                self.unsubscribe(subscription)
+
+
+_log_broadcaster: LogBroadcastHandler | None = None
+
+
+def get_log_broadcaster() -> LogBroadcastHandler:
+    """获取进程级日志广播处理器单例。"""
+    global _log_broadcaster
+    if _log_broadcaster is None:
+        _log_broadcaster = LogBroadcastHandler()
+        _log_broadcaster.setLevel(logging.INFO)
+    return _log_broadcaster
+
+
 class LogManager:
     """日志管理器 - 负责日志文件的创建、清理等操作"""
 
@@ -202,12 +304,7 @@ class LogManager:
         )
 
         file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+        file_handler.setFormatter(logging.Formatter(LOG_FILE_FORMAT, datefmt=LOG_FILE_DATEFMT))
         return file_handler
 
     def setup_task_file_logging(
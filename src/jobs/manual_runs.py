@@ -0,0 +1,201 @@
+"""手动触发任务的后台运行队列：接口立即返回 run_id，任务在事件循环后台执行。
+
+同一 job_id 已有运行中的手动任务时直接返回该运行，避免重复点击并发启动；
+进度取自任务专属日志上下文（见 registry._task_logging_context）中该任务写出的日志。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.jobs.log_manager import LOG_FILE_DATEFMT
+from src.jobs.registry import OVERRUN_CONCURRENT, run_task_with_logging
+
+logger = logging.getLogger(__name__)
+
+# 保留的已结束运行记录数
+MANUAL_RUN_HISTORY_SIZE = 50
+# 每个运行保留的最近日志行数
+MANUAL_RUN_PROGRESS_LINES = 20
+
+RUN_QUEUED = "queued"
+RUN_RUNNING = "running"
+RUN_SUCCEEDED = "succeeded"
+# 任务返回 False（未执行、配置不完整或执行失败，见 task_outcome）
+RUN_FAILED = "failed"
+# 任务抛出异常
+RUN_ERROR = "error"
+RUN_CANCELLED = "cancelled"
+ACTIVE_RUN_STATUSES = frozenset({RUN_QUEUED, RUN_RUNNING})
+
+
+@dataclass(eq=False)
+class ManualRun:
+    """一次手动运行的状态。"""
+
+    run_id: str
+    job_id: str
+    status: str = RUN_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    message: str = ""
+    log_count: int = 0
+    recent_logs: deque[str] = field(default_factory=lambda: deque(maxlen=MANUAL_RUN_PROGRESS_LINES))
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_RUN_STATUSES
+
+    @property
+    def duration(self) -> float | None:
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return round(end - self.started_at, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "job_id": self.job_id,
+            "status": self.status,
+            "active": self.active,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration": self.duration,
+            "message": self.message,
+            "log_count": self.log_count,
+            "recent_logs": list(self.recent_logs),
+        }
+
+
+class ManualRunProgressHandler(logging.Handler):
+    """挂在任务日志上下文中的处理器：把该任务写出的日志记录为运行进度。"""
+
+    def __init__(self, run: ManualRun):
+        super().__init__()
+        self.run = run
+        self.setFormatter(
+            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", LOG_FILE_DATEFMT)
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record).splitlines()[0]
+        except Exception:
+            self.handleError(record)
+            return
+        self.run.log_count += 1
+        self.run.recent_logs.append(line)
+
+
+class ManualRunQueue:
+    """进程级手动运行表：按 job_id 去重，结束后保留最近若干条供查询。"""
+
+    def __init__(self, history_size: int = MANUAL_RUN_HISTORY_SIZE):
+        self.history_size = history_size
+        self._runs: OrderedDict[str, ManualRun] = OrderedDict()
+        self._active: dict[str, ManualRun] = {}
+
+    def get(self, run_id: str) -> ManualRun | None:
+        return self._runs.get(run_id)
+
+    def active_run(self, job_id: str) -> ManualRun | None:
+        return self._active.get(job_id)
+
+    def runs(self) -> list[ManualRun]:
+        """最近的运行，新的在前。"""
+        return list(reversed(self._runs.values()))
+
+    def submit(
+        self,
+        job_id: str,
+        run_func: Callable[[], Awaitable[Any]],
+        overrun_policy: str = OVERRUN_CONCURRENT,
+    ) -> tuple[ManualRun, bool]:
+        """
+        在后台启动一次运行，返回 (运行, 是否新建)；该任务已在手动运行时返回已有运行。
+
+        overrun_policy 为 queue_one 时，调度中的同一任务结束后才开始执行（状态保持 queued）。
+        """
+        existing = self._active.get(job_id)
+        if existing is not None:
+            return existing, False
+        run = ManualRun(run_id=secrets.token_hex(8), job_id=job_id)
+        self._runs[run.run_id] = run
+        self._active[job_id] = run
+        run.task = asyncio.create_task(
+            self._execute(run, run_func, overrun_policy), name=f"manual-run-{job_id}"
+        )
+        self._trim()
+        return run, True
+
+    async def _execute(
+        self, run: ManualRun, run_func: Callable[[], Awaitable[Any]], overrun_policy: str
+    ) -> None:
+        progress = ManualRunProgressHandler(run)
+
+        async def mark_started_and_run() -> Any:
+            run.status = RUN_RUNNING
+            run.started_at = time.time()
+            return await run_func()
+
+        try:
+            result = await run_task_with_logging(
+                run.job_id, mark_started_and_run, progress, overrun_policy
+            )
+        except asyncio.CancelledError:
+            run.status = RUN_CANCELLED
+            run.message = "任务已取消"
+            raise
+        except Exception as e:
+            logger.error("任务 %s 手动执行失败: %s", run.job_id, e, exc_info=True)
+            run.status = RUN_ERROR
+            run.message = f"任务执行失败: {e}"
+        else:
+            if result is False:
+                run.status = RUN_FAILED
+                run.message = f"任务 {run.job_id} 未成功完成"
+            else:
+                run.status = RUN_SUCCEEDED
+                run.message = f"任务 {run.job_id} 执行成功"
+            logger.info("任务 %s 手动执行结束: %s", run.job_id, run.status)
+        finally:
+            run.finished_at = time.time()
+            run.task = None
+            if self._active.get(run.job_id) is run:
+                del self._active[run.job_id]
+            self._trim()
+
+    def _trim(self) -> None:
+        finished = [run_id for run_id, run in self._runs.items() if not run.active]
+        for run_id in finished[: max(0, len(finished) - self.history_size)]:
+            del self._runs[run_id]
+
+    async def cancel_all(self) -> None:
+        """取消所有运行中的手动任务（程序退出时调用）。"""
+        tasks = [run.task for run in self._active.values() if run.task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_manual_runs: ManualRunQueue | None = None
+
+
+def get_manual_runs() -> ManualRunQueue:
+    """获取进程级手动运行队列。"""
+    global _manual_runs
+    if _manual_runs is None:
+        _manual_runs = ManualRunQueue()
+    return _manual_runs
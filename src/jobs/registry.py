@@ -7,24 +7,117 @@
 3. 在任务模块内调用 register_monitor() 或 register_task() 完成注册
 
 MONITOR_MODULES / TASK_MODULES 由 metadata 生成并在本模块兼容导出。
+
+启动时只导入配置中已启用任务的模块；其余任务按 TaskSpec 先注册占位描述（deferred），
+首次启用或运行时在线程池中导入实现模块，并按模块注册的参数重建调度任务
+（见 discover_and_import / load_job_module_async）。
 """
 
+import asyncio
 import functools
 import importlib
 import logging
+import sys
+import time
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.core.metrics import StatsCounters, get_metrics_registry
 from src.jobs.enable_fields import MONITOR_JOB_ENABLE_FIELD_MAP, TASK_JOB_ENABLE_FIELD_MAP
 from src.jobs.log_manager import LogManager, TaskLogFilter, _current_job_id
-from src.jobs.metadata import MONITOR_MODULES, TASK_MODULES
+from src.jobs.metadata import (
+    MONITOR_MODULES,  # noqa: F401  兼容导出
+    MONITOR_SPECS,
+    TASK_MODULES,
+    TASK_SPECS,
+    TaskSpec,
+    get_task_spec,
+)
 from src.jobs.task_outcome import TASK_FAILED, TASK_SUCCESS, TaskOutcome
-from src.settings.config import AppConfig, get_config
+from src.settings.config import AppConfig, get_config, parse_checkin_time
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_metrics_registry()
+JOB_DURATION = _metrics.histogram(
+    "job_duration_seconds", "Job run duration, including manual runs.", ("job_id",)
+)
+JOB_RUNS = _metrics.counter(
+    "job_runs_total", "Finished job runs by outcome.", ("job_id", "outcome")
+)
+JOB_OVERLAPS = _metrics.counter(
+    "job_overlaps_total", "Job runs started while a previous run was still active.", ("job_id",)
+)
+JOB_SKIPS = _metrics.counter(
+    "job_skips_total", "Scheduled job runs that did not execute, by reason.", ("job_id", "reason")
+)
+JOB_OVERRUNS = _metrics.counter(
+    "job_overruns_total", "Interval job runs that took longer than their interval.", ("job_id",)
+)
+JOB_QUEUED = _metrics.counter(
+    "job_queued_total",
+    "Scheduled runs that waited for the previous run to finish (queue_one policy).",
+    ("job_id",),
+)
+# job_id -> 正在执行的次数（调度与手动运行合计），用于统计重叠执行
+_running_jobs: dict[str, int] = {}
+
+# 上一轮仍在执行时新的触发如何处理（JobDescriptor.overrun_policy）
+OVERRUN_SKIP = "skip"  # 跳过本次触发
+OVERRUN_QUEUE_ONE = "queue_one"  # 排队一次，上一轮结束后立即执行；更多的触发跳过
+OVERRUN_CONCURRENT = "concurrent"  # 并发执行，最多 max_concurrent 个
+OVERRUN_POLICIES = (OVERRUN_SKIP, OVERRUN_QUEUE_ONE, OVERRUN_CONCURRENT)
+
+
+@dataclass
+class JobRunStats(StatsCounters):
+    """单个任务自进程启动以来的执行统计（任务 API 展示）。"""
+
+    runs: int = 0
+    overlaps: int = 0
+    overruns: int = 0
+    queued: int = 0
+    skipped: dict[str, int] = field(default_factory=dict)
+    last_duration: float | None = None
+
+    def derived(self) -> dict[str, Any]:
+        return {
+            "skipped_total": sum(self.skipped.values()),
+            "last_duration": (
+                round(self.last_duration, 3) if self.last_duration is not None else None
+            ),
+        }
+
+
+_job_stats: dict[str, JobRunStats] = {}
+# queue_one 策略的任务各自一把锁：调度触发串行执行，最多一次在锁上排队
+_queue_gates: dict[str, asyncio.Lock] = {}
+
+
+def get_job_stats(job_id: str) -> JobRunStats:
+    """获取（必要时创建）任务的执行统计。"""
+    stats = _job_stats.get(job_id)
+    if stats is None:
+        stats = _job_stats[job_id] = JobRunStats()
+    return stats
+
+
+def record_job_skip(job_id: str, reason: str) -> None:
+    """记录一次未执行的调度（disabled / already_run_today / max_instances / misfire）。"""
+    JOB_SKIPS.inc(job_id=job_id, reason=reason)
+    skipped = get_job_stats(job_id).skipped
+    skipped[reason] = skipped.get(reason, 0) + 1
+
+
+def interval_seconds(trigger_kwargs: dict[str, Any]) -> int | None:
+    """间隔触发参数对应的秒数（优先级 seconds > minutes > hours，与调度器一致）。"""
+    for key, factor in (("seconds", 1), ("minutes", 60), ("hours", 3600)):
+        if trigger_kwargs.get(key) is not None:
+            return int(trigger_kwargs[key]) * factor
+    return None
+
 
 @dataclass
 class JobDescriptor:
@@ -39,6 +132,21 @@ class JobDescriptor:
     original_run_func: Callable[[], Awaitable[TaskOutcome]] | None = field(default=None)
     # 是否参与项目启动后的首轮执行；监控与既有任务默认保持原行为
     run_on_startup: bool = True
+    # 上一轮仍在执行时的处理策略（OVERRUN_*），concurrent 策略的并发上限
+    overrun_policy: str = OVERRUN_SKIP
+    max_concurrent: int = 1
+    # 每次触发的随机延迟上限（秒）；None 时间隔任务取间隔的 5%，Cron 任务不延迟
+    jitter_seconds: int | None = None
+    # 需要启动浏览器（Selenium）；启动首轮中此类任务同一时间只运行一个
+    uses_browser: bool = False
+    # 按 TaskSpec 注册的占位描述：实现模块尚未导入，首次运行时由 load_job_module 加载
+    deferred: bool = False
+
+    def __post_init__(self) -> None:
+        if self.overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"任务 {self.job_id} 的 overrun_policy 无效: {self.overrun_policy}")
+        if self.max_concurrent < 1:
+            raise ValueError(f"任务 {self.job_id} 的 max_concurrent 必须大于 0")
 
 
 MONITOR_JOBS: list[JobDescriptor] = []
@@ -55,33 +163,105 @@ def _upsert_job(jobs: list[JobDescriptor], descriptor: JobDescriptor) -> None:
 
 
 @asynccontextmanager
-async def _task_logging_context(job_id: str):
+async def _task_logging_context(job_id: str, *extra_handlers: logging.Handler):
     """
     异步上下文管理器：在任务执行期间挂载专属日志文件处理器，
     通过 TaskLogFilter + _current_job_id 保证并发任务日志隔离。
+    extra_handlers（如手动运行的进度处理器）同样只接收该任务的日志。
     """
     log_manager = LogManager()
-    handler = log_manager.setup_task_file_logging(job_id)
-    handler.addFilter(TaskLogFilter(job_id))
-    logging.root.addHandler(handler)
+    handlers = [log_manager.setup_task_file_logging(job_id), *extra_handlers]
+    for handler in handlers:
+        handler.addFilter(TaskLogFilter(job_id))
+        logging.root.addHandler(handler)
     token = _current_job_id.set(job_id)
     try:
         yield
     finally:
         _current_job_id.reset(token)
-        try:
-            logging.root.removeHandler(handler)
-            handler.close()
-        except Exception as e:
-            logger.debug("移除任务日志处理器时出错（可忽略）: %s", e)
+        for handler in handlers:
+            try:
+                logging.root.removeHandler(handler)
+                handler.close()
+            except Exception as e:
+                logger.debug("移除任务日志处理器时出错（可忽略）: %s", e)
 
 
-async def run_task_with_logging(job_id: str, run_func: Callable[[], Awaitable[None]]) -> None:
+async def _observed_run(
+    job_id: str,
+    run_func: Callable[[], Awaitable[Any]],
+    interval: float | None = None,
+) -> Any:
     """
-    在任务专属日志支持下执行任务。用于手动触发时确保也写入任务专属日志文件。
+    执行任务并记录耗时、结果与重叠执行次数（返回 False 视为 failed）。
+
+    interval 为间隔任务的触发间隔，耗时超过间隔时计入 overruns。
     """
-    async with _task_logging_context(job_id):
-        await run_func()
+    stats = get_job_stats(job_id)
+    if _running_jobs.get(job_id, 0) > 0:
+        JOB_OVERLAPS.inc(job_id=job_id)
+        stats.overlaps += 1
+    _running_jobs[job_id] = _running_jobs.get(job_id, 0) + 1
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        result = await run_func()
+        outcome = "failed" if result is False else "success"
+        return result
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    finally:
+        _running_jobs[job_id] -= 1
+        duration = time.perf_counter() - started
+        JOB_DURATION.observe(duration, job_id=job_id)
+        JOB_RUNS.inc(job_id=job_id, outcome=outcome)
+        stats.runs += 1
+        stats.last_duration = duration
+        if interval and duration > interval:
+            JOB_OVERRUNS.inc(job_id=job_id)
+            stats.overruns += 1
+            logger.warning(
+                "%s 本轮耗时 %.1f 秒，超过触发间隔 %d 秒", job_id, duration, int(interval)
+            )
+
+
+@asynccontextmanager
+async def _overrun_gate(job_id: str, overrun_policy: str):
+    """queue_one 策略：上一轮仍在执行时排队等待（调度器 max_instances=2 保证最多排队一次）。"""
+    if overrun_policy != OVERRUN_QUEUE_ONE:
+        yield
+        return
+    gate = _queue_gates.get(job_id)
+    if gate is None:
+        gate = _queue_gates[job_id] = asyncio.Lock()
+    if gate.locked():
+        JOB_QUEUED.inc(job_id=job_id)
+        get_job_stats(job_id).queued += 1
+        logger.info("%s 上一轮仍在执行，本次触发排队等待", job_id)
+    async with gate:
+        yield
+
+
+def job_running(job_id: str) -> bool:
+    """该任务当前是否有运行在执行（调度与手动运行合计）。"""
+    return _running_jobs.get(job_id, 0) > 0
+
+
+async def run_task_with_logging(
+    job_id: str,
+    run_func: Callable[[], Awaitable[Any]],
+    progress_handler: logging.Handler | None = None,
+    overrun_policy: str = OVERRUN_CONCURRENT,
+) -> Any:
+    """
+    在任务专属日志支持下执行任务并返回其结果。用于手动触发时确保也写入任务专属日志文件。
+
+    overrun_policy 为 queue_one 时与调度触发共用排队锁，等上一轮结束后再执行。
+    """
+    extra = (progress_handler,) if progress_handler is not None else ()
+    async with _overrun_gate(job_id, overrun_policy), _task_logging_context(job_id, *extra):
+        return await _observed_run(job_id, run_func)
 
 
 def monitor_job_enabled(job_id: str, config: AppConfig) -> bool:
@@ -107,10 +287,15 @@ def register_monitor(
     get_trigger_kwargs: Callable[[AppConfig], dict[str, Any]],
     *,
     description: str = "",
+    overrun_policy: str = OVERRUN_SKIP,
+    max_concurrent: int = 1,
+    jitter_seconds: int | None = None,
 ) -> None:
     """
     注册一个监控任务（间隔触发）。
     应在监控模块加载时调用，例如：register_monitor("huya_monitor", run_huya_monitor, lambda c: {"seconds": c.huya_monitor_interval_seconds})
+
+    overrun_policy / max_concurrent / jitter_seconds 见 JobDescriptor。
     """
 
     @functools.wraps(run_func)
@@ -118,9 +303,11 @@ def register_monitor(
         config = get_config()
         if not monitor_job_enabled(job_id, config):
             logger.debug("%s: 当前配置未启用，跳过执行", job_id)
+            record_job_skip(job_id, "disabled")
             return
-        async with _task_logging_context(job_id):
-            await run_func()
+        interval = interval_seconds(get_trigger_kwargs(config))
+        async with _overrun_gate(job_id, overrun_policy), _task_logging_context(job_id):
+            await _observed_run(job_id, run_func, interval)
 
     _upsert_job(
         MONITOR_JOBS,
@@ -131,6 +318,9 @@ def register_monitor(
             get_trigger_kwargs=get_trigger_kwargs,
             description=description or f"任务 {job_id}",
             original_run_func=run_func,
+            overrun_policy=overrun_policy,
+            max_concurrent=max_concurrent,
+            jitter_seconds=jitter_seconds,
         ),
     )
     logger.debug("已注册监控任务: %s", job_id)
@@ -144,6 +334,10 @@ def register_task(
     skip_if_run_today: bool = True,
     run_on_startup: bool = True,
     description: str = "",
+    overrun_policy: str = OVERRUN_SKIP,
+    max_concurrent: int = 1,
+    jitter_seconds: int | None = None,
+    uses_browser: bool = False,
 ) -> None:
     """
     注册一个定时任务（Cron 触发）。
@@ -156,26 +350,36 @@ def register_task(
         skip_if_run_today: 是否在当天已运行过时跳过（默认 True）
         run_on_startup: 是否在项目启动首轮执行（默认 True）
         description: Web 任务列表展示文案
+        overrun_policy: 上一轮仍在执行时的处理策略（默认跳过，见 OVERRUN_*）
+        max_concurrent: concurrent 策略的并发上限
+        jitter_seconds: 每次触发的随机延迟上限（秒），默认不延迟
+        uses_browser: 是否启动浏览器（Selenium），启动首轮中此类任务串行执行
     """
-    from src.storage.database import has_run_today as check_run_today
-    from src.storage.database import mark_as_run_today
 
     @functools.wraps(run_func)
     async def wrapped_run_func() -> TaskOutcome:
+        # 延迟导入：青龙单任务只调用原始执行函数，无需加载数据库驱动
+        from src.storage.database import has_run_today as check_run_today
+        from src.storage.database import mark_as_run_today
+
         config = get_config()
         if not task_job_enabled(job_id, config):
             logger.debug("%s: 当前配置未启用，跳过调度执行", job_id)
+            record_job_skip(job_id, "disabled")
             return TASK_FAILED
 
-        if skip_if_run_today and await check_run_today(job_id):
-            logger.info("%s: 当天已经运行过了，跳过该任务", job_id)
-            return TASK_FAILED
+        # 排队的触发在上一轮结束后再检查「当天已运行」
+        async with _overrun_gate(job_id, overrun_policy):
+            if skip_if_run_today and await check_run_today(job_id):
+                logger.info("%s: 当天已经运行过了，跳过该任务", job_id)
+                record_job_skip(job_id, "already_run_today")
+                return TASK_FAILED
 
-        async with _task_logging_context(job_id):
-            result = await run_func()
-            if skip_if_run_today and result is TASK_SUCCESS:
-                await mark_as_run_today(job_id)
-            return result
+            async with _task_logging_context(job_id):
+                result = await _observed_run(job_id, run_func)
+                if skip_if_run_today and result is TASK_SUCCESS:
+                    await mark_as_run_today(job_id)
+                return result
 
     _upsert_job(
         TASK_JOBS,
@@ -187,6 +391,10 @@ def register_task(
             description=description or f"任务 {job_id}",
             original_run_func=run_func,
             run_on_startup=run_on_startup,
+            overrun_policy=overrun_policy,
+            max_concurrent=max_concurrent,
+            jitter_seconds=jitter_seconds,
+            uses_browser=uses_browser,
         ),
     )
     logger.debug(
@@ -214,13 +422,183 @@ def discover_and_import_tasks_only() -> None:
             logger.warning("导入任务模块 %s 失败: %s", mod_name, e)
 
 
-def discover_and_import() -> None:
+# 单个任务模块导入耗时超过该值时告警（秒）
+MODULE_IMPORT_BUDGET_SECONDS = 1.0
+
+
+@dataclass
+class ModuleImportRecord:
+    """任务模块的一次导入：耗时与新增的 sys.modules 数量（含首次导入的共享依赖）。"""
+
+    module: str
+    seconds: float
+    new_modules: int
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "module": self.module,
+            "seconds": round(self.seconds, 3),
+            "new_modules": self.new_modules,
+            "error": self.error,
+        }
+
+
+_module_imports: dict[str, ModuleImportRecord] = {}
+
+
+def get_module_import_report() -> list[ModuleImportRecord]:
+    """已导入的任务模块，按导入耗时从高到低。"""
+    return sorted(_module_imports.values(), key=lambda r: r.seconds, reverse=True)
+
+
+def import_job_module(mod_name: str) -> bool:
+    """导入任务模块并记录耗时；导入失败过的模块不再重试（修复依赖后需重启）。"""
+    record = _module_imports.get(mod_name)
+    if record is not None:
+        return record.error is None
+    before = len(sys.modules)
+    started = time.perf_counter()
+    error = None
+    try:
+        importlib.import_module(mod_name)
+    except Exception as e:
+        error = str(e)
+        logger.warning("导入任务模块 %s 失败: %s", mod_name, e)
+    record = _module_imports[mod_name] = ModuleImportRecord(
+        mod_name, time.perf_counter() - started, len(sys.modules) - before, error
+    )
+    if record.seconds > MODULE_IMPORT_BUDGET_SECONDS:
+        logger.warning(
+            "导入任务模块 %s 耗时 %.2f 秒，超出预算 %.1f 秒（新增 %d 个模块）",
+            mod_name,
+            record.seconds,
+            MODULE_IMPORT_BUDGET_SECONDS,
+            record.new_modules,
+        )
+    return error is None
+
+
+def _find_job(job_id: str) -> JobDescriptor | None:
+    for job in MONITOR_JOBS + TASK_JOBS:
+        if job.job_id == job_id:
+            return job
+    return None
+
+
+def load_job_module(job_id: str) -> JobDescriptor | None:
+    """
+    确保任务的实现模块已导入，返回其注册的描述符；模块导入失败或未注册该任务时返回 None。
+    """
+    job = _find_job(job_id)
+    if job is not None and not job.deferred:
+        return job
+    spec = get_task_spec(job_id)
+    if spec is None or not import_job_module(spec.module):
+        return None
+    job = _find_job(job_id)
+    if job is None or job.deferred:
+        logger.error("任务模块 %s 未注册任务 %s", spec.module, job_id)
+        return None
+    logger.info("已按需加载任务 %s（%s）", job_id, spec.module)
+    return job
+
+
+# 占位描述被模块注册的描述替换后的回调（由调度器设置，按实际注册参数重建调度任务）
+_job_loaded_hook: Callable[[JobDescriptor], None] | None = None
+
+
+def set_job_loaded_hook(hook: Callable[[JobDescriptor], None] | None) -> None:
+    """设置按需加载完成后的回调；回调在事件循环中执行，传入模块注册的描述。"""
+    global _job_loaded_hook
+    _job_loaded_hook = hook
+
+
+async def load_job_module_async(job_id: str) -> JobDescriptor | None:
     """
-    按 MONITOR_MODULES 与 TASK_MODULES 导入模块，触发各模块内的 register_monitor/register_task 调用。
-    主入口在启动调度前调用一次即可。
+    load_job_module 的异步版本：在线程池中导入模块，避免导入较重的依赖时阻塞事件循环。
+
+    占位描述被替换后回到事件循环调用 set_job_loaded_hook 设置的回调。
     """
-    for mod_name in MONITOR_MODULES + TASK_MODULES:
+    job = _find_job(job_id)
+    if job is not None and not job.deferred:
+        return job
+    job = await asyncio.to_thread(load_job_module, job_id)
+    if job is not None and _job_loaded_hook is not None:
         try:
-            importlib.import_module(mod_name)
+            _job_loaded_hook(job)
         except Exception as e:
-            logger.warning("导入任务模块 %s 失败: %s", mod_name, e)
+            logger.error("任务 %s 加载后重建调度失败: %s", job_id, e, exc_info=True)
+    return job
+
+
+def _config_value(config: AppConfig, path: str) -> Any:
+    """读取配置字段；plugins.demo_task.time 形式的路径逐级读取插件字典。"""
+    head, *rest = path.split(".")
+    value = getattr(config, head, None)
+    for key in rest:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+
+def _spec_trigger_kwargs(spec: TaskSpec, config: AppConfig) -> dict[str, Any]:
+    """按 TaskSpec 的间隔/时间字段计算触发参数（与各模块的 _get_*_trigger_kwargs 一致）。"""
+    if spec.interval_field:
+        return {"seconds": getattr(config, spec.interval_field)}
+    raw = _config_value(config, spec.time_field) if spec.time_field else None
+    hour, minute = parse_checkin_time(str(raw or spec.default_time or "08:00"))
+    return {"minute": minute, "hour": hour}
+
+
+def _deferred_descriptor(spec: TaskSpec) -> JobDescriptor:
+    """实现模块尚未导入的任务：调度或手动运行时先导入模块，再转交其注册的执行函数。"""
+    job_id = spec.job_id
+    is_monitor = spec.kind == "monitor"
+
+    async def load() -> JobDescriptor:
+        job = await load_job_module_async(job_id)
+        if job is None:
+            raise RuntimeError(f"任务 {job_id} 的模块 {spec.module} 加载失败")
+        return job
+
+    async def run_deferred() -> TaskOutcome | None:
+        enabled = monitor_job_enabled if is_monitor else task_job_enabled
+        if not enabled(job_id, get_config()):
+            logger.debug("%s: 当前配置未启用，跳过执行", job_id)
+            record_job_skip(job_id, "disabled")
+            return None if is_monitor else TASK_FAILED
+        return await (await load()).run_func()
+
+    async def run_deferred_manually() -> TaskOutcome | None:
+        job = await load()
+        return await (job.original_run_func or job.run_func)()
+
+    return JobDescriptor(
+        job_id=job_id,
+        run_func=run_deferred,
+        trigger="interval" if is_monitor else "cron",
+        get_trigger_kwargs=functools.partial(_spec_trigger_kwargs, spec),
+        description=spec.description,
+        original_run_func=run_deferred_manually,
+        deferred=True,
+    )
+
+
+def discover_and_import(config: AppConfig | None = None) -> None:
+    """
+    按 MONITOR_SPECS 与 TASK_SPECS 注册全部任务（重复调用只补注册缺失的任务）。
+
+    配置中已启用的任务导入实现模块，由模块内的 register_monitor/register_task 注册；
+    未启用或导入失败的任务注册为占位描述，首次启用或运行时再导入（见 load_job_module）。
+    """
+    if config is None:
+        config = get_config()
+    for spec in MONITOR_SPECS + TASK_SPECS:
+        if _find_job(spec.job_id) is not None:
+            continue
+        enabled = monitor_job_enabled if spec.kind == "monitor" else task_job_enabled
+        if enabled(spec.job_id, config):
+            import_job_module(spec.module)
+        if _find_job(spec.job_id) is None:
+            jobs = MONITOR_JOBS if spec.kind == "monitor" else TASK_JOBS
+            _upsert_job(jobs, _deferred_descriptor(spec))
@@ -2,23 +2,116 @@
 
 import asyncio
 import logging
+import math
 import os
+import random
 import signal
 import sys
 import threading
+import time
+import zlib
 from collections.abc import Callable
+from datetime import datetime
 
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, JobEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.base import SchedulerNotRunningError
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from src.core.runtime import arm_shutdown_watchdog
+from src.jobs.registry import (
+    OVERRUN_CONCURRENT,
+    OVERRUN_QUEUE_ONE,
+    OVERRUN_SKIP,
+    interval_seconds,
+    record_job_skip,
+)
 from src.settings.config import AppConfig, get_config
 
 # 控制台日志分隔符：在「任务源」日志（监控/定时任务/主流程）与上一组推送之间插入，提升阅读体验
 _LOG_SEPARATOR = "─" * 60
 
+# 间隔任务默认抖动：间隔的 5%，最多 30 秒
+INTERVAL_JITTER_RATIO = 0.05
+INTERVAL_JITTER_MAX_SECONDS = 30
+# Cron 任务允许的最大延迟触发时间（事件循环繁忙时仍补跑，超过则计为 misfire）
+CRON_MISFIRE_GRACE_SECONDS = 300
+
+
+def job_phase_offset(job_id: str, period: float) -> float:
+    """按 job_id 计算固定的相位偏移（0 <= 偏移 < period），重启后保持不变。"""
+    return zlib.crc32(job_id.encode("utf-8")) % 10_000 / 10_000 * period
+
+
+def _default_interval_jitter(period: int) -> int | None:
+    return min(round(period * INTERVAL_JITTER_RATIO), INTERVAL_JITTER_MAX_SECONDS) or None
+
+
+def _overrun_job_options(policy: str, max_concurrent: int, misfire_grace_time: int) -> dict:
+    """
+    将 overrun 策略转换为 APScheduler 任务参数。
+
+    queue_one 允许第二个实例启动，由注册表的执行包装在锁上排队；再多的触发
+    由 APScheduler 以 max_instances 跳过（计入 job_skips）。
+    """
+    max_instances = {
+        OVERRUN_SKIP: 1,
+        OVERRUN_QUEUE_ONE: 2,
+        OVERRUN_CONCURRENT: max_concurrent,
+    }[policy]
+    return {
+        "max_instances": max_instances,
+        "coalesce": True,
+        "misfire_grace_time": misfire_grace_time,
+    }
+
+
+class PhasedIntervalTrigger(IntervalTrigger):
+    """
+    按固定网格触发的间隔触发器。
+
+    APScheduler 的 IntervalTrigger 以「上一次（含抖动）的触发时间 + 间隔」计算下一次，
+    抖动会不断累积、相位逐渐漂移；此处先回到网格点再叠加本次抖动（抖动须小于间隔）。
+    """
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        if previous_fire_time is None:
+            return super().get_next_fire_time(previous_fire_time, now)
+        start = self.start_date.timestamp()
+        slots = math.floor((previous_fire_time.timestamp() - start) / self.interval_length) + 1
+        next_fire_time = start + slots * self.interval_length
+        if self.jitter:
+            next_fire_time += random.uniform(0, self.jitter)
+        if not self.end_date or next_fire_time <= self.end_date.timestamp():
+            return datetime.fromtimestamp(next_fire_time, tz=self.timezone)
+        return None
+
+
+def build_interval_trigger(
+    job_id: str,
+    trigger_kwargs: dict[str, int],
+    jitter_seconds: int | None = None,
+    now: float | None = None,
+) -> PhasedIntervalTrigger:
+    """
+    构建带相位偏移与抖动的间隔触发器。
+
+    首次触发为注册后至少一个间隔、且落在该任务相位上的时间点；
+    jitter_seconds 为 None 时取间隔的 5%（最多 30 秒），且不超过半个间隔。
+    """
+    period = interval_seconds(trigger_kwargs) or 60
+    now = time.time() if now is None else now
+    offset = job_phase_offset(job_id, period)
+    start = math.ceil((now + period - offset) / period) * period + offset
+    jitter = _default_interval_jitter(period) if jitter_seconds is None else jitter_seconds
+    jitter = min(jitter or 0, period // 2) or None
+    return PhasedIntervalTrigger(
+        **trigger_kwargs,
+        start_date=datetime.fromtimestamp(start).astimezone(),
+        jitter=jitter,
+    )
+
 
 def _interval_trigger_kwargs(
     seconds: int | None,
@@ -115,6 +208,11 @@ class TaskScheduler:
         self._shutdown_event = asyncio.Event()
         self._shutdown_signal_count = 0
         self._signals_installed = False
+        # job_id -> 注册时指定的抖动上限，热重载重建触发器时沿用
+        self._job_jitter: dict[str, int | None] = {}
+        self.scheduler.add_listener(
+            self._on_job_skipped, EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED
+        )
 
     def add_job(
         self,
@@ -147,6 +245,10 @@ class TaskScheduler:
         minutes: int | None = None,
         hours: int | None = None,
         job_id: str | None = None,
+        *,
+        overrun_policy: str = OVERRUN_SKIP,
+        max_concurrent: int = 1,
+        jitter_seconds: int | None = None,
     ):
         """
         添加间隔任务
@@ -157,17 +259,26 @@ class TaskScheduler:
             minutes: 间隔分钟数
             hours: 间隔小时数
             job_id: 任务ID
+            overrun_policy: 上一轮仍在执行时的处理策略（见 src.jobs.registry.OVERRUN_*）
+            max_concurrent: concurrent 策略的并发上限
+            jitter_seconds: 每次触发的随机延迟上限，None 时取间隔的 5%
 
         注意：seconds、minutes、hours 至少需要提供一个，如果提供多个，优先级为 seconds > minutes > hours
+
+        各任务按 job_id 错开固定相位，避免同间隔的任务在同一秒触发。
         """
         trigger_kwargs = _interval_trigger_kwargs(
             seconds, minutes, hours, default_minutes_if_all_none=1
         ) or {"minutes": 1}
+        job_id = job_id or func.__name__
+        self._job_jitter[job_id] = jitter_seconds
+        period = interval_seconds(trigger_kwargs) or 60
 
         self.add_job(
             func,
-            trigger=IntervalTrigger(**trigger_kwargs),
+            trigger=build_interval_trigger(job_id, trigger_kwargs, jitter_seconds),
             job_id=job_id,
+            **_overrun_job_options(overrun_policy, max_concurrent, max(1, period // 2)),
         )
 
     def add_cron_job(
@@ -179,6 +290,10 @@ class TaskScheduler:
         month: str = "*",
         day_of_week: str = "*",
         job_id: str | None = None,
+        *,
+        overrun_policy: str = OVERRUN_SKIP,
+        max_concurrent: int = 1,
+        jitter_seconds: int | None = None,
     ):
         """
         添加Cron任务
@@ -191,7 +306,12 @@ class TaskScheduler:
             month: 月份
             day_of_week: 星期几
             job_id: 任务ID
+            overrun_policy: 上一轮仍在执行时的处理策略（见 src.jobs.registry.OVERRUN_*）
+            max_concurrent: concurrent 策略的并发上限
+            jitter_seconds: 每次触发的随机延迟上限，默认不延迟
         """
+        job_id = job_id or func.__name__
+        self._job_jitter[job_id] = jitter_seconds
         self.add_job(
             func,
             trigger=CronTrigger(
@@ -200,8 +320,10 @@ class TaskScheduler:
                 day=day,
                 month=month,
                 day_of_week=day_of_week,
+                jitter=jitter_seconds or None,
             ),
             job_id=job_id,
+            **_overrun_job_options(overrun_policy, max_concurrent, CRON_MISFIRE_GRACE_SECONDS),
         )
 
     def update_interval_job(
@@ -235,11 +357,13 @@ class TaskScheduler:
             self.logger.warning("未提供有效的间隔时间参数，无法更新任务 %s", job_id)
             return None
 
-        # 创建新的触发器
-        new_trigger = IntervalTrigger(**trigger_kwargs)
+        # 创建新的触发器（沿用相位偏移与注册时的抖动设置）
+        new_trigger = build_interval_trigger(job_id, trigger_kwargs, self._job_jitter.get(job_id))
+        period = interval_seconds(trigger_kwargs) or 60
 
         # 更新任务的触发器
         job.reschedule(trigger=new_trigger)
+        job.modify(misfire_grace_time=max(1, period // 2))
         # 返回更新信息，不直接输出日志
         if seconds is not None:
             return f"{job_id}(间隔: {seconds}秒)"
@@ -259,6 +383,16 @@ class TaskScheduler:
             self.logger.warning("暂停任务 %s 失败: %s", job_id, e)
             return False
 
+    def remove_job(self, job_id: str) -> bool:
+        """移除指定任务，用于按需加载的任务按实际注册参数重建时。"""
+        try:
+            self.scheduler.remove_job(job_id)
+            self.logger.debug("已移除任务: %s", job_id)
+            return True
+        except Exception as e:
+            self.logger.warning("移除任务 %s 失败: %s", job_id, e)
+            return False
+
     def resume_job(self, job_id: str) -> bool:
         """恢复指定任务，用于监控启用开关打开时。"""
         try:
@@ -315,6 +449,7 @@ class TaskScheduler:
             day=new_day,
             month=new_month,
             day_of_week=new_day_of_week,
+            jitter=self._job_jitter.get(job_id) or None,
         )
 
         # 更新任务的触发器
@@ -322,6 +457,11 @@ class TaskScheduler:
         # 返回更新信息，不直接输出日志
         return f"{job_id}(执行时间: {new_hour}:{new_minute})"
 
+    def _on_job_skipped(self, event: JobEvent) -> None:
+        """上一轮仍在执行（max_instances）或错过触发时间时计入跳过次数。"""
+        reason = "max_instances" if event.code == EVENT_JOB_MAX_INSTANCES else "misfire"
+        record_job_skip(event.job_id, reason)
+
     def start(self):
         """启动调度器"""
         self.scheduler.start()
@@ -0,0 +1,166 @@
+"""自适应轮询：按各监控目标的实际变化频率决定本轮是否轮询，并按平台限制请求速率。
+
+调度器的 ``*_monitor_interval_seconds`` 仍是监控任务的触发周期，也是单个目标的最短轮询间隔；
+每轮只轮询「到期」的目标：
+
+- 本轮有变化（开播/下播、新动态等）或处于热状态（正在直播）的目标，下次仍按最短间隔轮询；
+- 没变化的目标每轮将间隔翻倍，直到 ``app.adaptive_polling_max_interval_seconds``；
+- 每个平台的请求按 ``app.adaptive_polling_requests_per_second`` 匀速发出，单轮轮询的目标数
+  也以此为上限（触发周期内发得完），超出部分按逾期程度排序、顺延到下一轮。
+
+状态保存在常驻监控实例中（见 ``src.monitors.base``）；每轮新建实例时每轮都会轮询全部目标。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.core.metrics import get_metrics_registry
+
+# 无变化时间隔的增长倍数
+ADAPTIVE_POLL_BACKOFF = 2.0
+
+_metrics = get_metrics_registry()
+TARGETS_POLLED = _metrics.counter(
+    "monitor_targets_polled_total",
+    "Monitor targets polled under adaptive polling.",
+    ("platform",),
+)
+TARGETS_DEFERRED = _metrics.counter(
+    "monitor_targets_deferred_total",
+    "Monitor targets skipped in a tick (not_due = backed off, budget = rate budget exhausted).",
+    ("platform", "reason"),
+)
+
+
+@dataclass
+class _TargetState:
+    interval: float
+    next_due: float
+    selected_at: float | None = None
+    changes: int = 0
+
+
+class AdaptivePollSchedule:
+    """单个监控实例内各目标的轮询间隔与下次到期时间。"""
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = ADAPTIVE_POLL_BACKOFF,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self._targets: dict[str, _TargetState] = {}
+
+    def configure(self, min_interval: float, max_interval: float) -> None:
+        """更新间隔上下限（热重载），已有目标的间隔收敛到新的范围内。"""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        for state in self._targets.values():
+            state.interval = min(max(state.interval, self.min_interval), self.max_interval)
+
+    def select(
+        self,
+        targets: Iterable[str],
+        budget: int | None = None,
+        now: float | None = None,
+    ) -> tuple[list[str], int, int]:
+        """
+        挑选本轮应轮询的目标。
+
+        新目标优先，其次按逾期程度（逾期时长 / 当前间隔）从高到低；已从配置移除的目标
+        同时被清理。
+
+        Returns:
+            (本轮目标, 未到期跳过数, 超出预算顺延数)
+        """
+        now = time.monotonic() if now is None else now
+        targets = list(dict.fromkeys(targets))
+        for removed in self._targets.keys() - set(targets):
+            del self._targets[removed]
+
+        # 调度触发存在抖动，提前半个最短间隔内到期的目标也算本轮到期
+        horizon = now + self.min_interval / 2
+        due: list[tuple[float, str]] = []
+        for target in targets:
+            state = self._targets.get(target)
+            if state is None:
+                due.append((math.inf, target))
+            elif state.next_due <= horizon:
+                due.append(((now - state.next_due) / state.interval, target))
+        not_due = len(targets) - len(due)
+
+        due.sort(key=lambda item: item[0], reverse=True)
+        if budget is not None and len(due) > budget:
+            due, deferred = due[:budget], len(due) - budget
+        else:
+            deferred = 0
+        selected = [target for _, target in due]
+        for target in selected:
+            state = self._targets.get(target)
+            if state is None:
+                state = self._targets[target] = _TargetState(self.min_interval, now)
+            state.selected_at = now
+        return selected, not_due, deferred
+
+    def record(
+        self,
+        target: str,
+        *,
+        changed: bool,
+        hot: bool = False,
+        now: float | None = None,
+    ) -> float:
+        """记录一次轮询结果并返回该目标新的轮询间隔。"""
+        now = time.monotonic() if now is None else now
+        state = self._targets.get(target)
+        if state is None:
+            state = self._targets[target] = _TargetState(self.min_interval, now)
+        if changed:
+            state.changes += 1
+        if changed or hot:
+            state.interval = self.min_interval
+        else:
+            state.interval = min(state.interval * self.backoff, self.max_interval)
+        started = state.selected_at if state.selected_at is not None else now
+        state.next_due = started + state.interval
+        state.selected_at = None
+        return state.interval
+
+    def interval(self, target: str) -> float | None:
+        state = self._targets.get(target)
+        return state.interval if state else None
+
+
+class PlatformRateLimiter:
+    """进程级按平台的请求限速：同一平台的请求按给定速率均匀排开。"""
+
+    def __init__(self):
+        self._next_slot: dict[str, float] = {}
+
+    async def acquire(self, platform: str, rate: float, cost: float = 1) -> None:
+        """等待到该平台下一个可用时间片；cost 为本次将发出的请求数。"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot.get(platform, now))
+        self._next_slot[platform] = slot + cost / rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_rate_limiter: PlatformRateLimiter | None = None
+
+
+def get_platform_rate_limiter() -> PlatformRateLimiter:
+    """获取进程级平台请求限速器。"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = PlatformRateLimiter()
+    return _rate_limiter
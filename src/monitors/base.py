@@ -1,11 +1,22 @@
 """监控任务基类 - 提供可扩展的监控框架"""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
 import aiohttp
 from aiohttp import ClientSession
 
+from src.core.change_feed import COOKIE_EXPIRED, COOKIE_RESTORED, get_change_feed
+from src.core.session_pool import get_session_registry
+from src.monitors.adaptive_polling import (
+    TARGETS_DEFERRED,
+    TARGETS_POLLED,
+    AdaptivePollSchedule,
+    get_platform_rate_limiter,
+)
 from src.push_channel.manager import UnifiedPushManager, build_push_manager
 from src.settings.config import AppConfig
 from src.storage.cookie_cache import get_cookie_cache
@@ -23,6 +34,9 @@ class CookieExpiredError(Exception):
 class BaseMonitor(ABC):
     """监控任务基类 - 所有监控任务都应该继承此类"""
 
+    # 轮询单个目标平均发出的请求数，用于按 adaptive_polling_requests_per_second 限速
+    poll_requests_per_target = 1
+
     def __init__(self, config: AppConfig, session: ClientSession | None = None):
         """
         初始化监控器
@@ -37,11 +51,60 @@ class BaseMonitor(ABC):
         self.db: AsyncDatabase | None = None
         self.push: UnifiedPushManager | None = None
         self.logger = logging.getLogger(self.__class__.__name__)
+        # 常驻实例模式下的状态：内存中的旧数据是否需要在下一轮前从数据库重新加载
+        self._state_stale = False
+        self._run_lock = asyncio.Lock()
+        # run_tick 期间暂存的状态变更事件，本轮事务提交成功后再发布
+        self._pending_changes: list[tuple[str, str, dict]] | None = None
+        # 自适应轮询：各目标的轮询间隔，以及本轮发布过变更事件的目标
+        self._poll_schedule: AdaptivePollSchedule | None = None
+        self._changed_targets: set[str] = set()
+        # 最近一次创建推送管理器时的推送配置；每轮执行都会替换 self.config，热重载时据此比较
+        self._push_inputs: tuple | None = None
 
     async def _get_session(self) -> ClientSession:
         """获取或创建HTTP会话"""
-        if self.session is None:
-            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        return await self._acquire_session()
+
+    async def _acquire_session(
+        self,
+        headers: Mapping[str, str | None] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        connector_factory: Callable[..., aiohttp.TCPConnector] | None = None,
+    ) -> ClientSession:
+        """
+        获取HTTP会话：已有会话时热替换 Header；运行时启用共享会话池时按平台借用，
+        否则创建由本实例负责关闭的独立会话。
+
+        Args:
+            headers: 平台默认请求头（Cookie/User-Agent 等），值为 None 表示移除
+            timeout: 新建会话时使用的超时配置，默认总超时 10 秒
+            connector_factory: 新建会话时的连接器工厂，如 create_certifi_connector
+        """
+        if self.session is not None and not getattr(self.session, "closed", False):
+            for key, value in (headers or {}).items():
+                if value is None:
+                    self.session.headers.pop(key, None)
+                else:
+                    self.session.headers[key] = value
+            return self.session
+
+        timeout = timeout or aiohttp.ClientTimeout(total=10)
+        registry = get_session_registry()
+        if registry.active:
+            self.session = await registry.acquire(
+                self.platform_name,
+                headers=headers,
+                timeout=timeout,
+                connector_factory=connector_factory,
+            )
+            self._own_session = False
+        else:
+            self.session = aiohttp.ClientSession(
+                headers={k: v for k, v in (headers or {}).items() if v is not None},
+                timeout=timeout,
+                connector=connector_factory() if connector_factory else None,
+            )
             self._own_session = True
         return self.session
 
@@ -50,9 +113,12 @@ class BaseMonitor(ABC):
         self.db = AsyncDatabase()
         await self.db.initialize()
 
-        session = await self._get_session()
+        await self._build_push()
 
-        # 初始化推送通道，按任务配置的通道名称过滤
+    async def _build_push(self) -> None:
+        """按当前配置（重新）创建推送管理器，按任务配置的通道名称过滤"""
+        session = await self._get_session()
+        self._push_inputs = self._current_push_inputs()
         self.push = await build_push_manager(
             self.config.push_channel_list,
             session,
@@ -62,10 +128,100 @@ class BaseMonitor(ABC):
         if self.push is None:
             self.logger.warning("未配置任何推送通道，推送功能将不可用")
 
+    def _current_push_inputs(self) -> tuple:
+        return (self.config.push_channel_list, self.push_channel_names)
+
+    async def load_old_info(self):
+        """从数据库加载旧数据到内存 - 有状态的子类应重写此方法"""
+        pass
+
+    async def apply_config(self, config: AppConfig) -> None:
+        """
+        热重载：将新配置应用到常驻实例
+
+        推送通道配置与创建推送管理器时不同则重建（与上一次 self.config 比较不可靠：
+        每轮执行都会换成最新配置）；监控目标可能已被 sync_config_to_db
+        同步删除，因此标记内存旧数据在下一轮执行前重新加载。
+        """
+        self.config = config
+        self._state_stale = True
+        if self._push_inputs is not None and self._current_push_inputs() != self._push_inputs:
+            if self.push:
+                await self.push.close()
+            await self._build_push()
+
+    async def run_tick(self) -> None:
+        """
+        执行一轮 run()，本轮所有写库操作合并为单个事务提交
+
+        写库在提交前已按成功处理（内存旧数据同步更新），提交失败时标记旧数据
+        在下一轮执行前从数据库重新加载。推送前会先提交已排队的写库（见 send_push_news），
+        写库未落盘时不发送推送，避免崩溃或提交失败后下一轮重复推送。
+        """
+        if self.db is None:
+            await self.run()
+            return
+        self._pending_changes = []
+        try:
+            async with self.db.batch() as batch:
+                await self.run()
+        finally:
+            pending, self._pending_changes = self._pending_changes, None
+        if batch.succeeded is False:
+            self._state_stale = True
+            self.logger.warning(
+                "%s 本轮写库失败（%d 条），下一轮将重新加载旧数据", self.monitor_name, len(batch)
+            )
+            return
+        feed = get_change_feed()
+        for platform, event_type, kwargs in pending:
+            feed.publish(platform, event_type, **kwargs)
+
+    def publish_change(
+        self,
+        event_type: str,
+        key: str = "",
+        *,
+        name: str = "",
+        platform: str | None = None,
+        **data,
+    ) -> None:
+        """
+        发布状态变更事件（见 src.core.change_feed）；platform 默认取 platform_name
+
+        run_tick 内发布的事件会等本轮事务提交后再送达订阅者，避免客户端读到未提交的数据。
+        """
+        kwargs = {"key": key, "name": name, "data": data}
+        platform = platform or self.platform_name
+        if self._poll_schedule is not None:
+            self._changed_targets.add(key)
+        if self._pending_changes is not None:
+            self._pending_changes.append((platform, event_type, kwargs))
+        else:
+            get_change_feed().publish(platform, event_type, **kwargs)
+
+    def _on_tick_finished(self) -> None:
+        """
+        常驻实例一轮执行结束后的状态收尾
+
+        首轮（空表）执行完成后内存中已有数据，后续新增目标应正常推送。
+        拥有多个首次标记的子类应重写此方法。
+        """
+        if getattr(self, "_is_first_time", False):
+            self._is_first_time = not getattr(self, "old_data_dict", None)
+
     async def send_push_news(self, **kwargs) -> None:
-        """发送推送消息；未配置推送通道时静默跳过。"""
+        """
+        发送推送消息；未配置推送通道时静默跳过。
+
+        run_tick 内先提交本轮已排队的写库，提交失败时不推送，下一轮重新加载旧数据后再检测。
+        """
         if not self.push:
             return
+        if self.db is not None and not await self.db.flush_batch():
+            self._state_stale = True
+            self.logger.warning("%s 写库失败，跳过本次推送，下一轮将重新检测", self.monitor_name)
+            return
         await self.push.send_news(**kwargs)
 
     def skip_if_no_targets(self, targets: list[str] | None, target_label: str) -> bool:
@@ -75,6 +231,72 @@ class BaseMonitor(ABC):
         self.logger.warning("%s 没有配置%s，跳过本次执行", self.monitor_name, target_label)
         return True
 
+    @property
+    def poll_interval_seconds(self) -> int:
+        """监控任务的触发周期（秒），即自适应轮询的最短间隔。"""
+        return getattr(self.config, f"{self.platform_name}_monitor_interval_seconds", 60)
+
+    def is_hot_target(self, target: str) -> bool:
+        """目标是否处于热状态（如正在直播），热目标始终按最短间隔轮询；子类按需重写。"""
+        return False
+
+    def select_poll_targets(self, targets: list[str]) -> list[str]:
+        """
+        自适应轮询：返回本轮到期且在平台请求预算内的目标（未启用时原样返回全部目标）。
+
+        单轮预算为 requests_per_second × 触发周期 / poll_requests_per_target，
+        保证本轮请求在下一次触发前发完。
+        """
+        if not self.config.adaptive_polling_enable:
+            self._poll_schedule = None
+            return list(targets)
+        min_interval = self.poll_interval_seconds
+        max_interval = self.config.adaptive_polling_max_interval_seconds
+        if self._poll_schedule is None:
+            self._poll_schedule = AdaptivePollSchedule(min_interval, max_interval)
+        else:
+            self._poll_schedule.configure(min_interval, max_interval)
+        rate = self.config.adaptive_polling_requests_per_second
+        budget = max(1, int(rate * min_interval / self.poll_requests_per_target))
+        selected, not_due, deferred = self._poll_schedule.select(targets, budget)
+        platform = self.platform_name
+        if not_due:
+            TARGETS_DEFERRED.inc(not_due, platform=platform, reason="not_due")
+        if deferred:
+            TARGETS_DEFERRED.inc(deferred, platform=platform, reason="budget")
+            self.logger.info(
+                "%s 本轮请求预算已满，%d 个目标顺延到下一轮", self.monitor_name, deferred
+            )
+        self.logger.debug(
+            "%s 自适应轮询：本轮 %d 个目标，%d 个未到期",
+            self.monitor_name,
+            len(selected),
+            not_due,
+        )
+        return selected
+
+    async def poll_target(self, target: str, process: Callable[[str], Awaitable[Any]]) -> Any:
+        """
+        轮询单个目标：自适应轮询启用时按平台限速，并按本次是否发布变更事件更新其轮询间隔。
+
+        process 抛出异常时不更新间隔，该目标下一轮仍会被轮询。
+        """
+        schedule = self._poll_schedule
+        if schedule is None:
+            return await process(target)
+        await get_platform_rate_limiter().acquire(
+            self.platform_name,
+            self.config.adaptive_polling_requests_per_second,
+            self.poll_requests_per_target,
+        )
+        self._changed_targets.discard(target)
+        result = await process(target)
+        TARGETS_POLLED.inc(platform=self.platform_name)
+        changed = target in self._changed_targets
+        self._changed_targets.discard(target)
+        schedule.record(target, changed=changed, hot=self.is_hot_target(target))
+        return result
+
     async def close(self):
         """关闭资源"""
         if self.db:
@@ -145,6 +367,7 @@ class BaseMonitor(ABC):
         # 首次检测到Cookie失效，记录日志并标记
         self.logger.error("检测到Cookie失效: %s", error)
         await cookie_cache.mark_expired(platform)
+        get_change_feed().publish(platform, COOKIE_EXPIRED, data={"message": str(error)})
 
         # 只有在未发送过提醒时才发送
         if not cookie_cache.is_notified(platform):
@@ -157,6 +380,7 @@ class BaseMonitor(ABC):
         if not cookie_cache.is_valid(platform):
             await cookie_cache.mark_valid(platform)
             self.logger.info("%s Cookie已恢复有效", self.monitor_name)
+            get_change_feed().publish(platform, COOKIE_RESTORED)
 
     async def push_cookie_expired_notification(self) -> None:
         """
@@ -179,3 +403,78 @@ class BaseMonitor(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口"""
         await self.close()
+
+
+# ---------------------------------------------------------------------------
+# 常驻实例模式：由 main.py 的运行时启用，监控实例跨调度存活，
+# 旧数据保留在内存中并随写库同步更新（write-through），避免每轮全表加载。
+# 未启用时（QL 单次运行、测试等）保持每轮新建并销毁实例的行为。
+# ---------------------------------------------------------------------------
+
+_live_monitors: dict[type[BaseMonitor], BaseMonitor] = {}
+_persistent_monitors_enabled = False
+
+
+def enable_persistent_monitors(enabled: bool = True) -> None:
+    """启用/停用监控常驻实例模式。"""
+    global _persistent_monitors_enabled
+    _persistent_monitors_enabled = enabled
+
+
+def live_monitors() -> list[BaseMonitor]:
+    """当前常驻的监控实例列表。"""
+    return list(_live_monitors.values())
+
+
+async def run_monitor(monitor_cls: type[BaseMonitor], config: AppConfig) -> None:
+    """
+    执行一轮监控：常驻模式下复用已初始化的实例，否则每轮新建并关闭。
+
+    Args:
+        monitor_cls: 监控器类
+        config: 本轮使用的应用配置
+    """
+    if not _persistent_monitors_enabled:
+        async with monitor_cls(config) as monitor:
+            await monitor.run_tick()
+        return
+
+    monitor = _live_monitors.get(monitor_cls)
+    if monitor is None:
+        monitor = monitor_cls(config)
+        try:
+            await monitor.initialize()
+        except Exception:
+            await monitor.close()
+            raise
+        _live_monitors[monitor_cls] = monitor
+    else:
+        monitor.config = config
+
+    # 调度与手动触发可能重叠，同一实例的执行串行化
+    async with monitor._run_lock:
+        if monitor._state_stale:
+            monitor._state_stale = False
+            await monitor.load_old_info()
+        await monitor.run_tick()
+        monitor._on_tick_finished()
+
+
+async def apply_config_to_live_monitors(config: AppConfig) -> None:
+    """配置热重载时将新配置应用到所有常驻实例。"""
+    for monitor in live_monitors():
+        try:
+            await monitor.apply_config(config)
+        except Exception as e:
+            monitor.logger.error("应用新配置到常驻监控实例失败: %s", e)
+
+
+async def close_live_monitors() -> None:
+    """关闭并移除全部常驻实例（程序退出时调用）。"""
+    monitors = live_monitors()
+    _live_monitors.clear()
+    for monitor in monitors:
+        try:
+            await monitor.close()
+        except Exception as e:
+            monitor.logger.debug("关闭常驻监控实例失败: %s", e)
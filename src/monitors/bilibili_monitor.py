@@ -5,11 +5,11 @@ import logging
 import time
 from collections import deque
 
-import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
+from src.core.change_feed import LIVE_END, LIVE_START, NEW_POST, TARGET_ADDED
 from src.jobs.registry import register_monitor
-from src.monitors.base import BaseMonitor
+from src.monitors.base import BaseMonitor, run_monitor
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
 
 BILIBILI_USER_AGENT = (
@@ -22,6 +22,9 @@ DEQUE_LEN = 5
 class BilibiliMonitor(BaseMonitor):
     """哔哩哔哩监控类（动态检测 + 开播/下播检测）"""
 
+    # 每个 UID 依次查询动态与直播状态
+    poll_requests_per_target = 2
+
     def __init__(self, config: AppConfig, session: ClientSession | None = None):
         super().__init__(config, session)
         self.bilibili_config = config.get_bilibili_config()
@@ -36,19 +39,14 @@ class BilibiliMonitor(BaseMonitor):
         await self.load_old_info()
 
     async def _get_session(self) -> ClientSession:
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": BILIBILI_USER_AGENT,
-                    "Accept": "application/json, text/plain, */*",
-                    "Referer": "https://space.bilibili.com/",
-                },
-                timeout=ClientTimeout(total=15),
-            )
-            self._own_session = True
-        else:
-            self.session.headers["User-Agent"] = BILIBILI_USER_AGENT
-        return self.session
+        return await self._acquire_session(
+            headers={
+                "User-Agent": BILIBILI_USER_AGENT,
+                "Accept": "application/json, text/plain, */*",
+                "Referer": "https://space.bilibili.com/",
+            },
+            timeout=ClientTimeout(total=15),
+        )
 
     async def load_old_info(self):
         try:
@@ -75,6 +73,13 @@ class BilibiliMonitor(BaseMonitor):
             self._is_first_time_dynamic = True
             self._is_first_time_live = True
 
+    def _on_tick_finished(self) -> None:
+        """常驻实例：首轮执行后动态/直播均已有基线数据，后续变化正常推送。"""
+        if self._is_first_time_dynamic:
+            self._is_first_time_dynamic = not self.old_dynamic_dict
+        if self._is_first_time_live:
+            self._is_first_time_live = not self.old_live_dict
+
     async def _get_buvid3(self) -> str | None:
         """获取 buvid3（可选）"""
         if self._buvid3:
@@ -142,7 +147,7 @@ class BilibiliMonitor(BaseMonitor):
                 "INSERT OR REPLACE INTO bilibili_dynamic "
                 "(uid, uname, dynamic_id, dynamic_text) VALUES (%(uid)s, %(uname)s, %(dynamic_id)s, %(dynamic_text)s)"
             )
-            await self.db.execute_update(
+            if await self.db.execute_update(
                 sql,
                 {
                     "uid": uid,
@@ -150,7 +155,8 @@ class BilibiliMonitor(BaseMonitor):
                     "dynamic_id": dynamic_id,
                     "dynamic_text": "",
                 },
-            )
+            ):
+                self.publish_change(TARGET_ADDED, uid, name=uname, platform="bilibili_dynamic")
             return
 
         if dynamic_id in self.old_dynamic_dict[uid]:
@@ -213,7 +219,7 @@ class BilibiliMonitor(BaseMonitor):
             "UPDATE bilibili_dynamic SET uname=%(uname)s, dynamic_id=%(dynamic_id)s, dynamic_text=%(dynamic_text)s "
             "WHERE uid=%(uid)s"
         )
-        await self.db.execute_update(
+        if await self.db.execute_update(
             sql,
             {
                 "uid": uid,
@@ -221,7 +227,8 @@ class BilibiliMonitor(BaseMonitor):
                 "dynamic_id": dynamic_id,
                 "dynamic_text": content,
             },
-        )
+        ):
+            self.publish_change(NEW_POST, uid, name=uname, platform="bilibili_dynamic")
 
         self.logger.info(f"【B站-{uname}】{title_msg}📺")
         if not self._is_first_time_dynamic:
@@ -283,7 +290,7 @@ class BilibiliMonitor(BaseMonitor):
                 "INSERT OR REPLACE INTO bilibili_live (uid, uname, room_id, is_live) "
                 "VALUES (%(uid)s, %(uname)s, %(room_id)s, %(is_live)s)"
             )
-            await self.db.execute_update(
+            if await self.db.execute_update(
                 sql,
                 {
                     "uid": uid,
@@ -291,7 +298,8 @@ class BilibiliMonitor(BaseMonitor):
                     "room_id": str(room_id),
                     "is_live": status_num,
                 },
-            )
+            ):
+                self.publish_change(TARGET_ADDED, uid, name=uname, platform="bilibili_live")
             self.logger.info(f"【B站-{uname}】直播初始化")
             return
 
@@ -305,7 +313,7 @@ class BilibiliMonitor(BaseMonitor):
             "UPDATE bilibili_live SET uname=%(uname)s, room_id=%(room_id)s, is_live=%(is_live)s "
             "WHERE uid=%(uid)s"
         )
-        await self.db.execute_update(
+        if await self.db.execute_update(
             sql,
             {
                 "uid": uid,
@@ -313,7 +321,13 @@ class BilibiliMonitor(BaseMonitor):
                 "room_id": str(room_id),
                 "is_live": status_num,
             },
-        )
+        ):
+            self.publish_change(
+                LIVE_START if status_num == "1" else LIVE_END,
+                uid,
+                name=uname,
+                platform="bilibili_live",
+            )
 
         res = 1 if status_num == "1" else 0
         status_msg = "开播啦📺📺📺" if res == 1 else "下播了💤💤💤"
@@ -350,6 +364,11 @@ class BilibiliMonitor(BaseMonitor):
         except Exception as e:
             self.logger.error(f"推送失败: {e}")
 
+    def is_hot_target(self, target: str) -> bool:
+        """正在直播的 UID 按最短间隔轮询，以便及时发现下播。"""
+        old = self.old_live_dict.get(target)
+        return bool(old) and len(old) > 3 and old[3] == "1"
+
     @property
     def platform_name(self) -> str:
         return "bilibili"
@@ -373,22 +392,25 @@ class BilibiliMonitor(BaseMonitor):
 
         semaphore = asyncio.Semaphore(self.bilibili_config.concurrency)
 
+        async def poll_uid(uid: str):
+            errors = []
+            try:
+                await self.query_dynamic(uid)
+            except Exception as e:
+                errors.append(f"动态:{e}")
+            await asyncio.sleep(1)
+            try:
+                await self.query_live(uid)
+            except Exception as e:
+                errors.append(f"直播:{e}")
+            if errors:
+                self.logger.warning(f"UID {uid}: {' '.join(errors)}")
+
         async def process_uid(uid: str):
             async with semaphore:
-                errors = []
-                try:
-                    await self.query_dynamic(uid)
-                except Exception as e:
-                    errors.append(f"动态:{e}")
-                await asyncio.sleep(1)
-                try:
-                    await self.query_live(uid)
-                except Exception as e:
-                    errors.append(f"直播:{e}")
-                if errors:
-                    self.logger.warning(f"UID {uid}: {' '.join(errors)}")
-
-        tasks = [process_uid(uid) for uid in self.bilibili_config.uids]
+                await self.poll_target(uid, poll_uid)
+
+        tasks = [process_uid(uid) for uid in self.select_poll_targets(self.bilibili_config.uids)]
         await asyncio.gather(*tasks, return_exceptions=True)
         self.logger.debug("执行完成 %s", self.monitor_name)
 
@@ -400,8 +422,7 @@ class BilibiliMonitor(BaseMonitor):
 async def run_bilibili_monitor() -> None:
     config = get_config(reload=True)
     logging.getLogger(__name__).debug("哔哩哔哩监控：已重新加载配置文件")
-    async with BilibiliMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(BilibiliMonitor, config)
 
 
 def _get_bilibili_trigger_kwargs(config: AppConfig) -> dict:
@@ -5,11 +5,11 @@ import json
 import logging
 from datetime import datetime
 
-import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
+from src.core.change_feed import LIVE_END, LIVE_START, TARGET_ADDED
 from src.core.http import fetch_hitokoto_quote
-from src.monitors.base import BaseMonitor
+from src.monitors.base import BaseMonitor, run_monitor
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
 
 DOUYIN_USER_AGENT = (
@@ -58,19 +58,14 @@ class DouyinMonitor(BaseMonitor):
             self.logger.debug(f"获取 ttwid 失败（可忽略）: {e}")
 
     async def _get_session(self) -> ClientSession:
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": DOUYIN_USER_AGENT,
-                    "Accept": "application/json",
-                    "Referer": "https://live.douyin.com/",
-                },
-                timeout=ClientTimeout(total=10),
-            )
-            self._own_session = True
-        else:
-            self.session.headers["User-Agent"] = DOUYIN_USER_AGENT
-        return self.session
+        return await self._acquire_session(
+            headers={
+                "User-Agent": DOUYIN_USER_AGENT,
+                "Accept": "application/json",
+                "Referer": "https://live.douyin.com/",
+            },
+            timeout=ClientTimeout(total=10),
+        )
 
     async def load_old_info(self):
         try:
@@ -173,7 +168,11 @@ class DouyinMonitor(BaseMonitor):
                     "UPDATE douyin SET name=%(name)s, is_live=%(is_live)s "
                     "WHERE douyin_id=%(douyin_id)s"
                 )
-                await self.db.execute_update(sql, data)
+                if await self.db.execute_update(sql, data):
+                    self.old_data_dict[douyin_id] = (douyin_id, data["name"], data["is_live"])
+                    self.publish_change(
+                        LIVE_START if res == 1 else LIVE_END, douyin_id, name=data["name"]
+                    )
 
                 status_msg = "开播啦🎬🎬🎬" if res == 1 else "下播了💤💤💤"
                 self.logger.info(f"{data['name']} {status_msg}")
@@ -184,7 +183,9 @@ class DouyinMonitor(BaseMonitor):
                 "INSERT INTO douyin (douyin_id, name, is_live) "
                 "VALUES (%(douyin_id)s, %(name)s, %(is_live)s)"
             )
-            await self.db.execute_insert(sql, data)
+            if await self.db.execute_insert(sql, data):
+                self.old_data_dict[douyin_id] = (douyin_id, data["name"], data["is_live"])
+                self.publish_change(TARGET_ADDED, douyin_id, name=data["name"])
 
             if self._is_first_time:
                 self.logger.info(f"新录入主播: {data['name']}（首次创建数据库，跳过推送）")
@@ -223,6 +224,11 @@ class DouyinMonitor(BaseMonitor):
         except Exception as e:
             self.logger.error(f"推送失败: {e}")
 
+    def is_hot_target(self, target: str) -> bool:
+        """正在直播的目标按最短间隔轮询，以便及时发现下播。"""
+        old_info = self.old_data_dict.get(target)
+        return bool(old_info) and len(old_info) > 2 and str(old_info[2]) == "1"
+
     @property
     def platform_name(self) -> str:
         return "douyin"
@@ -248,14 +254,15 @@ class DouyinMonitor(BaseMonitor):
 
         async def process_with_semaphore(did: str):
             async with semaphore:
-                return await self.process_room(did)
+                return await self.poll_target(did, self.process_room)
 
-        tasks = [process_with_semaphore(did) for did in self.douyin_config.douyin_ids]
+        douyin_ids = self.select_poll_targets(self.douyin_config.douyin_ids)
+        tasks = [process_with_semaphore(did) for did in douyin_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                self.logger.error(f"处理 {self.douyin_config.douyin_ids[i]} 时出错: {result}")
+                self.logger.error(f"处理 {douyin_ids[i]} 时出错: {result}")
         self.logger.debug("执行完成 %s", self.monitor_name)
 
     @property
@@ -266,8 +273,7 @@ class DouyinMonitor(BaseMonitor):
 async def run_douyin_monitor() -> None:
     config = get_config(reload=True)
     logging.getLogger(__name__).debug("抖音监控：已重新加载配置文件")
-    async with DouyinMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(DouyinMonitor, config)
 
 
 def _get_douyin_trigger_kwargs(config: AppConfig) -> dict:
@@ -5,11 +5,11 @@ import json
 import logging
 from datetime import datetime
 
-import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
+from src.core.change_feed import LIVE_END, LIVE_START, TARGET_ADDED
 from src.core.http import fetch_hitokoto_quote
-from src.monitors.base import BaseMonitor
+from src.monitors.base import BaseMonitor, run_monitor
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
 
 DOUYU_USER_AGENT = (
@@ -32,15 +32,10 @@ class DouyuMonitor(BaseMonitor):
         await self.load_old_info()
 
     async def _get_session(self) -> ClientSession:
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={"User-Agent": DOUYU_USER_AGENT},
-                timeout=ClientTimeout(total=10),
-            )
-            self._own_session = True
-        else:
-            self.session.headers["User-Agent"] = DOUYU_USER_AGENT
-        return self.session
+        return await self._acquire_session(
+            headers={"User-Agent": DOUYU_USER_AGENT},
+            timeout=ClientTimeout(total=10),
+        )
 
     async def load_old_info(self):
         try:
@@ -105,7 +100,11 @@ class DouyuMonitor(BaseMonitor):
                 self.logger.debug(f"{data['name']} 最近直播状态没变化🐟")
             else:
                 sql = "UPDATE douyu SET name=%(name)s, is_live=%(is_live)s WHERE room=%(room)s"
-                await self.db.execute_update(sql, data)
+                if await self.db.execute_update(sql, data):
+                    self.old_data_dict[room_id] = (room_id, data["name"], data["is_live"])
+                    self.publish_change(
+                        LIVE_START if res == 1 else LIVE_END, room_id, name=data["name"]
+                    )
 
                 status_msg = "开播啦🐟🐟🐟" if res == 1 else "下播了💤💤💤"
                 self.logger.info(f"{data['name']} {status_msg}")
@@ -113,7 +112,9 @@ class DouyuMonitor(BaseMonitor):
                 await self.push_notification(data, res)
         else:
             sql = "INSERT INTO douyu (room, name, is_live) VALUES (%(room)s, %(name)s, %(is_live)s)"
-            await self.db.execute_insert(sql, data)
+            if await self.db.execute_insert(sql, data):
+                self.old_data_dict[room_id] = (room_id, data["name"], data["is_live"])
+                self.publish_change(TARGET_ADDED, room_id, name=data["name"])
 
             if self._is_first_time:
                 self.logger.info(f"新录入主播: {data['name']}（首次创建数据库，跳过推送）")
@@ -150,6 +151,11 @@ class DouyuMonitor(BaseMonitor):
         except Exception as e:
             self.logger.error(f"推送失败: {e}")
 
+    def is_hot_target(self, target: str) -> bool:
+        """正在直播的房间按最短间隔轮询，以便及时发现下播。"""
+        old_info = self.old_data_dict.get(target)
+        return bool(old_info) and len(old_info) > 2 and str(old_info[2]) == "1"
+
     @property
     def platform_name(self) -> str:
         return "douyu"
@@ -175,14 +181,15 @@ class DouyuMonitor(BaseMonitor):
 
         async def process_with_semaphore(room_id: str):
             async with semaphore:
-                return await self.process_room(room_id)
+                return await self.poll_target(room_id, self.process_room)
 
-        tasks = [process_with_semaphore(rid) for rid in self.douyu_config.rooms]
+        rooms = self.select_poll_targets(self.douyu_config.rooms)
+        tasks = [process_with_semaphore(rid) for rid in rooms]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                self.logger.error(f"处理房间 {self.douyu_config.rooms[i]} 时出错: {result}")
+                self.logger.error(f"处理房间 {rooms[i]} 时出错: {result}")
         self.logger.debug("执行完成 %s", self.monitor_name)
 
     @property
@@ -193,8 +200,7 @@ class DouyuMonitor(BaseMonitor):
 async def run_douyu_monitor() -> None:
     config = get_config(reload=True)
     logging.getLogger(__name__).debug("斗鱼监控：已重新加载配置文件")
-    async with DouyuMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(DouyuMonitor, config)
 
 
 def _get_douyu_trigger_kwargs(config: AppConfig) -> dict:
@@ -6,11 +6,11 @@ import logging
 import re
 from datetime import datetime
 
-import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
+from src.core.change_feed import LIVE_END, LIVE_START, TARGET_ADDED
 from src.core.http import fetch_hitokoto_quote
-from src.monitors.base import BaseMonitor, CookieExpiredError
+from src.monitors.base import BaseMonitor, CookieExpiredError, run_monitor
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
 
 # 硬编码的 User-Agent
@@ -44,21 +44,14 @@ class HuyaMonitor(BaseMonitor):
         await self.load_old_info()
 
     async def _get_session(self) -> ClientSession:
-        """获取或创建session"""
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": HUYA_USER_AGENT,
-                    "Cookie": HUYA_COOKIE,
-                },
-                timeout=ClientTimeout(total=10),
-            )
-            self._own_session = True
-        else:
-            # 如果session已存在，更新User-Agent（用于热重载）
-            self.session.headers["User-Agent"] = HUYA_USER_AGENT
-            self.session.headers["Cookie"] = HUYA_COOKIE
-        return self.session
+        """获取共享/独立session，并热替换User-Agent与Cookie（用于热重载）"""
+        return await self._acquire_session(
+            headers={
+                "User-Agent": HUYA_USER_AGENT,
+                "Cookie": HUYA_COOKIE,
+            },
+            timeout=ClientTimeout(total=10),
+        )
 
     async def load_old_info(self):
         """从数据库加载旧信息"""
@@ -158,7 +151,11 @@ class HuyaMonitor(BaseMonitor):
                     "room_pic=%(room_pic)s, avatar_url=%(avatar_url)s "
                     "WHERE room=%(room)s"
                 )
-                await self.db.execute_update(sql, data)
+                if await self.db.execute_update(sql, data):
+                    self.old_data_dict[room_id] = (room_id, data["name"], data["is_live"])
+                    self.publish_change(
+                        LIVE_START if res == 1 else LIVE_END, room_id, name=data["name"]
+                    )
 
                 status_msg = "开播啦🐯🐯🐯" if res == 1 else "下播了🐟🐟🐟"
                 self.logger.info(f"{data['name']} {status_msg}")
@@ -170,7 +167,9 @@ class HuyaMonitor(BaseMonitor):
                 "INSERT INTO huya (room, name, is_live, room_pic, avatar_url) "
                 "VALUES (%(room)s, %(name)s, %(is_live)s, %(room_pic)s, %(avatar_url)s)"
             )
-            await self.db.execute_insert(sql, data)
+            if await self.db.execute_insert(sql, data):
+                self.old_data_dict[room_id] = (room_id, data["name"], data["is_live"])
+                self.publish_change(TARGET_ADDED, room_id, name=data["name"])
 
             if self._is_first_time:
                 self.logger.info(f"新录入主播: {data['name']}（首次创建数据库，跳过推送）")
@@ -241,6 +240,11 @@ class HuyaMonitor(BaseMonitor):
         except Exception as e:
             self.logger.error(f"发送Cookie失效提醒失败: {e}")
 
+    def is_hot_target(self, target: str) -> bool:
+        """正在直播的房间按最短间隔轮询，以便及时发现下播。"""
+        old_info = self.old_data_dict.get(target)
+        return bool(old_info) and len(old_info) > 2 and str(old_info[2]) == "1"
+
     @property
     def platform_name(self) -> str:
         """平台名称"""
@@ -330,15 +334,16 @@ class HuyaMonitor(BaseMonitor):
             async def process_with_semaphore(room_id: str):
                 """使用信号量包装的处理函数"""
                 async with semaphore:
-                    return await self.process_room(room_id)
+                    return await self.poll_target(room_id, self.process_room)
 
-            tasks = [process_with_semaphore(room_id) for room_id in self.huya_config.rooms]
+            rooms = self.select_poll_targets(self.huya_config.rooms)
+            tasks = [process_with_semaphore(room_id) for room_id in rooms]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # 检查并记录异常
             for i, result in enumerate(results):
                 if isinstance(result, Exception):
-                    self.logger.error(f"处理房间 {self.huya_config.rooms[i]} 时出错: {result}")
+                    self.logger.error(f"处理房间 {rooms[i]} 时出错: {result}")
         except Exception as e:
             self.logger.error("%s 执行失败: %s", self.monitor_name, e)
             raise
@@ -356,8 +361,7 @@ async def run_huya_monitor() -> None:
     config = get_config(reload=True)
     logger_instance = logging.getLogger(__name__)
     logger_instance.debug("虎牙监控：已重新加载配置文件")
-    async with HuyaMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(HuyaMonitor, config)
 
 
 def _get_huya_trigger_kwargs(config: AppConfig) -> dict:
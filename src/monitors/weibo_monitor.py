@@ -1,29 +1,40 @@
 """微博监控模块"""
 
 import asyncio
+import contextlib
 import html
 import json
 import logging
 import re
 import shutil
+import time
 import uuid
+from collections.abc import Awaitable
+from contextvars import ContextVar
 from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qs, quote, unquote, urlsplit
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 from bs4 import BeautifulSoup, NavigableString, Tag
-from PIL import Image, ImageOps
+from PIL import Image
 
+from src.core.change_feed import NEW_POST, TARGET_ADDED, TARGET_UPDATED
 from src.core.http import create_certifi_connector
+from src.core.media_pipeline import get_media_pipeline
 from src.core.paths import DATA_DIR
 from src.core.weibo_http import WEIBO_DESKTOP_USER_AGENT
-from src.monitors.base import BaseMonitor, CookieExpiredError
+from src.monitors.base import BaseMonitor, CookieExpiredError, run_monitor
 from src.push_channel.rich_text import RichText, RichTextBuilder, RichTextSegment
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
+from src.storage.media_store import MediaStore, get_media_store, media_key
+from src.storage.weibo_time import weibo_created_at_timestamp
 
 POST_IMAGE_TIMEOUT = ClientTimeout(total=180, sock_connect=20, sock_read=90)
+# 正文图片下载缓冲达到该大小后交给媒体线程池写盘，避免逐块同步写文件阻塞事件循环
+POST_IMAGE_WRITE_BUFFER = 1024 * 1024
 POST_IMAGE_HEADERS = {
     "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
     "Referer": "https://weibo.com/",
@@ -35,16 +46,39 @@ WEIBO_CONTENT_SEGMENTS_INDEX = 10
 WEIBO_TAGS_INDEX = 11
 WEIBO_CONTENT_TYPE_INDEX = 12
 WEIBO_VIDEO_COVER_INDEX = 13
+# 单个 UID 一轮内并发的 HTTP 请求上限（头像、长文本等后续请求共享）
+WEIBO_PER_UID_REQUEST_BUDGET = 4
+
+_uid_request_budget: ContextVar[asyncio.Semaphore | None] = ContextVar(
+    "weibo_uid_request_budget", default=None
+)
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """并发执行并按顺序返回结果；任一失败时取消并等待其余请求结束后再抛出原异常。"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class WeiboMonitor(BaseMonitor):
     """微博监控类"""
 
+    # 每个 UID 至少请求用户资料与微博列表两个接口
+    poll_requests_per_target = 2
+
     def __init__(self, config: AppConfig, session: ClientSession | None = None):
         super().__init__(config, session)
         self.weibo_config = config.get_weibo_config()
         self.old_data_dict: dict[str, tuple] = {}
         self._is_first_time: bool = False  # 标记是否是首次创建数据库
+        # 用户资料缓存：uid -> (获取时间 monotonic, profile/info 中的 user)，常驻实例下跨轮复用
+        self._profile_cache: dict[str, tuple[float, dict]] = {}
 
     async def initialize(self):
         """初始化数据库和推送服务"""
@@ -53,24 +87,24 @@ class WeiboMonitor(BaseMonitor):
         await self.load_old_info()
 
     async def _get_session(self) -> ClientSession:
-        """获取或创建session"""
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": WEIBO_DESKTOP_USER_AGENT,
-                    "Accept": "application/json, text/plain, */*",
-                    "Referer": "https://www.weibo.com/",
-                    "Cookie": self.weibo_config.cookie,
-                    "X-Requested-With": "XMLHttpRequest",
-                },
-                timeout=ClientTimeout(total=10),
-                connector=create_certifi_connector(),
-            )
-            self._own_session = True
-        else:
-            # 如果session已存在，更新Cookie（用于热重载）
-            self.session.headers["Cookie"] = self.weibo_config.cookie
-        return self.session
+        """获取共享/独立session，并热替换Cookie（用于热重载）"""
+        return await self._acquire_session(
+            headers={
+                "User-Agent": WEIBO_DESKTOP_USER_AGENT,
+                "Accept": "application/json, text/plain, */*",
+                "Referer": "https://www.weibo.com/",
+                "Cookie": self.weibo_config.cookie,
+                "X-Requested-With": "XMLHttpRequest",
+            },
+            timeout=ClientTimeout(total=10),
+            connector_factory=create_certifi_connector,
+        )
+
+    @staticmethod
+    def _request_slot() -> contextlib.AbstractAsyncContextManager:
+        """占用当前 UID 的请求并发额度；不在 get_info 上下文中时不限流。"""
+        semaphore = _uid_request_budget.get()
+        return semaphore if semaphore is not None else contextlib.nullcontext()
 
     async def load_old_info(self):
         """从数据库加载旧信息"""
@@ -124,31 +158,6 @@ class WeiboMonitor(BaseMonitor):
         """构造 /weibo_img 静态图片 URL，路径片段统一做 URL 编码。"""
         return "/weibo_img/" + "/".join(quote(str(part), safe="") for part in parts)
 
-    def _get_post_thumbnail_path(self, image_path: Path) -> Path:
-        """正文原图旁边的缩略图路径。"""
-        return image_path.with_name(f"{image_path.stem}.thumb.jpg")
-
-    def _make_post_thumbnail(self, image_path: Path, thumb_path: Path) -> bool:
-        """为微博正文图片生成列表缩略图；失败不影响原图展示。"""
-        try:
-            with Image.open(image_path) as img:
-                img = ImageOps.exif_transpose(img)
-                img.thumbnail((480, 480), Image.Resampling.LANCZOS)
-                if img.mode in ("RGBA", "LA", "P"):
-                    bg = Image.new("RGB", img.size, (255, 255, 255))
-                    if img.mode == "P":
-                        img = img.convert("RGBA")
-                    bg.paste(img, mask=img.getchannel("A") if img.mode in ("RGBA", "LA") else None)
-                    img = bg
-                else:
-                    img = img.convert("RGB")
-                thumb_path.parent.mkdir(parents=True, exist_ok=True)
-                img.save(thumb_path, "JPEG", quality=82, optimize=True)
-            return True
-        except Exception as e:
-            self.logger.debug("生成微博正文图片缩略图失败（已忽略）: %s", e)
-            return False
-
     def _add_pic_url(self, urls: list[str], url: str | None) -> None:
         """追加去重后的图片 URL，兼容微博返回的 // 开头地址。"""
         if not isinstance(url, str):
@@ -305,14 +314,23 @@ class WeiboMonitor(BaseMonitor):
                 result.append(candidates)
         return result
 
+    def _media_store(self) -> MediaStore:
+        """data/weibo 下的内容寻址图片存储。"""
+        return get_media_store(self._get_weibo_data_dir())
+
     def _remove_path(self, path: Path) -> None:
-        """删除文件或目录；仅用于微博本地图片目录维护。"""
-        if not path.exists():
-            return
-        if path.is_dir():
-            shutil.rmtree(path)
-        else:
-            path.unlink()
+        """删除文件或目录，并回收其中不再被引用的图片对象；仅用于微博本地图片目录维护。"""
+        self._media_store().release(path)
+
+    async def _remove_path_async(self, path: Path) -> None:
+        """在媒体线程池中删除文件或目录。"""
+        await get_media_pipeline().run_blocking("delete", self._remove_path, path)
+
+    @staticmethod
+    def _open_download_file(path: Path):
+        """创建父目录并以写模式打开下载临时文件（在媒体线程池中执行）。"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("wb")
 
     def _parse_post_image_urls(self, raw_images: object) -> list[str]:
         """解析数据库中的微博正文图片 JSON。"""
@@ -620,18 +638,29 @@ class WeiboMonitor(BaseMonitor):
             if not candidates:
                 return False
 
+            store = self._media_store()
+            key = media_key(candidates[0])
+            if await get_media_pipeline().run_blocking("link", store.link_existing, key, save_path):
+                self.logger.debug("微博图片已在本地存储中，直接复用: %s", save_path)
+                return True
+
             last_status: int | None = None
 
             for candidate in candidates:
-                async with session.get(candidate) as resp:
+                async with (
+                    self._request_slot(),
+                    get_media_pipeline().download_slot("avatar_download"),
+                    session.get(candidate) as resp,
+                ):
                     last_status = resp.status
                     if resp.status != 200:
                         # 非 200 则尝试下一个候选
                         continue
 
                     content = await resp.read()
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
-                    save_path.write_bytes(content)
+                    await get_media_pipeline().run_blocking(
+                        "write", store.put_bytes, key, content, save_path
+                    )
                     self.logger.debug("已保存微博头像到: %s (URL: %s)", save_path, candidate)
                     return True
 
@@ -655,6 +684,14 @@ class WeiboMonitor(BaseMonitor):
         if not urls:
             return False
 
+        pipeline = get_media_pipeline()
+        store = self._media_store()
+        # 同一张图片（如多个账号转发同一条原微博）已下载过时直接硬链接，免去重复下载
+        key = media_key(urls[0])
+        if await pipeline.run_blocking("link", store.link_existing, key, save_path):
+            self.logger.debug("微博正文图片已在本地存储中，直接复用: %s", save_path)
+            return True
+
         session = await self._get_session()
         last_status: int | None = None
         last_error = ""
@@ -662,33 +699,44 @@ class WeiboMonitor(BaseMonitor):
         for candidate in urls:
             temp_path = save_path.with_name(f".{save_path.name}.{uuid.uuid4().hex}.download")
             try:
-                async with session.get(
-                    candidate,
-                    headers=POST_IMAGE_HEADERS,
-                    timeout=POST_IMAGE_TIMEOUT,
-                ) as resp:
+                async with (
+                    pipeline.download_slot(),
+                    session.get(
+                        candidate,
+                        headers=POST_IMAGE_HEADERS,
+                        timeout=POST_IMAGE_TIMEOUT,
+                    ) as resp,
+                ):
                     last_status = resp.status
                     if resp.status != 200:
                         continue
 
-                    save_path.parent.mkdir(parents=True, exist_ok=True)
                     written = 0
-                    with temp_path.open("wb") as file:
+                    file = await pipeline.run_blocking("write", self._open_download_file, temp_path)
+                    try:
+                        buffer = bytearray()
                         async for chunk in resp.content.iter_chunked(64 * 1024):
                             if not chunk:
                                 continue
-                            file.write(chunk)
+                            buffer += chunk
                             written += len(chunk)
+                            if len(buffer) >= POST_IMAGE_WRITE_BUFFER:
+                                await pipeline.run_blocking("write", file.write, bytes(buffer))
+                                buffer.clear()
+                        if buffer:
+                            await pipeline.run_blocking("write", file.write, bytes(buffer))
+                    finally:
+                        await pipeline.run_blocking("write", file.close)
 
                     if written == 0:
-                        self._remove_path(temp_path)
+                        await self._remove_path_async(temp_path)
                         continue
 
-                    temp_path.replace(save_path)
+                    await pipeline.run_blocking("move", store.adopt, temp_path, key, save_path)
                     self.logger.debug("已保存微博正文图片到: %s (URL: %s)", save_path, candidate)
                     return True
             except (aiohttp.ClientError, TimeoutError, OSError) as e:
-                self._remove_path(temp_path)
+                await self._remove_path_async(temp_path)
                 last_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
                 self.logger.debug(
                     "微博正文图片候选 URL 下载失败（继续尝试）: %s, URL: %s",
@@ -1392,15 +1440,18 @@ class WeiboMonitor(BaseMonitor):
             return None
         try:
             session = await self._get_session()
-            async with session.get(
-                "https://m.weibo.cn/statuses/extend",
-                params={"id": str(status_id)},
-                headers={
-                    "Referer": f"https://m.weibo.cn/detail/{status_id}",
-                    "MWeibo-Pwa": "1",
-                    "X-Requested-With": "XMLHttpRequest",
-                },
-            ) as resp:
+            async with (
+                self._request_slot(),
+                session.get(
+                    "https://m.weibo.cn/statuses/extend",
+                    params={"id": str(status_id)},
+                    headers={
+                        "Referer": f"https://m.weibo.cn/detail/{status_id}",
+                        "MWeibo-Pwa": "1",
+                        "X-Requested-With": "XMLHttpRequest",
+                    },
+                ) as resp,
+            ):
                 resp.raise_for_status()
                 result = await resp.json()
 
@@ -1431,11 +1482,14 @@ class WeiboMonitor(BaseMonitor):
                 if xsrf_token:
                     headers["X-XSRF-TOKEN"] = xsrf_token
 
-                async with session.get(
-                    "https://www.weibo.com/ajax/statuses/longtext",
-                    params={"id": str(long_text_id)},
-                    headers=headers or None,
-                ) as resp:
+                async with (
+                    self._request_slot(),
+                    session.get(
+                        "https://www.weibo.com/ajax/statuses/longtext",
+                        params={"id": str(long_text_id)},
+                        headers=headers or None,
+                    ) as resp,
+                ):
                     resp.raise_for_status()
                     result = await resp.json()
 
@@ -1464,19 +1518,21 @@ class WeiboMonitor(BaseMonitor):
         candidates_by_pic: list[list[str]],
         temp_dir: Path,
     ) -> list[int]:
-        """下载一批微博图片到临时目录，并返回已落盘的图片序号。"""
-        saved_indices: list[int] = []
-        for index, candidates in enumerate(candidates_by_pic, start=1):
+        """下载一批微博图片到临时目录，并返回已落盘的图片序号（并发受媒体流水线额度约束）。"""
+
+        async def download_one(index: int, candidates: list[str]) -> bool:
             save_path = temp_dir / f"{index:02d}.jpg"
             if save_path.exists() and save_path.stat().st_size > 0:
-                saved_indices.append(index)
-                continue
-
-            if await self._download_post_image(candidates, save_path):
-                self._make_post_thumbnail(save_path, self._get_post_thumbnail_path(save_path))
-                saved_indices.append(index)
+                return True
+            return await self._download_post_image(candidates, save_path)
 
-        return saved_indices
+        results = await asyncio.gather(
+            *(
+                download_one(index, candidates)
+                for index, candidates in enumerate(candidates_by_pic, start=1)
+            )
+        )
+        return [index for index, saved in enumerate(results, start=1) if saved]
 
     async def _download_post_images_to_temp(
         self,
@@ -1550,7 +1606,9 @@ class WeiboMonitor(BaseMonitor):
             if keep_existing:
                 image_urls = existing_urls
             else:
-                self._commit_post_image_dir(user_dir, post_mid, None)
+                await get_media_pipeline().run_blocking(
+                    "delete", self._commit_post_image_dir, user_dir, post_mid, None
+                )
             data["图片"] = json.dumps(image_urls, ensure_ascii=False)
             return image_urls
 
@@ -1588,7 +1646,7 @@ class WeiboMonitor(BaseMonitor):
                 and len(image_urls) <= existing_available_count
                 and len(image_urls) < expected_count
             ):
-                self._remove_path(temp_dir)
+                await self._remove_path_async(temp_dir)
                 data["图片"] = json.dumps(existing_urls, ensure_ascii=False)
                 self.logger.warning(
                     "%s 微博正文图片补偿下载未改善，保留已有本地图片 %s/%s 张",
@@ -1599,13 +1657,17 @@ class WeiboMonitor(BaseMonitor):
                 return existing_urls
 
             if image_urls:
-                self._commit_post_image_dir(user_dir, post_mid, temp_dir)
+                await get_media_pipeline().run_blocking(
+                    "move", self._commit_post_image_dir, user_dir, post_mid, temp_dir
+                )
             else:
-                self._remove_path(temp_dir)
+                await self._remove_path_async(temp_dir)
                 if not keep_existing:
-                    self._commit_post_image_dir(user_dir, post_mid, None)
+                    await get_media_pipeline().run_blocking(
+                        "delete", self._commit_post_image_dir, user_dir, post_mid, None
+                    )
         except Exception as e:
-            self._remove_path(temp_dir)
+            await self._remove_path_async(temp_dir)
             image_urls = existing_urls if keep_existing else []
             self.logger.warning("保存微博正文图片时发生异常（已忽略）: %s", e)
 
@@ -1639,7 +1701,14 @@ class WeiboMonitor(BaseMonitor):
             if keep_existing:
                 image_urls = existing_urls
             else:
-                self._commit_retweeted_image_dir(user_dir, post_mid, retweeted_mid, None)
+                await get_media_pipeline().run_blocking(
+                    "delete",
+                    self._commit_retweeted_image_dir,
+                    user_dir,
+                    post_mid,
+                    retweeted_mid,
+                    None,
+                )
             retweeted["images"] = image_urls
             data["转发微博"] = self._dump_retweeted_status(retweeted)
             return image_urls
@@ -1694,7 +1763,7 @@ class WeiboMonitor(BaseMonitor):
                 and len(image_urls) <= existing_available_count
                 and len(image_urls) < expected_count
             ):
-                self._remove_path(temp_dir)
+                await self._remove_path_async(temp_dir)
                 retweeted["images"] = existing_urls
                 data["转发微博"] = self._dump_retweeted_status(retweeted)
                 self.logger.warning(
@@ -1706,13 +1775,27 @@ class WeiboMonitor(BaseMonitor):
                 return existing_urls
 
             if image_urls:
-                self._commit_retweeted_image_dir(user_dir, post_mid, retweeted_mid, temp_dir)
+                await get_media_pipeline().run_blocking(
+                    "move",
+                    self._commit_retweeted_image_dir,
+                    user_dir,
+                    post_mid,
+                    retweeted_mid,
+                    temp_dir,
+                )
             else:
-                self._remove_path(temp_dir)
+                await self._remove_path_async(temp_dir)
                 if not keep_existing:
-                    self._commit_retweeted_image_dir(user_dir, post_mid, retweeted_mid, None)
+                    await get_media_pipeline().run_blocking(
+                        "delete",
+                        self._commit_retweeted_image_dir,
+                        user_dir,
+                        post_mid,
+                        retweeted_mid,
+                        None,
+                    )
         except Exception as e:
-            self._remove_path(temp_dir)
+            await self._remove_path_async(temp_dir)
             image_urls = existing_urls if keep_existing else []
             self.logger.warning("保存被转发微博图片时发生异常（已忽略）: %s", e)
 
@@ -1725,11 +1808,6 @@ class WeiboMonitor(BaseMonitor):
         candidates = data.get("_video_cover_url_candidates") or []
         existing_url = str(data.get("视频封面") or "").strip()
         if keep_existing and existing_url and self._local_post_image_exists(existing_url):
-            existing_path = self._get_local_post_image_path(existing_url)
-            if existing_path:
-                thumb = self._get_post_thumbnail_path(existing_path)
-                if not thumb.exists():
-                    self._make_post_thumbnail(existing_path, thumb)
             return existing_url
 
         post_mid = self._sanitize_path_part(data.get("mid") or "0")
@@ -1744,7 +1822,6 @@ class WeiboMonitor(BaseMonitor):
         local_url = self._build_weibo_img_url(safe_username, "posts", post_mid, "video_cover.jpg")
         try:
             if await self._download_post_image(candidates, save_path):
-                self._make_post_thumbnail(save_path, self._get_post_thumbnail_path(save_path))
                 data["视频封面"] = local_url
                 return local_url
         except Exception as e:
@@ -1761,11 +1838,6 @@ class WeiboMonitor(BaseMonitor):
         candidates = data.get("_retweeted_video_cover_url_candidates") or []
         existing_url = str(retweeted.get("video_cover") or "").strip()
         if keep_existing and existing_url and self._local_post_image_exists(existing_url):
-            existing_path = self._get_local_post_image_path(existing_url)
-            if existing_path:
-                thumb = self._get_post_thumbnail_path(existing_path)
-                if not thumb.exists():
-                    self._make_post_thumbnail(existing_path, thumb)
             return existing_url
 
         post_mid = self._sanitize_path_part(data.get("mid") or "0")
@@ -1795,7 +1867,6 @@ class WeiboMonitor(BaseMonitor):
         )
         try:
             if await self._download_post_image(candidates, save_path):
-                self._make_post_thumbnail(save_path, self._get_post_thumbnail_path(save_path))
                 retweeted["video_cover"] = local_url
                 data["转发微博"] = self._dump_retweeted_status(retweeted)
                 return local_url
@@ -1916,7 +1987,19 @@ class WeiboMonitor(BaseMonitor):
         data = dict(base_data)
         content = self._get_status_rich_text(target_wb)
         list_text_raw = content.plain_text().strip()
-        long_text_content = await self._fetch_long_text_rich(target_wb)
+        # 正文长文本与被转发微博（含其长文本）互不依赖，并发补取
+        (
+            long_text_content,
+            (
+                retweeted_status,
+                retweeted_pic_candidates,
+                retweeted_video_cover_candidates,
+                retweeted_long_text_fetched,
+            ),
+        ) = await _gather_or_cancel(
+            self._fetch_long_text_rich(target_wb),
+            self._extract_retweeted_status(target_wb),
+        )
         if long_text_content:
             content = long_text_content
         text_raw = content.plain_text().strip()
@@ -1930,12 +2013,6 @@ class WeiboMonitor(BaseMonitor):
         if not isinstance(url_struct, list):
             url_struct = []
         created_at = str(target_wb.get("created_at") or "")
-        (
-            retweeted_status,
-            retweeted_pic_candidates,
-            retweeted_video_cover_candidates,
-            retweeted_long_text_fetched,
-        ) = await self._extract_retweeted_status(target_wb)
         content_type = self._get_weibo_content_type(target_wb)
         tags = self._extract_weibo_tags(text_raw)
         video_cover_candidates = self._extract_video_cover_candidates(target_wb)
@@ -1964,6 +2041,7 @@ class WeiboMonitor(BaseMonitor):
         data["标签"] = self._dump_weibo_tags(tags)
         data["内容类型"] = content_type
         data["视频封面"] = ""
+        data["created_at"] = weibo_created_at_timestamp(created_at)
         data["_text_raw"] = text_raw
         data["_list_text_raw"] = list_text_raw
         data["_long_text_fetched"] = bool(long_text_content)
@@ -1979,30 +2057,83 @@ class WeiboMonitor(BaseMonitor):
 
         return data
 
+    async def _fetch_json(self, url: str) -> dict:
+        """请求微博 ajax 接口并解析 JSON。"""
+        session = await self._get_session()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
     async def get_info(self, uid: str, old_mid: str | None = None) -> dict:
         """获取微博信息"""
-        session = await self._get_session()
-        info_url = f"https://www.weibo.com/ajax/profile/info?uid={uid}"
-        con_url = f"https://www.weibo.com/ajax/statuses/mymblog?uid={uid}&page=1&feature=0"
+        budget_token = _uid_request_budget.set(asyncio.Semaphore(WEIBO_PER_UID_REQUEST_BUDGET))
+        try:
+            return await self._get_info_with_budget(uid, old_mid)
+        finally:
+            _uid_request_budget.reset(budget_token)
 
-        # 并发请求两个接口
-        async with session.get(info_url) as info_resp, session.get(con_url) as con_resp:
-            info_resp.raise_for_status()
-            con_resp.raise_for_status()
+    def _get_cached_profile(self, uid: str) -> dict | None:
+        """返回未过期的用户资料缓存；weibo.profile_refresh_seconds 为 0 时不缓存。"""
+        ttl = getattr(self.config, "weibo_profile_refresh_seconds", 0)
+        cached = self._profile_cache.get(uid)
+        if ttl <= 0 or cached is None:
+            return None
+        fetched_at, user_info = cached
+        if time.monotonic() - fetched_at >= ttl:
+            return None
+        return user_info
 
-            res_info = await info_resp.json()
-            res_list = await con_resp.json()
+    def _is_timeline_unchanged(self, res_list: dict, old_mid: str | None) -> bool:
+        """最新非置顶微博 mid 与数据库记录一致时视为无新微博。"""
+        if not old_mid or self._sanitize_path_part(old_mid) == "0":
+            return False
+        wb_list = (res_list.get("data") or {}).get("list") or []
+        statuses = self._get_timeline_statuses(wb_list)
+        return bool(statuses) and self._same_mid(statuses[0].get("mid"), old_mid)
 
-            # 检测cookie是否失效
-            if res_info.get("ok") == -100 or res_list.get("ok") == -100:
-                raise CookieExpiredError("微博Cookie已失效，需要重新登录")
+    @staticmethod
+    def _check_cookie_payloads(*payloads: dict) -> None:
+        """检测cookie是否失效"""
+        if any(payload.get("ok") == -100 for payload in payloads):
+            raise CookieExpiredError("微博Cookie已失效，需要重新登录")
+
+    async def _get_info_with_budget(self, uid: str, old_mid: str | None) -> dict:
+        """get_info 主体：后续头像/长文本请求共享当前 UID 的并发额度。"""
+        info_url = f"https://www.weibo.com/ajax/profile/info?uid={uid}"
+        con_url = f"https://www.weibo.com/ajax/statuses/mymblog?uid={uid}&page=1&feature=0"
+
+        user_info = self._get_cached_profile(uid)
+        if user_info is None:
+            # 资料缓存过期：并发请求两个接口，并走完整解析（含图片补偿等）
+            res_info, res_list = await _gather_or_cancel(
+                self._fetch_json(info_url),
+                self._fetch_json(con_url),
+            )
+            self._check_cookie_payloads(res_info, res_list)
+        else:
+            # 资料缓存有效：只轮询时间线，最新 mid 未变化时跳过全部解析
+            res_list = await self._fetch_json(con_url)
+            self._check_cookie_payloads(res_list)
+            if self._is_timeline_unchanged(res_list, old_mid):
+                return {"UID": uid, "mid": str(old_mid), "_timeline_unchanged": True}
+            # 有新微博时刷新资料，保证微博数差值准确
+            res_info = await self._fetch_json(info_url)
+            self._check_cookie_payloads(res_info)
 
         # 解析用户信息
         user_info = res_info["data"]["user"]
+        self._profile_cache[uid] = (time.monotonic(), user_info)
 
-        # 在链接仍然有效时，尝试将头像图片保存到本地 data/weibo/<用户名>/ 目录
-        await self._save_user_images(user_info)
+        # 在链接仍然有效时，尝试将头像图片保存到本地 data/weibo/<用户名>/ 目录；
+        # 与微博解析并发进行，在返回前等待完成
+        avatar_task = asyncio.create_task(self._save_user_images(user_info))
+        try:
+            return await self._parse_timeline(user_info, res_list, old_mid)
+        finally:
+            await avatar_task
 
+    async def _parse_timeline(self, user_info: dict, res_list: dict, old_mid: str | None) -> dict:
+        """解析用户信息与最新微博列表，生成数据库/推送共用结构。"""
         verified_reason = user_info.get("verified_reason", "人气博主")
         user_description = (
             user_info["description"] if user_info["description"] else "peace and love"
@@ -2027,6 +2158,7 @@ class WeiboMonitor(BaseMonitor):
             data["标签"] = "[]"
             data["内容类型"] = "text"
             data["视频封面"] = ""
+            data["created_at"] = 0
             data["_candidate_new_posts"] = []
             data["_old_mid_found"] = False
             return data
@@ -2041,21 +2173,27 @@ class WeiboMonitor(BaseMonitor):
             data["标签"] = "[]"
             data["内容类型"] = "text"
             data["视频封面"] = ""
+            data["created_at"] = 0
             data["_candidate_new_posts"] = []
             data["_old_mid_found"] = False
             return data
 
         candidate_statuses, old_mid_found = self._collect_candidate_new_statuses(statuses, old_mid)
-        parsed_by_mid: dict[str, dict] = {}
 
-        async def parse_status(status: dict) -> dict:
-            cache_key = str(status.get("mid") or id(status))
-            if cache_key not in parsed_by_mid:
-                parsed_by_mid[cache_key] = await self._build_status_data(data, status)
-            return parsed_by_mid[cache_key]
+        # 最新一条与候选新微博按 mid 去重后并发解析（网络请求受 UID 额度约束）
+        unique_statuses: dict[str, dict] = {}
+        for status in (statuses[0], *candidate_statuses):
+            unique_statuses.setdefault(str(status.get("mid") or id(status)), status)
+        parsed = await _gather_or_cancel(
+            *(self._build_status_data(data, status) for status in unique_statuses.values())
+        )
+        parsed_by_mid = dict(zip(unique_statuses, parsed, strict=True))
+
+        def parse_status(status: dict) -> dict:
+            return parsed_by_mid[str(status.get("mid") or id(status))]
 
-        latest_data = await parse_status(statuses[0])
-        candidate_posts = [await parse_status(status) for status in candidate_statuses]
+        latest_data = parse_status(statuses[0])
+        candidate_posts = [parse_status(status) for status in candidate_statuses]
         latest_data["_candidate_new_posts"] = candidate_posts
         latest_data["_old_mid_found"] = old_mid_found
 
@@ -2151,11 +2289,17 @@ class WeiboMonitor(BaseMonitor):
             self.logger.error(f"获取用户 {uid} 数据失败: {e}")
             return
 
+        if new_data.get("_timeline_unchanged") and old_info:
+            self.logger.debug(f"{old_info[1]} 最近在摸鱼🐟")
+            return
+
         new_data.setdefault("转发微博", "{}")
         new_data.setdefault("正文结构", "[]")
         new_data.setdefault("标签", "[]")
         new_data.setdefault("内容类型", "text")
         new_data.setdefault("视频封面", "")
+        if "created_at" not in new_data:
+            new_data["created_at"] = weibo_created_at_timestamp(new_data.get("文本"))
         new_data.setdefault("_retweeted_pic_url_candidates", [])
         new_data.setdefault("_video_cover_url_candidates", [])
         new_data.setdefault("_retweeted_video_cover_url_candidates", [])
@@ -2277,14 +2421,15 @@ class WeiboMonitor(BaseMonitor):
                         "UPDATE weibo SET 用户名=%(用户名)s, 认证信息=%(认证信息)s, 简介=%(简介)s, "
                         "粉丝数=%(粉丝数)s, 微博数=%(微博数)s, 文本=%(文本)s, mid=%(mid)s, "
                         "图片=%(图片)s, 转发微博=%(转发微博)s, 正文结构=%(正文结构)s, "
-                        "标签=%(标签)s, 内容类型=%(内容类型)s, 视频封面=%(视频封面)s "
-                        "WHERE UID=%(UID)s"
+                        "标签=%(标签)s, 内容类型=%(内容类型)s, 视频封面=%(视频封面)s, "
+                        "created_at=%(created_at)s WHERE UID=%(UID)s"
                     )
                     updated = await self.db.execute_update(sql, new_data)
                     if not updated:
                         self.logger.error("%s 微博数据补偿写入数据库失败", new_data["用户名"])
                     else:
                         self.old_data_dict[uid] = self._data_to_old_info_tuple(new_data)
+                        self.publish_change(TARGET_UPDATED, uid, name=new_data["用户名"])
                         if should_push_long_text:
                             self.logger.info("%s 微博长文本已补全并写入数据库", new_data["用户名"])
                             await self.push_notification(
@@ -2302,8 +2447,8 @@ class WeiboMonitor(BaseMonitor):
                     "UPDATE weibo SET 用户名=%(用户名)s, 认证信息=%(认证信息)s, 简介=%(简介)s, "
                     "粉丝数=%(粉丝数)s, 微博数=%(微博数)s, 文本=%(文本)s, mid=%(mid)s, "
                     "图片=%(图片)s, 转发微博=%(转发微博)s, 正文结构=%(正文结构)s, "
-                    "标签=%(标签)s, 内容类型=%(内容类型)s, 视频封面=%(视频封面)s "
-                    "WHERE UID=%(UID)s"
+                    "标签=%(标签)s, 内容类型=%(内容类型)s, 视频封面=%(视频封面)s, "
+                    "created_at=%(created_at)s WHERE UID=%(UID)s"
                 )
                 updated = await self.db.execute_update(sql, new_data)
                 if not updated:
@@ -2327,6 +2472,12 @@ class WeiboMonitor(BaseMonitor):
                     self.logger.info(f"{new_data['用户名']} 删除了{abs(diff)}条微博😞")
 
                 self.old_data_dict[uid] = self._data_to_old_info_tuple(new_data)
+                self.publish_change(
+                    NEW_POST if diff > 0 else TARGET_UPDATED,
+                    uid,
+                    name=new_data["用户名"],
+                    count=len(posts_to_push),
+                )
 
                 if diff > 0:
                     if len(posts_to_push) > 1:
@@ -2348,15 +2499,16 @@ class WeiboMonitor(BaseMonitor):
             # 新用户插入
             sql = (
                 "INSERT INTO weibo (UID, 用户名, 认证信息, 简介, 粉丝数, 微博数, 文本, mid, "
-                "图片, 转发微博, 正文结构, 标签, 内容类型, 视频封面) "
+                "图片, 转发微博, 正文结构, 标签, 内容类型, 视频封面, created_at) "
                 "VALUES (%(UID)s, %(用户名)s, %(认证信息)s, %(简介)s, %(粉丝数)s, "
                 "%(微博数)s, %(文本)s, %(mid)s, %(图片)s, %(转发微博)s, %(正文结构)s, "
-                "%(标签)s, %(内容类型)s, %(视频封面)s)"
+                "%(标签)s, %(内容类型)s, %(视频封面)s, %(created_at)s)"
             )
             inserted = await self.db.execute_insert(sql, new_data)
             if not inserted:
                 self.logger.error("插入 %s 微博数据失败，跳过推送", new_data["用户名"])
                 return
+            self.publish_change(TARGET_ADDED, uid, name=new_data["用户名"])
 
             if self._is_first_time:
                 self.logger.info(f"{new_data['用户名']} 新收录（首次创建数据库，跳过推送）")
@@ -2618,7 +2770,9 @@ class WeiboMonitor(BaseMonitor):
             cover_pic_url, local_pic_path = self._select_push_cover(data)
             if local_pic_path and self._has_wecom_apps_channel():
                 wecom_path = local_pic_path.with_name(f"{local_pic_path.stem}_wecom.jpg")
-                if self._resize_cover_for_wecom(local_pic_path, wecom_path):
+                if await get_media_pipeline().run_blocking(
+                    "resize", self._resize_cover_for_wecom, local_pic_path, wecom_path
+                ):
                     wecom_pic_url = self._public_weibo_image_url(wecom_path)
 
             # 头像（用于 Bark icon）
@@ -2819,15 +2973,16 @@ class WeiboMonitor(BaseMonitor):
             async def process_with_semaphore(uid: str):
                 """使用信号量包装的处理函数"""
                 async with semaphore:
-                    return await self.process_user(uid)
+                    return await self.poll_target(uid, self.process_user)
 
-            tasks = [process_with_semaphore(uid) for uid in self.weibo_config.uids]
+            uids = self.select_poll_targets(self.weibo_config.uids)
+            tasks = [process_with_semaphore(uid) for uid in uids]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
             # 检查并记录异常
             for i, result in enumerate(results):
                 if isinstance(result, Exception):
-                    self.logger.error(f"处理用户 {self.weibo_config.uids[i]} 时出错: {result}")
+                    self.logger.error(f"处理用户 {uids[i]} 时出错: {result}")
         except Exception as e:
             self.logger.error("%s 执行失败: %s", self.monitor_name, e)
             raise
@@ -2847,8 +3002,7 @@ async def run_weibo_monitor() -> None:
     logger_instance.debug(
         "微博监控：已重新加载配置文件 (Cookie长度: %s 字符)", len(config.weibo_cookie)
     )
-    async with WeiboMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(WeiboMonitor, config)
 
 
 def _get_weibo_trigger_kwargs(config: AppConfig) -> dict:
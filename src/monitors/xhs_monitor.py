@@ -5,10 +5,10 @@ import json
 import logging
 from datetime import datetime
 
-import aiohttp
 from aiohttp import ClientSession, ClientTimeout
 
-from src.monitors.base import BaseMonitor
+from src.core.change_feed import NEW_POST, TARGET_ADDED
+from src.monitors.base import BaseMonitor, run_monitor
 from src.settings.config import AppConfig, get_config, is_in_quiet_hours
 
 XHS_USER_AGENT = (
@@ -62,25 +62,16 @@ class XhsMonitor(BaseMonitor):
         await self.load_old_info()
 
     async def _get_session(self) -> ClientSession:
-        if self.session is None:
-            headers = {
+        return await self._acquire_session(
+            headers={
                 "User-Agent": XHS_USER_AGENT,
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "zh-CN,zh;q=0.9",
                 "Referer": "https://www.xiaohongshu.com/",
-            }
-            if self.xhs_config.cookie:
-                headers["Cookie"] = self.xhs_config.cookie
-            self.session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=ClientTimeout(total=15),
-            )
-            self._own_session = True
-        else:
-            self.session.headers["User-Agent"] = XHS_USER_AGENT
-            if self.xhs_config.cookie:
-                self.session.headers["Cookie"] = self.xhs_config.cookie
-        return self.session
+                "Cookie": self.xhs_config.cookie or None,
+            },
+            timeout=ClientTimeout(total=15),
+        )
 
     async def load_old_info(self):
         try:
@@ -171,6 +162,16 @@ class XhsMonitor(BaseMonitor):
             "pic_url": pic_url,
         }
 
+    @staticmethod
+    def _data_to_old_info_tuple(data: dict) -> tuple:
+        """将当前笔记数据转换为 old_data_dict 使用的行结构。"""
+        return (
+            data["profile_id"],
+            data["user_name"],
+            data.get("latest_note_title", ""),
+            data.get("note_id", ""),
+        )
+
     def check_info(self, data: dict, old_info: tuple) -> bool:
         """是否有新动态（优先比较 note_id）"""
         new_id = (data.get("note_id") or "").strip()
@@ -198,7 +199,9 @@ class XhsMonitor(BaseMonitor):
                 "UPDATE xhs SET user_name=%(user_name)s, latest_note_title=%(latest_note_title)s, "
                 "note_id=%(note_id)s WHERE profile_id=%(profile_id)s"
             )
-            await self.db.execute_update(sql, new_data)
+            if await self.db.execute_update(sql, new_data):
+                self.old_data_dict[profile_id] = self._data_to_old_info_tuple(new_data)
+                self.publish_change(NEW_POST, profile_id, name=new_data["user_name"])
 
             self.logger.info(f"{new_data['user_name']} 发布了新笔记📕")
             await self.push_notification(new_data)
@@ -207,7 +210,9 @@ class XhsMonitor(BaseMonitor):
                 "INSERT INTO xhs (profile_id, user_name, latest_note_title, note_id) "
                 "VALUES (%(profile_id)s, %(user_name)s, %(latest_note_title)s, %(note_id)s)"
             )
-            await self.db.execute_insert(sql, new_data)
+            if await self.db.execute_insert(sql, new_data):
+                self.old_data_dict[profile_id] = self._data_to_old_info_tuple(new_data)
+                self.publish_change(TARGET_ADDED, profile_id, name=new_data["user_name"])
 
             if self._is_first_time:
                 self.logger.info(f"{new_data['user_name']} 新收录（首次创建数据库，跳过推送）")
@@ -273,14 +278,15 @@ class XhsMonitor(BaseMonitor):
 
         async def process_with_semaphore(pid: str):
             async with semaphore:
-                return await self.process_user(pid)
+                return await self.poll_target(pid, self.process_user)
 
-        tasks = [process_with_semaphore(pid) for pid in self.xhs_config.profile_ids]
+        profile_ids = self.select_poll_targets(self.xhs_config.profile_ids)
+        tasks = [process_with_semaphore(pid) for pid in profile_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                self.logger.error(f"处理用户 {self.xhs_config.profile_ids[i]} 时出错: {result}")
+                self.logger.error(f"处理用户 {profile_ids[i]} 时出错: {result}")
         self.logger.debug("执行完成 %s", self.monitor_name)
 
     @property
@@ -291,8 +297,7 @@ class XhsMonitor(BaseMonitor):
 async def run_xhs_monitor() -> None:
     config = get_config(reload=True)
     logging.getLogger(__name__).debug("小红书监控：已重新加载配置文件")
-    async with XhsMonitor(config) as monitor:
-        await monitor.run()
+    await run_monitor(XhsMonitor, config)
 
 
 def _get_xhs_trigger_kwargs(config: AppConfig) -> dict:
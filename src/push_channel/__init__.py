@@ -1,47 +1,63 @@
+"""推送通道：各通道实现按类型在首次使用时导入（青龙单任务只加载配置中用到的通道）。"""
+
+import importlib
+from collections.abc import Iterator, Mapping
+
 from aiohttp import ClientSession
 
 from ._push_channel import PushChannel
-from .bark import Bark
-from .demo import Demo
-from .dingtalk_bot import DingtalkBot
-from .email import Email
-from .feishu_apps import FeishuApps
-from .feishu_bot import FeishuBot
-from .gotify import Gotify
-from .napcat_qq import NapCatQQ
-from .pushplus import PushPlus
-from .qlapi import QLAPIPushChannel
-from .qq_bot import QQBot
-from .server_chan_3 import ServerChan3
-from .server_chan_turbo import ServerChanTurbo
-from .telegram_bot import TelegramBot
-from .webhook import Webhook
-from .wecom_apps import WeComApps
-from .wecom_bot import WeComBot
-from .wxpusher import WxPusher
-
-_channel_type_to_class = {
-    "serverChan_turbo": ServerChanTurbo,
-    "serverChan_3": ServerChan3,
-    "wecom_apps": WeComApps,
-    "wecom_bot": WeComBot,
-    "dingtalk_bot": DingtalkBot,
-    "feishu_apps": FeishuApps,
-    "feishu_bot": FeishuBot,
-    "telegram_bot": TelegramBot,
-    "qq_bot": QQBot,
-    "napcat_qq": NapCatQQ,
-    "bark": Bark,
-    "gotify": Gotify,
-    "webhook": Webhook,
-    "email": Email,
-    "pushplus": PushPlus,
-    "wxpusher": WxPusher,
-    "demo": Demo,
-    "qlapi": QLAPIPushChannel,
+
+# 通道类型 -> (模块, 类名)
+_CHANNEL_CLASS_PATHS: dict[str, tuple[str, str]] = {
+    "serverChan_turbo": ("server_chan_turbo", "ServerChanTurbo"),
+    "serverChan_3": ("server_chan_3", "ServerChan3"),
+    "wecom_apps": ("wecom_apps", "WeComApps"),
+    "wecom_bot": ("wecom_bot", "WeComBot"),
+    "dingtalk_bot": ("dingtalk_bot", "DingtalkBot"),
+    "feishu_apps": ("feishu_apps", "FeishuApps"),
+    "feishu_bot": ("feishu_bot", "FeishuBot"),
+    "telegram_bot": ("telegram_bot", "TelegramBot"),
+    "qq_bot": ("qq_bot", "QQBot"),
+    "napcat_qq": ("napcat_qq", "NapCatQQ"),
+    "bark": ("bark", "Bark"),
+    "gotify": ("gotify", "Gotify"),
+    "webhook": ("webhook", "Webhook"),
+    "email": ("email", "Email"),
+    "pushplus": ("pushplus", "PushPlus"),
+    "wxpusher": ("wxpusher", "WxPusher"),
+    "demo": ("demo", "Demo"),
+    "qlapi": ("qlapi", "QLAPIPushChannel"),
 }
 
 
+def _import_channel_class(module: str, class_name: str) -> type[PushChannel]:
+    return getattr(importlib.import_module(f".{module}", __name__), class_name)
+
+
+class _ChannelClassMap(Mapping[str, type[PushChannel]]):
+    """通道类型到实现类的只读映射，取值时才导入对应模块。"""
+
+    def __getitem__(self, channel_type: str) -> type[PushChannel]:
+        return _import_channel_class(*_CHANNEL_CLASS_PATHS[channel_type])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_CHANNEL_CLASS_PATHS)
+
+    def __len__(self) -> int:
+        return len(_CHANNEL_CLASS_PATHS)
+
+
+_channel_type_to_class = _ChannelClassMap()
+
+
+def __getattr__(name: str) -> type[PushChannel]:
+    """兼容 from src.push_channel import Bark 等写法。"""
+    for module, class_name in _CHANNEL_CLASS_PATHS.values():
+        if class_name == name:
+            return _import_channel_class(module, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_push_channel(config: dict, session: ClientSession | None = None) -> PushChannel:
     """
     创建推送通道实例
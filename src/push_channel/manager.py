@@ -2,13 +2,23 @@
 
 import asyncio
 import logging
+import time
 
 from aiohttp import ClientSession
 
+from src.core.metrics import get_metrics_registry
 from src.push_channel import get_push_channel
 from src.push_channel.cute_copy import style_push_description, style_push_title
 from src.push_channel.rich_text import RichText
 
+_metrics = get_metrics_registry()
+PUSH_DURATION = _metrics.histogram(
+    "push_duration_seconds", "Push send latency per channel type.", ("channel_type",)
+)
+PUSH_SENDS = _metrics.counter(
+    "push_sends_total", "Push sends per channel type and outcome.", ("channel_type", "outcome")
+)
+
 
 def _truncate_content_to_bytes(content: str, max_bytes: int) -> str:
     """将内容按 UTF-8 字节截断到 max_bytes 以内，末尾加省略号。"""
@@ -294,7 +304,10 @@ class UnifiedPushManager:
         author: str,
         extend_data: dict | None,
     ):
-        """带错误处理的发送包装器"""
+        """带错误处理的发送包装器（记录各通道类型的推送耗时与成败）"""
+        channel_type = getattr(channel, "type", "") or "unknown"
+        started = time.perf_counter()
+        outcome = "failure"
         try:
             # 将 send_news 的参数转换为 push 方法的参数
             # description 作为 content，to_url 作为 jump_url，picurl 作为 pic_url
@@ -305,9 +318,11 @@ class UnifiedPushManager:
                 pic_url=picurl if picurl else None,
                 extend_data=extend_data,
             )
+            outcome = "success"
             return {"status": "success"}
-        except Exception:
-            raise
+        finally:
+            PUSH_DURATION.observe(time.perf_counter() - started, channel_type=channel_type)
+            PUSH_SENDS.inc(channel_type=channel_type, outcome=outcome)
 
     async def close(self):
         """关闭所有推送服务"""
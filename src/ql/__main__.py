@@ -4,6 +4,9 @@
 示例：
   python -m src.ql ikuuu_checkin
   python -m src.ql --list
+
+青龙每次定时执行都是新进程：按 TaskSpec 只导入目标任务的模块（推送通道在发送时按类型导入），
+任务列表直接读取 metadata，不导入任何任务模块。
 """
 
 from __future__ import annotations
@@ -24,23 +27,26 @@ def _print_usage() -> None:
 
 
 def _list_tasks() -> None:
-    from src.jobs.metadata import TASK_ENV_MAP
-    from src.jobs.registry import TASK_MODULES, discover_and_import_tasks_only
-
-    discover_and_import_tasks_only()
-    from src.jobs.registry import TASK_JOBS
+    from src.jobs.metadata import TASK_ENV_MAP, TASK_MODULES, TASK_SPECS
 
     print("可运行的定时任务（青龙 CLI）：")
-    supported_jobs = [
-        job for job in TASK_JOBS if job.job_id in TASK_ENV_MAP and job.job_id != "demo_task"
+    supported = [
+        spec for spec in TASK_SPECS if spec.job_id in TASK_ENV_MAP and spec.job_id != "demo_task"
     ]
-    for job in supported_jobs:
-        print(f"  {job.job_id:28}  {job.description}")
+    for spec in supported:
+        print(f"  {spec.job_id:28}  {spec.description}")
     print()
-    print(f"共 {len(supported_jobs)} 个任务（不含 demo_task 与仅服务模式任务）")
+    print(f"共 {len(supported)} 个任务（不含 demo_task 与仅服务模式任务）")
     print(f"模块列表由 src/jobs/metadata.py 生成（兼容导出 {len(TASK_MODULES)} 项）")
 
 
+def load_ql_task(task_id: str):
+    """按 TaskSpec 只导入 task_id 对应的任务模块，返回其注册的 JobDescriptor（失败为 None）。"""
+    from src.jobs.registry import load_job_module
+
+    return load_job_module(task_id)
+
+
 def main() -> None:
     if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
         _print_usage()
@@ -56,7 +62,6 @@ def main() -> None:
         sys.exit(1)
 
     from src.jobs.metadata import TASK_ENV_MAP
-    from src.jobs.registry import discover_and_import_tasks_only, get_registered_task
     from src.ql._runner import run_task
 
     if task_id not in TASK_ENV_MAP or task_id == "demo_task":
@@ -64,8 +69,7 @@ def main() -> None:
         print("使用 python -m src.ql --list 查看可用任务")
         sys.exit(1)
 
-    discover_and_import_tasks_only()
-    job = get_registered_task(task_id)
+    job = load_ql_task(task_id)
     if job is None:
         print(f"错误: 未找到任务 '{task_id}'")
         print("使用 python -m src.ql --list 查看可用任务")
@@ -10,6 +10,12 @@ import asyncio
 import logging
 import os
 import sys
+import time
+
+# 项目代码开始执行的时刻，用于统计冷启动耗时（不含解释器自身启动）
+_STARTED_AT = time.perf_counter()
+# 单任务冷启动目标（导入任务模块与注入配置，至任务开始执行）
+COLD_START_TARGET_SECONDS = 0.5
 
 # 切换到项目根目录（ql 的父目录）
 _QL_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -41,6 +47,21 @@ def run_task(task_id: str, run_func) -> None:
 
     from src.jobs.log_manager import _current_job_id
 
+    cold_start = time.perf_counter() - _STARTED_AT
+    log = logging.getLogger(__name__)
+    if cold_start > COLD_START_TARGET_SECONDS:
+        log.warning(
+            "%s 冷启动耗时 %.2f 秒，超过目标 %.1f 秒（已导入 %d 个模块）",
+            task_id,
+            cold_start,
+            COLD_START_TARGET_SECONDS,
+            len(sys.modules),
+        )
+    else:
+        log.debug(
+            "%s 冷启动耗时 %.2f 秒（已导入 %d 个模块）", task_id, cold_start, len(sys.modules)
+        )
+
     async def _run_with_job_context() -> None:
         token = _current_job_id.set(task_id)
         try:
@@ -74,6 +74,13 @@ class AppConfig(BaseModel):
 
     # 基础访问地址，用于构造对外可访问的 HTTP 链接（例如微博封面图 URL）
     base_url: str = ""
+    # 事件循环卡顿看门狗：心跳超过阈值未更新时记录阻塞事件循环的调用栈
+    loop_watchdog_enable: bool = False
+    loop_watchdog_threshold_ms: int = Field(default=200, ge=20, le=10000)
+    # 自适应轮询：按目标变化频率在监控间隔与上限之间调整轮询间隔，并按平台限制请求速率
+    adaptive_polling_enable: bool = False
+    adaptive_polling_max_interval_seconds: int = Field(default=1800, ge=60, le=86400)
+    adaptive_polling_requests_per_second: float = Field(default=5.0, gt=0, le=100)
 
     # MySQL 主库；配置不完整或不可用时自动使用本地 SQLite
     mysql_enabled: bool = False
@@ -109,6 +116,8 @@ class AppConfig(BaseModel):
     weibo_cookie_refresh_time: str = "21:00"  # Cookie 刷新时间（格式：HH:MM）
     weibo_uids: str = ""  # 逗号分隔的UID列表
     weibo_concurrency: int = 3  # 微博监控并发数，建议2-5（避免触发限流）
+    # 用户资料（粉丝数/简介/头像）缓存秒数；期间只轮询时间线，0 表示每轮都请求资料
+    weibo_profile_refresh_seconds: int = Field(default=1800, ge=0)
     weibo_push_channels: list[str] = Field(
         default_factory=list
     )  # 推送通道名称列表，为空时使用全部通道
@@ -625,6 +634,8 @@ def load_config_from_yml(yml_path: str = "config.yml") -> dict:
 _config_cache: AppConfig | None = None
 _config_file_mtime: float = 0  # 配置文件最后修改时间
 _config_lock = threading.RLock()
+# 青龙单任务进程中由环境变量构建的配置所属任务（进程内环境变量不变，只构建一次）
+_ql_config_task_id: str | None = None
 
 
 @contextmanager
@@ -662,7 +673,7 @@ def get_config(reload: bool = False) -> AppConfig:
     Returns:
         AppConfig实例
     """
-    global _config_cache, _config_file_mtime
+    global _config_cache, _config_file_mtime, _ql_config_task_id
 
     current_mtime = _read_config_mtime()
     cached = _try_return_cached_config(reload, current_mtime)
@@ -677,8 +688,11 @@ def get_config(reload: bool = False) -> AppConfig:
 
                 task_id = getattr(ql_compat, "_current_ql_task_id", None)
                 if task_id is not None:
+                    if _config_cache is not None and _ql_config_task_id == task_id:
+                        return _config_cache
                     cfg = ql_compat.load_config_from_env(task_id)
                     _config_cache = AppConfig(**cfg)
+                    _ql_config_task_id = task_id
                     return _config_cache
             except Exception:  # noqa: BLE001
                 pass
@@ -701,6 +715,7 @@ def get_config(reload: bool = False) -> AppConfig:
         config = AppConfig(**yml_config)
 
         _config_cache = config
+        _ql_config_task_id = None
         new_weibo_cookie = config.weibo_cookie
         if old_weibo_cookie is not None and old_weibo_cookie != new_weibo_cookie:
             logger.info("微博Cookie已更新 (长度: %s 字符)", len(new_weibo_cookie or ""))
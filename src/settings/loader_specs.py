@@ -24,6 +24,11 @@ class MultiStringSpec:
 CONFIG_MAPPINGS: dict[str, dict[str, str]] = {
     "app": {
         "base_url": "base_url",
+        "loop_watchdog_enable": "loop_watchdog_enable",
+        "loop_watchdog_threshold_ms": "loop_watchdog_threshold_ms",
+        "adaptive_polling_enable": "adaptive_polling_enable",
+        "adaptive_polling_max_interval_seconds": "adaptive_polling_max_interval_seconds",
+        "adaptive_polling_requests_per_second": "adaptive_polling_requests_per_second",
     },
     "mysql": {
         "enabled": "mysql_enabled",
@@ -43,6 +48,7 @@ CONFIG_MAPPINGS: dict[str, dict[str, str]] = {
         "cookie_refresh_time": "weibo_cookie_refresh_time",
         "uids": "weibo_uids",
         "concurrency": "weibo_concurrency",
+        "profile_refresh_seconds": "weibo_profile_refresh_seconds",
         "monitor_interval_seconds": "weibo_monitor_interval_seconds",
         "push_channels": "weibo_push_channels",
     },
@@ -4,29 +4,41 @@ import asyncio
 import json
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
-from dataclasses import replace
-from datetime import date, datetime
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+from src.core.metrics import get_metrics_registry
 from src.core.paths import DB_PATH
 from src.storage.mysql_backend import (
     TABLE_SPECS,
     MySQLSettings,
     close_mysql_pool,
     create_mysql_pool,
+    fetch_mysql_changes,
     fetch_mysql_tables,
     initialize_mysql_schema,
     is_mysql_connection_error,
     mysql_query,
+    mysql_server_time,
+    mysql_table_checksums,
     mysql_tables_empty,
     mysql_update,
+    mysql_update_many,
     replace_mysql_tables,
     replay_mysql_events,
+    row_checksum,
     test_mysql_connection,
 )
+from src.storage.table_versions import get_table_versions
+from src.storage.weibo_time import weibo_created_at_timestamp
 
 # 全局单例数据库连接
 _shared_connection: aiosqlite.Connection | None = None
@@ -46,10 +58,29 @@ _sqlite_healthy = True
 _mysql_reachable = False
 _mirror_degraded = False
 _hybrid_init_lock = asyncio.Lock()
-_database_operation_lock = asyncio.Lock()
+# 单写者：SQLite 写入、MySQL 写入与镜像维护、后端切换串行执行；读路径不加锁
+_database_write_lock = asyncio.Lock()
+
+_metrics = get_metrics_registry()
+DB_OPERATION_DURATION = _metrics.histogram(
+    "db_operation_duration_seconds",
+    "AsyncDatabase call latency including write lock wait, by operation and backend.",
+    ("operation", "backend"),
+)
+DB_WRITE_LOCK_WAIT = _metrics.histogram(
+    "db_write_lock_wait_seconds", "Time spent waiting for the database write lock.", ("operation",)
+)
 _maintenance_task: asyncio.Task | None = None
 _maintenance_stop = asyncio.Event()
 
+# SQLite 镜像增量校准：按 MySQL 行版本水位线拉取变更，定期以行数+校验和核对，
+# 不一致（如其他实例删除了行）时才全量重载。水位线为 None 表示下次需全量重载。
+_calibration_watermark: datetime | None = None
+# 水位线回退窗口：行版本取自语句执行时刻，晚提交的事务可能早于上次水位线
+_CALIBRATION_OVERLAP = timedelta(seconds=120)
+# 每隔多少次增量校准做一次校验和核对（维护循环约 60 秒校准一次）
+_CALIBRATION_VERIFY_EVERY = 10
+
 _WRITE_TABLE = re.compile(
     r"^\s*(?:INSERT(?:\s+OR\s+REPLACE)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+[`\"]?([A-Za-z_][A-Za-z0-9_]*)",
     re.IGNORECASE,
@@ -62,6 +93,162 @@ _CLEAR_TABLE = re.compile(
 # MySQL 风格 %(name)s 占位符 -> SQLite :name（预编译避免每条 SQL 重复编译正则）
 _MYSQL_STYLE_PARAM = re.compile(r"%\((\w+)\)s")
 
+# 回退模式批量写入后按主键回读行数据时，单条 IN 查询的主键数量上限
+_OUTBOX_FETCH_CHUNK = 500
+# MySQL 恢复后回放离线日志的分块大小；切换前的分块回放在块与块之间释放写锁
+OUTBOX_REPLAY_CHUNK = 500
+
+Statement = tuple[str, dict | None]
+
+
+class DatabaseBatch:
+    """``AsyncDatabase.batch()`` 期间排队的写操作，退出时合并为单个事务提交。"""
+
+    def __init__(self):
+        self.statements: list[Statement] = []
+        # 提交结果；提交前为 None
+        self.succeeded: bool | None = None
+        # flush() 提前提交的部分是否失败过
+        self.flush_failed = False
+
+    def add(self, sql: str, params: dict | None = None) -> None:
+        # 浅拷贝参数，调用方后续修改业务字典不影响已排队的写入
+        self.statements.append((sql, dict(params) if params is not None else None))
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+_current_batch: ContextVar[DatabaseBatch | None] = ContextVar(
+    "database_current_batch", default=None
+)
+
+
+def _group_statements(statements: Iterable[Statement]) -> list[tuple[str, list[dict | None]]]:
+    """将相邻的同一 SQL 合并为一组，便于 executemany。"""
+    groups: list[tuple[str, list[dict | None]]] = []
+    for sql, params in statements:
+        if groups and groups[-1][0] == sql:
+            groups[-1][1].append(params)
+        else:
+            groups.append((sql, [params]))
+    return groups
+
+
+# SQLite 只读连接池大小（WAL 模式下读者互不阻塞，也不阻塞写者）
+SQLITE_READER_POOL_SIZE = 3
+# 后端切换后等待旧代读者退出的最长时间（秒），超时后仍关闭旧连接池
+_GENERATION_DRAIN_TIMEOUT = 5.0
+
+
+@dataclass(eq=False)
+class _BackendGeneration:
+    """
+    读路径使用的后端快照（RCU 风格）。
+
+    读者获取当前代并登记，全程无锁；切换后端时发布新一代，旧代的 MySQL 连接池
+    等到已登记的读者全部退出后再关闭。
+    """
+
+    number: int
+    backend: str
+    pool: Any = None
+    readers: int = 0
+    _drained: asyncio.Event | None = None
+
+    def enter(self) -> None:
+        self.readers += 1
+
+    def exit(self) -> None:
+        self.readers -= 1
+        if self.readers == 0 and self._drained is not None:
+            self._drained.set()
+
+    async def wait_drained(self, timeout: float = _GENERATION_DRAIN_TIMEOUT) -> None:
+        if self.readers == 0:
+            return
+        self._drained = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout=timeout)
+        except TimeoutError:
+            _logger.warning("等待旧数据库后端读者退出超时（%d 个），继续切换", self.readers)
+
+
+_generation = _BackendGeneration(0, "sqlite")
+
+
+def _publish_generation() -> _BackendGeneration:
+    """按当前 _active_backend/_mysql_pool 发布新一代读快照，返回被替换的旧代。"""
+    global _generation
+    previous = _generation
+    _generation = _BackendGeneration(previous.number + 1, _active_backend, _mysql_pool)
+    return previous
+
+
+async def _retire_mysql_pool(previous: _BackendGeneration, pool) -> None:
+    """等待旧代读者退出后关闭其 MySQL 连接池。"""
+    if pool is None:
+        return
+    if previous.pool is pool:
+        await previous.wait_drained()
+    await close_mysql_pool(pool)
+
+
+class _SQLiteReaderPool:
+    """共享数据库文件上的只读 SQLite 连接池。"""
+
+    def __init__(self, size: int = SQLITE_READER_POOL_SIZE):
+        self.size = size
+        self._idle: list[aiosqlite.Connection] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._path: Path | None = None
+
+    async def _open(self, path: Path) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(str(path), timeout=30.0)
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA busy_timeout=30000")
+        await conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        path = DB_PATH.resolve()
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop or self._path != path:
+            # 数据库文件或事件循环变化（测试、重启）时丢弃旧连接
+            await self.close()
+            self._slots = asyncio.Semaphore(self.size)
+            self._loop = loop
+            self._path = path
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await self._open(path)
+            try:
+                yield conn
+            except BaseException:
+                # 查询失败时不复用该连接，避免残留游标或损坏状态
+                await _close_quietly(conn)
+                raise
+            self._idle.append(conn)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await _close_quietly(conn)
+        self._slots = None
+        self._loop = None
+        self._path = None
+
+
+async def _close_quietly(conn: aiosqlite.Connection) -> None:
+    try:
+        await conn.close()
+    except Exception as e:
+        _logger.debug("关闭 SQLite 只读连接失败: %s", e)
+
+
+_sqlite_readers = _SQLiteReaderPool()
+
 
 async def _configure_sqlite_connection(conn: aiosqlite.Connection) -> None:
     """统一 SQLite 连接的并发与返回值配置。"""
@@ -72,6 +259,22 @@ async def _configure_sqlite_connection(conn: aiosqlite.Connection) -> None:
     await conn.commit()
 
 
+async def _backfill_weibo_created_at(conn: aiosqlite.Connection) -> None:
+    """为旧数据回填 weibo.created_at（从「文本」末尾的发布时间解析）；仅处理 NULL 行。"""
+    try:
+        async with conn.execute("SELECT UID, 文本 FROM weibo WHERE created_at IS NULL") as cursor:
+            rows = await cursor.fetchall()
+        if not rows:
+            return
+        await conn.executemany(
+            "UPDATE weibo SET created_at = ? WHERE UID = ?",
+            [(weibo_created_at_timestamp(text), uid) for uid, text in rows],
+        )
+        _logger.info("已为 %d 条微博记录回填发布时间", len(rows))
+    except Exception as e:
+        _logger.warning("回填微博发布时间失败（不影响主流程）: %s", e)
+
+
 class AsyncDatabase:
     """兼容原 API 的异步数据库门面。"""
 
@@ -141,7 +344,8 @@ class AsyncDatabase:
                 正文结构 TEXT DEFAULT '[]',
                 标签 TEXT DEFAULT '[]',
                 内容类型 TEXT DEFAULT 'text',
-                视频封面 TEXT DEFAULT ''
+                视频封面 TEXT DEFAULT '',
+                created_at INTEGER
             )
         """
         )
@@ -161,8 +365,15 @@ class AsyncDatabase:
                 await conn.execute("ALTER TABLE weibo ADD COLUMN 内容类型 TEXT DEFAULT 'text'")
             if "视频封面" not in columns:
                 await conn.execute("ALTER TABLE weibo ADD COLUMN 视频封面 TEXT DEFAULT ''")
+            if "created_at" not in columns:
+                await conn.execute("ALTER TABLE weibo ADD COLUMN created_at INTEGER")
         except Exception as e:
             _logger.warning("为 weibo 表添加展示字段失败（不影响主流程）: %s", e)
+        # 数据页按发布时间倒序分页
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_weibo_created_at ON weibo (created_at DESC, UID)"
+        )
+        await _backfill_weibo_created_at(conn)
 
         # 创建 huya 表（基础字段）
         await conn.execute(
@@ -271,6 +482,13 @@ class AsyncDatabase:
             )
             """
         )
+        # 追加时按 (表, 主键) 压缩旧事件
+        await conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_mysql_sync_outbox_key
+            ON mysql_sync_outbox (table_name, pk_value)
+            """
+        )
 
         await conn.commit()
 
@@ -462,31 +680,60 @@ class AsyncDatabase:
             raise last_exception
 
     async def execute_query(self, sql: str, params: dict | None = None) -> list[tuple]:
-        """从当前权威后端查询；MySQL 断连时自动回退 SQLite。"""
+        """
+        从当前权威后端查询；MySQL 断连时自动回退 SQLite。
+
+        读路径不获取写锁：MySQL 直接使用连接池，SQLite 使用只读连接池（WAL 并发读）。
+        """
         sqlite_sql = self._convert_sql(sql)
         await self._ensure_connection()
         await _ensure_hybrid_runtime()
+        started = time.perf_counter()
         try:
-            async with _database_operation_lock:
-                if _active_backend == "mysql" and _mysql_pool is not None:
-                    try:
-                        return await mysql_query(_mysql_pool, sql, params)
-                    except Exception as exc:
-                        if not is_mysql_connection_error(exc):
-                            raise
+            generation = _generation
+            mysql_failed = False
+            if generation.backend == "mysql" and generation.pool is not None:
+                generation.enter()
+                try:
+                    return await mysql_query(generation.pool, sql, params)
+                except Exception as exc:
+                    if not is_mysql_connection_error(exc):
+                        raise
+                    mysql_failed = True
+                finally:
+                    generation.exit()
+            if mysql_failed:
+                async with _database_write_lock:
+                    # 其他读者/写者可能已完成回退或重连
+                    if _mysql_pool is generation.pool:
                         await _activate_sqlite_fallback_locked("MySQL 连接中断，已回退 SQLite")
-                return await _sqlite_query(self._conn, sqlite_sql, params)
+            return await self._sqlite_read(sqlite_sql, params)
         except Exception as e:
             _logger.error("数据库查询失败: %s\nSQL: %s", e, sqlite_sql)
             raise
+        finally:
+            DB_OPERATION_DURATION.observe(
+                time.perf_counter() - started, operation="query", backend=_active_backend
+            )
+
+    async def _sqlite_read(self, sql: str, params: dict | None) -> list[tuple]:
+        if not self._use_shared or self._conn is not _shared_connection:
+            return await _sqlite_query(self._conn, sql, params)
+        async with _sqlite_readers.connection() as conn:
+            return await _sqlite_query(conn, sql, params)
 
     async def execute_update(self, sql: str, params: dict | None = None) -> bool:
-        """写入权威后端并维护 SQLite 镜像。"""
+        """写入权威后端并维护 SQLite 镜像；处于 batch() 上下文时仅排队。"""
+        batch = _current_batch.get()
+        if batch is not None:
+            batch.add(sql, params)
+            return True
         sqlite_sql = self._convert_sql(sql)
         await self._ensure_connection()
         await _ensure_hybrid_runtime()
+        started = time.perf_counter()
         try:
-            async with _database_operation_lock:
+            async with _timed_write_lock("update"):
                 if _active_backend == "mysql" and _mysql_pool is not None:
                     try:
                         await mysql_update(_mysql_pool, sql, params)
@@ -500,6 +747,7 @@ class AsyncDatabase:
                             _set_sqlite_health(True)
                         except Exception as mirror_error:
                             _mark_mirror_degraded(mirror_error)
+                        _notify_tables_changed([sql])
                         return True
 
                 journal = bool(_mysql_settings and _mysql_settings.configured)
@@ -508,6 +756,7 @@ class AsyncDatabase:
                 else:
                     await _sqlite_update(self._conn, sqlite_sql, params)
                 _set_sqlite_health(True)
+                _notify_tables_changed([sql])
                 return True
         except Exception as e:
             try:
@@ -519,6 +768,121 @@ class AsyncDatabase:
                 _set_sqlite_health(False)
             _logger.error("数据库操作失败: %s\nSQL: %s", e, sqlite_sql)
             return False
+        finally:
+            DB_OPERATION_DURATION.observe(
+                time.perf_counter() - started, operation="update", backend=_active_backend
+            )
+
+    async def execute_many(self, sql: str, params_list: Iterable[dict | None]) -> bool:
+        """同一条 SQL 按多组参数批量写入（单个事务、executemany）。"""
+        return await self.execute_batch([(sql, params) for params in params_list])
+
+    async def execute_batch(self, statements: list[Statement]) -> bool:
+        """
+        在单个事务内执行一批写操作，并维护 SQLite 镜像与 MySQL 离线日志。
+
+        相邻的同一 SQL 使用 executemany；MySQL 回退模式下整批只追加一次离线日志。
+        处于 batch() 上下文时仅排队。
+
+        Returns:
+            整批全部成功时返回 True，失败时整批回滚并返回 False
+        """
+        batch = _current_batch.get()
+        if batch is not None:
+            for sql, params in statements:
+                batch.add(sql, params)
+            return True
+        if not statements:
+            return True
+
+        groups = _group_statements(statements)
+        sqlite_groups = [(self._convert_sql(sql), params_list) for sql, params_list in groups]
+        await self._ensure_connection()
+        await _ensure_hybrid_runtime()
+        started = time.perf_counter()
+        try:
+            async with _timed_write_lock("batch"):
+                if _active_backend == "mysql" and _mysql_pool is not None:
+                    try:
+                        await mysql_update_many(_mysql_pool, groups)
+                    except Exception as exc:
+                        if not is_mysql_connection_error(exc):
+                            raise
+                        await _activate_sqlite_fallback_locked("MySQL 连接中断，已回退 SQLite")
+                    else:
+                        try:
+                            await _sqlite_update_many(self._conn, sqlite_groups)
+                            _set_sqlite_health(True)
+                        except Exception as mirror_error:
+                            _mark_mirror_degraded(mirror_error)
+                        _notify_tables_changed(sql for sql, _ in groups)
+                        return True
+
+                journal = bool(_mysql_settings and _mysql_settings.configured)
+                if journal:
+                    await _sqlite_update_many_with_outbox(self._conn, sqlite_groups)
+                else:
+                    await _sqlite_update_many(self._conn, sqlite_groups)
+                _set_sqlite_health(True)
+                _notify_tables_changed(sql for sql, _ in groups)
+                return True
+        except Exception as e:
+            try:
+                if self._conn:
+                    await self._conn.rollback()
+            except Exception:
+                pass
+            if _active_backend != "mysql":
+                _set_sqlite_health(False)
+            _logger.error(
+                "数据库批量写入失败（%d 条语句）: %s\nSQL: %s",
+                len(statements),
+                e,
+                "; ".join(sql for sql, _ in sqlite_groups),
+            )
+            return False
+        finally:
+            DB_OPERATION_DURATION.observe(
+                time.perf_counter() - started, operation="batch", backend=_active_backend
+            )
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[DatabaseBatch]:
+        """
+        合并写操作：上下文内的 execute_update/insert/delete 先排队并返回 True，
+        退出时在单个事务中提交，结果记录在 ``DatabaseBatch.succeeded``。嵌套时复用外层批次。
+        """
+        outer = _current_batch.get()
+        if outer is not None:
+            yield outer
+            return
+        batch = DatabaseBatch()
+        token = _current_batch.set(batch)
+        try:
+            yield batch
+        finally:
+            _current_batch.reset(token)
+            committed = await self.execute_batch(batch.statements)
+            batch.succeeded = committed and not batch.flush_failed
+
+    async def flush_batch(self) -> bool:
+        """
+        提前提交当前 batch() 中已排队的写操作，供推送等外部副作用之前调用。
+
+        不在 batch() 中时直接返回 True；提交失败时整个批次最终记为失败。
+        """
+        batch = _current_batch.get()
+        if batch is None:
+            return True
+        statements, batch.statements = batch.statements, []
+        token = _current_batch.set(None)
+        try:
+            committed = await self.execute_batch(statements)
+        finally:
+            _current_batch.reset(token)
+        if not committed:
+            batch.flush_failed = True
+        return committed
 
     async def execute_insert(self, sql: str, params: dict | None = None) -> bool:
         """执行插入操作"""
@@ -597,6 +961,19 @@ async def _sqlite_update(
         raise
 
 
+async def _sqlite_update_many(
+    conn: aiosqlite.Connection,
+    groups: list[tuple[str, list[dict | None]]],
+) -> None:
+    try:
+        for sql, params_list in groups:
+            await conn.executemany(sql, [params or {} for params in params_list])
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+
+
 def _table_from_write_sql(sql: str) -> str | None:
     match = _WRITE_TABLE.match(sql)
     if match is None:
@@ -605,67 +982,141 @@ def _table_from_write_sql(sql: str) -> str | None:
     return table_name if table_name in TABLE_SPECS else None
 
 
+def _notify_tables_changed(sqls: Iterable[str]) -> None:
+    """写入成功后递增受影响监控表的版本号（Web 状态快照据此失效）。"""
+    tables = {table for sql in sqls if (table := _table_from_write_sql(sql)) is not None}
+    get_table_versions().bump(tables)
+
+
 async def _sqlite_update_with_outbox(
     conn: aiosqlite.Connection,
     sql: str,
     params: dict | None,
 ) -> None:
     """原子写入 SQLite 业务表和 MySQL 离线日志。"""
-    table_name = _table_from_write_sql(sql)
-    if table_name is None:
-        raise ValueError("MySQL 回退模式不支持未登记的数据表写入")
+    await _sqlite_update_many_with_outbox(conn, [(sql, [params])])
+
+
+def _outbox_operations(
+    groups: list[tuple[str, list[dict | None]]],
+) -> dict[tuple[str, str | None], str]:
+    """
+    推导一批写操作对应的离线日志事件：(表名, 主键) -> 操作类型。
+
+    同一主键只保留最后一次操作；整表清空会覆盖该表之前的事件。
+    """
+    operations: dict[tuple[str, str | None], str] = {}
+    for sql, params_list in groups:
+        table_name = _table_from_write_sql(sql)
+        if table_name is None:
+            raise ValueError("MySQL 回退模式不支持未登记的数据表写入")
+        spec = TABLE_SPECS[table_name]
+        is_delete = sql.lstrip().upper().startswith("DELETE")
+        is_clear = bool(_CLEAR_TABLE.fullmatch(sql))
+        for params in params_list:
+            if is_clear:
+                for key in [key for key in operations if key[0] == table_name]:
+                    del operations[key]
+                operations[(table_name, None)] = "clear"
+                continue
+            param_values = params or {}
+            pk_value_raw = param_values.get(spec.primary_key, param_values.get("pk"))
+            if pk_value_raw is None:
+                raise ValueError(
+                    f"MySQL 回退模式写入 {table_name} 时缺少主键参数 {spec.primary_key}"
+                )
+            key = (table_name, str(pk_value_raw))
+            # 重新插入使事件顺序跟随最后一次操作
+            operations.pop(key, None)
+            operations[key] = "delete" if is_delete else "upsert"
+    return operations
+
+
+async def _fetch_rows_by_pk(
+    conn: aiosqlite.Connection,
+    table_name: str,
+    pk_values: list[str],
+) -> dict[str, dict[str, Any]]:
     spec = TABLE_SPECS[table_name]
-    normalized = sql.lstrip().upper()
-    is_delete = normalized.startswith("DELETE")
-    is_clear = bool(_CLEAR_TABLE.fullmatch(sql))
-    param_values = params or {}
-    pk_value_raw = param_values.get(spec.primary_key, param_values.get("pk"))
-    if not is_clear and pk_value_raw is None:
-        raise ValueError(
-            f"MySQL 回退模式写入 {table_name} 时缺少主键参数 {spec.primary_key}"
-        )
+    quoted_columns = ", ".join(f'"{column}"' for column in spec.columns)
+    rows: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(pk_values), _OUTBOX_FETCH_CHUNK):
+        chunk = pk_values[start : start + _OUTBOX_FETCH_CHUNK]
+        placeholders = ",".join("?" for _ in chunk)
+        async with conn.execute(
+            f'SELECT {quoted_columns} FROM "{table_name}" '
+            f'WHERE "{spec.primary_key}" IN ({placeholders})',
+            chunk,
+        ) as cursor:
+            for row in await cursor.fetchall():
+                row_data = dict(zip(spec.columns, tuple(row), strict=True))
+                rows[str(row_data[spec.primary_key])] = row_data
+    return rows
+
+
+async def _sqlite_update_many_with_outbox(
+    conn: aiosqlite.Connection,
+    groups: list[tuple[str, list[dict | None]]],
+) -> None:
+    """在单个事务内批量写入 SQLite 业务表，并一次性追加对应的 MySQL 离线日志。"""
+    operations = _outbox_operations(groups)
 
     try:
         await conn.execute("BEGIN IMMEDIATE")
-        await conn.execute(sql, params)
-        if is_clear:
-            operation = "clear"
-            pk_value = None
+        for sql, params_list in groups:
+            await conn.executemany(sql, [params or {} for params in params_list])
+
+        upsert_pks: dict[str, list[str]] = {}
+        for (table_name, pk_value), operation in operations.items():
+            if operation == "upsert":
+                upsert_pks.setdefault(table_name, []).append(pk_value)
+        rows_by_table = {
+            table_name: await _fetch_rows_by_pk(conn, table_name, pk_values)
+            for table_name, pk_values in upsert_pks.items()
+        }
+
+        # 压缩离线日志：同一主键只保留最新状态，整表清空覆盖该表之前的全部事件
+        cleared_tables = [
+            table_name for (table_name, pk_value) in operations if pk_value is None
+        ]
+        if cleared_tables:
+            await conn.executemany(
+                "DELETE FROM mysql_sync_outbox WHERE table_name=?",
+                [(table_name,) for table_name in cleared_tables],
+            )
+        await conn.executemany(
+            "DELETE FROM mysql_sync_outbox WHERE table_name=? AND pk_value=?",
+            [key for key in operations if key[1] is not None],
+        )
+
+        created_at = datetime.now().isoformat(timespec="seconds")
+        events = []
+        for (table_name, pk_value), operation in operations.items():
             row_data = None
-        else:
-            pk_value = str(pk_value_raw)
-            if is_delete:
-                operation = "delete"
-                row_data = None
-            else:
-                quoted_columns = ", ".join(f'"{column}"' for column in spec.columns)
-                async with conn.execute(
-                    f'SELECT {quoted_columns} FROM "{table_name}" WHERE "{spec.primary_key}"=:pk',
-                    {"pk": pk_value},
-                ) as cursor:
-                    row = await cursor.fetchone()
+            if operation == "upsert":
+                row = rows_by_table[table_name].get(pk_value)
                 if row is None:
+                    spec = TABLE_SPECS[table_name]
                     raise RuntimeError(
                         f"写入 {table_name} 后未找到主键 {spec.primary_key}={pk_value}"
                     )
-                operation = "upsert"
-                row_data = json.dumps(
-                    dict(zip(spec.columns, tuple(row), strict=True)),
-                    ensure_ascii=False,
-                )
-        await conn.execute(
+                row_data = json.dumps(row, ensure_ascii=False)
+            events.append(
+                {
+                    "table_name": table_name,
+                    "pk_value": pk_value,
+                    "operation": operation,
+                    "row_data": row_data,
+                    "created_at": created_at,
+                }
+            )
+        await conn.executemany(
             """
             INSERT INTO mysql_sync_outbox
                 (table_name, pk_value, operation, row_data, created_at)
             VALUES (:table_name, :pk_value, :operation, :row_data, :created_at)
             """,
-            {
-                "table_name": table_name,
-                "pk_value": pk_value,
-                "operation": operation,
-                "row_data": row_data,
-                "created_at": datetime.now().isoformat(timespec="seconds"),
-            },
+            events,
         )
         await conn.commit()
     except Exception:
@@ -712,9 +1163,73 @@ async def _replace_sqlite_tables(
         raise
 
 
-async def _load_outbox(conn: aiosqlite.Connection) -> list[dict[str, Any]]:
+async def _upsert_sqlite_rows(
+    conn: aiosqlite.Connection,
+    tables: dict[str, list[dict[str, Any]]],
+) -> dict[str, int]:
+    """
+    将增量变更行写入 SQLite 镜像（单个短事务），返回每张表实际发生变化的行数。
+
+    水位线回退窗口内会重复拉到已同步的行，内容完全相同的行不写入也不计数，
+    避免每轮校准都让状态快照失效。
+    """
+    changed: dict[str, int] = {}
+    if not any(tables.values()):
+        return changed
+    try:
+        await conn.execute("BEGIN IMMEDIATE")
+        for spec in TABLE_SPECS.values():
+            rows = tables.get(spec.name, [])
+            if not rows:
+                continue
+            quoted_columns = ", ".join(f'"{column}"' for column in spec.columns)
+            placeholders = ", ".join(f":{column}" for column in spec.columns)
+            others = [column for column in spec.columns if column != spec.primary_key]
+            assignments = ", ".join(f'"{column}" = excluded."{column}"' for column in others)
+            differs = " OR ".join(
+                f'"{spec.name}"."{column}" IS NOT excluded."{column}"' for column in others
+            )
+            before = conn.total_changes
+            await conn.executemany(
+                f'INSERT INTO "{spec.name}" ({quoted_columns}) VALUES ({placeholders}) '
+                f'ON CONFLICT("{spec.primary_key}") DO UPDATE SET {assignments} '
+                f"WHERE {differs}",
+                [{column: row.get(column) for column in spec.columns} for row in rows],
+            )
+            if conn.total_changes > before:
+                changed[spec.name] = conn.total_changes - before
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+    return changed
+
+
+async def _sqlite_table_checksums(conn: aiosqlite.Connection) -> dict[str, tuple[int, int]]:
+    """按表计算 SQLite 镜像的 (行数, 各行 CRC32 异或值)，算法与 MySQL 侧一致。"""
+    result: dict[str, tuple[int, int]] = {}
+    for spec in TABLE_SPECS.values():
+        quoted_columns = ", ".join(f'"{column}"' for column in spec.columns)
+        count = 0
+        checksum = 0
+        async with conn.execute(f'SELECT {quoted_columns} FROM "{spec.name}"') as cursor:
+            async for row in cursor:
+                count += 1
+                checksum ^= row_checksum(tuple(row))
+        result[spec.name] = (count, checksum)
+    return result
+
+
+async def _load_outbox(
+    conn: aiosqlite.Connection,
+    *,
+    after_id: int = 0,
+    limit: int = -1,
+) -> list[dict[str, Any]]:
     async with conn.execute(
-        "SELECT id, table_name, pk_value, operation, row_data FROM mysql_sync_outbox ORDER BY id"
+        "SELECT id, table_name, pk_value, operation, row_data FROM mysql_sync_outbox "
+        "WHERE id > ? ORDER BY id LIMIT ?",
+        (after_id, limit),
     ) as cursor:
         rows = await cursor.fetchall()
     events = []
@@ -731,6 +1246,96 @@ async def _load_outbox(conn: aiosqlite.Connection) -> list[dict[str, Any]]:
     return events
 
 
+async def _compact_outbox(conn: aiosqlite.Connection) -> int:
+    """
+    压缩历史离线日志（兼容压缩上线前积累的日志），返回删除的事件数。
+
+    每个 (表, 主键) 只保留最后一条事件，并丢弃各表最后一次 clear 之前的事件。
+    """
+    try:
+        cursor = await conn.execute(
+            """
+            DELETE FROM mysql_sync_outbox
+            WHERE pk_value IS NOT NULL
+              AND id NOT IN (
+                  SELECT MAX(id) FROM mysql_sync_outbox
+                  WHERE pk_value IS NOT NULL
+                  GROUP BY table_name, pk_value
+              )
+            """
+        )
+        removed = cursor.rowcount
+        cursor = await conn.execute(
+            """
+            DELETE FROM mysql_sync_outbox
+            WHERE id < (
+                SELECT MAX(cleared.id) FROM mysql_sync_outbox AS cleared
+                WHERE cleared.table_name = mysql_sync_outbox.table_name
+                  AND cleared.operation = 'clear'
+            )
+            """
+        )
+        removed += cursor.rowcount
+        await conn.commit()
+    except Exception:
+        await conn.rollback()
+        raise
+    return removed
+
+
+@asynccontextmanager
+async def _timed_write_lock(operation: str) -> AsyncIterator[None]:
+    """持有写锁并记录排队等待时间。"""
+    started = time.perf_counter()
+    async with _database_write_lock:
+        DB_WRITE_LOCK_WAIT.observe(time.perf_counter() - started, operation=operation)
+        yield
+
+
+async def _replay_outbox_chunk(conn: aiosqlite.Connection, pool) -> int:
+    """回放最早的一块离线日志并在 MySQL 提交后删除，返回回放的事件数。"""
+    events = await _load_outbox(conn, limit=OUTBOX_REPLAY_CHUNK)
+    if events:
+        await replay_mysql_events(pool, events)
+        await _clear_outbox(conn, [event["id"] for event in events])
+    return len(events)
+
+
+async def _replay_outbox_locked(conn: aiosqlite.Connection, pool) -> int:
+    """
+    持有写锁时压缩并回放全部离线日志到 MySQL，返回回放的事件数。
+
+    每块在独立的 MySQL 事务中提交后删除对应日志；回放是幂等的，中途失败可从剩余日志继续。
+    """
+    removed = await _compact_outbox(conn)
+    if removed:
+        _logger.info("已压缩 MySQL 离线日志: 合并 %d 条过期事件", removed)
+    replayed = 0
+    while count := await _replay_outbox_chunk(conn, pool):
+        replayed += count
+    return replayed
+
+
+async def _replay_outbox_in_chunks(conn: aiosqlite.Connection, pool) -> int:
+    """
+    切换到 MySQL 前分块回放积压的离线日志，返回回放的事件数。
+
+    每块单独持有写锁，块与块之间排队的写者可以先执行；期间新写入的日志（id 更大）在后续块中一并回放，
+    最后剩余的日志在同步时持锁回放。
+    """
+    async with _database_write_lock:
+        removed = await _compact_outbox(conn)
+    if removed:
+        _logger.info("已压缩 MySQL 离线日志: 合并 %d 条过期事件", removed)
+    replayed = 0
+    while True:
+        async with _database_write_lock:
+            count = await _replay_outbox_chunk(conn, pool)
+        if not count:
+            return replayed
+        replayed += count
+
+
 async def _clear_outbox(conn: aiosqlite.Connection, event_ids: list[int] | None = None) -> None:
     if event_ids:
         placeholders = ",".join("?" for _ in event_ids)
@@ -746,23 +1351,26 @@ async def _clear_outbox(conn: aiosqlite.Connection, event_ids: list[int] | None
 async def _synchronize_connected_mysql_locked(pool) -> None:
     """按初始化规则对齐已连接的 MySQL 与 SQLite。"""
     global _sync_state, _last_sync_at, _status_message, _mirror_degraded
+    global _calibration_watermark
     conn = _shared_connection
     if conn is None:
         raise RuntimeError("SQLite 尚未初始化")
 
     _sync_state = "replaying"
     _status_message = "正在同步 MySQL 与 SQLite"
-    events = await _load_outbox(conn)
     if await mysql_tables_empty(pool):
         await replace_mysql_tables(pool, await _fetch_sqlite_tables(conn))
         await _clear_outbox(conn)
     else:
-        if events:
-            await replay_mysql_events(pool, events)
-            await _clear_outbox(conn, [event["id"] for event in events])
+        replayed = await _replay_outbox_locked(conn, pool)
+        if replayed:
+            _logger.info("已回放 MySQL 离线日志: %d 条", replayed)
         await _replace_sqlite_tables(conn, await fetch_mysql_tables(pool))
+        get_table_versions().bump(TABLE_SPECS)
 
     _mirror_degraded = False
+    # 首次校准按全量重载建立水位线
+    _calibration_watermark = None
     _last_sync_at = datetime.now().isoformat(timespec="seconds")
     _sync_state = "in_sync"
     _status_message = "MySQL 主库与 SQLite 镜像已同步"
@@ -773,10 +1381,11 @@ async def _activate_sqlite_fallback_locked(message: str) -> None:
     pool = _mysql_pool
     _mysql_pool = None
     _active_backend = "sqlite"
+    previous = _publish_generation()
     _sync_state = "fallback"
     _mysql_reachable = False
     _status_message = message
-    await close_mysql_pool(pool)
+    await _retire_mysql_pool(previous, pool)
     _start_maintenance_task()
 
 
@@ -797,6 +1406,7 @@ def _start_maintenance_task() -> None:
 
 async def _maintenance_loop() -> None:
     calibration_ticks = 0
+    calibrations = 0
     while not _maintenance_stop.is_set():
         try:
             await asyncio.wait_for(_maintenance_stop.wait(), timeout=30)
@@ -815,7 +1425,10 @@ async def _maintenance_loop() -> None:
                 continue
             calibration_ticks += 1
             if calibration_ticks >= 2:
-                await calibrate_sqlite_mirror()
+                calibrations += 1
+                await calibrate_sqlite_mirror(
+                    verify=calibrations % _CALIBRATION_VERIFY_EVERY == 0
+                )
                 calibration_ticks = 0
         except asyncio.CancelledError:
             raise
@@ -823,14 +1436,63 @@ async def _maintenance_loop() -> None:
             _logger.warning("数据库后台维护失败: %s", type(exc).__name__)
 
 
-async def calibrate_sqlite_mirror() -> None:
+async def _reload_sqlite_mirror_locked(pool) -> None:
+    """全量重载 SQLite 镜像，并以重载前的服务器时间作为新水位线。"""
+    global _calibration_watermark
+    watermark = await mysql_server_time(pool)
+    await _replace_sqlite_tables(_shared_connection, await fetch_mysql_tables(pool))
+    _calibration_watermark = watermark
+    get_table_versions().bump(TABLE_SPECS)
+
+
+async def _apply_mysql_changes_locked(pool) -> int:
+    """按水位线增量拉取 MySQL 变更并写入 SQLite 镜像。"""
+    global _calibration_watermark
+    watermark = await mysql_server_time(pool)
+    changes = await fetch_mysql_changes(pool, _calibration_watermark - _CALIBRATION_OVERLAP)
+    changed = await _upsert_sqlite_rows(_shared_connection, changes)
+    _set_sqlite_health(True)
+    _calibration_watermark = watermark
+    if changed:
+        # 其他实例写入的变更同样需要让状态快照失效；回退窗口内重复拉到的未变行不计入
+        get_table_versions().bump(changed)
+    return sum(changed.values())
+
+
+async def _sqlite_mirror_matches(pool) -> bool:
+    """比较两端每张表的行数与校验和。"""
+    mysql_checksums = await mysql_table_checksums(pool)
+    sqlite_checksums = await _sqlite_table_checksums(_shared_connection)
+    mismatched = [
+        table_name
+        for table_name, checksum in mysql_checksums.items()
+        if sqlite_checksums.get(table_name) != checksum
+    ]
+    if mismatched:
+        _logger.warning("SQLite 镜像校验不一致，将全量重载: %s", ", ".join(mismatched))
+    return not mismatched
+
+
+async def calibrate_sqlite_mirror(*, verify: bool = False) -> None:
+    """
+    校准 SQLite 镜像：默认仅按水位线增量拉取变更行。
+
+    Args:
+        verify: 增量校准后再以行数+校验和核对两端，不一致时全量重载
+    """
     global _last_sync_at, _sync_state, _status_message, _mirror_degraded
-    async with _database_operation_lock:
+    async with _database_write_lock:
         if _active_backend != "mysql" or _mysql_pool is None or _shared_connection is None:
             return
         try:
-            tables = await fetch_mysql_tables(_mysql_pool)
-            await _replace_sqlite_tables(_shared_connection, tables)
+            if _mirror_degraded or _calibration_watermark is None:
+                await _reload_sqlite_mirror_locked(_mysql_pool)
+            else:
+                applied = await _apply_mysql_changes_locked(_mysql_pool)
+                if applied:
+                    _logger.debug("SQLite 镜像增量校准: %d 行", applied)
+                if verify and not await _sqlite_mirror_matches(_mysql_pool):
+                    await _reload_sqlite_mirror_locked(_mysql_pool)
             _last_sync_at = datetime.now().isoformat(timespec="seconds")
             _mirror_degraded = False
             _sync_state = "in_sync"
@@ -864,11 +1526,14 @@ async def reconfigure_database(config=None, *, force: bool = False) -> dict[str,
             _start_maintenance_task()
             return await get_database_status()
 
-        async with _database_operation_lock:
+        async with _database_write_lock:
             old_pool = _mysql_pool
             _mysql_pool = None
+            _active_backend = "sqlite"
+            # 新读者立即转向 SQLite；旧代读者退出后再关闭旧连接池
+            previous = _publish_generation()
             if old_pool is not None:
-                if _active_backend == "mysql" and _shared_connection is not None:
+                if previous.backend == "mysql" and _shared_connection is not None:
                     try:
                         await _replace_sqlite_tables(
                             _shared_connection,
@@ -876,10 +1541,9 @@ async def reconfigure_database(config=None, *, force: bool = False) -> dict[str,
                         )
                     except Exception as exc:
                         _logger.warning("切换前校准 SQLite 失败: %s", type(exc).__name__)
-                await close_mysql_pool(old_pool)
+                await _retire_mysql_pool(previous, old_pool)
 
             _mysql_settings = settings
-            _active_backend = "sqlite"
             _mysql_reachable = False
             if not settings.configured:
                 _sync_state = "sqlite_only"
@@ -890,20 +1554,28 @@ async def reconfigure_database(config=None, *, force: bool = False) -> dict[str,
                 )
                 return await get_database_status()
 
-            pool = None
-            try:
-                pool = await create_mysql_pool(settings)
-                await initialize_mysql_schema(pool)
+        pool = None
+        try:
+            pool = await create_mysql_pool(settings)
+            await initialize_mysql_schema(pool)
+            if not await mysql_tables_empty(pool):
+                # 积压的离线日志先逐块回放，期间写入仍落到 SQLite 并追加日志
+                _sync_state = "replaying"
+                _status_message = "正在同步 MySQL 与 SQLite"
+                replayed = await _replay_outbox_in_chunks(_shared_connection, pool)
+                if replayed:
+                    _logger.info("已回放 MySQL 离线日志: %d 条", replayed)
+            async with _database_write_lock:
                 await _synchronize_connected_mysql_locked(pool)
-            except Exception as exc:
-                await close_mysql_pool(pool)
-                _sync_state = "fallback"
-                _status_message = "MySQL 暂时不可用，正在使用 SQLite 并等待重连"
-                _logger.warning("MySQL 连接或同步失败，已回退 SQLite: %s", type(exc).__name__)
-            else:
                 _mysql_pool = pool
                 _active_backend = "mysql"
+                _publish_generation()
                 _mysql_reachable = True
+        except Exception as exc:
+            await close_mysql_pool(pool)
+            _sync_state = "fallback"
+            _status_message = "MySQL 暂时不可用，正在使用 SQLite 并等待重连"
+            _logger.warning("MySQL 连接或同步失败，已回退 SQLite: %s", type(exc).__name__)
 
         _start_maintenance_task()
         return await get_database_status()
@@ -1010,6 +1682,7 @@ async def close_shared_connection():
     global _shared_connection, _connection_ref_count, _mysql_pool, _mysql_settings
     global _maintenance_task, _active_backend, _mysql_reachable, _sync_state
     global _sqlite_healthy, _mirror_degraded, _last_sync_at, _status_message
+    global _calibration_watermark
 
     _maintenance_stop.set()
     task = _maintenance_task
@@ -1023,14 +1696,17 @@ async def close_shared_connection():
 
     pool = _mysql_pool
     _mysql_pool = None
-    await close_mysql_pool(pool)
-    _mysql_settings = None
     _active_backend = "sqlite"
+    previous = _publish_generation()
+    await _retire_mysql_pool(previous, pool)
+    await _sqlite_readers.close()
+    _mysql_settings = None
     _mysql_reachable = False
     _sync_state = "sqlite_only"
     _sqlite_healthy = True
     _mirror_degraded = False
     _last_sync_at = None
+    _calibration_watermark = None
     _status_message = "未启用 MySQL，正在使用 SQLite"
 
     async with _connection_lock:
@@ -0,0 +1,175 @@
+"""微博图片按需缩放变体的磁盘缓存：``/weibo_img/...?w=320&fmt=webp`` 首次请求时生成并落盘。
+
+变体以 (原图相对路径, 原图 mtime/size, 宽度, 格式) 的哈希命名，原图替换后旧变体自然失效；
+缓存总大小超过上限时按最近访问时间（mtime，命中时刷新）淘汰最旧的变体。
+所有方法都是阻塞的文件系统/Pillow 操作，应通过媒体线程池调用。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from src.core.metrics import StatsCounters
+
+logger = logging.getLogger(__name__)
+
+# 请求宽度向上取整到这些档位，限制同一原图的变体数量
+IMAGE_VARIANT_WIDTHS = (96, 160, 320, 480, 640, 960, 1280, 1920)
+# 格式参数 -> (Pillow 格式, 文件扩展名, Content-Type)
+IMAGE_VARIANT_FORMATS = {
+    "webp": ("WEBP", ".webp", "image/webp"),
+    "jpeg": ("JPEG", ".jpg", "image/jpeg"),
+}
+IMAGE_VARIANT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# 淘汰到上限的该比例以下，避免每次写入都触发淘汰
+IMAGE_VARIANT_CACHE_LOW_WATERMARK = 0.9
+IMAGE_VARIANT_QUALITY = 82
+
+
+def snap_variant_width(width: int) -> int:
+    """把请求宽度取整到最近的不小于它的档位（超过最大档位时取最大档位）。"""
+    for candidate in IMAGE_VARIANT_WIDTHS:
+        if width <= candidate:
+            return candidate
+    return IMAGE_VARIANT_WIDTHS[-1]
+
+
+def normalize_variant_format(fmt: str | None) -> str | None:
+    """规范化格式参数（jpg 视为 jpeg），不支持时返回 None。"""
+    fmt = (fmt or "jpeg").strip().lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    return fmt if fmt in IMAGE_VARIANT_FORMATS else None
+
+
+@dataclass
+class ImageVariantStats(StatsCounters):
+    """变体缓存统计。"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+
+class ImageVariantCache:
+    """以 ``<root>/<aa>/<key><ext>`` 保存缩放变体的 LRU 磁盘缓存。"""
+
+    def __init__(self, root: Path, max_bytes: int = IMAGE_VARIANT_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+        self._stats = ImageVariantStats()
+
+    def variant_path(self, source: Path, rel: str, width: int, fmt: str) -> Path:
+        stat = source.stat()
+        digest = hashlib.sha1(
+            f"{rel}\0{stat.st_mtime_ns}\0{stat.st_size}\0{width}\0{fmt}".encode()
+        ).hexdigest()
+        return self.root / digest[:2] / f"{digest}{IMAGE_VARIANT_FORMATS[fmt][1]}"
+
+    def get_or_create(self, source: Path, rel: str, width: int, fmt: str) -> Path:
+        """返回变体文件路径，不存在时缩放生成；原图无法解码时抛出异常。"""
+        target = self.variant_path(source, rel, width, fmt)
+        try:
+            # 命中时刷新 mtime，作为 LRU 的访问时间
+            os.utime(target)
+            self._stats.hits += 1
+            return target
+        except FileNotFoundError:
+            pass
+        self._stats.misses += 1
+        try:
+            size = self._render(source, target, width, fmt)
+        except Exception:
+            self._stats.errors += 1
+            raise
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked(keep=target)
+        return target
+
+    @staticmethod
+    def _render(source: Path, target: Path, width: int, fmt: str) -> int:
+        pil_format = IMAGE_VARIANT_FORMATS[fmt][0]
+        with Image.open(source) as img:
+            img = ImageOps.exif_transpose(img)
+            if img.width > width:
+                height = max(1, round(img.height * width / img.width))
+                img = img.resize((width, height), Image.Resampling.LANCZOS)
+            if pil_format == "JPEG" and img.mode != "RGB":
+                rgba = img.convert("RGBA")
+                img = Image.new("RGB", rgba.size, (255, 255, 255))
+                img.paste(rgba, mask=rgba.getchannel("A"))
+            elif img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                img.save(staging, pil_format, quality=IMAGE_VARIANT_QUALITY, optimize=True)
+                os.replace(staging, target)
+            finally:
+                staging.unlink(missing_ok=True)
+        return target.stat().st_size
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        if not self.root.is_dir():
+            return entries
+        for path in self.root.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict_locked(self, keep: Path) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * IMAGE_VARIANT_CACHE_LOW_WATERMARK
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self._stats.evictions += 1
+        self._total_bytes = total
+        logger.debug("微博图片变体缓存淘汰后大小: %d 字节", total)
+
+    def stats(self) -> dict[str, int]:
+        return {**self._stats.as_dict(), "bytes": self._total_bytes or 0}
+
+
+_caches: dict[Path, ImageVariantCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_image_variant_cache(root: Path) -> ImageVariantCache:
+    """获取指定缓存目录的变体缓存实例。"""
+    root = Path(root)
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = ImageVariantCache(root)
+        return cache
@@ -0,0 +1,172 @@
+"""微博媒体内容寻址存储：按 尺寸/pic_id 或 URL 哈希去重，并以硬链接挂入 用户/mid 目录。
+
+同一张图片（例如多个账号转发同一条原微博）只下载、只占一份磁盘；``data/weibo/<用户>/...``
+下的文件是指向 ``.blobs`` 中对象的硬链接，文件的链接数即引用计数。删除用户目录时通过
+``release()`` 回收不再被引用的对象（链接数回落到 1）。文件系统不支持硬链接时退化为复制，
+此时去重失效但目录布局与读取方式不变。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from src.core.metrics import StatsCounters
+
+logger = logging.getLogger(__name__)
+
+MEDIA_BLOB_DIR_NAME = ".blobs"
+
+# 新浪图床文件名即 pic_id（如 006abcDEgy1hxxxx.jpg）；同一 pic_id 在不同尺寸目录
+# （large/mw690/orj480/crop.0.0.180.180.50）下是不同的图片内容
+_PIC_ID_RE = re.compile(r"^[0-9A-Za-z]{16,}\.(?:jpe?g|png|gif|webp)$", re.IGNORECASE)
+
+
+def media_key(url: str) -> str:
+    """计算图片 URL 的内容寻址键：优先使用 尺寸目录/pic_id（不区分图床域名），否则使用去掉查询参数的 host+path。"""
+    parts = urlsplit(str(url or "").strip())
+    *_, size, basename = ["", *parts.path.rsplit("/", 2)]
+    if _PIC_ID_RE.match(basename):
+        source = f"{size}/{basename}".lower()
+    else:
+        # Expires/ssig 等签名参数每次都会变化，不参与寻址
+        source = f"{parts.netloc}{parts.path}"
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class MediaStoreStats(StatsCounters):
+    """内容寻址存储统计。"""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    blobs_collected: int = 0
+    link_fallbacks: int = 0
+
+
+class MediaStore:
+    """以 ``<root>/.blobs/<aa>/<key>.jpg`` 保存图片对象的内容寻址存储。
+
+    所有方法都是阻塞的文件系统操作，应通过媒体线程池调用；内部锁保证链接与回收互斥。
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blob_dir = self.root / MEDIA_BLOB_DIR_NAME
+        self._lock = threading.Lock()
+        self._stats = MediaStoreStats()
+
+    def blob_path(self, key: str) -> Path:
+        return self.blob_dir / key[:2] / f"{key}.jpg"
+
+    def _link(self, blob: Path, dest: Path) -> bool:
+        """把对象以硬链接方式原子地放到 dest；不支持硬链接时复制并返回 False。"""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        staging = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.link")
+        linked = True
+        try:
+            os.link(blob, staging)
+        except OSError:
+            self._stats.link_fallbacks += 1
+            shutil.copyfile(blob, staging)
+            linked = False
+        os.replace(staging, dest)
+        return linked
+
+    def link_existing(self, key: str, dest: Path) -> bool:
+        """对象已存在时直接链接到 dest 并返回 True（免下载）。"""
+        blob = self.blob_path(key)
+        with self._lock:
+            try:
+                size = blob.stat().st_size
+            except FileNotFoundError:
+                self._stats.misses += 1
+                return False
+            if size == 0:
+                self._stats.misses += 1
+                return False
+            self._link(blob, dest)
+            self._stats.hits += 1
+            self._stats.bytes_saved += size
+        return True
+
+    def adopt(self, source: Path, key: str, dest: Path) -> None:
+        """将已下载完成的文件收入存储，并链接到 dest；source 会被移动。"""
+        blob = self.blob_path(key)
+        with self._lock:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, blob)
+            if not self._link(blob, dest):
+                # 无法以链接数计数引用时不保留对象，避免存储无限增长
+                blob.unlink(missing_ok=True)
+
+    def put_bytes(self, key: str, content: bytes, dest: Path) -> None:
+        """写入内存中的图片内容并链接到 dest。"""
+        blob = self.blob_path(key)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        staging = blob.with_name(f".{blob.name}.{uuid.uuid4().hex}.download")
+        staging.write_bytes(content)
+        self.adopt(staging, key, dest)
+
+    def release(self, path: Path) -> None:
+        """删除文件或目录，并回收其中不再被引用的对象。"""
+        if not path.exists():
+            return
+        if path.is_dir():
+            # 目录中存在多链接文件时才需要回收，普通缩略图等无需扫描存储
+            referenced = any(
+                child.is_file() and child.stat().st_nlink > 1 for child in path.rglob("*")
+            )
+            shutil.rmtree(path)
+        else:
+            referenced = path.stat().st_nlink > 1
+            path.unlink()
+        if referenced:
+            self.collect()
+
+    def collect(self) -> int:
+        """回收链接数为 1（只剩存储自身引用）的对象，返回回收数量。"""
+        if not self.blob_dir.is_dir():
+            return 0
+        removed = 0
+        with self._lock:
+            for blob in self.blob_dir.glob("*/*.jpg"):
+                if blob.name.startswith("."):
+                    # 正在写入的临时文件
+                    continue
+                try:
+                    if blob.stat().st_nlink <= 1:
+                        blob.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+            self._stats.blobs_collected += removed
+        if removed:
+            logger.debug("已回收未引用的微博媒体对象: %s 个", removed)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        return self._stats.as_dict()
+
+
+_stores: dict[Path, MediaStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_media_store(root: Path) -> MediaStore:
+    """获取指定媒体根目录（通常为 data/weibo）的存储实例。"""
+    root = Path(root)
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = MediaStore(root)
+        return store
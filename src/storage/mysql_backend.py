@@ -5,11 +5,15 @@ from __future__ import annotations
 import asyncio
 import re
 import warnings
+import zlib
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 import aiomysql
 
+from src.storage.weibo_time import weibo_created_at_timestamp
+
 
 @dataclass(frozen=True)
 class TableSpec:
@@ -38,6 +42,7 @@ TABLE_SPECS: dict[str, TableSpec] = {
             "标签",
             "内容类型",
             "视频封面",
+            "created_at",
         ),
         """
         CREATE TABLE IF NOT EXISTS `weibo` (
@@ -54,7 +59,9 @@ TABLE_SPECS: dict[str, TableSpec] = {
             `正文结构` LONGTEXT,
             `标签` LONGTEXT,
             `内容类型` LONGTEXT,
-            `视频封面` LONGTEXT
+            `视频封面` LONGTEXT,
+            `created_at` BIGINT NULL,
+            INDEX `idx_weibo_created_at` (`created_at`, `UID`)
         ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci
         """,
     ),
@@ -158,6 +165,7 @@ MYSQL_COLUMN_MIGRATIONS: dict[str, dict[str, str]] = {
         "标签": "LONGTEXT NULL",
         "内容类型": "LONGTEXT NULL",
         "视频封面": "LONGTEXT NULL",
+        "created_at": "BIGINT NULL",
     },
     "huya": {
         "room_pic": "LONGTEXT NULL",
@@ -169,6 +177,19 @@ MYSQL_COLUMN_MIGRATIONS: dict[str, dict[str, str]] = {
 }
 
 
+# 每张表的行版本列，由 MySQL 在插入/更新时自动维护（无论写入来自哪个实例），
+# 供 SQLite 镜像按水位线增量校准。SQLite 镜像不保存该列。
+MYSQL_ROW_VERSION_COLUMN = "row_updated_at"
+_ROW_VERSION_DDL = (
+    f"ADD COLUMN `{MYSQL_ROW_VERSION_COLUMN}` TIMESTAMP(6) NOT NULL "
+    "DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6), "
+    f"ADD INDEX `idx_{MYSQL_ROW_VERSION_COLUMN}` (`{MYSQL_ROW_VERSION_COLUMN}`)"
+)
+
+# 行校验和的字段分隔符；MySQL 与 Python 两侧必须保持一致
+_CHECKSUM_SEPARATOR = "\x1f"
+
+
 @dataclass(frozen=True)
 class MySQLSettings:
     enabled: bool
@@ -279,6 +300,8 @@ async def initialize_mysql_schema(pool: aiomysql.Pool) -> None:
                         )
                         await cursor.execute(spec.mysql_ddl)
                 await _migrate_mysql_columns(cursor)
+                await _migrate_mysql_row_versions(cursor)
+                await _migrate_mysql_weibo_created_at(cursor)
             await conn.commit()
         except Exception:
             await conn.rollback()
@@ -310,6 +333,62 @@ async def _migrate_mysql_columns(cursor) -> None:
                     raise
 
 
+async def _migrate_mysql_row_versions(cursor) -> None:
+    """为每张表补齐行版本列及其索引。"""
+    for spec in TABLE_SPECS.values():
+        await cursor.execute(
+            """
+            SELECT 1
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+            """,
+            (spec.name, MYSQL_ROW_VERSION_COLUMN),
+        )
+        if await cursor.fetchone() is not None:
+            continue
+        try:
+            await cursor.execute(f"ALTER TABLE `{spec.name}` {_ROW_VERSION_DDL}")
+        except aiomysql.OperationalError as exc:
+            if not exc.args or exc.args[0] not in (1060, 1061):
+                raise
+
+
+async def _migrate_mysql_weibo_created_at(cursor) -> None:
+    """
+    为 weibo 补齐 (created_at, UID) 复合索引，并从「文本」回填旧数据的发布时间。
+
+    早期版本的索引只含 created_at，键集分页的 UID 条件无法走索引，在此重建。
+    """
+    await cursor.execute(
+        """
+        SELECT COLUMN_NAME
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'weibo'
+          AND INDEX_NAME = 'idx_weibo_created_at'
+        ORDER BY SEQ_IN_INDEX
+        """
+    )
+    index_columns = [row[0] for row in await cursor.fetchall()]
+    if index_columns != ["created_at", "UID"]:
+        drop = "DROP INDEX `idx_weibo_created_at`, " if index_columns else ""
+        try:
+            await cursor.execute(
+                f"ALTER TABLE `weibo` {drop}ADD INDEX `idx_weibo_created_at` (`created_at`, `UID`)"
+            )
+        except aiomysql.OperationalError as exc:
+            # 多实例可能同时完成同一迁移：1061 重复索引，1091 索引已被删除
+            if not exc.args or exc.args[0] not in (1061, 1091):
+                raise
+
+    await cursor.execute("SELECT `UID`, `文本` FROM `weibo` WHERE `created_at` IS NULL")
+    rows = await cursor.fetchall()
+    if rows:
+        await cursor.executemany(
+            "UPDATE `weibo` SET `created_at` = %s WHERE `UID` = %s",
+            [(weibo_created_at_timestamp(text), uid) for uid, text in rows],
+        )
+
+
 async def mysql_query(pool: aiomysql.Pool, sql: str, params: dict | None = None) -> list[tuple]:
     converted_sql = convert_mysql_sql(sql)
     async with pool.acquire() as conn:
@@ -330,6 +409,26 @@ async def mysql_update(pool: aiomysql.Pool, sql: str, params: dict | None = None
             raise
 
 
+async def mysql_update_many(
+    pool: aiomysql.Pool,
+    statements: list[tuple[str, list[dict | None]]],
+) -> None:
+    """在单个 MySQL 事务内执行多组写入，每组同一 SQL 使用 executemany。"""
+    async with pool.acquire() as conn:
+        try:
+            async with conn.cursor() as cursor:
+                for sql, params_list in statements:
+                    converted_sql = convert_mysql_sql(sql)
+                    await cursor.executemany(
+                        converted_sql,
+                        [select_mysql_params(converted_sql, params) for params in params_list],
+                    )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            raise
+
+
 async def test_mysql_connection(settings: MySQLSettings) -> None:
     pool = await create_mysql_pool(settings)
     try:
@@ -353,6 +452,56 @@ async def fetch_mysql_tables(pool: aiomysql.Pool) -> dict[str, list[dict[str, An
     return result
 
 
+async def mysql_server_time(pool: aiomysql.Pool) -> datetime:
+    """MySQL 服务器当前时间，作为增量校准水位线（避免两端时钟偏差）。"""
+    rows = await mysql_query(pool, "SELECT NOW(6)")
+    return rows[0][0]
+
+
+async def fetch_mysql_changes(
+    pool: aiomysql.Pool,
+    since: datetime,
+) -> dict[str, list[dict[str, Any]]]:
+    """拉取行版本不早于 since 的行（插入与更新；删除由校验和核对发现）。"""
+    result: dict[str, list[dict[str, Any]]] = {}
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            for spec in TABLE_SPECS.values():
+                await cursor.execute(
+                    f"SELECT {_quoted_columns(spec)} FROM `{spec.name}` "
+                    f"WHERE `{MYSQL_ROW_VERSION_COLUMN}` >= %s",
+                    (since,),
+                )
+                rows = await cursor.fetchall()
+                result[spec.name] = [dict(zip(spec.columns, row, strict=True)) for row in rows]
+        # 结束只读事务，避免连接归还后仍持有旧快照
+        await conn.commit()
+    return result
+
+
+def row_checksum(values: tuple[Any, ...] | list[Any]) -> int:
+    """单行校验和：与 mysql_table_checksums 中的 SQL 表达式逐字节一致。"""
+    text = _CHECKSUM_SEPARATOR.join("" if value is None else str(value) for value in values)
+    return zlib.crc32(text.encode("utf-8"))
+
+
+async def mysql_table_checksums(pool: aiomysql.Pool) -> dict[str, tuple[int, int]]:
+    """按表返回 (行数, 各行 CRC32 异或值)，校验过程不把行数据传回客户端。"""
+    result: dict[str, tuple[int, int]] = {}
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            for spec in TABLE_SPECS.values():
+                fields = ", ".join(f"IFNULL(`{column}`, '')" for column in spec.columns)
+                await cursor.execute(
+                    f"SELECT COUNT(*), IFNULL(BIT_XOR(CRC32(CONCAT_WS("
+                    f"CHAR(31 USING utf8mb4), {fields}))), 0) FROM `{spec.name}`"
+                )
+                count, checksum = await cursor.fetchone()
+                result[spec.name] = (int(count), int(checksum))
+        await conn.commit()
+    return result
+
+
 async def mysql_tables_empty(pool: aiomysql.Pool) -> bool:
     async with pool.acquire() as conn:
         async with conn.cursor() as cursor:
@@ -363,16 +512,23 @@ async def mysql_tables_empty(pool: aiomysql.Pool) -> bool:
     return True
 
 
-async def _upsert_row(cursor, spec: TableSpec, row: dict[str, Any]) -> None:
+def _upsert_sql(spec: TableSpec) -> str:
     columns = spec.columns
     placeholders = ", ".join(f"%({column})s" for column in columns)
     update_columns = [column for column in columns if column != spec.primary_key]
     updates = ", ".join(f"`{column}`=VALUES(`{column}`)" for column in update_columns)
-    sql = (
+    return (
         f"INSERT INTO `{spec.name}` ({_quoted_columns(spec)}) VALUES ({placeholders}) "
         f"ON DUPLICATE KEY UPDATE {updates}"
     )
-    await cursor.execute(sql, {column: row.get(column) for column in columns})
+
+
+def _upsert_params(spec: TableSpec, row: dict[str, Any]) -> dict[str, Any]:
+    return {column: row.get(column) for column in spec.columns}
+
+
+async def _upsert_row(cursor, spec: TableSpec, row: dict[str, Any]) -> None:
+    await cursor.execute(_upsert_sql(spec), _upsert_params(spec, row))
 
 
 async def replace_mysql_tables(
@@ -393,22 +549,36 @@ async def replace_mysql_tables(
 
 
 async def replay_mysql_events(pool: aiomysql.Pool, events: list[dict[str, Any]]) -> None:
-    """在单个 MySQL 事务内幂等回放 SQLite 离线日志。"""
+    """
+    在单个 MySQL 事务内幂等回放一块 SQLite 离线日志。
+
+    相邻的同表同类操作合并为一次 executemany，保持事件整体顺序不变。
+    """
+    groups: list[tuple[str, str, list[dict[str, Any]]]] = []
+    for event in events:
+        key = (event["table_name"], event["operation"])
+        if groups and groups[-1][:2] == key and key[1] != "clear":
+            groups[-1][2].append(event)
+        else:
+            groups.append((*key, [event]))
+
     async with pool.acquire() as conn:
         try:
             async with conn.cursor() as cursor:
-                for event in events:
-                    spec = TABLE_SPECS[event["table_name"]]
-                    operation = event["operation"]
+                for table_name, operation, grouped in groups:
+                    spec = TABLE_SPECS[table_name]
                     if operation == "clear":
                         await cursor.execute(f"DELETE FROM `{spec.name}`")
                     elif operation == "delete":
-                        await cursor.execute(
+                        await cursor.executemany(
                             f"DELETE FROM `{spec.name}` WHERE `{spec.primary_key}`=%s",
-                            (event["pk_value"],),
+                            [(event["pk_value"],) for event in grouped],
                         )
                     else:
-                        await _upsert_row(cursor, spec, event["row_data"])
+                        await cursor.executemany(
+                            _upsert_sql(spec),
+                            [_upsert_params(spec, event["row_data"]) for event in grouped],
+                        )
             await conn.commit()
         except Exception:
             await conn.rollback()
@@ -0,0 +1,78 @@
+"""监控数据表的变更版本号：写库成功后递增，供 Web 快照缓存判断失效与长轮询等待。
+
+版本号只在当前进程内有意义（重启后从 0 开始），对外使用时应与 ``epoch`` 组合。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+from collections.abc import Iterable
+
+
+class TableVersions:
+    """全局版本号 + 每张表最近一次变更时的全局版本号。"""
+
+    def __init__(self) -> None:
+        self.epoch = secrets.token_hex(4)
+        self._version = 0
+        self._tables: dict[str, int] = {}
+        self._changed: asyncio.Event | None = None
+        self._changed_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def table_version(self, table: str) -> int:
+        return self._tables.get(table, 0)
+
+    def bump(self, tables: Iterable[str]) -> int:
+        """标记若干表已变更并唤醒等待者，返回新的全局版本号。"""
+        tables = set(tables)
+        if not tables:
+            return self._version
+        self._version += 1
+        for table in tables:
+            self._tables[table] = self._version
+        changed, self._changed = self._changed, None
+        if changed is not None:
+            changed.set()
+        return self._version
+
+    def _get_changed_event(self) -> asyncio.Event:
+        # 事件与事件循环绑定；测试或重启后循环变化时重建
+        loop = asyncio.get_running_loop()
+        if self._changed is None or self._changed_loop is not loop:
+            self._changed = asyncio.Event()
+            self._changed_loop = loop
+        return self._changed
+
+    async def wait_for_change(self, since: int, timeout: float, table: str | None = None) -> bool:
+        """等待 (指定表的) 版本号超过 since；超时返回 False。"""
+
+        def current() -> int:
+            return self._version if table is None else self.table_version(table)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while current() <= since:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(self._get_changed_event().wait(), timeout=remaining)
+            except TimeoutError:
+                return current() > since
+        return True
+
+
+_table_versions: TableVersions | None = None
+
+
+def get_table_versions() -> TableVersions:
+    """获取进程级表版本单例。"""
+    global _table_versions
+    if _table_versions is None:
+        _table_versions = TableVersions()
+    return _table_versions
@@ -1274,4 +1274,5 @@ register_task(
     run_checkin_once,
     _get_checkin_trigger_kwargs,
     description="iKuuu 签到",
+    uses_browser=True,
 )
@@ -265,4 +265,5 @@ register_task(
     run_rainyun_checkin_once,
     _get_rainyun_trigger_kwargs,
     description="雨云签到",
+    uses_browser=True,
 )
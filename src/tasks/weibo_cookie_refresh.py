@@ -728,4 +728,5 @@ register_task(
     _get_weibo_cookie_refresh_trigger_kwargs,
     run_on_startup=False,
     description="微博 Cookie 自动刷新",
+    uses_browser=True,
 )
@@ -0,0 +1,134 @@
+"""自适应轮询：按变化频率调整目标轮询间隔、平台请求预算与监控基类接入。"""
+
+from __future__ import annotations
+
+import asyncio
+import types
+
+import pytest
+
+import src.monitors.adaptive_polling as adaptive_module
+from src.core.change_feed import LIVE_START
+from src.monitors.adaptive_polling import (
+    TARGETS_DEFERRED,
+    AdaptivePollSchedule,
+    PlatformRateLimiter,
+)
+from src.monitors.base import BaseMonitor
+from src.settings.config import AppConfig
+
+
+def test_quiet_targets_back_off_until_max_and_change_resets() -> None:
+    schedule = AdaptivePollSchedule(min_interval=60, max_interval=300)
+    now = 0.0
+    intervals = []
+    for _ in range(5):
+        selected, not_due, deferred = schedule.select(["a"], now=now)
+        assert selected == ["a"] and not_due == 0 and deferred == 0
+        intervals.append(schedule.record("a", changed=False, now=now + 5))
+        now += intervals[-1]
+    assert intervals == [120, 240, 300, 300, 300]
+
+    # 未到期时跳过；调度抖动（提前不到半个最短间隔）仍算到期
+    assert schedule.select(["a"], now=now - 60) == ([], 1, 0)
+    assert schedule.select(["a"], now=now - 20)[0] == ["a"]
+    assert schedule.record("a", changed=True, now=now) == 60
+
+
+def test_hot_targets_stay_at_min_interval() -> None:
+    schedule = AdaptivePollSchedule(min_interval=30, max_interval=600)
+    for tick in range(4):
+        assert schedule.select(["live"], now=tick * 30)[0] == ["live"]
+        assert schedule.record("live", changed=False, hot=True, now=tick * 30) == 30
+
+
+def test_budget_prefers_new_then_most_overdue_targets() -> None:
+    schedule = AdaptivePollSchedule(min_interval=60, max_interval=3600)
+    schedule.select(["slow", "fast", "gone"], now=0)
+    schedule.record("slow", changed=False, now=0)  # 120s 后到期
+    schedule.record("fast", changed=True, now=0)  # 60s 后到期
+    schedule.record("gone", changed=True, now=0)
+
+    selected, not_due, deferred = schedule.select(["slow", "fast", "new"], budget=2, now=150)
+    assert selected == ["new", "fast"]
+    assert (not_due, deferred) == (0, 1)
+    # 已从配置移除的目标不再保留状态
+    assert schedule.interval("gone") is None
+
+    schedule.record("new", changed=False, now=150)
+    schedule.record("fast", changed=False, now=150)
+    selected, _, _ = schedule.select(["slow", "fast", "new"], budget=2, now=151)
+    assert selected == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_per_platform() -> None:
+    limiter = PlatformRateLimiter()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*(limiter.acquire("huya", rate=20) for _ in range(3)))
+    await limiter.acquire("douyu", rate=20)
+    assert loop.time() - started >= 0.09
+    assert loop.time() - started < 0.5
+
+
+class _RoomsMonitor(BaseMonitor):
+    def __init__(self, config: AppConfig):
+        super().__init__(config)
+        self.live: set[str] = set()
+        self.going_live: set[str] = set()
+        self.polled: list[str] = []
+
+    def is_hot_target(self, target: str) -> bool:
+        return target in self.live
+
+    async def process_room(self, room: str) -> None:
+        self.polled.append(room)
+        if room in self.going_live:
+            self.going_live.discard(room)
+            self.live.add(room)
+            self.publish_change(LIVE_START, room, name=room)
+
+    async def run(self):
+        rooms = self.select_poll_targets(["r1", "r2", "r3"])
+        await asyncio.gather(*(self.poll_target(room, self.process_room) for room in rooms))
+
+    @property
+    def monitor_name(self) -> str:
+        return "房间监控"
+
+    @property
+    def platform_name(self) -> str:
+        return "adaptive_probe"
+
+
+@pytest.mark.asyncio
+async def test_monitor_polls_changed_and_live_targets_more_often(monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(adaptive_module, "time", types.SimpleNamespace(monotonic=lambda: clock[0]))
+    config = AppConfig(
+        adaptive_polling_enable=True,
+        adaptive_polling_max_interval_seconds=600,
+        adaptive_polling_requests_per_second=100,
+    )
+    monitor = _RoomsMonitor(config)
+    monkeypatch.setattr(_RoomsMonitor, "poll_interval_seconds", 60)
+    monitor.going_live.add("r2")
+
+    await monitor.run()
+    assert sorted(monitor.polled) == ["r1", "r2", "r3"]
+
+    # 刚开播（且仍在直播）的房间每个触发周期都轮询，没变化的房间间隔逐轮翻倍
+    expected = [["r2"], ["r1", "r2", "r3"], ["r2"], ["r2"], ["r2"], ["r1", "r2", "r3"]]
+    for polled in expected:
+        monitor.polled.clear()
+        clock[0] += 60
+        await monitor.run()
+        assert sorted(monitor.polled) == polled
+    assert TARGETS_DEFERRED.value(platform="adaptive_probe", reason="not_due") == 8
+
+    # 关闭后恢复每轮轮询全部目标
+    monitor.config = AppConfig()
+    monitor.polled.clear()
+    await monitor.run()
+    assert sorted(monitor.polled) == ["r1", "r2", "r3"]
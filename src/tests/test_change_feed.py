@@ -0,0 +1,136 @@
+"""监控状态变更事件总线：环形缓冲补发、平台过滤、事务提交后发布与 SSE 输出。"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+import src.core.change_feed as change_feed_module
+from src.core.change_feed import LIVE_START, NEW_POST, ChangeFeed
+from src.monitors.base import BaseMonitor
+from src.settings.config import AppConfig
+from src.web.routers import changes as changes_router
+
+
+@pytest.fixture
+def fresh_feed(monkeypatch):
+    feed = ChangeFeed(buffer_size=3)
+    monkeypatch.setattr(change_feed_module, "_change_feed", feed)
+    return feed
+
+
+@pytest.mark.asyncio
+async def test_subscribers_only_receive_their_platforms(fresh_feed) -> None:
+    huya = fresh_feed.subscribe(["huya"])
+    everything = fresh_feed.subscribe()
+    fresh_feed.publish("weibo", NEW_POST, key="1")
+    fresh_feed.publish("huya", LIVE_START, key="2", name="主播")
+    await asyncio.sleep(0)
+
+    event = huya.queue.get_nowait()
+    assert (event.platform, event.type, event.key, event.name) == ("huya", LIVE_START, "2", "主播")
+    assert huya.queue.empty()
+    assert everything.queue.qsize() == 2
+
+    fresh_feed.unsubscribe(huya)
+    fresh_feed.unsubscribe(everything)
+    assert fresh_feed.subscriber_count == 0
+
+
+def test_replay_detects_gaps_and_foreign_ids(fresh_feed) -> None:
+    for key in "12345":
+        fresh_feed.publish("huya", LIVE_START, key=key)
+
+    # 缓冲区只保留 3..5
+    assert [e.key for e in fresh_feed.replay(2)] == ["3", "4", "5"]
+    assert fresh_feed.replay(4, ["weibo"]) == []
+    assert fresh_feed.replay(1) is None
+    assert fresh_feed.replay(9) is None
+
+
+class _FakeBatch:
+    def __init__(self) -> None:
+        self.succeeded: bool | None = None
+
+    def __len__(self) -> int:
+        return 1
+
+
+class _FakeDatabase:
+    def __init__(self, ok: bool):
+        self.ok = ok
+
+    @asynccontextmanager
+    async def batch(self):
+        batch = _FakeBatch()
+        yield batch
+        batch.succeeded = self.ok
+
+
+class _PublishingMonitor(BaseMonitor):
+    async def initialize(self):
+        pass
+
+    async def run(self):
+        self.publish_change(LIVE_START, "9", name="主播")
+        # 事务提交前不应送达
+        assert change_feed_module.get_change_feed().last_id == 0
+
+    @property
+    def monitor_name(self) -> str:
+        return "事件监控"
+
+    @property
+    def platform_name(self) -> str:
+        return "huya"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ok", [True, False])
+async def test_monitor_events_wait_for_commit(fresh_feed, ok: bool) -> None:
+    monitor = _PublishingMonitor(AppConfig())
+    monitor.db = _FakeDatabase(ok)
+    await monitor.run_tick()
+
+    events = fresh_feed.replay(0)
+    if ok:
+        assert [(e.platform, e.type, e.key) for e in events] == [("huya", LIVE_START, "9")]
+    else:
+        assert events == []
+        assert monitor._state_stale is True
+    assert monitor._pending_changes is None
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_after_last_event_id_then_goes_live(fresh_feed) -> None:
+    first = fresh_feed.publish("huya", LIVE_START, key="1")
+    fresh_feed.publish("huya", LIVE_START, key="2")
+    fresh_feed.publish("weibo", NEW_POST, key="3")
+
+    request = SimpleNamespace(is_disconnected=lambda: asyncio.sleep(0, False))
+    platforms = changes_router._parse_platforms("huya")
+    stream = changes_router._change_stream_events(
+        request, platforms, f"{fresh_feed.epoch}:{first.id}"
+    )
+    replayed = await stream.__anext__()
+    assert replayed.startswith(f"id: {fresh_feed.epoch}:2\nevent: live_start\n")
+    assert "event: ready" in await stream.__anext__()
+
+    fresh_feed.publish("huya", LIVE_START, key="4")
+    live = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert f"id: {fresh_feed.epoch}:4\n" in live
+    await stream.aclose()
+    assert fresh_feed.subscriber_count == 0
+
+    stale = changes_router._change_stream_events(request, platforms, "other:1")
+    assert (await stale.__anext__()).startswith("event: resync")
+    await stale.aclose()
+
+
+def test_platform_filter_validation() -> None:
+    assert changes_router._parse_platforms("") == frozenset()
+    assert changes_router._parse_platforms("bilibili_live") == {"bilibili_live", "bilibili"}
+    assert changes_router._parse_platforms("huya,unknown") is None
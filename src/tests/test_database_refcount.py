@@ -1,5 +1,7 @@
 """Tests for shared SQLite connection reference tracking."""
 
+import asyncio
+
 import pytest
 
 import src.storage.database as db_module
@@ -81,3 +83,22 @@ async def test_double_initialize_does_not_inflate_ref_count(isolated_db):
         assert db_module._connection_ref_count == 0
     finally:
         await _reset_shared_db_state()
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_writer_lock(isolated_db):
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        assert await db.execute_update(
+            "INSERT INTO douyu (room, name, is_live) VALUES (%(room)s, %(name)s, %(is_live)s)",
+            {"room": "1", "name": "n", "is_live": "0"},
+        )
+        async with db_module._database_write_lock:
+            rows = await asyncio.wait_for(db.execute_query("SELECT room FROM douyu"), timeout=2)
+        assert rows == [("1",)]
+        assert db_module._sqlite_readers._idle
+    finally:
+        await db.close()
+        await _reset_shared_db_state()
+    assert db_module._sqlite_readers._idle == []
@@ -0,0 +1,184 @@
+"""任务重叠执行策略、相位错峰与跳过/超时统计。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+from src.jobs import registry as registry_module
+from src.jobs.manual_runs import RUN_QUEUED, RUN_SUCCEEDED, ManualRunQueue
+from src.jobs.registry import (
+    OVERRUN_CONCURRENT,
+    OVERRUN_QUEUE_ONE,
+    JobDescriptor,
+    get_job_stats,
+    register_monitor,
+)
+from src.jobs.scheduler import TaskScheduler, build_interval_trigger, job_phase_offset
+from src.settings.config import AppConfig
+from src.web.routers import tasks as tasks_router
+
+
+def test_interval_jobs_get_distinct_stable_phases() -> None:
+    now = 1_700_000_000.0
+    huya = build_interval_trigger("huya_monitor", {"seconds": 60}, now=now)
+    bilibili = build_interval_trigger("bilibili_monitor", {"seconds": 60}, now=now)
+
+    assert huya.start_date.timestamp() >= now + 60
+    assert huya.start_date.timestamp() % 60 == pytest.approx(job_phase_offset("huya_monitor", 60))
+    assert huya.start_date != bilibili.start_date
+    assert job_phase_offset("huya_monitor", 60) == job_phase_offset("huya_monitor", 60)
+    # 默认抖动为间隔的 5%
+    assert huya.jitter == 3
+
+
+def test_jitter_does_not_drift_phase() -> None:
+    trigger = build_interval_trigger("weibo_monitor", {"seconds": 300}, jitter_seconds=30)
+    start = trigger.start_date.timestamp()
+    fire = trigger.get_next_fire_time(None, datetime.now().astimezone())
+    for slot in range(1, 200):
+        fire = trigger.get_next_fire_time(fire, fire)
+        assert 0 <= fire.timestamp() - (start + slot * 300) <= 30
+
+
+def test_overrun_policy_maps_to_scheduler_options() -> None:
+    async def noop() -> None:
+        return None
+
+    scheduler = TaskScheduler(AppConfig())
+    scheduler.add_interval_job(noop, seconds=120, job_id="skip_job")
+    scheduler.add_interval_job(
+        noop, seconds=120, job_id="queue_job", overrun_policy=OVERRUN_QUEUE_ONE
+    )
+    scheduler.add_cron_job(
+        noop,
+        minute="0",
+        hour="8",
+        job_id="cron_job",
+        overrun_policy=OVERRUN_CONCURRENT,
+        max_concurrent=3,
+    )
+
+    skip_job = scheduler.scheduler.get_job("skip_job")
+    assert (skip_job.max_instances, skip_job.coalesce, skip_job.misfire_grace_time) == (1, True, 60)
+    assert scheduler.scheduler.get_job("queue_job").max_instances == 2
+    cron_job = scheduler.scheduler.get_job("cron_job")
+    assert (cron_job.max_instances, cron_job.misfire_grace_time) == (3, 300)
+
+    scheduler.update_interval_job("skip_job", seconds=30)
+    skip_job = scheduler.scheduler.get_job("skip_job")
+    assert skip_job.misfire_grace_time == 15
+    assert skip_job.trigger.start_date.timestamp() % 30 == pytest.approx(
+        job_phase_offset("skip_job", 30)
+    )
+
+
+def test_invalid_overrun_policy_is_rejected() -> None:
+    async def noop() -> None:
+        return None
+
+    with pytest.raises(ValueError):
+        JobDescriptor("bad", noop, "interval", lambda c: {}, overrun_policy="drop")
+
+
+@pytest.mark.asyncio
+async def test_queue_one_serializes_runs_and_counts_overruns(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(registry_module, "get_config", AppConfig)
+    monkeypatch.setattr(registry_module, "MONITOR_JOBS", [])
+    job_id = "overrun_probe_monitor"
+    active = 0
+    max_active = 0
+
+    async def slow_tick() -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+
+    register_monitor(job_id, slow_tick, lambda c: {"seconds": 0}, overrun_policy=OVERRUN_QUEUE_ONE)
+    desc = registry_module.MONITOR_JOBS[0]
+    await asyncio.gather(desc.run_func(), desc.run_func())
+
+    stats = get_job_stats(job_id).as_dict()
+    assert max_active == 1
+    assert stats["runs"] == 2
+    assert stats["queued"] == 1
+    assert stats["overlaps"] == 0
+
+    await registry_module._observed_run(job_id, slow_tick, interval=0.01)
+    assert get_job_stats(job_id).overruns == 1
+
+    registry_module.record_job_skip(job_id, "max_instances")
+    monkeypatch.setattr(tasks_router, "MONITOR_JOBS", [desc])
+    monkeypatch.setattr(tasks_router, "TASK_JOBS", [])
+    monkeypatch.setattr(tasks_router, "check_login", lambda session_id: True)
+    monkeypatch.setattr(tasks_router, "discover_and_import", lambda: None)
+    request = Request({"type": "http", "method": "GET", "headers": [], "session": {}})
+    response = await tasks_router.get_tasks_api(request)
+    item = json.loads(response.body)["tasks"][0]
+    assert item["overrun_policy"] == OVERRUN_QUEUE_ONE
+    assert item["stats"]["skipped"] == {"max_instances": 1}
+    assert item["stats"]["skipped_total"] == 1
+    assert item["stats"]["overruns"] == 1
+
+
+@pytest.mark.asyncio
+async def test_manual_run_respects_scheduled_run_overrun_policy(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(registry_module, "get_config", AppConfig)
+    monkeypatch.setattr(registry_module, "MONITOR_JOBS", [])
+    release = asyncio.Event()
+    active = 0
+    max_active = 0
+
+    async def tick() -> None:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await release.wait()
+        active -= 1
+
+    register_monitor("manual_skip_monitor", tick, lambda c: {"seconds": 60})
+    register_monitor(
+        "manual_queue_monitor", tick, lambda c: {"seconds": 60}, overrun_policy=OVERRUN_QUEUE_ONE
+    )
+    skip_desc, queue_desc = registry_module.MONITOR_JOBS
+    manual_runs = ManualRunQueue()
+    monkeypatch.setattr(tasks_router, "MONITOR_JOBS", [skip_desc, queue_desc])
+    monkeypatch.setattr(tasks_router, "TASK_JOBS", [])
+    monkeypatch.setattr(tasks_router, "check_login", lambda session_id: True)
+    monkeypatch.setattr(tasks_router, "discover_and_import", lambda: None)
+    monkeypatch.setattr(tasks_router, "get_manual_runs", lambda: manual_runs)
+    request = Request({"type": "http", "method": "POST", "headers": [], "session": {}})
+
+    scheduled = [
+        asyncio.create_task(skip_desc.run_func()),
+        asyncio.create_task(queue_desc.run_func()),
+    ]
+    await asyncio.sleep(0.01)
+
+    # skip：调度中的运行未结束时拒绝手动触发
+    response = await tasks_router.run_task_api(request, "manual_skip_monitor")
+    assert response.status_code == 409
+    assert manual_runs.active_run("manual_skip_monitor") is None
+
+    # queue_one：手动运行排队到调度中的运行结束
+    response = await tasks_router.run_task_api(request, "manual_queue_monitor")
+    assert response.status_code == 202
+    run = manual_runs.active_run("manual_queue_monitor")
+    manual_task = run.task
+    await asyncio.sleep(0.01)
+    assert run.status == RUN_QUEUED
+
+    release.set()
+    await asyncio.gather(*scheduled)
+    await asyncio.wait_for(manual_task, timeout=2)
+    assert run.status == RUN_SUCCEEDED
+    assert max_active == 2
+    assert get_job_stats("manual_queue_monitor").overlaps == 0
@@ -0,0 +1,168 @@
+"""按需加载任务模块：未启用任务的占位注册、首次运行/启用时导入与导入耗时记录。"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import textwrap
+import threading
+
+import pytest
+
+from src.jobs import lifecycle as lifecycle_module
+from src.jobs import registry as registry_module
+from src.jobs.metadata import MONITOR_SPECS, TASK_SPECS, TaskSpec
+from src.jobs.registry import discover_and_import, get_module_import_report
+from src.jobs.scheduler import TaskScheduler
+from src.jobs.task_outcome import TASK_FAILED, TASK_SUCCESS
+from src.settings.config import AppConfig
+from src.tests.conftest import safe_reload_modules
+
+_PROBE_MODULE = """
+import threading
+
+from src.jobs.registry import OVERRUN_QUEUE_ONE, register_task
+from src.jobs.task_outcome import TASK_SUCCESS
+
+IMPORT_THREAD = threading.current_thread()
+
+
+async def run_probe():
+    return TASK_SUCCESS
+
+
+register_task(
+    "{job_id}",
+    run_probe,
+    lambda config: {{"hour": "6", "minute": "15"}},
+    description="{job_id}",
+    overrun_policy=OVERRUN_QUEUE_ONE,
+)
+"""
+
+
+@pytest.fixture
+def probe_registry(tmp_path, monkeypatch):
+    """两个探针任务：lazy_probe_eager 已启用，lazy_probe_deferred 未启用。"""
+    specs = {}
+    for job_id in ("lazy_probe_eager", "lazy_probe_deferred"):
+        (tmp_path / f"{job_id}_mod.py").write_text(
+            textwrap.dedent(_PROBE_MODULE.format(job_id=job_id)), encoding="utf-8"
+        )
+        specs[job_id] = TaskSpec(
+            job_id,
+            f"{job_id}_mod",
+            job_id,
+            "task",
+            "probe",
+            time_field="probe_time",
+            default_time="06:15",
+        )
+    enabled = {"lazy_probe_eager"}
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(registry_module, "MONITOR_SPECS", ())
+    monkeypatch.setattr(registry_module, "TASK_SPECS", tuple(specs.values()))
+    monkeypatch.setattr(registry_module, "get_task_spec", specs.get)
+    monkeypatch.setattr(registry_module, "get_config", AppConfig)
+    monkeypatch.setattr(registry_module, "MONITOR_JOBS", [])
+    monkeypatch.setattr(registry_module, "TASK_JOBS", [])
+    monkeypatch.setattr(registry_module, "_module_imports", {})
+    for target in (lifecycle_module, registry_module):
+        monkeypatch.setattr(target, "task_job_enabled", lambda job_id, c: job_id in enabled)
+    monkeypatch.setattr(lifecycle_module, "get_config", AppConfig)
+    monkeypatch.setattr(registry_module, "_job_loaded_hook", None)
+    monkeypatch.setattr(lifecycle_module, "MONITOR_JOBS", registry_module.MONITOR_JOBS)
+    monkeypatch.setattr(lifecycle_module, "TASK_JOBS", registry_module.TASK_JOBS)
+    yield enabled
+    for job_id in specs:
+        sys.modules.pop(f"{job_id}_mod", None)
+
+
+@pytest.mark.asyncio
+async def test_only_enabled_modules_are_imported_until_first_run(probe_registry) -> None:
+    discover_and_import(AppConfig())
+
+    assert "lazy_probe_eager_mod" in sys.modules
+    assert "lazy_probe_deferred_mod" not in sys.modules
+    jobs = {job.job_id: job for job in registry_module.TASK_JOBS}
+    assert list(jobs) == ["lazy_probe_eager", "lazy_probe_deferred"]
+    assert not jobs["lazy_probe_eager"].deferred
+    deferred = jobs["lazy_probe_deferred"]
+    assert deferred.deferred
+    assert deferred.get_trigger_kwargs(AppConfig()) == {"minute": "15", "hour": "6"}
+
+    # 未启用时调度触发直接跳过，不导入模块
+    assert await deferred.run_func() is TASK_FAILED
+    assert "lazy_probe_deferred_mod" not in sys.modules
+    assert registry_module.get_job_stats("lazy_probe_deferred").skipped["disabled"] >= 1
+
+    # 手动运行时导入模块并执行其注册的函数
+    assert await deferred.original_run_func() is TASK_SUCCESS
+    assert "lazy_probe_deferred_mod" in sys.modules
+    assert not registry_module.get_registered_task("lazy_probe_deferred").deferred
+
+    report = {record.module: record for record in get_module_import_report()}
+    assert set(report) == {"lazy_probe_eager_mod", "lazy_probe_deferred_mod"}
+    assert all(record.error is None and record.new_modules >= 1 for record in report.values())
+
+    # 重复发现不会再导入或重复注册
+    discover_and_import(AppConfig())
+    assert len(registry_module.TASK_JOBS) == 2
+
+
+@pytest.mark.asyncio
+async def test_enabling_deferred_job_loads_module_and_rebuilds_schedule(probe_registry) -> None:
+    discover_and_import(AppConfig())
+    scheduler = TaskScheduler(AppConfig())
+    lifecycle_module._add_cron_jobs(scheduler, AppConfig())
+    registry_module.set_job_loaded_hook(
+        functools.partial(lifecycle_module._rebuild_loaded_job, scheduler)
+    )
+    assert scheduler.scheduler.get_job("lazy_probe_deferred").max_instances == 1
+
+    assert await lifecycle_module._load_newly_enabled_jobs(AppConfig()) == []
+    probe_registry.add("lazy_probe_deferred")
+    notes = await lifecycle_module._load_newly_enabled_jobs(AppConfig())
+
+    assert notes == ["lazy_probe_deferred(已加载)"]
+    job = scheduler.scheduler.get_job("lazy_probe_deferred")
+    loaded = registry_module.get_registered_task("lazy_probe_deferred")
+    assert job.func is loaded.run_func
+    # 按模块注册的 queue_one 策略重建
+    assert job.max_instances == 2
+    # 模块在线程池中导入，不阻塞事件循环
+    assert sys.modules["lazy_probe_deferred_mod"].IMPORT_THREAD is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_manual_run_of_deferred_job_rebuilds_paused_schedule(probe_registry) -> None:
+    discover_and_import(AppConfig())
+    scheduler = TaskScheduler(AppConfig())
+    lifecycle_module._add_cron_jobs(scheduler, AppConfig())
+    lifecycle_module._pause_tasks_disabled_in_config(scheduler, AppConfig())
+    registry_module.set_job_loaded_hook(
+        functools.partial(lifecycle_module._rebuild_loaded_job, scheduler)
+    )
+    deferred = registry_module.get_registered_task("lazy_probe_deferred")
+
+    assert await deferred.original_run_func() is TASK_SUCCESS
+
+    job = scheduler.scheduler.get_job("lazy_probe_deferred")
+    assert job.func is registry_module.get_registered_task("lazy_probe_deferred").run_func
+    assert job.max_instances == 2
+    # 仍未在配置中启用：重建后保持暂停
+    assert job.next_run_time is None
+
+
+def test_spec_trigger_kwargs_match_module_registration() -> None:
+    """占位期间按 TaskSpec 计算的触发参数须与模块自身注册的一致。"""
+    modules = [spec.module for spec in (*MONITOR_SPECS, *TASK_SPECS)]
+    failed = set(safe_reload_modules(modules))
+    config = AppConfig()
+    for spec in (*MONITOR_SPECS, *TASK_SPECS):
+        if spec.module in failed:
+            continue
+        job = registry_module._find_job(spec.job_id)
+        assert job is not None, spec.job_id
+        expected = job.get_trigger_kwargs(config)
+        assert registry_module._spec_trigger_kwargs(spec, config) == expected, spec.job_id
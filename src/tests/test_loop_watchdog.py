@@ -0,0 +1,70 @@
+"""事件循环卡顿看门狗：捕获阻塞调用栈、记录卡顿时长与按配置启停。"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+import src.core.loop_watchdog as loop_watchdog_module
+from src.core.loop_watchdog import LoopWatchdog
+from src.jobs.lifecycle import _apply_loop_watchdog
+from src.settings.config import AppConfig
+
+
+def _blocking_image_work() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stall_captures_blocking_stack_and_task() -> None:
+    watchdog = LoopWatchdog(threshold_ms=50, heartbeat=0.01)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+
+        async def monitor_tick():
+            _blocking_image_work()
+
+        await asyncio.create_task(monitor_tick(), name="weibo_monitor")
+        await asyncio.sleep(0.05)
+    finally:
+        await watchdog.stop()
+
+    stalls = watchdog.stalls()
+    assert len(stalls) == 1
+    stall = stalls[0].as_dict()
+    assert stall["ongoing"] is False
+    assert stall["duration_ms"] >= 200
+    assert stall["task"] == "weibo_monitor"
+    assert "monitor_tick" in stall["coroutine"]
+    assert "_blocking_image_work" in stall["location"]
+    assert any("monitor_tick" in frame for frame in stall["stack"])
+    assert watchdog.stall_count == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_loop_records_nothing() -> None:
+    watchdog = LoopWatchdog(threshold_ms=50, heartbeat=0.01)
+    watchdog.start()
+    await asyncio.sleep(0.2)
+    await watchdog.stop()
+    assert watchdog.stalls() == []
+    assert not watchdog.running
+
+
+@pytest.mark.asyncio
+async def test_config_reload_toggles_watchdog(monkeypatch) -> None:
+    watchdog = LoopWatchdog()
+    monkeypatch.setattr(loop_watchdog_module, "_loop_watchdog", watchdog)
+    old = AppConfig()
+    enabled = AppConfig(loop_watchdog_enable=True, loop_watchdog_threshold_ms=120)
+
+    assert await _apply_loop_watchdog(old, old) == []
+    notes = await _apply_loop_watchdog(old, enabled)
+    assert notes == ["事件循环卡顿看门狗(启用, 120ms)"]
+    assert watchdog.running and watchdog.threshold_ms == 120
+
+    await _apply_loop_watchdog(enabled, old)
+    assert not watchdog.running
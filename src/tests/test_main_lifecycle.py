@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import signal
 
@@ -108,3 +109,40 @@ async def test_initial_pass_skips_jobs_opted_out_of_startup() -> None:
     await _run_initial_pass(jobs)
 
     assert calls == ["regular"]
+
+
+@pytest.mark.asyncio
+async def test_initial_pass_starts_monitors_first_and_serializes_browser_tasks() -> None:
+    started = []
+    active = {"all": 0, "browser": 0}
+    peak = {"all": 0, "browser": 0}
+
+    def make_run(job_id: str, browser: bool = False):
+        async def run():
+            started.append(job_id)
+            active["all"] += 1
+            peak["all"] = max(peak["all"], active["all"])
+            if browser:
+                active["browser"] += 1
+                peak["browser"] = max(peak["browser"], active["browser"])
+            await asyncio.sleep(0.02)
+            active["all"] -= 1
+            if browser:
+                active["browser"] -= 1
+            return TASK_SUCCESS
+
+        return run
+
+    jobs = [
+        JobDescriptor("browser_a", make_run("browser_a", True), "cron", dict, uses_browser=True),
+        JobDescriptor("checkin", make_run("checkin"), "cron", dict),
+        JobDescriptor("browser_b", make_run("browser_b", True), "cron", dict, uses_browser=True),
+        JobDescriptor("weibo_monitor", make_run("weibo_monitor"), "interval", dict),
+        JobDescriptor("huya_monitor", make_run("huya_monitor"), "interval", dict),
+    ]
+
+    await _run_initial_pass(jobs, concurrency=3)
+
+    assert started[:3] == ["weibo_monitor", "huya_monitor", "checkin"]
+    assert sorted(started) == sorted(job.job_id for job in jobs)
+    assert peak == {"all": 3, "browser": 1}
@@ -0,0 +1,121 @@
+"""手动运行队列：后台执行、按任务去重、状态流转与进度日志。"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from src.jobs.manual_runs import (
+    RUN_CANCELLED,
+    RUN_ERROR,
+    RUN_FAILED,
+    RUN_RUNNING,
+    RUN_SUCCEEDED,
+    ManualRunQueue,
+)
+
+task_logger = logging.getLogger("src.tests.manual_run_job")
+
+
+@pytest.fixture(autouse=True)
+def _task_logs_in_tmp(tmp_path, monkeypatch):
+    # 任务专属日志写到 ./logs，测试中切到临时目录
+    monkeypatch.chdir(tmp_path)
+    task_logger.setLevel(logging.INFO)
+
+
+@pytest.mark.asyncio
+async def test_submit_returns_immediately_and_dedups_while_running() -> None:
+    queue = ManualRunQueue()
+    release = asyncio.Event()
+
+    async def job():
+        task_logger.info("第一步完成")
+        await release.wait()
+        task_logger.info("第二步完成")
+
+    run, created = queue.submit("demo", job)
+    assert created
+    again, created_again = queue.submit("demo", job)
+    assert again is run and not created_again
+
+    await asyncio.sleep(0.05)
+    assert run.status == RUN_RUNNING
+    assert queue.active_run("demo") is run
+    assert any("第一步完成" in line for line in run.recent_logs)
+
+    release.set()
+    await asyncio.wait_for(run.task, timeout=2)
+    assert run.status == RUN_SUCCEEDED
+    assert run.as_dict()["active"] is False
+    assert run.duration is not None and run.duration >= 0
+    assert run.log_count == 2
+    assert queue.active_run("demo") is None
+
+    # 结束后再次触发会新建运行
+    rerun, created = queue.submit("demo", job)
+    assert created and rerun.run_id != run.run_id
+    release.set()
+    await asyncio.wait_for(rerun.task, timeout=2)
+    assert [r.run_id for r in queue.runs()] == [rerun.run_id, run.run_id]
+
+
+@pytest.mark.asyncio
+async def test_false_result_and_exception_map_to_failed_and_error() -> None:
+    queue = ManualRunQueue()
+
+    async def returns_false():
+        return False
+
+    async def raises():
+        raise RuntimeError("boom")
+
+    failed, _ = queue.submit("a", returns_false)
+    errored, _ = queue.submit("b", raises)
+    await asyncio.gather(failed.task, errored.task)
+
+    assert failed.status == RUN_FAILED
+    assert errored.status == RUN_ERROR
+    assert "boom" in errored.message
+
+
+@pytest.mark.asyncio
+async def test_progress_is_isolated_between_concurrent_runs() -> None:
+    queue = ManualRunQueue()
+
+    async def job(name: str):
+        for i in range(3):
+            task_logger.info("%s 进度 %d", name, i)
+            await asyncio.sleep(0)
+
+    first, _ = queue.submit("first", lambda: job("first"))
+    second, _ = queue.submit("second", lambda: job("second"))
+    await asyncio.gather(first.task, second.task)
+
+    assert all("first" in line for line in first.recent_logs)
+    assert all("second" in line for line in second.recent_logs)
+    assert first.log_count == second.log_count == 3
+
+
+@pytest.mark.asyncio
+async def test_history_trim_and_cancel_all() -> None:
+    queue = ManualRunQueue(history_size=2)
+
+    async def quick():
+        return None
+
+    for job_id in ("a", "b", "c"):
+        run, _ = queue.submit(job_id, quick)
+        await run.task
+    assert [r.job_id for r in queue.runs()] == ["c", "b"]
+
+    async def forever():
+        await asyncio.Event().wait()
+
+    pending, _ = queue.submit("slow", forever)
+    await asyncio.sleep(0)
+    await queue.cancel_all()
+    assert pending.status == RUN_CANCELLED
+    assert queue.active_run("slow") is None
@@ -0,0 +1,56 @@
+"""媒体流水线：下载并发上限、线程池执行阻塞任务与阶段指标。"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.media_pipeline import MediaPipeline
+
+
+@pytest.mark.asyncio
+async def test_download_slot_bounds_concurrency() -> None:
+    pipeline = MediaPipeline(download_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def download() -> None:
+        nonlocal active, peak
+        async with pipeline.download_slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(download() for _ in range(6)))
+
+    assert peak == 2
+    metrics = pipeline.metrics()
+    assert metrics["downloads_waiting"] == 0
+    assert metrics["downloads_active"] == 0
+    assert metrics["stages"]["download"]["count"] == 6
+    assert metrics["stages"]["download_wait"]["count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_uses_worker_thread_and_records_errors() -> None:
+    pipeline = MediaPipeline(worker_threads=1)
+    main_thread = threading.get_ident()
+    try:
+        worker_thread = await pipeline.run_blocking("thumbnail", threading.get_ident)
+        assert worker_thread != main_thread
+
+        def boom() -> None:
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            await pipeline.run_blocking("write", boom)
+
+        stages = pipeline.metrics()["stages"]
+        assert stages["thumbnail"]["count"] == 1
+        assert stages["write"]["errors"] == 1
+        assert pipeline.metrics()["blocking_pending"] == 0
+    finally:
+        pipeline.shutdown()
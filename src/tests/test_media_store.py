@@ -0,0 +1,57 @@
+"""微博媒体内容寻址存储：pic_id 寻址、硬链接去重与引用计数回收。"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.monitors.weibo_monitor import WeiboMonitor
+from src.settings.config import AppConfig
+from src.storage.media_store import MediaStore, media_key
+
+
+def test_media_key_uses_size_and_pic_id_and_ignores_signature() -> None:
+    pic_id = "006abcDEgy1hxyz0123456789.jpg"
+    large = f"https://wx1.sinaimg.cn/large/{pic_id}?Expires=1&ssig=a"
+    assert media_key(large) == media_key(f"https://wx3.sinaimg.cn/large/{pic_id}?Expires=2")
+    # 同一用户的 profile_image_url / avatar_large / avatar_hd 只有尺寸目录不同
+    sizes = ["crop.0.0.180.180.50", "orj180", "orj480", "large"]
+    keys = {media_key(f"https://tvax1.sinaimg.cn/{size}/{pic_id}") for size in sizes}
+    assert len(keys) == len(sizes)
+    assert media_key("https://h5.sinaimg.cn/a/cover.jpg?x=1") == media_key(
+        "https://h5.sinaimg.cn/a/cover.jpg?x=2"
+    )
+
+
+def test_store_links_duplicates_and_collects_released_blobs(tmp_path) -> None:
+    store = MediaStore(tmp_path)
+    first = tmp_path / "a/posts/1/01.jpg"
+    second = tmp_path / "b/posts/2/retweeted/3/01.jpg"
+    store.put_bytes("ab" * 20, b"image", first)
+
+    assert store.link_existing("ab" * 20, second)
+    assert second.read_bytes() == b"image"
+    assert store.blob_path("ab" * 20).stat().st_nlink == 3
+
+    store.release(tmp_path / "a")
+    assert store.blob_path("ab" * 20).exists()
+
+    store.release(tmp_path / "b")
+    assert not store.blob_path("ab" * 20).exists()
+    assert store.stats()["hits"] == 1
+    assert store.stats()["blobs_collected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_download_post_image_reuses_stored_blob(tmp_path, monkeypatch) -> None:
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
+    monkeypatch.setattr(monitor, "_get_weibo_data_dir", lambda: tmp_path)
+    url = "https://wx1.sinaimg.cn/large/006abcDEgy1hxyz0123456789.jpg"
+    monitor._media_store().put_bytes(media_key(url), b"image", tmp_path / "a/01.jpg")
+
+    async def no_session():
+        raise AssertionError("命中本地存储时不应发起下载")
+
+    monkeypatch.setattr(monitor, "_get_session", no_session)
+    save_path = tmp_path / "b/posts/2/01.jpg"
+    assert await monitor._download_post_image([url], save_path)
+    assert save_path.read_bytes() == b"image"
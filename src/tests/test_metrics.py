@@ -0,0 +1,139 @@
+"""进程内指标：Prometheus 文本输出、任务/推送埋点与 /metrics 鉴权。"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from dataclasses import dataclass, field
+
+import pytest
+from starlette.requests import Request
+
+from src.core.metrics import MetricsRegistry, StatsCounters, gauge_sample
+from src.jobs import registry as registry_module
+from src.push_channel.manager import PUSH_SENDS, UnifiedPushManager
+from src.web.auth import hash_password
+from src.web.routers import metrics as metrics_router
+
+
+@pytest.mark.asyncio
+async def test_render_counter_histogram_and_collectors() -> None:
+    registry = MetricsRegistry()
+    runs = registry.counter("runs_total", "Runs.", ("job_id",))
+    runs.inc(job_id='a"b')
+    runs.inc(2, job_id='a"b')
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value)
+    registry.register_collector("depth", lambda: [gauge_sample("depth", "Depth.", 7, queue="q")])
+
+    assert registry.counter("runs_total", "Runs.", ("job_id",)) is runs
+    with pytest.raises(ValueError):
+        registry.gauge("runs_total", "Runs.")
+    with pytest.raises(ValueError):
+        runs.inc(platform="x")
+
+    text = await registry.render()
+    assert "# TYPE webmoniter_runs_total counter\n" in text
+    assert 'webmoniter_runs_total{job_id="a\\"b"} 3\n' in text
+    assert 'webmoniter_latency_seconds_bucket{le="0.1"} 1\n' in text
+    assert 'webmoniter_latency_seconds_bucket{le="1"} 2\n' in text
+    assert 'webmoniter_latency_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "webmoniter_latency_seconds_sum 3.55\n" in text
+    assert "webmoniter_latency_seconds_count 3\n" in text
+    assert 'webmoniter_depth{queue="q"} 7\n' in text
+
+
+@pytest.mark.asyncio
+async def test_job_runs_record_outcome_and_overlap(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    job_id = "metrics_probe_job"
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+
+    async def failing():
+        return False
+
+    first = asyncio.create_task(registry_module.run_task_with_logging(job_id, slow))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(registry_module.run_task_with_logging(job_id, slow))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+    await registry_module.run_task_with_logging(job_id, failing)
+
+    assert registry_module.JOB_OVERLAPS.value(job_id=job_id) == 1
+    assert registry_module.JOB_RUNS.value(job_id=job_id, outcome="success") == 2
+    assert registry_module.JOB_RUNS.value(job_id=job_id, outcome="failed") == 1
+    assert registry_module.JOB_DURATION.count(job_id=job_id) == 3
+
+
+class _Channel:
+    def __init__(self, channel_type: str, fail: bool) -> None:
+        self.name = channel_type
+        self.type = channel_type
+        self.fail = fail
+
+    async def push(self, **kwargs) -> None:
+        if self.fail:
+            raise RuntimeError("down")
+
+
+@pytest.mark.asyncio
+async def test_push_sends_are_counted_per_channel_type() -> None:
+    manager = UnifiedPushManager([_Channel("metrics_ok", False), _Channel("metrics_bad", True)])
+    result = await manager.send_news(title="t", description="d", to_url="")
+
+    assert len(result["errors"]) == 1
+    assert PUSH_SENDS.value(channel_type="metrics_ok", outcome="success") == 1
+    assert PUSH_SENDS.value(channel_type="metrics_bad", outcome="failure") == 1
+
+
+def _request(authorization: str | None = None) -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "headers": headers, "session": {}})
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_accepts_webui_basic_auth(monkeypatch) -> None:
+    monkeypatch.setattr(
+        metrics_router,
+        "load_auth",
+        lambda: {"username": "admin", "password_hash": hash_password("secret")},
+    )
+
+    denied = await metrics_router.metrics(_request())
+    assert denied.status_code == 401
+    assert denied.headers["www-authenticate"].startswith("Basic")
+    wrong = base64.b64encode(b"admin:nope").decode()
+    assert (await metrics_router.metrics(_request(f"Basic {wrong}"))).status_code == 401
+
+    token = base64.b64encode(b"admin:secret").decode()
+    response = await metrics_router.metrics(_request(f"Basic {token}"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.body.decode()
+    assert "# TYPE webmoniter_db_outbox_pending gauge" in body
+    assert 'webmoniter_stream_subscribers{stream="logs"}' in body
+
+
+def test_stats_counters_export_fields_and_derived_values() -> None:
+    @dataclass
+    class ProbeStats(StatsCounters):
+        hits: int = 0
+        misses: int = 0
+        reasons: dict[str, int] = field(default_factory=dict)
+
+        def derived(self) -> dict:
+            total = self.hits + self.misses
+            return {"hit_ratio": round(self.hits / total, 2) if total else 0.0}
+
+    stats = ProbeStats(hits=3, misses=1)
+    stats.reasons["expired"] = 1
+    exported = stats.as_dict()
+    assert exported == {"hits": 3, "misses": 1, "reasons": {"expired": 1}, "hit_ratio": 0.75}
+    # 导出的是快照，修改不影响计数
+    exported["reasons"]["expired"] = 9
+    assert stats.reasons == {"expired": 1}
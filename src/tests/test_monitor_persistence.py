@@ -0,0 +1,176 @@
+"""常驻监控实例：跨调度复用、写库同步更新内存与热重载标记重新加载。"""
+
+from __future__ import annotations
+
+import pytest
+
+import src.monitors.base as base_module
+from src.monitors.base import (
+    BaseMonitor,
+    apply_config_to_live_monitors,
+    close_live_monitors,
+    enable_persistent_monitors,
+    run_monitor,
+)
+from src.monitors.douyu_monitor import DouyuMonitor
+from src.settings.config import AppConfig
+
+
+class _CountingMonitor(BaseMonitor):
+    instances = 0
+
+    def __init__(self, config: AppConfig, session=None):
+        super().__init__(config, session)
+        type(self).instances += 1
+        self.initialized = 0
+        self.loads = 0
+        self.runs = 0
+        self.closed = False
+        self.old_data_dict: dict[str, tuple] = {}
+        self._is_first_time = False
+
+    async def initialize(self):
+        self.initialized += 1
+        await self.load_old_info()
+
+    async def load_old_info(self):
+        self.loads += 1
+        self._is_first_time = not self.old_data_dict
+
+    async def run(self):
+        self.runs += 1
+        self.old_data_dict["1"] = ("1", "name", "0")
+
+    async def close(self):
+        self.closed = True
+
+    @property
+    def monitor_name(self) -> str:
+        return "计数监控"
+
+    @property
+    def platform_name(self) -> str:
+        return "counting"
+
+
+@pytest.fixture
+def persistent_mode():
+    _CountingMonitor.instances = 0
+    enable_persistent_monitors()
+    try:
+        yield
+    finally:
+        enable_persistent_monitors(False)
+        base_module._live_monitors.clear()
+
+
+@pytest.mark.asyncio
+async def test_persistent_monitor_reuses_instance_across_ticks(persistent_mode) -> None:
+    config = AppConfig()
+    await run_monitor(_CountingMonitor, config)
+    await run_monitor(_CountingMonitor, config)
+
+    monitor = base_module._live_monitors[_CountingMonitor]
+    assert _CountingMonitor.instances == 1
+    assert monitor.initialized == 1
+    assert monitor.loads == 1
+    assert monitor.runs == 2
+    # 首轮（空表）结束后，后续新增目标不再被视为首次建库
+    assert monitor._is_first_time is False
+
+    await close_live_monitors()
+    assert monitor.closed
+    assert base_module._live_monitors == {}
+
+
+@pytest.mark.asyncio
+async def test_config_reload_marks_state_for_reload(persistent_mode) -> None:
+    await run_monitor(_CountingMonitor, AppConfig())
+    monitor = base_module._live_monitors[_CountingMonitor]
+
+    new_config = AppConfig(huya_rooms="1")
+    await apply_config_to_live_monitors(new_config)
+    assert monitor.config is new_config
+    assert monitor._state_stale is True
+
+    await run_monitor(_CountingMonitor, new_config)
+    assert monitor.loads == 2
+    assert monitor._state_stale is False
+
+
+class _PushingMonitor(_CountingMonitor):
+    async def initialize(self):
+        await super().initialize()
+        await self._build_push()
+
+
+@pytest.mark.asyncio
+async def test_config_reload_rebuilds_push_after_a_tick_with_new_config(
+    persistent_mode, monkeypatch
+) -> None:
+    built = []
+
+    async def fake_build_push_manager(channels, session, logger, channel_names=None):
+        built.append(channels)
+        return None
+
+    monkeypatch.setattr(base_module, "build_push_manager", fake_build_push_manager)
+    await run_monitor(_PushingMonitor, AppConfig())
+    monitor = base_module._live_monitors[_PushingMonitor]
+    try:
+        channels = [{"name": "bark", "type": "bark", "enable": True}]
+        new_config = AppConfig(push_channel_list=channels)
+        # 热重载回调之前，调度已用新配置执行了一轮
+        await run_monitor(_PushingMonitor, new_config)
+        await apply_config_to_live_monitors(new_config)
+        assert built == [[], channels]
+
+        # 推送配置未变化时不重建
+        await apply_config_to_live_monitors(AppConfig(push_channel_list=list(channels)))
+        assert len(built) == 2
+    finally:
+        if monitor.session is not None:
+            await monitor.session.close()
+
+
+@pytest.mark.asyncio
+async def test_run_monitor_without_persistence_closes_each_tick() -> None:
+    _CountingMonitor.instances = 0
+    await run_monitor(_CountingMonitor, AppConfig())
+    await run_monitor(_CountingMonitor, AppConfig())
+    assert _CountingMonitor.instances == 2
+    assert base_module._live_monitors == {}
+
+
+class _RecordingDatabase:
+    def __init__(self, ok: bool = True):
+        self.ok = ok
+        self.calls: list[str] = []
+
+    async def execute_update(self, sql: str, params: dict | None = None) -> bool:
+        self.calls.append(sql)
+        return self.ok
+
+    execute_insert = execute_update
+
+
+@pytest.mark.asyncio
+async def test_douyu_writes_through_to_memory(monkeypatch) -> None:
+    monitor = DouyuMonitor(AppConfig())
+    monitor.db = _RecordingDatabase()
+    monitor.old_data_dict = {"100": ("100", "主播", "0")}
+
+    async def fake_get_info(room_id: str) -> dict:
+        return {"room": room_id, "name": "主播", "is_live": "1"}
+
+    async def fake_push(data: dict, res: int) -> None:
+        return None
+
+    monkeypatch.setattr(monitor, "get_info", fake_get_info)
+    monkeypatch.setattr(monitor, "push_notification", fake_push)
+
+    await monitor.process_room("100")
+    await monitor.process_room("200")
+
+    assert monitor.old_data_dict["100"] == ("100", "主播", "1")
+    assert monitor.old_data_dict["200"] == ("200", "主播", "1")
@@ -0,0 +1,138 @@
+"""公开监控状态接口：版本化快照缓存、ETag/304 与长轮询。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import src.storage.database as db_module
+import src.web.status_snapshot as snapshot_module
+from src.storage.database import AsyncDatabase
+from src.storage.table_versions import TableVersions
+from src.web.routers import data as data_router
+
+
+@pytest.fixture
+def isolated_status(monkeypatch, tmp_path):
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "test.db")
+
+    async def skip_mysql_runtime():
+        return None
+
+    monkeypatch.setattr(db_module, "_ensure_hybrid_runtime", skip_mysql_runtime)
+    monkeypatch.setattr(snapshot_module, "_status_cache", None)
+
+
+def _request(etag: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(headers={"if-none-match": etag} if etag else {})
+
+
+async def _insert_huya(db: AsyncDatabase, room: str, is_live: str) -> None:
+    await db.execute_insert(
+        "INSERT OR REPLACE INTO huya (room, name, is_live) "
+        "VALUES (%(room)s, %(name)s, %(is_live)s)",
+        {"room": room, "name": f"主播{room}", "is_live": is_live},
+    )
+
+
+@pytest.mark.asyncio
+async def test_platform_status_is_cached_until_a_write(isolated_status) -> None:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        await _insert_huya(db, "1", "0")
+
+        first = await data_router.get_monitor_status_by_platform(_request(), "huya")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert json.loads(first.body)["data"][0]["is_live"] == "0"
+
+        cache = snapshot_module.get_monitor_status_cache()
+        misses = cache.misses
+        again = await data_router.get_monitor_status_by_platform(_request(), "huya")
+        assert again.body == first.body
+        assert cache.misses == misses
+
+        not_modified = await data_router.get_monitor_status_by_platform(_request(etag), "huya")
+        assert not_modified.status_code == 304
+        assert not_modified.body == b""
+
+        await _insert_huya(db, "1", "1")
+        changed = await data_router.get_monitor_status_by_platform(_request(etag), "huya")
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert json.loads(changed.body)["data"][0]["is_live"] == "1"
+    finally:
+        await db.close()
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_when_version_advances(isolated_status) -> None:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        current = json.loads((await data_router.get_monitor_status(_request())).body)
+        version = current["version"]
+
+        waiter = asyncio.create_task(
+            data_router.get_monitor_status(
+                _request(), since=f"{current['epoch']}-{version}", timeout=5
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await _insert_huya(db, "2", "1")
+        response = await asyncio.wait_for(waiter, timeout=2)
+        body = json.loads(response.body)
+        assert body["version"] > version
+        assert body["data"]["huya"][0]["room"] == "2"
+
+        timed_out = await data_router.get_monitor_status(
+            _request(), since=f"{body['epoch']}-{body['version']}", timeout=0.01
+        )
+        assert timed_out.status_code == 304
+    finally:
+        await db.close()
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_full_snapshot_after_restart(isolated_status) -> None:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        await _insert_huya(db, "1", "1")
+        current = json.loads((await data_router.get_monitor_status(_request())).body)
+
+        # 另一进程（重启前）签发的令牌：版本号可能远大于当前值，不能据此返回 304 或挂起
+        stale = await asyncio.wait_for(
+            data_router.get_monitor_status(
+                _request(), since=f"0000dead-{current['version'] + 100}", timeout=5
+            ),
+            timeout=1,
+        )
+        assert stale.status_code == 200
+        assert json.loads(stale.body)["epoch"] == current["epoch"]
+
+        invalid = await data_router.get_monitor_status(_request(), since="12", timeout=0.01)
+        assert invalid.status_code == 400
+    finally:
+        await db.close()
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_table_versions_track_per_table_changes() -> None:
+    versions = TableVersions()
+    assert versions.bump([]) == 0
+    assert versions.bump(["huya"]) == 1
+    assert versions.bump(["weibo", "douyu"]) == 2
+    assert versions.table_version("huya") == 1
+    assert versions.table_version("weibo") == 2
+    assert await versions.wait_for_change(1, 0.01, table="huya") is False
+    assert await versions.wait_for_change(1, 0.01) is True
@@ -1,17 +1,24 @@
 """MySQL 方言和 SQLite 离线日志契约。"""
 
+import asyncio
+from datetime import datetime
+
 import aiomysql
 import aiosqlite
 import pytest
 
+from src.monitors.base import BaseMonitor
 from src.settings.config import AppConfig
 from src.storage import database as db_module
 from src.storage.mysql_backend import (
     MySQLSettings,
     _migrate_mysql_columns,
+    _migrate_mysql_weibo_created_at,
     convert_mysql_sql,
+    row_checksum,
     select_mysql_params,
 )
+from src.storage.table_versions import TableVersions
 
 
 def test_mysql_sql_conversion_supports_both_project_placeholder_styles() -> None:
@@ -120,6 +127,41 @@ async def test_mysql_schema_migration_tolerates_concurrent_duplicate_column() ->
     await _migrate_mysql_columns(RacingCursor())
 
 
+@pytest.mark.asyncio
+async def test_weibo_created_at_index_is_rebuilt_as_composite() -> None:
+    class IndexCursor:
+        def __init__(self, index_columns) -> None:
+            self.index_columns = index_columns
+            self.results: list = []
+            self.alters: list[str] = []
+
+        async def execute(self, sql, params=None) -> None:
+            sql = " ".join(sql.split())
+            if sql.startswith("ALTER TABLE"):
+                self.alters.append(sql)
+            self.results = self.index_columns if "STATISTICS" in sql else []
+
+        async def fetchall(self):
+            return self.results
+
+    legacy = IndexCursor([("created_at",)])
+    await _migrate_mysql_weibo_created_at(legacy)
+    assert legacy.alters == [
+        "ALTER TABLE `weibo` DROP INDEX `idx_weibo_created_at`, "
+        "ADD INDEX `idx_weibo_created_at` (`created_at`, `UID`)"
+    ]
+
+    missing = IndexCursor([])
+    await _migrate_mysql_weibo_created_at(missing)
+    assert missing.alters == [
+        "ALTER TABLE `weibo` ADD INDEX `idx_weibo_created_at` (`created_at`, `UID`)"
+    ]
+
+    current = IndexCursor([("created_at",), ("UID",)])
+    await _migrate_mysql_weibo_created_at(current)
+    assert current.alters == []
+
+
 @pytest.mark.asyncio
 async def test_sqlite_fallback_write_and_outbox_are_committed_together(tmp_path) -> None:
     async with aiosqlite.connect(tmp_path / "fallback.db") as conn:
@@ -193,6 +235,138 @@ async def test_sqlite_fallback_full_delete_records_clear_event(tmp_path) -> None
     assert events[0]["pk_value"] is None
 
 
+@pytest.mark.asyncio
+async def test_sqlite_fallback_batch_appends_one_event_per_row(tmp_path) -> None:
+    async with aiosqlite.connect(tmp_path / "fallback.db") as conn:
+        conn.row_factory = aiosqlite.Row
+        await db_module.AsyncDatabase()._init_tables(conn)
+        insert = "INSERT INTO douyu (room, name, is_live) VALUES (:room, :name, :is_live)"
+        await db_module._sqlite_update_many_with_outbox(
+            conn,
+            [
+                (
+                    insert,
+                    [
+                        {"room": "1", "name": "主播", "is_live": "0"},
+                        {"room": "2", "name": "B", "is_live": "0"},
+                    ],
+                ),
+                (
+                    "UPDATE douyu SET is_live=:is_live WHERE room=:room",
+                    [{"room": "1", "is_live": "1"}],
+                ),
+                ("DELETE FROM douyu WHERE room=:pk", [{"pk": "2"}]),
+            ],
+        )
+        events = await db_module._load_outbox(conn)
+
+    assert [(event["pk_value"], event["operation"]) for event in events] == [
+        ("1", "upsert"),
+        ("2", "delete"),
+    ]
+    assert events[0]["row_data"]["is_live"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_database_batch_commits_queued_writes_on_exit(monkeypatch, tmp_path) -> None:
+    await db_module.close_shared_connection()
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "batch.db")
+    monkeypatch.setattr(db_module, "_ensure_hybrid_runtime", lambda: _async_result(None))
+    database = db_module.AsyncDatabase()
+    await database.initialize()
+    try:
+        async with database.batch() as batch:
+            for room in ("1", "2"):
+                assert await database.execute_insert(
+                    "INSERT INTO douyu (room, name, is_live) "
+                    "VALUES (%(room)s, %(name)s, %(is_live)s)",
+                    {"room": room, "name": "主播", "is_live": "0"},
+                )
+            assert await database.execute_query("SELECT room FROM douyu") == []
+        assert batch.succeeded is True
+        assert len(batch) == 2
+        assert await database.execute_query("SELECT room FROM douyu ORDER BY room") == [
+            ("1",),
+            ("2",),
+        ]
+
+        assert not await database.execute_many(
+            "INSERT INTO douyu (room, name, is_live) VALUES (:room, :name, :is_live)",
+            [
+                {"room": "3", "name": "新", "is_live": "0"},
+                {"room": "1", "name": "重复", "is_live": "0"},
+            ],
+        )
+        # 整批回滚：主键冲突导致前一条也不落库
+        assert await database.execute_query("SELECT room FROM douyu WHERE room='3'") == []
+    finally:
+        await database.close()
+        await db_module.close_shared_connection()
+
+
+class _RecordingPush:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def send_news(self, **kwargs) -> None:
+        self.sent.append(kwargs)
+
+
+class _LiveStartMonitor(BaseMonitor):
+    """写入开播状态后推送；room 2 与已有行主键冲突，写库会失败。"""
+
+    def __init__(self, config: AppConfig, rooms: list[str]):
+        super().__init__(config)
+        self.rooms = rooms
+
+    async def initialize(self):
+        pass
+
+    async def run(self):
+        for room in self.rooms:
+            await self.db.execute_insert(
+                "INSERT INTO douyu (room, name, is_live) VALUES (%(room)s, %(name)s, %(is_live)s)",
+                {"room": room, "name": "主播", "is_live": "1"},
+            )
+            await self.send_push_news(title=f"{room} 开播", description="", to_url="")
+
+    @property
+    def monitor_name(self) -> str:
+        return "推送监控"
+
+    @property
+    def platform_name(self) -> str:
+        return "douyu"
+
+
+@pytest.mark.asyncio
+async def test_failed_tick_commit_sends_no_push(monkeypatch, tmp_path) -> None:
+    await db_module.close_shared_connection()
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "push.db")
+    monkeypatch.setattr(db_module, "_ensure_hybrid_runtime", lambda: _async_result(None))
+    database = db_module.AsyncDatabase()
+    await database.initialize()
+    try:
+        await database.execute_insert(
+            "INSERT INTO douyu (room, name, is_live) VALUES (:room, :name, :is_live)",
+            {"room": "2", "name": "已有", "is_live": "0"},
+        )
+        monitor = _LiveStartMonitor(AppConfig(), ["1", "2"])
+        monitor.db = database
+        monitor.push = _RecordingPush()
+        await monitor.run_tick()
+
+        # room 1 在推送前已提交；room 2 提交失败，不推送并在下一轮重新加载旧数据
+        assert [news["title"] for news in monitor.push.sent] == ["1 开播"]
+        assert await database.execute_query("SELECT room FROM douyu WHERE is_live='1'") == [
+            ("1",)
+        ]
+        assert monitor._state_stale is True
+    finally:
+        await database.close()
+        await db_module.close_shared_connection()
+
+
 @pytest.mark.asyncio
 async def test_empty_mysql_is_seeded_from_existing_sqlite(monkeypatch, tmp_path) -> None:
     await db_module.close_shared_connection()
@@ -267,3 +441,244 @@ async def test_mysql_connection_failure_keeps_sqlite_available(monkeypatch, tmp_
     assert status["active_backend"] == "sqlite"
     assert status["sync_state"] == "fallback"
     assert status["sqlite_healthy"] is True
+
+
+@pytest.mark.asyncio
+async def test_calibration_pulls_deltas_and_reloads_only_on_checksum_mismatch(
+    monkeypatch, tmp_path
+) -> None:
+    await db_module.close_shared_connection()
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "calibrate.db")
+    conn = await db_module._ensure_shared_connection()
+    pool = object()
+    full_reloads = []
+    since_values = []
+    mysql_rows = {"douyu": [{"room": "1", "name": "主播", "is_live": "0"}]}
+
+    async def fake_server_time(target_pool):
+        return datetime(2026, 1, 1, 12, 0, len(since_values))
+
+    async def fake_fetch_tables(target_pool):
+        full_reloads.append(target_pool)
+        return mysql_rows
+
+    async def fake_fetch_changes(target_pool, since):
+        since_values.append(since)
+        return {"douyu": [{"room": "1", "name": "主播", "is_live": "1"}]}
+
+    async def fake_checksums(target_pool):
+        # MySQL 侧另有实例删除/新增了行：行数不一致
+        return {"douyu": (2, 0)}
+
+    monkeypatch.setattr(db_module, "mysql_server_time", fake_server_time)
+    monkeypatch.setattr(db_module, "fetch_mysql_tables", fake_fetch_tables)
+    monkeypatch.setattr(db_module, "fetch_mysql_changes", fake_fetch_changes)
+    monkeypatch.setattr(db_module, "mysql_table_checksums", fake_checksums)
+    monkeypatch.setattr(db_module, "close_mysql_pool", lambda target: _async_result(None))
+    monkeypatch.setattr(db_module, "_active_backend", "mysql")
+    monkeypatch.setattr(db_module, "_mysql_pool", pool)
+    monkeypatch.setattr(db_module, "_mirror_degraded", False)
+    monkeypatch.setattr(db_module, "_calibration_watermark", None)
+    try:
+        await db_module.calibrate_sqlite_mirror()
+        assert len(full_reloads) == 1
+
+        await db_module.calibrate_sqlite_mirror()
+        assert len(full_reloads) == 1
+        assert since_values == [datetime(2026, 1, 1, 12, 0, 0) - db_module._CALIBRATION_OVERLAP]
+        rows = await db_module._sqlite_query(conn, "SELECT room, is_live FROM douyu")
+        assert rows == [("1", "1")]
+
+        await db_module.calibrate_sqlite_mirror(verify=True)
+        assert len(full_reloads) == 2
+    finally:
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_calibration_overlap_rereads_do_not_bump_versions(monkeypatch, tmp_path) -> None:
+    await db_module.close_shared_connection()
+    monkeypatch.setattr(db_module, "DB_PATH", tmp_path / "overlap.db")
+    await db_module._ensure_shared_connection()
+    versions = TableVersions()
+    monkeypatch.setattr(db_module, "get_table_versions", lambda: versions)
+    changes = {"douyu": [{"room": "1", "name": "主播", "is_live": "1"}]}
+
+    async def fake_server_time(target_pool):
+        return datetime(2026, 1, 1, 12, 0, 0)
+
+    async def fake_fetch_changes(target_pool, since):
+        return changes
+
+    monkeypatch.setattr(db_module, "mysql_server_time", fake_server_time)
+    monkeypatch.setattr(db_module, "fetch_mysql_changes", fake_fetch_changes)
+    monkeypatch.setattr(db_module, "close_mysql_pool", lambda target: _async_result(None))
+    monkeypatch.setattr(db_module, "_active_backend", "mysql")
+    monkeypatch.setattr(db_module, "_mysql_pool", object())
+    monkeypatch.setattr(db_module, "_mirror_degraded", False)
+    monkeypatch.setattr(db_module, "_calibration_watermark", datetime(2026, 1, 1, 11, 59, 0))
+    try:
+        await db_module.calibrate_sqlite_mirror()
+        assert versions.table_version("douyu") == 1
+
+        # 回退窗口内再次拉到同一行且内容未变：不视为变更
+        await db_module.calibrate_sqlite_mirror()
+        assert versions.version == 1
+
+        changes["douyu"] = [{"room": "1", "name": "主播", "is_live": "0"}]
+        await db_module.calibrate_sqlite_mirror()
+        assert versions.table_version("douyu") == 2
+        assert versions.table_version("huya") == 0
+    finally:
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_checksums_match_row_checksum_contract(tmp_path) -> None:
+    async with aiosqlite.connect(tmp_path / "checksum.db") as conn:
+        conn.row_factory = aiosqlite.Row
+        await db_module.AsyncDatabase()._init_tables(conn)
+        await conn.execute("INSERT INTO douyu (room, name, is_live) VALUES ('1', '主播', NULL)")
+        await conn.commit()
+        checksums = await db_module._sqlite_table_checksums(conn)
+
+    assert checksums["douyu"] == (1, row_checksum(("1", "主播", None)))
+    assert row_checksum(("1", "主播", None)) == row_checksum(("1", "主播", ""))
+    assert checksums["huya"] == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_retired_mysql_pool_closes_after_in_flight_readers(monkeypatch) -> None:
+    closed = []
+
+    async def fake_close(pool):
+        closed.append(pool)
+
+    monkeypatch.setattr(db_module, "close_mysql_pool", fake_close)
+    pool = object()
+    previous = db_module._BackendGeneration(1, "mysql", pool)
+    previous.enter()
+
+    retire = asyncio.create_task(db_module._retire_mysql_pool(previous, pool))
+    await asyncio.sleep(0)
+    assert closed == []
+
+    previous.exit()
+    await asyncio.wait_for(retire, timeout=1)
+    assert closed == [pool]
+
+
+@pytest.mark.asyncio
+async def test_outbox_keeps_only_latest_event_per_key(tmp_path) -> None:
+    insert = "INSERT OR REPLACE INTO douyu (room, name, is_live) VALUES (:room, :name, :is_live)"
+    async with aiosqlite.connect(tmp_path / "fallback.db") as conn:
+        conn.row_factory = aiosqlite.Row
+        await db_module.AsyncDatabase()._init_tables(conn)
+        for is_live in ("0", "1", "0"):
+            await db_module._sqlite_update_with_outbox(
+                conn, insert, {"room": "1", "name": "主播", "is_live": is_live}
+            )
+        await db_module._sqlite_update_with_outbox(
+            conn, insert, {"room": "2", "name": "B", "is_live": "1"}
+        )
+        events = await db_module._load_outbox(conn)
+        assert [(event["pk_value"], event["row_data"]["is_live"]) for event in events] == [
+            ("1", "0"),
+            ("2", "1"),
+        ]
+
+        await db_module._sqlite_update_with_outbox(conn, "DELETE FROM douyu", None)
+        events = await db_module._load_outbox(conn)
+
+    assert [(event["pk_value"], event["operation"]) for event in events] == [(None, "clear")]
+
+
+@pytest.mark.asyncio
+async def test_outbox_replay_compacts_legacy_events_and_streams_chunks(
+    monkeypatch, tmp_path
+) -> None:
+    chunks = []
+
+    async def fake_replay(pool, events):
+        chunks.append([(event["pk_value"], event["operation"]) for event in events])
+
+    monkeypatch.setattr(db_module, "replay_mysql_events", fake_replay)
+    monkeypatch.setattr(db_module, "OUTBOX_REPLAY_CHUNK", 2)
+    async with aiosqlite.connect(tmp_path / "fallback.db") as conn:
+        conn.row_factory = aiosqlite.Row
+        await db_module.AsyncDatabase()._init_tables(conn)
+        # 压缩上线前积累的重复日志
+        legacy = [
+            ("douyu", "1", "upsert"),
+            ("douyu", None, "clear"),
+            ("douyu", "1", "upsert"),
+            ("douyu", "1", "upsert"),
+            ("douyu", "2", "delete"),
+            ("huya", "9", "upsert"),
+        ]
+        await conn.executemany(
+            "INSERT INTO mysql_sync_outbox (table_name, pk_value, operation, row_data, created_at) "
+            "VALUES (?, ?, ?, NULL, '2026-01-01T00:00:00')",
+            legacy,
+        )
+        await conn.commit()
+
+        replayed = await db_module._replay_outbox_locked(conn, object())
+        remaining = await db_module._load_outbox(conn)
+
+    assert replayed == 4
+    assert chunks == [[(None, "clear"), ("1", "upsert")], [("2", "delete"), ("9", "upsert")]]
+    assert remaining == []
+
+
+@pytest.mark.asyncio
+async def test_outbox_chunk_replay_takes_write_lock_per_chunk(monkeypatch, tmp_path) -> None:
+    lock_states = []
+
+    async def fake_replay(pool, events):
+        lock_states.append(db_module._database_write_lock.locked())
+        # 块之间写者可以拿到写锁
+        if len(lock_states) == 1:
+            asyncio.get_running_loop().call_soon(writer_ready.set)
+
+    async def writer():
+        await writer_ready.wait()
+        async with db_module._database_write_lock:
+            writes.append(len(lock_states))
+
+    writer_ready = asyncio.Event()
+    writes = []
+    monkeypatch.setattr(db_module, "replay_mysql_events", fake_replay)
+    monkeypatch.setattr(db_module, "OUTBOX_REPLAY_CHUNK", 1)
+    async with aiosqlite.connect(tmp_path / "fallback.db") as conn:
+        await db_module.AsyncDatabase()._init_tables(conn)
+        await conn.executemany(
+            "INSERT INTO mysql_sync_outbox (table_name, pk_value, operation, row_data, created_at) "
+            "VALUES ('huya', ?, 'delete', NULL, '2026-01-01T00:00:00')",
+            [("1",), ("2",), ("3",)],
+        )
+        await conn.commit()
+
+        writer_task = asyncio.create_task(writer())
+        replayed = await db_module._replay_outbox_in_chunks(conn, object())
+        await writer_task
+
+        # 等待写锁时取消：锁保持可用，剩余日志留待下次回放
+        await conn.execute(
+            "INSERT INTO mysql_sync_outbox (table_name, pk_value, operation, row_data, created_at) "
+            "VALUES ('huya', '4', 'delete', NULL, '2026-01-01T00:00:00')"
+        )
+        await conn.commit()
+        async with db_module._database_write_lock:
+            pending = asyncio.create_task(db_module._replay_outbox_in_chunks(conn, object()))
+            await asyncio.sleep(0)
+            pending.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+        remaining = await db_module._load_outbox(conn)
+
+    assert replayed == 3
+    assert lock_states == [True, True, True]
+    assert writes and writes[0] < 3
+    assert not db_module._database_write_lock.locked()
+    assert [event["pk_value"] for event in remaining] == ["4"]
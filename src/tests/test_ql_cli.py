@@ -1,5 +1,6 @@
 """青龙 CLI smoke 测试。"""
 
+import json
 import subprocess
 import sys
 
@@ -28,3 +29,43 @@ def test_rainyun_ql_single_account_env_builds_accounts(monkeypatch) -> None:
 
     assert cfg["rainyun_enable"] is True
     assert cfg["rainyun_accounts"] == [{"username": "user", "password": "pass", "api_key": "key"}]
+
+
+_IMPORTED_MODULES_PROBE = """
+import json
+import sys
+
+from src.ql.__main__ import load_ql_task
+
+job = load_ql_task("tieba_checkin")
+print(json.dumps({"job": job and job.job_id, "modules": sorted(sys.modules)}))
+"""
+
+
+def test_ql_single_task_imports_only_its_own_module() -> None:
+    """青龙单任务冷启动只导入目标任务模块，不加载其他任务、监控、数据库与推送通道实现。"""
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORTED_MODULES_PROBE],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = set(loaded["modules"])
+
+    assert loaded["job"] == "tieba_checkin"
+    tasks = {m for m in modules if m.startswith("src.tasks.")}
+    assert tasks <= {"src.tasks.tieba_checkin", "src.tasks.common"}
+    assert "src.tasks.tieba_checkin" in tasks
+    assert not any(m.startswith("src.monitors") for m in modules)
+    assert "src.storage.database" not in modules
+    channels = {m for m in modules if m.startswith("src.push_channel.")}
+    assert channels <= {
+        "src.push_channel._push_channel",
+        "src.push_channel.manager",
+        "src.push_channel.cute_copy",
+        "src.push_channel.rich_text",
+    }
+    for heavy in ("apscheduler", "fastapi", "selenium", "aiomysql"):
+        assert heavy not in modules, heavy
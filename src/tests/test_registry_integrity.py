@@ -32,7 +32,7 @@ def _reset_registry() -> None:
 def _reload_and_discover_all() -> list[str]:
     _reset_registry()
     failed = safe_reload_modules(MONITOR_MODULES + TASK_MODULES)
-    discover_and_import()
+    discover_and_import(AppConfig())
     return failed
 
 
@@ -101,8 +101,10 @@ def test_task_enable_map_matches_config_driven_jobs() -> None:
 def test_discover_registers_all_importable_modules() -> None:
     failed = _reload_and_discover_all()
     assert len(registry.MONITOR_JOBS) == len(MONITOR_MODULES)
-    expected_tasks = len(TASK_MODULES) - len(failed)
-    assert len(registry.TASK_JOBS) == expected_tasks
+    assert len(registry.TASK_JOBS) == len(TASK_MODULES)
+    # 导入失败的模块以占位描述注册，其余均由模块自身注册
+    deferred = {job.job_id for job in registry.MONITOR_JOBS + registry.TASK_JOBS if job.deferred}
+    assert deferred == {_job_id_from_module(mod) for mod in failed}
 
 
 def test_registered_job_ids_are_unique() -> None:
@@ -0,0 +1,102 @@
+"""共享 HTTP 会话池：跨调度复用连接、Header 热替换与监控器借用语义。"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from src.core.session_pool import SessionRegistry
+from src.monitors.douyu_monitor import DouyuMonitor
+from src.settings.config import AppConfig
+
+
+@asynccontextmanager
+async def _echo_server():
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"cookie": request.headers.get("Cookie", "")})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_connections_and_hot_swaps_headers() -> None:
+    registry = SessionRegistry()
+    registry.open()
+    async with _echo_server() as echo_server:
+        session = await registry.acquire("weibo", headers={"Cookie": "a=1"})
+        async with session.get(echo_server) as resp:
+            assert (await resp.json())["cookie"] == "a=1"
+
+        again = await registry.acquire("weibo", headers={"Cookie": "a=2"})
+        assert again is session
+        async with again.get(echo_server) as resp:
+            assert (await resp.json())["cookie"] == "a=2"
+
+        await registry.acquire("weibo", headers={"Cookie": None})
+        assert "Cookie" not in session.headers
+
+        stats = registry.stats()["weibo"]
+        assert stats["requests"] == 2
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 1
+        assert stats["sessions_created"] == 1
+        assert stats["open"] is True
+        await registry.close()
+
+    assert session.closed
+    assert registry.active is False
+    assert registry.stats()["weibo"]["open"] is False
+
+
+@pytest.mark.asyncio
+async def test_registry_recreates_closed_session() -> None:
+    registry = SessionRegistry()
+    first = await registry.acquire("huya")
+    await first.close()
+    second = await registry.acquire("huya")
+    try:
+        assert second is not first
+        assert registry.stats()["huya"]["sessions_created"] == 2
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_monitor_borrows_session_when_registry_active(monkeypatch) -> None:
+    registry = SessionRegistry()
+    registry.open()
+    monkeypatch.setattr("src.monitors.base.get_session_registry", lambda: registry)
+    try:
+        monitor = DouyuMonitor(AppConfig())
+        session = await monitor._get_session()
+        assert monitor._own_session is False
+        await monitor.close()
+        assert not session.closed
+
+        next_tick = DouyuMonitor(AppConfig())
+        assert await next_tick._get_session() is session
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_monitor_owns_session_when_registry_inactive(monkeypatch) -> None:
+    registry = SessionRegistry()
+    monkeypatch.setattr("src.monitors.base.get_session_registry", lambda: registry)
+    monitor = DouyuMonitor(AppConfig())
+    session = await monitor._get_session()
+    assert monitor._own_session is True
+    await monitor.close()
+    assert session.closed
@@ -0,0 +1,144 @@
+"""WebUI 静态资源：内容指纹、Accept-Encoding 协商与缓存头。"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import threading
+
+import pytest
+
+from src.web.static_files import FingerprintedStaticFiles, StaticAssetManifest
+
+SCRIPT = b"console.log('hello');\n" * 200
+
+
+async def _get(app, path: str, headers: dict[str, str] | None = None):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": f"/static/{path}",
+        "root_path": "/static",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    messages: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body
+
+
+@pytest.fixture
+def static_app(tmp_path):
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_bytes(SCRIPT)
+    manifest = StaticAssetManifest(tmp_path)
+    assert manifest.scan() == 1
+    return manifest, FingerprintedStaticFiles(manifest)
+
+
+@pytest.mark.asyncio
+async def test_fingerprinted_url_is_immutable_and_gzip_negotiated(static_app) -> None:
+    manifest, app = static_app
+    url = manifest.url("js/app.js")
+    digest = manifest.get("js/app.js").digest
+    assert url == f"/static/js/app.{digest}.js"
+
+    status, headers, body = await _get(
+        app, url.removeprefix("/static/"), {"Accept-Encoding": "gzip, deflate"}
+    )
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert "immutable" in headers["cache-control"]
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == SCRIPT
+
+    status, headers, _ = await _get(
+        app,
+        url.removeprefix("/static/"),
+        {"Accept-Encoding": "gzip", "If-None-Match": headers["etag"]},
+    )
+    assert status == 304
+
+
+@pytest.mark.asyncio
+async def test_plain_and_stale_paths_revalidate(static_app, tmp_path) -> None:
+    manifest, app = static_app
+    old_url = manifest.url("js/app.js")
+
+    status, headers, body = await _get(app, "js/app.js", {"Accept-Encoding": "gzip;q=0"})
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert headers["cache-control"] == "public, no-cache"
+    assert body == SCRIPT
+
+    manifest.revalidate_seconds = 0
+    script = tmp_path / "js" / "app.js"
+    script.write_bytes(b"console.log('changed');\n")
+    stat = script.stat()
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    # 事件循环中渲染只查清单，文件检查在线程中完成后下一次渲染使用新指纹
+    assert manifest.url("js/app.js") == old_url
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if manifest.url("js/app.js") != old_url:
+            break
+    assert manifest.url("js/app.js") != old_url
+
+    status, headers, body = await _get(app, old_url.removeprefix("/static/"))
+    assert status == 200
+    assert headers["cache-control"] == "public, no-cache"
+    assert body == b"console.log('changed');\n"
+
+    assert (await _get(app, "../secret.txt"))[0] == 404
+    assert (await _get(app, "js/missing.js"))[0] == 404
+
+
+@pytest.mark.asyncio
+async def test_fresh_assets_skip_revalidation(static_app, tmp_path, monkeypatch) -> None:
+    manifest, app = static_app
+    url = manifest.url("js/app.js")
+
+    def fail(rel):
+        raise AssertionError(f"重新检查间隔内不应在线程中解析 {rel}")
+
+    monkeypatch.setattr(manifest, "resolve", fail)
+    (tmp_path / "js" / "app.js").write_bytes(b"console.log('changed');\n")
+    # 间隔内不 stat：仍返回原指纹
+    assert manifest.url("js/app.js") == url
+    status, headers, _ = await _get(app, url.removeprefix("/static/"))
+    assert status == 200
+    assert "immutable" in headers["cache-control"]
+
+
+@pytest.mark.asyncio
+async def test_url_in_event_loop_checks_files_off_loop(static_app) -> None:
+    manifest, _ = static_app
+    url = manifest.url("js/app.js")
+    manifest.revalidate_seconds = 0
+    loop_thread = threading.get_ident()
+    get = manifest.get
+    threads = []
+
+    def record_get(rel):
+        threads.append(threading.get_ident())
+        return get(rel)
+
+    manifest.get = record_get
+    assert manifest.url("js/app.js") == url
+    # 检查进行中时不重复提交
+    assert manifest.url("js/app.js") == url
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if not manifest._refreshing:
+            break
+    assert len(threads) == 1 and threads[0] != loop_thread
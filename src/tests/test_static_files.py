@@ -1,6 +1,14 @@
 """Tests for cached static file handler."""
 
-from src.web.static_files import CachedStaticFiles
+import asyncio
+import io
+import os
+
+import pytest
+from PIL import Image
+
+from src.storage.image_variants import ImageVariantCache, snap_variant_width
+from src.web.static_files import CachedStaticFiles, ResizingStaticFiles
 
 
 def test_cache_control_long_lived_for_post_images():
@@ -20,3 +28,70 @@ def test_cache_control_short_lived_for_profile_avatar():
     control = handler._cache_control_for_path("/user/profile_image.jpg")
     assert control == "public, max-age=86400"
     assert "immutable" not in control
+
+
+def _png(path, size=(1200, 800)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, (240, 120, 160)).save(path, "PNG")
+
+
+def test_variant_cache_snaps_width_and_evicts_oldest(tmp_path):
+    source = tmp_path / "img" / "01.png"
+    _png(source)
+    cache = ImageVariantCache(tmp_path / "cache", max_bytes=10**9)
+
+    first = cache.get_or_create(source, "u/01.png", snap_variant_width(300), "webp")
+    with Image.open(first) as img:
+        assert img.format == "WEBP"
+        assert img.size == (320, 213)
+    assert cache.get_or_create(source, "u/01.png", 320, "webp") == first
+    assert cache.stats()["hits"] == 1
+
+    os.utime(first, (1, 1))
+    cache.max_bytes = first.stat().st_size + 1
+    second = cache.get_or_create(source, "u/01.png", 160, "jpeg")
+    assert second.is_file()
+    assert not first.exists()
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_resizing_handler_serves_variant_or_original(tmp_path):
+    _png(tmp_path / "weibo" / "user" / "posts" / "1" / "01.png")
+    handler = ResizingStaticFiles(
+        directory=str(tmp_path / "weibo"),
+        variant_cache=ImageVariantCache(tmp_path / "cache"),
+    )
+
+    async def get(query: bytes):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/weibo_img/user/posts/1/01.png",
+            "root_path": "/weibo_img",
+            "query_string": query,
+            "headers": [],
+        }
+        messages = []
+
+        async def receive():
+            # FileResponse 会监听断开事件；模拟客户端一直保持连接
+            await asyncio.Event().wait()
+
+        async def send(message):
+            messages.append(message)
+
+        await handler(scope, receive, send)
+        headers = dict(messages[0]["headers"])
+        return headers, b"".join(m.get("body", b"") for m in messages[1:])
+
+    headers, body = await get(b"w=480&fmt=webp")
+    assert headers[b"content-type"] == b"image/webp"
+    assert b"immutable" in headers[b"cache-control"]
+    with Image.open(io.BytesIO(body)) as img:
+        assert img.width == 480
+
+    headers, body = await get(b"")
+    assert headers[b"content-type"] == b"image/png"
+    with Image.open(io.BytesIO(body)) as img:
+        assert img.width == 1200
@@ -14,6 +14,7 @@ def isolated_session_store(tmp_path, monkeypatch):
     monkeypatch.setattr(auth, "WEB_SESSION_FILE", tmp_path / "web_sessions.json")
     auth.active_sessions.clear()
     yield
+    auth.flush_sessions()
     auth.active_sessions.clear()
 
 
@@ -26,6 +27,8 @@ def test_login_session_persists_across_process_memory_reset(monkeypatch):
 
     expires_at = auth.register_session("session-1")
     auth.active_sessions.clear()
+    # 模拟进程重启：从磁盘重新加载会话表
+    auth.load_sessions()
 
     assert auth.check_login("session-1") is True
     assert "session-1" in auth.active_sessions
@@ -68,6 +71,7 @@ def test_session_renews_when_close_to_expiration(monkeypatch):
     )
 
     assert auth.check_login("session-1") is True
+    auth.flush_sessions()
     assert _read_sessions()["session-1"]["expires_at"] == now + auth.WEB_SESSION_MAX_AGE_SECONDS
 
 
@@ -83,6 +87,69 @@ def test_replace_sessions_keeps_only_current_session(monkeypatch):
     assert auth.check_login("current-session") is True
 
 
+def test_check_login_uses_memory_table_and_coalesces_renewals(monkeypatch):
+    now = 20_000
+    monkeypatch.setattr(auth, "_now_ts", lambda: now)
+    monkeypatch.setattr(auth, "WEB_SESSION_FLUSH_DELAY_SECONDS", 3600)
+    near_expiry = now + auth.WEB_SESSION_RENEW_WITHIN_SECONDS - 1
+    auth.WEB_SESSION_FILE.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "sessions": {"a": {"expires_at": near_expiry}, "b": {"expires_at": near_expiry}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    assert auth.load_sessions() == 2
+
+    reads = 0
+    original_read = auth._read_session_file_locked
+
+    def counting_read():
+        nonlocal reads
+        reads += 1
+        return original_read()
+
+    monkeypatch.setattr(auth, "_read_session_file_locked", counting_read)
+    for _ in range(3):
+        assert auth.check_login("a") is True
+        assert auth.check_login("b") is True
+    assert reads == 0
+    # 续期尚在合并窗口内，磁盘上仍是旧值
+    assert _read_sessions()["a"]["expires_at"] == near_expiry
+
+    auth.flush_sessions()
+    sessions = _read_sessions()
+    assert sessions["a"]["expires_at"] == now + auth.WEB_SESSION_MAX_AGE_SECONDS
+    assert sessions["b"]["expires_at"] == now + auth.WEB_SESSION_MAX_AGE_SECONDS
+
+
+def test_periodic_sweep_drops_expired_sessions(monkeypatch):
+    clock = {"now": 30_000}
+    monkeypatch.setattr(auth, "_now_ts", lambda: clock["now"])
+    auth.register_session("long")
+    auth.WEB_SESSION_FILE.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "sessions": {
+                    "long": {"expires_at": clock["now"] + auth.WEB_SESSION_MAX_AGE_SECONDS},
+                    "short": {"expires_at": clock["now"] + 60},
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    auth.load_sessions()
+
+    clock["now"] += auth.WEB_SESSION_SWEEP_INTERVAL_SECONDS
+    assert auth.check_login("long") is True
+    assert "short" not in auth.active_sessions
+    auth.flush_sessions()
+    assert set(_read_sessions()) == {"long"}
+
+
 def test_session_cookie_lasts_one_year():
     app = create_web_app()
     middleware = next(item for item in app.user_middleware if item.cls is SessionMiddleware)
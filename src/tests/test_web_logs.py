@@ -0,0 +1,78 @@
+"""日志增量读取游标与实时日志广播。"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from src.jobs.log_manager import LogBroadcastHandler, _current_job_id
+from src.web.routers import logs as logs_router
+
+
+def test_log_chunk_tail_then_incremental_reads(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(logs_router, "LOG_TAIL_BLOCK_SIZE", 16)
+    log_file = tmp_path / "main_20260101.log"
+    log_file.write_text("".join(f"line {i}\n" for i in range(50)), encoding="utf-8")
+
+    lines, cursor, reset = logs_router._read_log_chunk_sync(log_file, 3)
+    assert reset is True
+    assert lines == ["line 47\n", "line 48\n", "line 49\n"]
+    assert cursor == log_file.stat().st_size
+
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write("line 50\nline 5")
+    lines, cursor, reset = logs_router._read_log_chunk_sync(log_file, 3, cursor)
+    assert reset is False
+    assert lines == ["line 50\n"]
+
+    # 未写完的半行留到下次
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write("1\n")
+    lines, cursor, _ = logs_router._read_log_chunk_sync(log_file, 3, cursor)
+    assert lines == ["line 51\n"]
+    assert cursor == log_file.stat().st_size
+
+    lines, cursor, reset = logs_router._read_log_chunk_sync(log_file, 3, cursor)
+    assert (lines, reset) == ([], False)
+
+
+def test_log_chunk_resets_when_file_truncated(tmp_path) -> None:
+    log_file = tmp_path / "main_20260101.log"
+    log_file.write_text("a\nb\n", encoding="utf-8")
+
+    lines, cursor, reset = logs_router._read_log_chunk_sync(log_file, 10, 1_000)
+    assert reset is True
+    assert lines == ["a\n", "b\n"]
+    assert cursor == 4
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_routes_records_by_task() -> None:
+    handler = LogBroadcastHandler()
+    everything = handler.subscribe()
+    only_task = handler.subscribe("demo_task")
+    test_logger = logging.getLogger("test_web_logs.broadcast")
+
+    def emit(message: str) -> None:
+        record = test_logger.makeRecord(test_logger.name, logging.INFO, "", 0, message, (), None)
+        handler.handle(record)
+
+    emit("main only")
+    token = _current_job_id.set("demo_task")
+    try:
+        emit("from task")
+    finally:
+        _current_job_id.reset(token)
+    await asyncio.sleep(0)
+
+    main_events = [everything.queue.get_nowait() for _ in range(everything.queue.qsize())]
+    task_events = [only_task.queue.get_nowait() for _ in range(only_task.queue.qsize())]
+    assert [e.lines[0].endswith("main only") for e in main_events] == [True, False]
+    assert [e.job_id for e in task_events] == ["demo_task"]
+    assert task_events[0].lines[0].endswith("from task")
+
+    handler.unsubscribe(everything)
+    handler.unsubscribe(only_task)
+    assert handler.subscriber_count == 0
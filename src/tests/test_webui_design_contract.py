@@ -5,7 +5,7 @@ from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from src.web.templating import STATIC_ASSET_VERSION
+from src.web.static_files import static_url
 
 WEBUI_ROOT = Path("src/webUI")
 TEMPLATE_ROOT = WEBUI_ROOT / "templates"
@@ -22,8 +22,8 @@ def _read(path: Path) -> str:
 def test_liquid_glass_assets_are_loaded_on_app_and_login_pages():
     for template_name in ("base.html", "login.html"):
         template = _read(TEMPLATE_ROOT / template_name)
-        assert "/static/css/style.css?v={{ static_version }}" in template
-        assert "/static/css/liquid-glass.css?v={{ static_version }}" in template
+        assert "{{ static_url('css/style.css') }}" in template
+        assert "{{ static_url('css/liquid-glass.css') }}" in template
         assert '<link rel="preload" href="/static/images/liquid-landscape.webp"' in template
 
     css = _read(LIQUID_CSS)
@@ -229,9 +229,7 @@ def test_external_template_links_are_isolated_and_scripts_share_cache_version():
         (TEMPLATE_ROOT / "logs.html", "logs.js"),
         (TEMPLATE_ROOT / "data.html", "data.js"),
     ):
-        assert f"/static/js/{script_name}?v={{{{ static_version }}}}" in _read(path)
-
-    assert STATIC_ASSET_VERSION == "1"
+        assert f"{{{{ static_url('js/{script_name}') }}}}" in _read(path)
 
     interactive_sources = [*template_paths, *sorted((STATIC_ROOT / "js").glob("*.js"))]
     for path in interactive_sources:
@@ -391,7 +389,7 @@ def test_all_frontend_templates_render_with_the_icon_macro():
         rendered = environment.get_template(template_name).render(
             page_title="测试页面",
             active_nav="config",
-            static_version=STATIC_ASSET_VERSION,
+            static_url=static_url,
         )
         assert "icon-" in rendered
         assert "ui-icon" in rendered
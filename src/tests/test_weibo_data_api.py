@@ -0,0 +1,111 @@
+"""微博数据列表：created_at 列迁移回填与 SQL 侧排序分页。"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+import src.storage.database as db_module
+from src.storage.database import AsyncDatabase
+from src.storage.weibo_time import weibo_created_at_timestamp
+from src.web.routers import data as data_router
+
+
+@pytest.fixture
+def isolated_db(monkeypatch, tmp_path):
+    db_path = tmp_path / "test.db"
+    monkeypatch.setattr(db_module, "DB_PATH", db_path)
+
+    async def skip_mysql_runtime():
+        return None
+
+    monkeypatch.setattr(db_module, "_ensure_hybrid_runtime", skip_mysql_runtime)
+    monkeypatch.setattr(data_router, "check_login", lambda session_id: True)
+    return db_path
+
+
+def _create_legacy_weibo_table(db_path, rows: list[tuple[str, str]]) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE weibo (UID TEXT PRIMARY KEY, 用户名 TEXT NOT NULL, 认证信息 TEXT, "
+            "简介 TEXT, 粉丝数 TEXT, 微博数 TEXT, 文本 TEXT, mid TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO weibo (UID, 用户名, 文本, mid) VALUES (?, ?, ?, '0')",
+            [(uid, f"用户{uid}", text) for uid, text in rows],
+        )
+
+
+async def _list_weibo(**kwargs) -> dict:
+    request = SimpleNamespace(session={"session_id": "s"})
+    response = await data_router.get_table_data(request, "weibo", **kwargs)
+    return json.loads(response.body)
+
+
+def test_weibo_created_at_timestamp_parses_display_text() -> None:
+    text = "          正文\n\nThu Feb 12 17:35:47 +0800 2026"
+    assert weibo_created_at_timestamp(text) == 1770888947
+    assert weibo_created_at_timestamp("Thu Feb 12 17:35:47 +0800 2026") == 1770888947
+    assert weibo_created_at_timestamp("无内容") == 0
+
+
+@pytest.mark.asyncio
+async def test_legacy_rows_are_backfilled_and_listed_newest_first(isolated_db) -> None:
+    _create_legacy_weibo_table(
+        isolated_db,
+        [
+            ("1", "a\n\nThu Feb 12 17:35:47 +0800 2026"),
+            ("2", "b\n\nFri Feb 13 08:00:00 +0800 2026"),
+            ("3", "无内容"),
+            ("4", "d\n\nWed Feb 11 09:00:00 +0800 2026"),
+        ],
+    )
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        rows = await db.execute_query("SELECT UID, created_at FROM weibo ORDER BY UID")
+        assert [row[1] for row in rows] == [1770888947, 1770940800, 0, 1770771600]
+
+        first = await _list_weibo(page=1, page_size=2)
+        assert [item["UID"] for item in first["data"]] == ["2", "1"]
+        assert first["total"] == 4
+        assert first["next_cursor"] == "1770888947:1"
+
+        second = await _list_weibo(page_size=2, cursor=first["next_cursor"])
+        assert [item["UID"] for item in second["data"]] == ["4", "3"]
+
+        by_offset = await _list_weibo(page=2, page_size=2)
+        assert [item["UID"] for item in by_offset["data"]] == ["4", "3"]
+    finally:
+        await db.close()
+        await db_module.close_shared_connection()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_reaches_rows_without_created_at(isolated_db) -> None:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+        await db.execute_update(
+            "INSERT INTO weibo (UID, 用户名, 文本, created_at) VALUES "
+            "('1', 'a', '', 200), ('2', 'b', '', 0), ('3', 'c', '', NULL), ('4', 'd', '', NULL)"
+        )
+
+        seen = []
+        cursor = None
+        for _ in range(4):
+            page = await _list_weibo(page_size=1, cursor=cursor)
+            seen.extend(item["UID"] for item in page["data"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        # NULL 排在最后，与 ORDER BY created_at DESC, UID DESC 的偏移分页一致
+        assert seen == ["1", "2", "4", "3"]
+        by_offset = await _list_weibo(page=1, page_size=4)
+        assert [item["UID"] for item in by_offset["data"]] == seen
+    finally:
+        await db.close()
+        await db_module.close_shared_connection()
@@ -1,12 +1,16 @@
 """Tests for Weibo post image persistence and API shape."""
 
+import asyncio
 import json
 import logging
+import time
 
 import aiosqlite
 import pytest
 from PIL import Image
 
+from src.core.media_pipeline import MediaPipeline
+from src.monitors import weibo_monitor as weibo_monitor_module
 from src.monitors.base import CookieExpiredError
 from src.monitors.weibo_monitor import WeiboMonitor
 from src.push_channel.rich_text import RichText
@@ -113,7 +117,7 @@ def test_weibo_row_to_item_parses_images_json():
     item = _weibo_row_to_item(row)
 
     assert item["images"] == ["/weibo_img/name/posts/123/01.jpg"]
-    assert item["image_thumbs"] == ["/weibo_img/name/posts/123/01.thumb.jpg"]
+    assert item["image_thumbs"] == ["/weibo_img/name/posts/123/01.jpg?w=480&fmt=webp"]
 
 
 def test_weibo_row_to_item_parses_retweeted_status_json():
@@ -148,7 +152,7 @@ def test_weibo_row_to_item_parses_retweeted_status_json():
     assert item["retweeted_status"]["url"] == "https://m.weibo.cn/detail/456"
     assert item["retweeted_status"]["images"] == ["/weibo_img/name/posts/123/retweeted/456/01.jpg"]
     assert item["retweeted_status"]["image_thumbs"] == [
-        "/weibo_img/name/posts/123/retweeted/456/01.thumb.jpg"
+        "/weibo_img/name/posts/123/retweeted/456/01.jpg?w=480&fmt=webp"
     ]
 
 
@@ -210,7 +214,7 @@ def test_weibo_row_to_item_exposes_segments_tags_type_and_video_cover():
     ]
     assert item["tags"] == ["话题一", "话题二"]
     assert item["content_type"] == "video"
-    assert item["video_cover_thumb"].endswith("/video_cover.thumb.jpg")
+    assert item["video_cover_thumb"].endswith("/video_cover.jpg?w=480&fmt=webp")
 
 
 def test_weibo_html_parser_preserves_order_and_hides_actual_urls():
@@ -1370,7 +1374,7 @@ def test_build_push_title_for_long_text_and_deletion():
 
 
 @pytest.mark.asyncio
-async def test_save_main_and_retweeted_video_covers_with_thumbnails(tmp_path, monkeypatch):
+async def test_save_main_and_retweeted_video_covers_store_originals_only(tmp_path, monkeypatch):
     monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
     monkeypatch.setattr(monitor, "_get_weibo_data_dir", lambda: tmp_path)
 
@@ -1409,8 +1413,9 @@ async def test_save_main_and_retweeted_video_covers_with_thumbnails(tmp_path, mo
     assert data["视频封面"] == "/weibo_img/name/posts/123/video_cover.jpg"
     assert retweeted["video_cover"].endswith("/posts/123/retweeted/456/video_cover.jpg")
     assert (tmp_path / "name/posts/123/video_cover.jpg").is_file()
-    assert (tmp_path / "name/posts/123/video_cover.thumb.jpg").is_file()
-    assert (tmp_path / "name/posts/123/retweeted/456/video_cover.thumb.jpg").is_file()
+    assert (tmp_path / "name/posts/123/retweeted/456/video_cover.jpg").is_file()
+    # 缩略图由 /weibo_img?w= 按需生成，入库时不再写 .thumb.jpg
+    assert not list(tmp_path.rglob("*.thumb.jpg"))
 
 
 def test_push_cover_prefers_current_video_cover(tmp_path, monkeypatch):
@@ -1652,19 +1657,6 @@ async def test_process_user_skips_older_mid_without_overwriting_snapshot(monkeyp
     assert "本次接口返回的微博时间未晚于已记录微博" not in caplog.text
 
 
-def test_make_post_thumbnail_creates_small_jpeg(tmp_path):
-    monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
-    image_path = tmp_path / "01.jpg"
-    thumb_path = monitor._get_post_thumbnail_path(image_path)
-    Image.new("RGB", (1200, 800), (240, 120, 160)).save(image_path)
-
-    assert monitor._make_post_thumbnail(image_path, thumb_path) is True
-
-    with Image.open(thumb_path) as img:
-        assert img.format == "JPEG"
-        assert max(img.size) <= 480
-
-
 def test_commit_post_image_dir_replaces_old_mid(tmp_path):
     monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
     user_dir = tmp_path / "weibo" / "user"
@@ -1842,7 +1834,6 @@ async def test_save_post_images_retries_with_refreshed_links(tmp_path, monkeypat
     monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
     root_dir = tmp_path / "weibo"
     monkeypatch.setattr(monitor, "_get_weibo_data_dir", lambda: root_dir)
-    monkeypatch.setattr(monitor, "_make_post_thumbnail", lambda image_path, thumb_path: True)
 
     async def fake_download(candidates, save_path):
         if str(candidates[0]).startswith("fresh"):
@@ -1876,3 +1867,199 @@ async def test_save_post_images_retries_with_refreshed_links(tmp_path, monkeypat
     assert json.loads(data["图片"]) == image_urls
     assert (post_dir / "01.jpg").read_bytes() == b"image"
     assert (post_dir / "02.jpg").read_bytes() == b"image"
+
+
+class _BarrierWeiboResponse(_FakeWeiboResponse):
+    def __init__(self, payload: dict, session: "_BarrierWeiboSession"):
+        super().__init__(payload)
+        self.session = session
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+        if self.session.in_flight >= 2:
+            self.session.both_started.set()
+        await self.session.both_started.wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.session.in_flight -= 1
+        return False
+
+
+class _BarrierWeiboSession(_FakeWeiboSession):
+    def __init__(self, payloads: dict[str, dict]):
+        super().__init__(payloads)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.both_started = asyncio.Event()
+
+    def get(self, url, **kwargs):
+        response = super().get(url, **kwargs)
+        return _BarrierWeiboResponse(response.payload, self)
+
+
+@pytest.mark.asyncio
+async def test_get_info_requests_profile_and_timeline_concurrently(monkeypatch):
+    session = _BarrierWeiboSession(
+        {
+            "profile/info": {
+                "ok": 1,
+                "data": {
+                    "user": {
+                        "idstr": "1",
+                        "screen_name": "name",
+                        "description": "",
+                        "followers_count_str": "10",
+                        "statuses_count": 1,
+                    }
+                },
+            },
+            "statuses/mymblog": {"ok": 1, "data": {"list": []}},
+        }
+    )
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"), session=session)
+
+    async def skip_save_user_images(user_info):
+        return None
+
+    monkeypatch.setattr(monitor, "_save_user_images", skip_save_user_images)
+
+    # 两个接口串行请求时第一个响应会一直等待第二个请求发出而超时
+    data = await asyncio.wait_for(monitor.get_info("1"), timeout=2)
+
+    assert session.max_in_flight == 2
+    assert data["用户名"] == "name"
+    assert data["mid"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_get_info_short_circuits_unchanged_timeline_with_cached_profile(monkeypatch):
+    profile_payload = {
+        "ok": 1,
+        "data": {
+            "user": {
+                "idstr": "1",
+                "screen_name": "name",
+                "description": "",
+                "followers_count_str": "10",
+                "statuses_count": 1,
+            }
+        },
+    }
+    timeline_payload = {
+        "ok": 1,
+        "data": {
+            "list": [
+                {"isTop": 1, "text_raw": "置顶", "mid": "999"},
+                {"isTop": 0, "text_raw": "旧微博", "mid": "101"},
+            ]
+        },
+    }
+    session = _FakeWeiboSession(
+        {"profile/info": profile_payload, "statuses/mymblog": timeline_payload}
+    )
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"), session=session)
+
+    async def skip_save_user_images(user_info):
+        return None
+
+    async def fail_build_status_data(base_data, status):
+        raise AssertionError("unchanged timeline should not be parsed")
+
+    monkeypatch.setattr(monitor, "_save_user_images", skip_save_user_images)
+
+    first = await monitor.get_info("1")
+    assert first["mid"] == "101"
+    assert sum("profile/info" in url for url, _ in session.requests) == 1
+
+    monkeypatch.setattr(monitor, "_build_status_data", fail_build_status_data)
+    second = await monitor.get_info("1", old_mid="101")
+
+    assert second == {"UID": "1", "mid": "101", "_timeline_unchanged": True}
+    # 资料缓存命中：第二轮只请求了时间线
+    assert sum("profile/info" in url for url, _ in session.requests) == 1
+    assert sum("statuses/mymblog" in url for url, _ in session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_info_refreshes_profile_when_new_post_appears(monkeypatch):
+    session = _FakeWeiboSession(
+        {
+            "profile/info": {
+                "ok": 1,
+                "data": {
+                    "user": {
+                        "idstr": "1",
+                        "screen_name": "name",
+                        "description": "",
+                        "followers_count_str": "10",
+                        "statuses_count": 2,
+                    }
+                },
+            },
+            "statuses/mymblog": {
+                "ok": 1,
+                "data": {"list": [{"isTop": 0, "text_raw": "新微博", "mid": "102"}]},
+            },
+        }
+    )
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"), session=session)
+    monitor._profile_cache["1"] = (
+        time.monotonic(),
+        {"idstr": "1", "screen_name": "name", "description": "", "statuses_count": 1},
+    )
+
+    async def skip_save_user_images(user_info):
+        return None
+
+    monkeypatch.setattr(monitor, "_save_user_images", skip_save_user_images)
+
+    data = await monitor.get_info("1", old_mid="101")
+
+    assert data["mid"] == "102"
+    assert data["微博数"] == "2"
+    assert [url for url, _ in session.requests][-1].endswith("profile/info?uid=1")
+
+
+@pytest.mark.asyncio
+async def test_removing_temp_image_dir_is_timed_as_delete_stage(tmp_path, monkeypatch):
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
+    monkeypatch.setattr(monitor, "_get_weibo_data_dir", lambda: tmp_path)
+    pipeline = MediaPipeline(worker_threads=1)
+    monkeypatch.setattr(weibo_monitor_module, "get_media_pipeline", lambda: pipeline)
+    temp_dir = tmp_path / "name" / "posts" / ".tmp-123"
+    temp_dir.mkdir(parents=True)
+    (temp_dir / "1.jpg").write_bytes(b"jpg")
+    try:
+        await monitor._remove_path_async(temp_dir)
+        stages = pipeline.metrics()["stages"]
+    finally:
+        pipeline.shutdown()
+
+    assert not temp_dir.exists()
+    assert stages["delete"]["count"] == 1
+    assert "move" not in stages
+
+
+@pytest.mark.asyncio
+async def test_get_info_cancels_timeline_request_when_profile_request_fails(monkeypatch):
+    monitor = WeiboMonitor(AppConfig(weibo_uids="1"))
+    timeline_cancelled = asyncio.Event()
+
+    async def fake_fetch_json(url):
+        if "profile/info" in url:
+            await asyncio.sleep(0)
+            raise RuntimeError("HTTP 502")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            timeline_cancelled.set()
+            raise
+
+    monkeypatch.setattr(monitor, "_fetch_json", fake_fetch_json)
+
+    with pytest.raises(RuntimeError, match="HTTP 502"):
+        await monitor.get_info("1")
+    # 原异常抛出前，并发的时间线请求已被取消并结束
+    assert timeline_cancelled.is_set()
@@ -1,15 +1,33 @@
 """FastAPI application assembly for the Web UI and API."""
 
+import asyncio
 import secrets
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
-from src.core.paths import SESSION_SECRET_FILE, WEB_UI_STATIC_DIR, WEIBO_IMG_DIR
-from src.web.auth import WEB_SESSION_MAX_AGE_SECONDS
-from src.web.routers import auth, config, data, logs, pages, tasks
-from src.web.static_files import CachedStaticFiles
+from src.core.paths import SESSION_SECRET_FILE, WEIBO_IMG_DIR, WEIBO_IMG_VARIANT_DIR
+from src.storage.image_variants import get_image_variant_cache
+from src.web.auth import WEB_SESSION_MAX_AGE_SECONDS, load_sessions
+from src.web.routers import (
+    auth,
+    changes,
+    config,
+    data,
+    diagnostics,
+    logs,
+    metrics,
+    pages,
+    tasks,
+)
+from src.web.static_files import (
+    FingerprintedStaticFiles,
+    ResizingStaticFiles,
+    get_static_manifest,
+)
 
 
 def _get_or_create_session_secret() -> str:
@@ -27,9 +45,20 @@ def _get_or_create_session_secret() -> str:
 SECRET_KEY = _get_or_create_session_secret()
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 启动时在线程中计算静态资源指纹，首个页面渲染前完成；模板引用带指纹的路径并长期缓存
+    manifest = get_static_manifest()
+    await asyncio.to_thread(manifest.scan)
+    threading.Thread(target=manifest.precompress, name="static-precompress", daemon=True).start()
+    yield
+
+
 def create_web_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    app = FastAPI(title="Web任务系统", description="Web任务系统管理界面")
+    app = FastAPI(title="Web任务系统", description="Web任务系统管理界面", lifespan=_lifespan)
+    # 登录会话表只在此处加载一次，之后鉴权只查内存
+    load_sessions()
     app.add_middleware(
         SessionMiddleware,
         secret_key=SECRET_KEY,
@@ -37,13 +66,14 @@ def create_web_app() -> FastAPI:
         same_site="lax",
     )
 
-    app.mount("/static", StaticFiles(directory=str(WEB_UI_STATIC_DIR)), name="static")
+    app.mount("/static", FingerprintedStaticFiles(get_static_manifest()), name="static")
 
     WEIBO_IMG_DIR.mkdir(parents=True, exist_ok=True)
     app.mount(
         "/weibo_img",
-        CachedStaticFiles(
+        ResizingStaticFiles(
             directory=str(WEIBO_IMG_DIR),
+            variant_cache=get_image_variant_cache(WEIBO_IMG_VARIANT_DIR),
             short_cache_paths=(
                 "profile_image.jpg",
                 "avatar_large.jpg",
@@ -60,4 +90,7 @@ def create_web_app() -> FastAPI:
     app.include_router(config.router)
     app.include_router(data.router)
     app.include_router(logs.router)
+    app.include_router(changes.router)
+    app.include_router(metrics.router)
+    app.include_router(diagnostics.router)
     return app
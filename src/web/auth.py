@@ -4,7 +4,8 @@ import hashlib
 import json
 import logging
 import time
-from threading import RLock
+from pathlib import Path
+from threading import RLock, Timer
 
 from src.core.paths import AUTH_FILE, WEB_SESSION_FILE
 
@@ -13,10 +14,18 @@ DEFAULT_USERNAME = "admin"
 DEFAULT_PASSWORD = "123"
 WEB_SESSION_MAX_AGE_SECONDS = 365 * 24 * 60 * 60
 WEB_SESSION_RENEW_WITHIN_SECONDS = 30 * 24 * 60 * 60
+# 续期/过期清理的写盘合并窗口与过期扫描周期
+WEB_SESSION_FLUSH_DELAY_SECONDS = 5.0
+WEB_SESSION_SWEEP_INTERVAL_SECONDS = 10 * 60
 
-# 当前进程内的登录会话缓存；权威数据持久化在 data/web_sessions.json。
+# 进程内权威会话表（session_id -> {"expires_at": ts}），写回 data/web_sessions.json 持久化。
+_session_records: dict[str, dict[str, int]] = {}
 active_sessions: set[str] = set()
 _session_lock = RLock()
+_loaded_from: Path | None = None
+_session_dirty = False
+_flush_timer: Timer | None = None
+_last_sweep_at = 0
 
 
 def _now_ts() -> int:
@@ -104,41 +113,118 @@ def _save_session_records_locked(records: dict[str, dict[str, int]]) -> None:
     temp_file.replace(WEB_SESSION_FILE)
 
 
-def _load_session_records_locked(*, persist_purge: bool = True) -> dict[str, dict[str, int]]:
-    now = _now_ts()
+def _read_session_file_locked() -> tuple[dict[str, dict[str, int]], bool]:
+    """读取会话文件，返回 (未过期记录, 是否清理过过期/无效记录)。"""
     if not WEB_SESSION_FILE.is_file():
-        active_sessions.clear()
-        return {}
+        return {}, False
 
     try:
         raw_data = json.loads(WEB_SESSION_FILE.read_text(encoding="utf-8"))
     except Exception as e:
         logger.error("加载 Web 登录会话失败: %s", e)
-        active_sessions.clear()
-        return {}
+        return {}, False
 
-    records = _normalize_session_records(raw_data, now)
+    records = _normalize_session_records(raw_data, _now_ts())
     raw_sessions = raw_data.get("sessions", raw_data) if isinstance(raw_data, dict) else None
     raw_count = len(raw_sessions) if isinstance(raw_sessions, dict) else len(records)
-    if persist_purge and raw_count != len(records):
-        try:
-            _save_session_records_locked(records)
-        except Exception as e:
-            logger.error("清理过期 Web 登录会话失败: %s", e)
+    return records, raw_count != len(records)
+
+
+def _flush_locked() -> None:
+    global _session_dirty, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if not _session_dirty:
+        return
+    try:
+        _save_session_records_locked(dict(_session_records))
+        _session_dirty = False
+    except Exception as e:
+        logger.error("保存 Web 登录会话失败: %s", e)
+
+
+def _flush_from_timer() -> None:
+    global _flush_timer
+    with _session_lock:
+        _flush_timer = None
+        _flush_locked()
 
+
+def _mark_dirty_locked(*, immediate: bool = False) -> None:
+    """标记会话表已变更；登录/登出等安全相关变更立即落盘，续期与过期清理合并延迟写入。"""
+    global _session_dirty, _flush_timer
+    _session_dirty = True
+    if immediate:
+        _flush_locked()
+        return
+    if _flush_timer is None:
+        _flush_timer = Timer(WEB_SESSION_FLUSH_DELAY_SECONDS, _flush_from_timer)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _sweep_expired_locked(now: int) -> int:
+    global _last_sweep_at
+    _last_sweep_at = now
+    expired = [sid for sid, record in _session_records.items() if record["expires_at"] <= now]
+    for session_id in expired:
+        del _session_records[session_id]
+        active_sessions.discard(session_id)
+    if expired:
+        logger.debug("已清理过期 Web 登录会话: %s 个", len(expired))
+        _mark_dirty_locked()
+    return len(expired)
+
+
+def _ensure_loaded_locked() -> None:
+    """会话表按文件路径加载一次；路径变化（如测试替换 WEB_SESSION_FILE）时重新加载。"""
+    if _loaded_from != WEB_SESSION_FILE:
+        _load_sessions_locked()
+
+
+def _load_sessions_locked() -> None:
+    global _loaded_from, _session_dirty, _flush_timer, _last_sweep_at
+    if _loaded_from == WEB_SESSION_FILE:
+        # 重新加载前先写出本文件尚未落盘的续期
+        _flush_locked()
+    elif _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    records, purged = _read_session_file_locked()
+    _session_records.clear()
+    _session_records.update(records)
     active_sessions.clear()
     active_sessions.update(records)
-    return records
+    _loaded_from = WEB_SESSION_FILE
+    _session_dirty = False
+    _last_sweep_at = _now_ts()
+    if purged:
+        # 启动时一次性清理，直接落盘
+        _mark_dirty_locked(immediate=True)
+
+
+def load_sessions() -> int:
+    """从磁盘（重新）加载登录会话表，返回有效会话数；Web 应用创建时调用一次。"""
+    with _session_lock:
+        _load_sessions_locked()
+        return len(_session_records)
+
+
+def flush_sessions() -> None:
+    """立即写出尚未落盘的会话变更（程序退出时调用）。"""
+    with _session_lock:
+        _flush_locked()
 
 
 def register_session(session_id: str) -> int:
     """登记并持久化一个登录会话，返回过期时间戳。"""
     with _session_lock:
-        records = _load_session_records_locked()
+        _ensure_loaded_locked()
         expires_at = _session_expires_at()
-        records[session_id] = {"expires_at": expires_at}
-        _save_session_records_locked(records)
+        _session_records[session_id] = {"expires_at": expires_at}
         active_sessions.add(session_id)
+        _mark_dirty_locked(immediate=True)
         return expires_at
 
 
@@ -147,46 +233,52 @@ def revoke_session(session_id: str | None) -> None:
     if not session_id:
         return
     with _session_lock:
-        records = _load_session_records_locked()
-        records.pop(session_id, None)
-        _save_session_records_locked(records)
+        _ensure_loaded_locked()
+        _session_records.pop(session_id, None)
         active_sessions.discard(session_id)
+        _mark_dirty_locked(immediate=True)
 
 
 def replace_sessions_with(session_id: str) -> int:
     """清空其它会话，仅保留当前会话；用于修改密码后收敛旧登录态。"""
     with _session_lock:
+        _ensure_loaded_locked()
         expires_at = _session_expires_at()
-        records = {session_id: {"expires_at": expires_at}}
-        _save_session_records_locked(records)
+        _session_records.clear()
+        _session_records[session_id] = {"expires_at": expires_at}
         active_sessions.clear()
         active_sessions.add(session_id)
+        _mark_dirty_locked(immediate=True)
         return expires_at
 
 
 def check_login(session_id: str | None) -> bool:
-    """检查用户是否已登录。"""
+    """检查用户是否已登录（仅查内存会话表，不读磁盘）。"""
     if not session_id:
         return False
 
     with _session_lock:
-        records = _load_session_records_locked()
-        record = records.get(session_id)
+        _ensure_loaded_locked()
+        now = _now_ts()
+        if now - _last_sweep_at >= WEB_SESSION_SWEEP_INTERVAL_SECONDS:
+            _sweep_expired_locked(now)
+
+        record = _session_records.get(session_id)
         if not record:
             active_sessions.discard(session_id)
             return False
 
-        now = _now_ts()
         remaining = record["expires_at"] - now
         if remaining <= 0:
-            records.pop(session_id, None)
-            _save_session_records_locked(records)
+            del _session_records[session_id]
             active_sessions.discard(session_id)
+            _mark_dirty_locked()
             return False
 
         if remaining < WEB_SESSION_RENEW_WITHIN_SECONDS:
+            # 滑动续期：多个会话/多次请求的续期在延迟窗口内合并为一次写盘
             record["expires_at"] = _session_expires_at(now)
-            _save_session_records_locked(records)
+            _mark_dirty_locked()
 
         active_sessions.add(session_id)
         return True
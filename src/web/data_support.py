@@ -2,7 +2,6 @@
 
 import json
 import re
-from datetime import datetime, timedelta, timezone
 from urllib.parse import urlsplit
 
 # 平台配置：table_name, primary_key, filter_query_param
@@ -18,6 +17,7 @@ PLATFORM_CONFIG = {
 PLATFORM_PRIMARY_KEY = {k: v[1] for k, v in PLATFORM_CONFIG.items()}
 VALID_PLATFORMS = frozenset(PLATFORM_CONFIG)
 WEIBO_CONTENT_TYPES = {"repost", "video", "image", "text"}
+WEIBO_THUMB_QUERY = "w=480&fmt=webp"
 
 
 def _safe_http_url(raw: object) -> str:
@@ -179,85 +179,10 @@ def _parse_weibo_retweeted_status(raw: str | None) -> dict | None:
 
 
 def _weibo_thumb_url(image_url: str) -> str:
-    """按保存规则从原图 URL 推导缩略图 URL。"""
-    if "/" not in image_url:
+    """本地原图的列表缩略图 URL：由 /weibo_img 按需缩放（见 ResizingStaticFiles）。"""
+    if not image_url.startswith("/weibo_img/") or "?" in image_url:
         return image_url
-    parent, filename = image_url.rsplit("/", 1)
-    if "." not in filename:
-        return image_url
-    stem, _ = filename.rsplit(".", 1)
-    return f"{parent}/{stem}.thumb.jpg"
-
-
-def _parse_weibo_created_at(text: str | None) -> datetime | None:
-    """
-    从微博文本中解析发布时间。文本格式为 "...\n\n{created_at}"。
-    支持格式：Thu Feb 12 17:35:47 +0800 2026 等。
-    """
-    if not text or not isinstance(text, str):
-        return None
-    raw = None
-    for sep in ("\n\n", "\r\n\r\n"):
-        if sep in text:
-            parts = text.rsplit(sep, 1)
-            if len(parts) >= 2:
-                raw = parts[-1].strip()
-                break
-    if not raw or len(raw) > 80:
-        return None
-
-    formats = [
-        "%a %b %d %H:%M:%S %z %Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%b %d %H:%M:%S %z %Y",
-    ]
-    for fmt in formats:
-        try:
-            return datetime.strptime(raw, fmt)
-        except (ValueError, TypeError):
-            continue
-
-    m = re.match(
-        r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+"
-        r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+"
-        r"(\d{1,2})\s+(\d{2}):(\d{2}):(\d{2})\s+([+-]\d{4})\s+(\d{4})",
-        raw,
-    )
-    if m:
-        try:
-            months = {
-                "Jan": 1,
-                "Feb": 2,
-                "Mar": 3,
-                "Apr": 4,
-                "May": 5,
-                "Jun": 6,
-                "Jul": 7,
-                "Aug": 8,
-                "Sep": 9,
-                "Oct": 10,
-                "Nov": 11,
-                "Dec": 12,
-            }
-            month = months.get(m.group(1), 1)
-            tz_str = m.group(6)
-            sign = 1 if tz_str[0] == "+" else -1
-            tz_h = sign * int(tz_str[1:3])
-            tz_m = sign * int(tz_str[3:5]) if len(tz_str) >= 5 else 0
-            tz = timezone(timedelta(hours=tz_h, minutes=tz_m))
-            return datetime(
-                int(m.group(7)),
-                month,
-                int(m.group(2)),
-                int(m.group(3)),
-                int(m.group(4)),
-                int(m.group(5)),
-                tzinfo=tz,
-            )
-        except (ValueError, KeyError, IndexError):
-            pass
-    return None
+    return f"{image_url}?{WEIBO_THUMB_QUERY}"
 
 
 def _weibo_row_to_item(row: tuple) -> dict:
@@ -290,6 +215,7 @@ def _weibo_row_to_item(row: tuple) -> dict:
         "video_cover": video_cover,
         "video_cover_thumb": _weibo_thumb_url(video_cover) if video_cover else "",
         "url": f"https://m.weibo.cn/detail/{mid}" if mid else f"https://www.weibo.com/u/{row[0]}",
+        "created_at": row[14] if len(row) > 14 else None,
     }
 
 
@@ -429,7 +355,7 @@ _PLATFORM_SELECT = {
 _PLATFORM_LIST_SQL = {
     "weibo": (
         "SELECT UID, 用户名, 认证信息, 简介, 粉丝数, 微博数, 文本, mid, 图片, "
-        "转发微博, 正文结构, 标签, 内容类型, 视频封面 FROM weibo"
+        "转发微博, 正文结构, 标签, 内容类型, 视频封面, created_at FROM weibo"
     ),
     "huya": "SELECT room, name, is_live, room_pic, avatar_url FROM huya",
     "bilibili_live": "SELECT uid, uname, room_id, is_live FROM bilibili_live",
@@ -440,3 +366,42 @@ _PLATFORM_LIST_SQL = {
 }
 
 _PLATFORM_LIST_SQL_HUYA_BASIC = "SELECT room, name, is_live FROM huya"
+
+# 列表排序：微博按已索引的发布时间倒序，UID 作为同一时间内的稳定次序（也是游标的一部分）
+_PLATFORM_LIST_ORDER = {"weibo": " ORDER BY created_at DESC, UID DESC"}
+
+
+def _parse_weibo_page_cursor(raw: str | None) -> tuple[int | None, str] | None:
+    """
+    解析微博列表的翻页游标 ``<created_at>:<UID>``，格式错误返回 None。
+
+    created_at 为空表示上一页末行尚未回填发布时间（NULL，按倒序排在最后）。
+    """
+    if not raw or ":" not in raw:
+        return None
+    created_at, uid = raw.split(":", 1)
+    if not created_at:
+        return None, uid
+    try:
+        return int(created_at), uid
+    except ValueError:
+        return None
+
+
+def _weibo_page_cursor(item: dict) -> str:
+    created_at = item.get("created_at")
+    return f"{'' if created_at is None else created_at}:{item['UID']}"
+
+
+def _weibo_keyset_clause(created_at: int | None) -> str:
+    """
+    游标之后的行：与 ``ORDER BY created_at DESC, UID DESC`` 一致，NULL 排在所有时间之后。
+
+    不用 COALESCE 改写列，使条件与排序都能走 (created_at, UID) 索引。
+    """
+    if created_at is None:
+        return "(created_at IS NULL AND UID < :cursor_uid)"
+    return (
+        "(created_at < :cursor_ts OR (created_at = :cursor_ts AND UID < :cursor_uid)"
+        " OR created_at IS NULL)"
+    )
@@ -0,0 +1,110 @@
+"""Live monitor change feed (Server-Sent Events)."""
+
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.core.change_feed import ChangeEvent, get_change_feed
+from src.web.auth import check_login
+from src.web.data_support import VALID_PLATFORMS
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+CHANGE_STREAM_HEARTBEAT_SECONDS = 15.0
+
+# B站直播/动态共用一个 Cookie，Cookie 事件以监控器平台名 "bilibili" 发布
+_COOKIE_PLATFORM = {"bilibili_live": "bilibili", "bilibili_dynamic": "bilibili"}
+
+
+def _parse_platforms(raw: str) -> frozenset[str] | None:
+    """解析 platforms=a,b 过滤参数；含未知平台时返回 None。"""
+    platforms = {p.strip() for p in raw.split(",") if p.strip()}
+    if not platforms <= VALID_PLATFORMS:
+        return None
+    return frozenset(platforms | {_COOKIE_PLATFORM[p] for p in platforms if p in _COOKIE_PLATFORM})
+
+
+def _parse_last_event_id(raw: str | None, epoch: str) -> int | None:
+    """解析 "<epoch>:<id>" 形式的事件 ID；epoch 不匹配（服务已重启）或格式错误时返回 None。"""
+    if not raw:
+        return None
+    event_epoch, _, event_id = raw.partition(":")
+    if event_epoch != epoch or not event_id.isdigit():
+        return None
+    return int(event_id)
+
+
+def _sse_event(event: ChangeEvent, epoch: str) -> str:
+    data = json.dumps(event.as_dict(), ensure_ascii=False)
+    return f"id: {epoch}:{event.id}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+async def _change_stream_events(
+    request: Request, platforms: frozenset[str], last_event_id: str | None
+):
+    """先补发 Last-Event-ID 之后的缓冲事件，再转发实时事件；无法补发时通知客户端整体重新加载。"""
+    feed = get_change_feed()
+    # 订阅先于补发建立，补发期间发布的事件以 ID 去重
+    subscription = feed.subscribe(platforms)
+    try:
+        sent_id = feed.last_id
+        if last_event_id:
+            after_id = _parse_last_event_id(last_event_id, feed.epoch)
+            replay = feed.replay(after_id, platforms) if after_id is not None else None
+            if replay is None:
+                yield f"event: resync\ndata: {json.dumps({'last_id': sent_id})}\n\n"
+            else:
+                for event in replay:
+                    yield _sse_event(event, feed.epoch)
+                sent_id = max([after_id, *(e.id for e in replay)])
+        # 告知客户端当前游标，断线重连时浏览器会通过 Last-Event-ID 带回
+        yield f"id: {feed.epoch}:{sent_id}\nevent: ready\ndata: {{}}\n\n"
+
+        while True:
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield "event: resync\ndata: {}\n\n"
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=CHANGE_STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+            if event.id <= sent_id:
+                continue
+            sent_id = event.id
+            yield _sse_event(event, feed.epoch)
+    finally:
+        feed.unsubscribe(subscription)
+
+
+@router.get("/api/changes/stream")
+async def stream_changes(request: Request, platforms: str = "", last_event_id: str | None = None):
+    """
+    Server-Sent Events 监控状态变更流（需登录）。
+
+    platforms 为逗号分隔的平台名（为空表示全部）；事件类型见 src.core.change_feed，
+    另有 ready（当前游标）与 resync（缓冲区无法补发，需重新加载列表）。
+    """
+    session_id = request.session.get("session_id")
+    if not check_login(session_id):
+        return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
+
+    wanted = _parse_platforms(platforms)
+    if wanted is None:
+        return JSONResponse({"error": "无效的平台"}, status_code=status.HTTP_400_BAD_REQUEST)
+
+    return StreamingResponse(
+        _change_stream_events(
+            request, wanted, request.headers.get("last-event-id") or last_event_id
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
@@ -1,27 +1,33 @@
 """Monitoring data API routes."""
 
 import logging
-from datetime import datetime
 
 from fastapi import APIRouter, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from src.storage.database import AsyncDatabase
 from src.web.auth import check_login
 from src.web.data_support import (
+    _PLATFORM_LIST_ORDER,
     _PLATFORM_LIST_SQL,
     _PLATFORM_LIST_SQL_HUYA_BASIC,
     _PLATFORM_SELECT,
     PLATFORM_CONFIG,
     PLATFORM_PRIMARY_KEY,
     VALID_PLATFORMS,
-    _parse_weibo_created_at,
+    _parse_weibo_page_cursor,
     _row_to_item,
+    _weibo_keyset_clause,
+    _weibo_page_cursor,
 )
+from src.web.status_snapshot import StatusSnapshot, get_monitor_status_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+MONITOR_STATUS_LONG_POLL_DEFAULT_SECONDS = 25.0
+MONITOR_STATUS_LONG_POLL_MAX_SECONDS = 60.0
+
 
 @router.get("/api/data/huya/images")
 async def get_huya_images(request: Request, rooms: str = ""):
@@ -92,8 +98,13 @@ async def get_table_data(
     uid: str | None = None,
     room: str | None = None,
     id: str | None = None,
+    cursor: str | None = None,
 ):
-    """获取监控数据列表（需登录）。支持分页与按主键过滤。"""
+    """获取监控数据列表（需登录）。支持分页与按主键过滤。
+
+    微博按 created_at 倒序在 SQL 中排序分页；传入上一页返回的 next_cursor 时改用
+    键集分页（忽略 page），翻页开销与表大小无关。
+    """
     session_id = request.session.get("session_id")
     if not check_login(session_id):
         return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
@@ -134,123 +145,168 @@ async def get_table_data(
                 if platform == "huya" and not include_media
                 else _PLATFORM_LIST_SQL[platform]
             )
-            if platform == "weibo":
-                sql = f"{_PLATFORM_LIST_SQL[platform]}{where_clause}"
-                fetch_params = {k: v for k, v in params.items() if k == "filter_val"}
-                rows = await db.execute_query(sql, fetch_params if fetch_params else None)
-            else:
-                sql = f"{base_sql}{where_clause} LIMIT :limit OFFSET :offset"
-                rows = await db.execute_query(sql, params)
+            page_cursor = _parse_weibo_page_cursor(cursor) if platform == "weibo" else None
+            if page_cursor is not None:
+                cursor_ts, params["cursor_uid"] = page_cursor
+                if cursor_ts is not None:
+                    params["cursor_ts"] = cursor_ts
+                params["offset"] = 0
+                keyset = _weibo_keyset_clause(cursor_ts)
+                where_clause = (
+                    f"{where_clause} AND {keyset}" if where_clause else f" WHERE {keyset}"
+                )
+            order_clause = _PLATFORM_LIST_ORDER.get(platform, "")
+            sql = f"{base_sql}{where_clause}{order_clause} LIMIT :limit OFFSET :offset"
+            rows = await db.execute_query(sql, params)
 
         data = [_row_to_item(platform, row) for row in rows]
 
-        if platform == "weibo" and data:
-
-            def sort_key(item: dict):
-                dt = _parse_weibo_created_at(item.get("文本"))
-                if dt is None:
-                    return 0.0
-                return dt.timestamp()
-
-            data.sort(key=sort_key, reverse=True)
-            offset = (page - 1) * page_size
-            data = data[offset : offset + page_size]
-
-        return JSONResponse(
-            {
-                "data": data,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size if total else 0,
-            }
-        )
+        payload = {
+            "data": data,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total + page_size - 1) // page_size if total else 0,
+        }
+        if platform == "weibo":
+            payload["next_cursor"] = (
+                _weibo_page_cursor(data[-1]) if len(data) == page_size else None
+            )
+        return JSONResponse(payload)
     except Exception as e:
         logger.error("获取表数据失败: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+def _not_modified(snapshot: StatusSnapshot) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": snapshot.etag, "Cache-Control": "no-cache"},
+    )
+
+
+def _snapshot_response(request: Request, snapshot: StatusSnapshot) -> Response:
+    """按 ETag 协商返回快照：If-None-Match 命中时返回 304 且不带响应体。"""
+    if_none_match = request.headers.get("if-none-match", "")
+    if snapshot.status_code == 200 and snapshot.etag in {
+        tag.strip() for tag in if_none_match.split(",")
+    }:
+        return _not_modified(snapshot)
+    return Response(
+        content=snapshot.body,
+        status_code=snapshot.status_code,
+        media_type="application/json",
+        headers={"ETag": snapshot.etag, "Cache-Control": "no-cache"},
+    )
+
+
+def _parse_since(since: str | None) -> int | None:
+    """
+    解析长轮询 since 令牌 ``<epoch>-<version>``，返回本进程内的版本号。
+
+    版本号重启后从 0 开始，epoch 与当前进程不一致时返回 None：不等待，直接返回完整快照。
+    格式错误时抛出 ValueError。
+    """
+    if since is None:
+        return None
+    epoch, sep, version = since.rpartition("-")
+    if not sep or not epoch or not version.isdigit():
+        raise ValueError(since)
+    if epoch != get_monitor_status_cache().versions.epoch:
+        return None
+    return int(version)
+
+
+async def _wait_for_status_change(since: int | None, timeout: float, table: str | None) -> None:
+    """长轮询：since 为客户端已持有的版本号，版本未前进时最多等待 timeout 秒。"""
+    if since is None:
+        return
+    wait_seconds = max(0.0, min(timeout, MONITOR_STATUS_LONG_POLL_MAX_SECONDS))
+    await get_monitor_status_cache().versions.wait_for_change(since, wait_seconds, table)
+
+
+def _invalid_since() -> JSONResponse:
+    return JSONResponse({"error": "无效的 since 参数，应为 <epoch>-<version>"}, status_code=400)
+
+
 @router.get("/api/monitor-status/{platform}/{item_id}")
-async def get_monitor_status_item(request: Request, platform: str, item_id: str):
+async def get_monitor_status_item(
+    request: Request,
+    platform: str,
+    item_id: str,
+    since: str | None = None,
+    timeout: float = MONITOR_STATUS_LONG_POLL_DEFAULT_SECONDS,
+):
     """按平台与主键 ID 获取单条监控状态（无需登录）。支持所有已持久化的平台。"""
-    if platform not in VALID_PLATFORMS:
+    if platform not in VALID_PLATFORMS or platform not in _PLATFORM_SELECT:
         return JSONResponse({"error": "无效的平台"}, status_code=400)
 
     try:
-        if platform not in _PLATFORM_SELECT:
-            return JSONResponse({"error": "无效的平台"}, status_code=400)
-
-        async with AsyncDatabase() as db:
-            _, sql = _PLATFORM_SELECT[platform]
-            rows = await db.execute_query(sql, {"pk": item_id})
+        since_version = _parse_since(since)
+    except ValueError:
+        return _invalid_since()
 
-        if not rows:
-            return JSONResponse({"error": "未找到该资源"}, status_code=404)
-
-        data = _row_to_item(platform, rows[0])
-
-        return JSONResponse(
-            {
-                "success": True,
-                "data": data,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+    try:
+        await _wait_for_status_change(since_version, timeout, PLATFORM_CONFIG[platform][0])
+        snapshot = await get_monitor_status_cache().item_status(platform, item_id)
+        if since_version is not None and snapshot.version <= since_version:
+            return _not_modified(snapshot)
+        return _snapshot_response(request, snapshot)
     except Exception as e:
         logger.error("获取监控状态失败: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
 @router.get("/api/monitor-status/{platform}")
-async def get_monitor_status_by_platform(request: Request, platform: str):
+async def get_monitor_status_by_platform(
+    request: Request,
+    platform: str,
+    since: str | None = None,
+    timeout: float = MONITOR_STATUS_LONG_POLL_DEFAULT_SECONDS,
+):
     """按平台获取监控状态列表（无需登录）。支持所有已持久化的平台。"""
-    if platform not in VALID_PLATFORMS:
+    if platform not in VALID_PLATFORMS or platform not in _PLATFORM_LIST_SQL:
         return JSONResponse({"error": "无效的平台"}, status_code=400)
 
     try:
-        if platform not in _PLATFORM_LIST_SQL:
-            return JSONResponse({"error": "无效的平台"}, status_code=400)
-
-        async with AsyncDatabase() as db:
-            rows = await db.execute_query(_PLATFORM_LIST_SQL[platform])
+        since_version = _parse_since(since)
+    except ValueError:
+        return _invalid_since()
 
-        data = [_row_to_item(platform, row) for row in rows]
-
-        return JSONResponse(
-            {
-                "success": True,
-                "data": data,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+    try:
+        await _wait_for_status_change(since_version, timeout, PLATFORM_CONFIG[platform][0])
+        snapshot = await get_monitor_status_cache().platform_status(platform)
+        if since_version is not None and snapshot.version <= since_version:
+            return _not_modified(snapshot)
+        return _snapshot_response(request, snapshot)
     except Exception as e:
         logger.error("获取监控状态失败: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
 @router.get("/api/monitor-status")
-async def get_monitor_status(request: Request):
-    """获取全部监控任务状态（无需登录）。返回所有已持久化平台的聚合结果。"""
+async def get_monitor_status(
+    request: Request,
+    since: str | None = None,
+    timeout: float = MONITOR_STATUS_LONG_POLL_DEFAULT_SECONDS,
+):
+    """获取全部监控任务状态（无需登录）。返回所有已持久化平台的聚合结果。
 
+    响应带 ETag、``epoch`` 与 ``version``；携带 If-None-Match 且未变化时返回 304。
+    传入 ``?since=<epoch>-<version>`` 时进入长轮询，版本前进或超时（304）后返回；
+    epoch 不一致（服务已重启）时立即返回 200 完整快照。
+    """
     try:
-        async with AsyncDatabase() as db:
-            all_data: dict[str, list[dict]] = {}
+        since_version = _parse_since(since)
+    except ValueError:
+        return _invalid_since()
 
-            for platform, base_sql in _PLATFORM_LIST_SQL.items():
-                try:
-                    rows = await db.execute_query(base_sql)
-                    all_data[platform] = [_row_to_item(platform, row) for row in rows]
-                except Exception as e:
-                    logger.error("获取平台 %s 监控状态失败: %s", platform, e, exc_info=True)
-                    all_data[platform] = []
-
-        return JSONResponse(
-            {
-                "success": True,
-                "data": all_data,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+    try:
+        await _wait_for_status_change(since_version, timeout, None)
+        snapshot = await get_monitor_status_cache().all_status()
+        if since_version is not None and snapshot.version <= since_version:
+            return _not_modified(snapshot)
+        return _snapshot_response(request, snapshot)
     except Exception as e:
         logger.error("获取监控状态失败: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
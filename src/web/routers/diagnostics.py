@@ -0,0 +1,31 @@
+"""Runtime diagnostics API routes."""
+
+import logging
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+
+from src.core.loop_watchdog import get_loop_watchdog
+from src.web.auth import check_login
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/api/diagnostics/loop-stalls")
+async def get_loop_stalls(request: Request):
+    """事件循环卡顿看门狗状态与最近的卡顿记录（含卡顿时事件循环线程的调用栈）"""
+    session_id = request.session.get("session_id")
+    if not check_login(session_id):
+        return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
+
+    watchdog = get_loop_watchdog()
+    return JSONResponse(
+        {
+            "success": True,
+            "enabled": watchdog.running,
+            "threshold_ms": watchdog.threshold_ms,
+            "stall_count": watchdog.stall_count,
+            "stalls": [stall.as_dict() for stall in watchdog.stalls()],
+        }
+    )
@@ -1,6 +1,7 @@
 """Log API routes."""
 
 import asyncio
+import json
 import logging
 import os
 import time
@@ -8,7 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 from fastapi import APIRouter, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.jobs.registry import MONITOR_JOBS, TASK_JOBS, discover_and_import
 from src.web.auth import check_login
@@ -16,39 +17,63 @@ from src.web.auth import check_login
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
 
-def _read_log_file_sync(file_path: Path, num_lines: int) -> tuple[list, int]:
-    """同步读取日志文件最后 N 行。处理文件写入时的读取冲突，带重试。返回 (最近行列表, 总行数)。"""
 
-    def _do_read() -> tuple[list, int]:
-        with open(file_path, encoding="utf-8", errors="ignore") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
+LOG_TAIL_BLOCK_SIZE = 64 * 1024
+# 增量读取单次最多返回的字节数；落后更多时直接退回到尾部读取
+LOG_INCREMENT_MAX_BYTES = 1024 * 1024
+LOG_STREAM_HEARTBEAT_SECONDS = 15.0
+# 实时流建立时，与尾部快照比对去重的排队记录上限
+LOG_STREAM_DEDUP_WINDOW = 200
 
-            if file_size < 1024 * 1024:
-                f.seek(0)
-                all_lines = f.readlines()
-            else:
-                estimated_bytes = num_lines * 200
-                read_start = max(0, file_size - estimated_bytes)
-                f.seek(read_start)
-                if read_start > 0:
-                    f.readline()
-                all_lines = f.readlines()
-
-            if len(all_lines) > num_lines:
-                recent_lines = all_lines[-num_lines:]
-            else:
-                recent_lines = all_lines
-            return recent_lines, len(all_lines)
 
-    def _do_read_binary() -> tuple[list, int]:
+def _tail_bytes(f, end: int, num_lines: int) -> tuple[bytes, int]:
+    """自 end 向前按块读取，直到覆盖 num_lines 个完整行；返回 (内容, 起始偏移)。"""
+    start = end
+    chunks: list[bytes] = []
+    newlines = 0
+    while start > 0 and newlines <= num_lines:
+        block = min(LOG_TAIL_BLOCK_SIZE, start)
+        start -= block
+        f.seek(start)
+        chunk = f.read(block)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+    return b"".join(reversed(chunks)), start
+
+
+def _read_log_chunk_sync(
+    file_path: Path, num_lines: int, cursor: int | None = None
+) -> tuple[list[str], int, bool]:
+    """按字节游标读取日志。
+
+    - cursor 为 None、超出文件大小（文件被截断/轮转）或落后过多时，返回最后 num_lines 行；
+    - 否则只返回 cursor 之后新写入的完整行。
+
+    返回 (行列表, 新游标, 是否为重置后的尾部快照)。游标总是落在行尾，未写完的半行留待下次。
+    """
+
+    def _do_read() -> tuple[list[str], int, bool]:
         with open(file_path, "rb") as f:
-            content = f.read()
-        text = content.decode("utf-8", errors="ignore")
-        all_lines = text.splitlines(keepends=True)
-        recent_lines = all_lines[-num_lines:] if len(all_lines) > num_lines else all_lines
-        return recent_lines, len(all_lines)
+            size = f.seek(0, os.SEEK_END)
+            reset = cursor is None or cursor > size or size - cursor > LOG_INCREMENT_MAX_BYTES
+            if reset:
+                data, start = _tail_bytes(f, size, num_lines)
+            else:
+                start = cursor
+                f.seek(start)
+                data = f.read(size - start)
+
+            complete = data.rfind(b"\n") + 1
+            new_cursor = start + complete
+            lines = data[:complete].decode("utf-8", errors="ignore").splitlines(keepends=True)
+            if reset and start > 0 and lines:
+                # 向前读到的第一行可能不完整
+                lines = lines[1:]
+            if len(lines) > num_lines:
+                lines = lines[-num_lines:]
+            return lines, new_cursor, reset
 
     max_retries = 5
     retry_delay = 0.2
@@ -56,61 +81,136 @@ def _read_log_file_sync(file_path: Path, num_lines: int) -> tuple[list, int]:
     for attempt in range(max_retries):
         try:
             return _do_read()
-        except (OSError, PermissionError):
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay * (attempt + 1))
-                continue
-            try:
-                return _do_read_binary()
-            except Exception as final_e:
-                logger.error("读取日志文件失败（所有方法都失败）: %s", final_e)
-                raise
-        except Exception as e:
-            logger.error("读取日志文件时发生未知错误: %s", e)
+        except (OSError, PermissionError) as e:
             if attempt < max_retries - 1:
                 time.sleep(retry_delay * (attempt + 1))
                 continue
+            logger.error("读取日志文件失败: %s", e)
             raise
-    return [], 0
+    return [], 0, True
+
+
+def _resolve_log_file(task: str | None) -> Path:
+    from src.jobs.log_manager import LogManager
+
+    log_manager = LogManager()
+    if task:
+        return log_manager.get_task_log_file(task, date_format="%Y%m%d")
+    return log_manager.get_log_file("main", date_format="%Y%m%d")
 
 
 @router.get("/api/logs")
-async def get_logs(request: Request, lines: int = 100, task: str | None = None):
-    """获取日志内容。不传 task 时返回今日总日志，传 task 时返回指定任务的今日日志"""
+async def get_logs(
+    request: Request,
+    lines: int = 100,
+    task: str | None = None,
+    cursor: int | None = None,
+    file: str | None = None,
+):
+    """获取日志内容。不传 task 时返回今日总日志，传 task 时返回指定任务的今日日志。
+
+    传入上次返回的 cursor 与 file 时只返回新增行；跨天轮转（file 变化）或文件被截断时
+    返回 ``reset: true`` 与最新的尾部快照，前端据此整体替换而非追加。
+    """
     session_id = request.session.get("session_id")
     if not check_login(session_id):
         return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
 
     try:
-        from src.jobs.log_manager import LogManager
-
-        log_manager = LogManager()
-
-        if task:
-            log_file = log_manager.get_task_log_file(task, date_format="%Y%m%d")
-        else:
-            log_file = log_manager.get_log_file("main", date_format="%Y%m%d")
-
+        log_file = _resolve_log_file(task)
         if not log_file.exists():
             return JSONResponse(
-                {"logs": [], "message": "今日暂无日志" if not task else f"任务 {task} 今日暂无日志"}
+                {
+                    "logs": [],
+                    "cursor": 0,
+                    "file": log_file.name,
+                    "reset": True,
+                    "message": "今日暂无日志" if not task else f"任务 {task} 今日暂无日志",
+                },
+                headers=_NO_STORE_HEADERS,
             )
 
+        if file != log_file.name:
+            cursor = None
         try:
-            recent_lines, total_lines = await asyncio.wait_for(
-                asyncio.to_thread(_read_log_file_sync, log_file, lines),
+            recent_lines, new_cursor, reset = await asyncio.wait_for(
+                asyncio.to_thread(_read_log_chunk_sync, log_file, lines, cursor),
                 timeout=10.0,
             )
         except TimeoutError:
             logger.error("读取日志文件超时: %s", log_file)
             return JSONResponse({"error": "读取日志超时，请稍后重试"}, status_code=504)
 
-        return JSONResponse({"logs": recent_lines, "total_lines": total_lines})
+        return JSONResponse(
+            {"logs": recent_lines, "cursor": new_cursor, "file": log_file.name, "reset": reset},
+            headers=_NO_STORE_HEADERS,
+        )
     except Exception as e:
         logger.error("读取日志失败: %s", e, exc_info=True)
         return JSONResponse({"error": f"读取日志失败: {str(e)}"}, status_code=500)
 
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _log_stream_events(request: Request, task: str | None, lines: int):
+    """实时日志流：先发送一次尾部快照，之后只转发日志处理器推送的新记录，不再读盘。"""
+    from src.jobs.log_manager import get_log_broadcaster
+
+    broadcaster = get_log_broadcaster()
+    subscription = broadcaster.subscribe(task)
+    try:
+        log_file = _resolve_log_file(task)
+        snapshot: list[str] = []
+        if log_file.exists():
+            snapshot, _, _ = await asyncio.to_thread(_read_log_chunk_sync, log_file, lines)
+        yield _sse("snapshot", {"logs": snapshot, "file": log_file.name})
+
+        # 订阅先于快照建立，快照期间写入的记录可能已在快照中，逐条比对后丢弃
+        recent = {line.rstrip("\n") for line in snapshot[-LOG_STREAM_DEDUP_WINDOW:]}
+        pending = min(subscription.queue.qsize(), LOG_STREAM_DEDUP_WINDOW)
+        current_date = log_file.stem.rsplit("_", 1)[-1]
+        while True:
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield _sse("reset", {})
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=LOG_STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+
+            if pending:
+                pending -= 1
+                if all(line in recent for line in event.lines):
+                    continue
+            if event.date != current_date:
+                current_date = event.date
+                yield _sse("rotate", {"file": _resolve_log_file(task).name})
+            yield _sse("lines", {"logs": list(event.lines)})
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@router.get("/api/logs/stream")
+async def stream_logs(request: Request, task: str | None = None, lines: int = 500):
+    """Server-Sent Events 实时日志流（snapshot / lines / rotate / reset 事件）。"""
+    session_id = request.session.get("session_id")
+    if not check_login(session_id):
+        return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return StreamingResponse(
+        _log_stream_events(request, task, lines),
+        media_type="text/event-stream",
+        headers={**_NO_STORE_HEADERS, "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/api/logs/tasks")
 async def get_log_tasks_list(request: Request):
     """获取今日有日志文件的任务 ID 列表，以及全部任务列表（用于前端下拉选择）"""
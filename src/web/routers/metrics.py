@@ -0,0 +1,189 @@
+"""Prometheus metrics endpoint."""
+
+import asyncio
+import base64
+import binascii
+import logging
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.core.change_feed import get_change_feed
+from src.core.loop_watchdog import get_loop_watchdog
+from src.core.media_pipeline import get_media_pipeline
+from src.core.metrics import Sample, counter_sample, gauge_sample, get_metrics_registry
+from src.core.paths import WEIBO_IMG_VARIANT_DIR
+from src.core.session_pool import get_session_registry
+from src.jobs.log_manager import get_log_broadcaster
+from src.jobs.manual_runs import get_manual_runs
+from src.jobs.registry import get_module_import_report
+from src.storage.database import get_database_status
+from src.storage.image_variants import get_image_variant_cache
+from src.web.auth import check_login, load_auth, verify_password
+from src.web.status_snapshot import get_monitor_status_cache
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def _database_samples() -> list[Sample]:
+    db_status = await get_database_status()
+    return [
+        gauge_sample(
+            "db_outbox_pending",
+            "Writes journaled in SQLite waiting to be replayed to MySQL.",
+            db_status["pending_changes"],
+        ),
+        gauge_sample(
+            "db_active_backend",
+            "Backend currently serving reads and writes (1 = active).",
+            1,
+            backend=db_status["active_backend"],
+        ),
+    ]
+
+
+def _runtime_samples() -> list[Sample]:
+    samples = []
+    for platform, stats in get_session_registry().stats().items():
+        for key in ("requests", "new_connections", "reused_connections"):
+            samples.append(
+                counter_sample(
+                    f"http_pool_{key}_total",
+                    f"Pooled HTTP session {key.replace('_', ' ')} per platform.",
+                    stats[key],
+                    platform=platform,
+                )
+            )
+
+    pipeline = get_media_pipeline().metrics()
+    for key in ("downloads_waiting", "downloads_active", "blocking_pending"):
+        samples.append(
+            gauge_sample(f"media_{key}", f"Media pipeline {key.replace('_', ' ')}.", pipeline[key])
+        )
+    for stage, stats in pipeline["stages"].items():
+        samples.append(
+            counter_sample(
+                "media_stage_runs_total", "Media pipeline stage runs.", stats["count"], stage=stage
+            )
+        )
+        samples.append(
+            counter_sample(
+                "media_stage_errors_total",
+                "Media pipeline stage failures.",
+                stats["errors"],
+                stage=stage,
+            )
+        )
+        samples.append(
+            counter_sample(
+                "media_stage_seconds_total",
+                "Time spent in a media pipeline stage.",
+                stats["total_seconds"],
+                stage=stage,
+            )
+        )
+
+    status_cache = get_monitor_status_cache().stats()
+    for key in ("hits", "misses"):
+        samples.append(
+            counter_sample(
+                f"status_cache_{key}_total",
+                f"Monitor status snapshot cache {key}.",
+                status_cache[key],
+            )
+        )
+
+    variants = get_image_variant_cache(WEIBO_IMG_VARIANT_DIR).stats()
+    for key in ("hits", "misses", "evictions", "errors"):
+        samples.append(
+            counter_sample(
+                f"image_variant_{key}_total", f"Resized image variant cache {key}.", variants[key]
+            )
+        )
+    samples.append(
+        gauge_sample(
+            "image_variant_cache_bytes", "Resized image variant cache size.", variants["bytes"]
+        )
+    )
+
+    samples.append(
+        gauge_sample(
+            "stream_subscribers",
+            "Connected live stream clients.",
+            get_change_feed().subscriber_count,
+            stream="changes",
+        )
+    )
+    samples.append(
+        gauge_sample(
+            "stream_subscribers",
+            "Connected live stream clients.",
+            get_log_broadcaster().subscriber_count,
+            stream="logs",
+        )
+    )
+    samples.append(
+        counter_sample(
+            "event_loop_stalls_total",
+            "Event loop stalls caught by the watchdog (app.loop_watchdog_enable).",
+            get_loop_watchdog().stall_count,
+        )
+    )
+    samples.append(
+        gauge_sample(
+            "manual_runs_active",
+            "Manually triggered job runs still in progress.",
+            sum(1 for run in get_manual_runs().runs() if run.active),
+        )
+    )
+    for record in get_module_import_report():
+        samples.append(
+            gauge_sample(
+                "job_module_import_seconds",
+                "Import time of a job implementation module (loaded when first enabled or run).",
+                record.seconds,
+                module=record.module,
+            )
+        )
+    return samples
+
+
+_registry = get_metrics_registry()
+_registry.register_collector("database", _database_samples)
+_registry.register_collector("runtime", _runtime_samples)
+
+
+async def _basic_auth_ok(request: Request) -> bool:
+    """Prometheus 的 basic_auth 使用 WebUI 用户名与密码。"""
+    scheme, _, encoded = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "basic" or not encoded:
+        return False
+    try:
+        username, _, password = base64.b64decode(encoded).decode("utf-8").partition(":")
+    except (binascii.Error, UnicodeDecodeError):
+        return False
+    auth_data = await asyncio.to_thread(load_auth)
+    return username == auth_data.get("username") and verify_password(
+        password, auth_data.get("password_hash", "")
+    )
+
+
+@router.get("/metrics")
+async def metrics(request: Request):
+    """
+    Prometheus 文本格式指标（需登录，或使用 WebUI 账号的 HTTP Basic 认证）。
+
+    包括任务耗时/重叠/跳过、按平台与主机的 HTTP 延迟、数据库耗时与写锁等待、
+    各推送通道类型的耗时与失败、离线日志积压与事件循环延迟。
+    """
+    if not check_login(request.session.get("session_id")) and not await _basic_auth_ok(request):
+        return JSONResponse(
+            {"error": "未授权"},
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": 'Basic realm="metrics"'},
+        )
+    body = await get_metrics_registry().render()
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -5,11 +5,14 @@ import logging
 from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
 
+from src.jobs.manual_runs import get_manual_runs
 from src.jobs.registry import (
     MONITOR_JOBS,
+    OVERRUN_SKIP,
     TASK_JOBS,
     discover_and_import,
-    run_task_with_logging,
+    get_job_stats,
+    job_running,
 )
 from src.web.auth import check_login
 
@@ -19,13 +22,18 @@ router = APIRouter()
 
 @router.get("/api/tasks")
 async def get_tasks_api(request: Request):
-    """获取所有注册的任务列表"""
+    """获取所有注册的任务列表（含 overrun 策略、是否尚未加载与跳过/超时等执行统计）"""
     session_id = request.session.get("session_id")
     if not check_login(session_id):
         return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
 
     try:
         discover_and_import()
+        manual_runs = get_manual_runs()
+
+        def active_run_id(job_id: str) -> str | None:
+            run = manual_runs.active_run(job_id)
+            return run.run_id if run is not None else None
 
         tasks = []
         for job in MONITOR_JOBS:
@@ -36,6 +44,10 @@ async def get_tasks_api(request: Request):
                     "type": "monitor",
                     "type_label": "监控任务",
                     "description": job.description,
+                    "active_run_id": active_run_id(job.job_id),
+                    "overrun_policy": job.overrun_policy,
+                    "deferred": job.deferred,
+                    "stats": get_job_stats(job.job_id).as_dict(),
                 }
             )
 
@@ -47,6 +59,10 @@ async def get_tasks_api(request: Request):
                     "type": "task",
                     "type_label": "定时任务",
                     "description": job.description,
+                    "active_run_id": active_run_id(job.job_id),
+                    "overrun_policy": job.overrun_policy,
+                    "deferred": job.deferred,
+                    "stats": get_job_stats(job.job_id).as_dict(),
                 }
             )
 
@@ -58,7 +74,14 @@ async def get_tasks_api(request: Request):
 
 @router.post("/api/tasks/{task_id}/run")
 async def run_task_api(request: Request, task_id: str):
-    """手动触发执行指定任务"""
+    """
+    手动触发执行指定任务：在后台运行并立即返回 run_id（202）
+
+    该任务已有手动运行进行中时返回已有运行（deduplicated=true），不会重复启动；
+    调度中的同一任务仍在执行时按其 overrun 策略处理：skip 返回 409，queue_one 排队到上一轮结束，
+    concurrent 直接并发执行；
+    通过 GET /api/tasks/runs/{run_id} 查询状态、耗时、结果与最近日志。
+    """
     session_id = request.session.get("session_id")
     if not check_login(session_id):
         return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
@@ -76,26 +99,60 @@ async def run_task_api(request: Request, task_id: str):
         if target_job is None:
             return JSONResponse({"error": f"任务 {task_id} 不存在"}, status_code=404)
 
-        logger.info("手动触发任务: %s", task_id)
-        try:
-            run_func = target_job.original_run_func or target_job.run_func
-            await run_task_with_logging(task_id, run_func)
-            logger.info("任务 %s 手动执行完成", task_id)
-            return JSONResponse(
-                {
-                    "success": True,
-                    "message": f"任务 {task_id} 执行成功",
-                }
-            )
-        except Exception as e:
-            logger.error("任务 %s 执行失败: %s", task_id, e, exc_info=True)
+        manual_runs = get_manual_runs()
+        policy = target_job.overrun_policy
+        if (
+            policy == OVERRUN_SKIP
+            and manual_runs.active_run(task_id) is None
+            and job_running(task_id)
+        ):
+            logger.info("任务 %s 正在由调度执行，跳过本次手动触发", task_id)
             return JSONResponse(
-                {
-                    "success": False,
-                    "message": f"任务执行失败: {str(e)}",
-                },
-                status_code=500,
+                {"error": f"任务 {task_id} 正在执行中，请等待本轮结束后再试"},
+                status_code=status.HTTP_409_CONFLICT,
             )
+
+        run_func = target_job.original_run_func or target_job.run_func
+        run, created = manual_runs.submit(task_id, run_func, policy)
+        if created:
+            logger.info("手动触发任务: %s (run_id=%s)", task_id, run.run_id)
+        else:
+            logger.info("任务 %s 已在手动运行中，复用 run_id=%s", task_id, run.run_id)
+        return JSONResponse(
+            {
+                "success": True,
+                "run_id": run.run_id,
+                "deduplicated": not created,
+                "message": (
+                    f"任务 {task_id} 已开始运行" if created else f"任务 {task_id} 正在运行中"
+                ),
+                "run": run.as_dict(),
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+        )
     except Exception as e:
         logger.error("触发任务失败: %s", e)
         return JSONResponse({"error": str(e)}, status_code=500)
+
+
+@router.get("/api/tasks/runs")
+async def list_task_runs(request: Request):
+    """最近的手动运行记录（新的在前）"""
+    session_id = request.session.get("session_id")
+    if not check_login(session_id):
+        return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return JSONResponse({"success": True, "runs": [r.as_dict() for r in get_manual_runs().runs()]})
+
+
+@router.get("/api/tasks/runs/{run_id}")
+async def get_task_run(request: Request, run_id: str):
+    """查询手动运行的状态、耗时、结果与最近日志"""
+    session_id = request.session.get("session_id")
+    if not check_login(session_id):
+        return JSONResponse({"error": "未授权"}, status_code=status.HTTP_401_UNAUTHORIZED)
+
+    run = get_manual_runs().get(run_id)
+    if run is None:
+        return JSONResponse({"error": f"运行记录 {run_id} 不存在"}, status_code=404)
+    return JSONResponse({"success": True, "run": run.as_dict()})
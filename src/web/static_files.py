@@ -1,8 +1,35 @@
 """Static file handlers with HTTP cache headers."""
 
+import asyncio
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from stat import S_ISREG
+from urllib.parse import parse_qs
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.types import Receive, Scope, Send
 
+from src.core.media_pipeline import get_media_pipeline
+from src.core.paths import WEB_UI_STATIC_DIR
+from src.storage.image_variants import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    ImageVariantCache,
+    normalize_variant_format,
+    snap_variant_width,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class CachedStaticFiles(StaticFiles):
     """StaticFiles that adds Cache-Control headers to successful responses."""
@@ -45,3 +72,359 @@ class CachedStaticFiles(StaticFiles):
             await send(message)
 
         await super().__call__(scope, receive, send_wrapper)
+
+
+# 支持按需缩放的原图格式（GIF 可能为动图，原样返回）
+RESIZABLE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+# 媒体线程池排队超过该数量时直接返回原图，避免缩放请求堆积
+IMAGE_VARIANT_MAX_PENDING = 16
+
+
+class ResizingStaticFiles(CachedStaticFiles):
+    """
+    带缓存头的图片目录，支持 ``?w=<宽度>&fmt=webp|jpeg`` 按需返回缩放变体
+
+    变体在媒体线程池中生成并写入磁盘缓存（见 src.storage.image_variants）；相同变体的并发请求
+    只生成一次。线程池繁忙或缩放失败时退回原图。
+    """
+
+    def __init__(self, *args, variant_cache: ImageVariantCache, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.variant_cache = variant_cache
+        self._inflight: dict[tuple[str, int, str], asyncio.Future] = {}
+
+    @staticmethod
+    def _variant_params(scope: Scope) -> tuple[int, str] | None:
+        params = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if "w" not in params and "fmt" not in params:
+            return None
+        try:
+            width = int(params.get("w", ["0"])[0] or 0)
+        except ValueError:
+            return None
+        fmt = normalize_variant_format(params.get("fmt", [None])[0])
+        if fmt is None or width < 0:
+            return None
+        return snap_variant_width(width) if width else IMAGE_VARIANT_WIDTHS[-1], fmt
+
+    async def _variant(self, source: Path, rel: str, width: int, fmt: str) -> Path | None:
+        pipeline = get_media_pipeline()
+        key = (rel, width, fmt)
+        future = self._inflight.get(key)
+        if future is None:
+            if pipeline.metrics()["blocking_pending"] >= IMAGE_VARIANT_MAX_PENDING:
+                return None
+            future = asyncio.ensure_future(
+                pipeline.run_blocking(
+                    "resize", self.variant_cache.get_or_create, source, rel, width, fmt
+                )
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        try:
+            return await asyncio.shield(future)
+        except Exception as e:
+            logger.debug("生成图片变体失败（返回原图）%s: %s", rel, e)
+            return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        variant = self._variant_params(scope) if scope["type"] == "http" else None
+        if variant is None or scope.get("method") not in ("GET", "HEAD"):
+            await super().__call__(scope, receive, send)
+            return
+        rel = self.get_path(scope)
+        if Path(rel).suffix.lower() not in RESIZABLE_SUFFIXES:
+            await super().__call__(scope, receive, send)
+            return
+        full_path, stat_result = await asyncio.to_thread(self.lookup_path, rel)
+        if stat_result is None or not S_ISREG(stat_result.st_mode):
+            await super().__call__(scope, receive, send)
+            return
+
+        width, fmt = variant
+        target = await self._variant(Path(full_path), Path(rel).as_posix(), width, fmt)
+        if target is None:
+            await super().__call__(scope, receive, send)
+            return
+        response = FileResponse(
+            target,
+            media_type=IMAGE_VARIANT_FORMATS[fmt][2],
+            headers={"Cache-Control": self._cache_control_for_path(scope.get("path", ""))},
+        )
+        await response(scope, receive, send)
+
+
+# 可压缩的文本类资源；图片等已压缩格式原样返回
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".js", ".svg", ".html", ".json", ".txt", ".map"})
+ASSET_HASH_LENGTH = 10
+_HASHED_NAME_RE = re.compile(
+    rf"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{{{ASSET_HASH_LENGTH}}})(?P<ext>\.[^./]+)$"
+)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 未带指纹的路径（JS 内硬编码、CSS 相对引用、旧页面）每次协商缓存
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+# 同一资源两次检查文件变化（stat）的最短间隔（秒）；间隔内直接使用清单中的指纹
+STATIC_REVALIDATE_SECONDS = 2.0
+
+
+@dataclass
+class StaticAsset:
+    """单个静态资源：内容指纹与按需生成的压缩变体（编码 -> 字节）。"""
+
+    path: Path
+    digest: str
+    mtime_ns: int
+    size: int
+    media_type: str
+    variants: dict[str, bytes] = field(default_factory=dict)
+    # 最近一次确认文件未变化的时间（time.monotonic()）
+    checked_at: float = field(default_factory=time.monotonic)
+
+    def fingerprinted(self, rel: str) -> str:
+        stem, dot, ext = rel.rpartition(".")
+        if not dot or "/" in ext:
+            return rel
+        return f"{stem}.{self.digest}.{ext}"
+
+
+class StaticAssetManifest:
+    """
+    WebUI 静态资源清单：按内容哈希生成带指纹的文件名，并缓存 gzip 压缩结果
+
+    模板通过 ``static_url()`` 引用带指纹的路径，可安全地长期缓存；文件修改后
+    （开发时）按 mtime/size 检测并重新计算指纹，同一资源每 revalidate_seconds 秒最多检查一次。
+    渲染模板时只查清单，检查文件在后台线程中进行，下一次渲染使用新指纹。
+    """
+
+    def __init__(self, root: Path, revalidate_seconds: float = STATIC_REVALIDATE_SECONDS):
+        self.root = root.resolve()
+        self.revalidate_seconds = revalidate_seconds
+        self._assets: dict[str, StaticAsset] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def scan(self) -> int:
+        """计算全部资源的指纹，返回资源数（启动时在线程中执行，见 src.web.app）。"""
+        count = 0
+        for path in sorted(self.root.rglob("*")):
+            if path.is_file() and not path.name.startswith("."):
+                if self.get(path.relative_to(self.root).as_posix()) is not None:
+                    count += 1
+        return count
+
+    def precompress(self) -> None:
+        """预先生成所有可压缩资源的 gzip 变体（在后台线程中执行）。"""
+        with self._lock:
+            assets = list(self._assets.values())
+        for asset in assets:
+            if asset.path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+                continue
+            try:
+                self.encode(asset, "gzip")
+            except OSError as e:
+                logger.debug("预压缩静态资源失败 %s: %s", asset.path.name, e)
+
+    def _fresh(self, rel: str) -> StaticAsset | None:
+        """清单中仍在重新检查间隔内的资源；不访问文件系统。"""
+        with self._lock:
+            asset = self._assets.get(rel)
+        if asset is not None and time.monotonic() - asset.checked_at < self.revalidate_seconds:
+            return asset
+        return None
+
+    def get(self, rel: str) -> StaticAsset | None:
+        """按相对路径获取资源（文件变化时刷新），不存在或越界时返回 None。"""
+        asset = self._fresh(rel)
+        if asset is not None:
+            return asset
+        path = (self.root / rel).resolve()
+        if not path.is_relative_to(self.root):
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not S_ISREG(stat.st_mode):
+            return None
+        with self._lock:
+            asset = self._assets.get(rel)
+            if asset is not None and (asset.mtime_ns, asset.size) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                asset.checked_at = time.monotonic()
+                return asset
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:ASSET_HASH_LENGTH]
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        asset = StaticAsset(path, digest, stat.st_mtime_ns, stat.st_size, media_type)
+        with self._lock:
+            self._assets[rel] = asset
+        return asset
+
+    def resolve_cached(self, rel: str) -> tuple[StaticAsset, bool] | None:
+        """
+        只查清单的 resolve：资源在重新检查间隔内时返回结果，否则返回 None，
+        由调用方在线程中执行 resolve（stat 与重新计算指纹会阻塞事件循环）。
+        """
+        asset = self._fresh(rel)
+        if asset is not None:
+            return asset, False
+        match = _HASHED_NAME_RE.match(rel)
+        if match is None:
+            return None
+        asset = self._fresh(match["stem"] + match["ext"])
+        if asset is None:
+            return None
+        return asset, asset.digest == match["hash"]
+
+    def resolve(self, rel: str) -> tuple[StaticAsset, bool] | None:
+        """把请求路径解析为资源；第二项表示是否为与当前内容一致的指纹路径。"""
+        asset = self.get(rel)
+        if asset is not None:
+            return asset, False
+        match = _HASHED_NAME_RE.match(rel)
+        if match is None:
+            return None
+        asset = self.get(match["stem"] + match["ext"])
+        if asset is None:
+            return None
+        # 旧指纹（页面缓存早于升级）仍返回当前内容，但不允许长期缓存
+        return asset, asset.digest == match["hash"]
+
+    def _refresh(self, rel: str) -> None:
+        try:
+            self.get(rel)
+        finally:
+            with self._lock:
+                self._refreshing.discard(rel)
+
+    def url(self, rel: str) -> str:
+        """
+        带指纹的 /static 路径。事件循环中只查清单：资源超过重新检查间隔时在线程中检查文件，
+        本次仍返回清单中的指纹；不在事件循环中（脚本、测试）时直接检查。
+        """
+        with self._lock:
+            asset = self._assets.get(rel)
+            stale = (
+                asset is None or time.monotonic() - asset.checked_at >= self.revalidate_seconds
+            ) and rel not in self._refreshing
+        if stale:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asset = self.get(rel)
+            else:
+                with self._lock:
+                    self._refreshing.add(rel)
+                loop.run_in_executor(None, self._refresh, rel)
+        if asset is None:
+            logger.warning("静态资源不存在: %s", rel)
+            return f"/static/{rel}"
+        return f"/static/{asset.fingerprinted(rel)}"
+
+    @staticmethod
+    def encode(asset: StaticAsset, encoding: str) -> bytes | None:
+        """返回资源的压缩变体（首次调用时生成并缓存）；压缩无收益时返回 None。"""
+        if encoding in asset.variants:
+            return asset.variants[encoding] or None
+        raw = asset.path.read_bytes()
+        if encoding != "gzip":
+            return None
+        data = gzip.compress(raw, compresslevel=9, mtime=0)
+        if len(data) >= len(raw):
+            data = b""
+        asset.variants[encoding] = data
+        return data or None
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """解析 Accept-Encoding，忽略 q=0 的编码。"""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        _, _, q = params.strip().partition("q=")
+        try:
+            if q and float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        if name:
+            accepted.add(name)
+    return accepted
+
+
+class FingerprintedStaticFiles:
+    """
+    /static 处理器：指纹路径返回 immutable 长缓存，其余路径协商缓存；
+    按 Accept-Encoding 返回预压缩的 gzip 变体。
+    """
+
+    def __init__(self, manifest: StaticAssetManifest):
+        self.manifest = manifest
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            raise RuntimeError("FingerprintedStaticFiles 只处理 HTTP 请求")
+        request = Request(scope, receive)
+        if request.method not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", status_code=405)
+            await response(scope, receive, send)
+            return
+
+        rel = scope["path"].removeprefix(scope.get("root_path", "")).lstrip("/")
+        resolved = None
+        if rel:
+            resolved = self.manifest.resolve_cached(rel) or await asyncio.to_thread(
+                self.manifest.resolve, rel
+            )
+        if resolved is None:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+        asset, immutable = resolved
+
+        encoding = None
+        body = None
+        if asset.path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            if "gzip" in _accepted_encodings(request.headers.get("accept-encoding", "")):
+                body = asset.variants.get("gzip")
+                if body is None:
+                    body = await asyncio.to_thread(self.manifest.encode, asset, "gzip")
+                if body:
+                    encoding = "gzip"
+        if not encoding:
+            body = await asyncio.to_thread(asset.path.read_bytes)
+
+        etag = f'"{asset.digest}-{encoding}"' if encoding else f'"{asset.digest}"'
+        headers = {
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        if etag in request.headers.get("if-none-match", ""):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            body = b""
+        response = Response(body, media_type=asset.media_type, headers=headers)
+        await response(scope, receive, send)
+
+
+_static_manifest: StaticAssetManifest | None = None
+
+
+def get_static_manifest() -> StaticAssetManifest:
+    """获取 WebUI 静态资源清单（进程级单例）。"""
+    global _static_manifest
+    if _static_manifest is None:
+        _static_manifest = StaticAssetManifest(WEB_UI_STATIC_DIR)
+    return _static_manifest
+
+
+def static_url(rel: str) -> str:
+    """模板中引用静态资源：返回带内容指纹的 /static 路径。"""
+    return get_static_manifest().url(rel)
@@ -0,0 +1,196 @@
+"""公开监控状态接口的进程内快照缓存。
+
+快照按表版本号（见 ``src.storage.table_versions``）失效：监控写库成功后版本递增，
+下一次请求才重新查询并转换；版本未变时直接复用已序列化的响应体，轮询几乎零成本。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.storage.database import AsyncDatabase
+from src.storage.table_versions import TableVersions, get_table_versions
+from src.web.data_support import (
+    _PLATFORM_LIST_SQL,
+    _PLATFORM_SELECT,
+    PLATFORM_CONFIG,
+    _row_to_item,
+)
+
+logger = logging.getLogger(__name__)
+
+# 单条状态缓存的条目上限（接口无需登录，避免任意 ID 撑大内存）
+STATUS_ITEM_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """某一范围（全部/单平台/单条）在某个版本下的响应。"""
+
+    version: int
+    body: bytes
+    etag: str
+    status_code: int = 200
+
+
+class MonitorStatusCache:
+    """全部、单平台与单条监控状态的快照；同一范围并发未命中时只查询一次。"""
+
+    def __init__(self, versions: TableVersions | None = None):
+        self.versions = versions or get_table_versions()
+        self._platforms: dict[str, tuple[int, list[dict]]] = {}
+        self._all: StatusSnapshot | None = None
+        self._platform_snapshots: dict[str, StatusSnapshot] = {}
+        self._items: OrderedDict[tuple[str, str], StatusSnapshot] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._locks_loop: asyncio.AbstractEventLoop | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def etag(self, scope: str, version: int) -> str:
+        return f'"{self.versions.epoch}-{scope}-{version}"'
+
+    def scope_version(self, platform: str | None = None) -> int:
+        if platform is None:
+            return self.versions.version
+        return self.versions.table_version(PLATFORM_CONFIG[platform][0])
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._locks_loop is not loop:
+            self._locks = {}
+            self._locks_loop = loop
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    async def _platform_items(self, db: AsyncDatabase, platform: str) -> list[dict]:
+        version = self.scope_version(platform)
+        cached = self._platforms.get(platform)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = await db.execute_query(_PLATFORM_LIST_SQL[platform])
+        items = [_row_to_item(platform, row) for row in rows]
+        # 记录查询前读取的版本号：查询期间若有写入，下次请求会再次刷新
+        self._platforms[platform] = (version, items)
+        return items
+
+    async def all_status(self) -> StatusSnapshot:
+        version = self.scope_version()
+        snapshot = self._all
+        if snapshot is not None and snapshot.version == version:
+            self.hits += 1
+            return snapshot
+        async with self._lock("all"):
+            version = self.scope_version()
+            snapshot = self._all
+            if snapshot is not None and snapshot.version == version:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            all_data: dict[str, list[dict]] = {}
+            async with AsyncDatabase() as db:
+                for platform in _PLATFORM_LIST_SQL:
+                    try:
+                        all_data[platform] = await self._platform_items(db, platform)
+                    except Exception as e:
+                        logger.error("获取平台 %s 监控状态失败: %s", platform, e, exc_info=True)
+                        all_data[platform] = []
+            payload = {
+                "success": True,
+                "data": all_data,
+                "epoch": self.versions.epoch,
+                "version": version,
+                "timestamp": datetime.now().isoformat(),
+            }
+            snapshot = StatusSnapshot(version, self._encode(payload), self.etag("all", version))
+            self._all = snapshot
+            return snapshot
+
+    async def platform_status(self, platform: str) -> StatusSnapshot:
+        version = self.scope_version(platform)
+        snapshot = self._platform_snapshots.get(platform)
+        if snapshot is not None and snapshot.version == version:
+            self.hits += 1
+            return snapshot
+        async with self._lock(platform):
+            version = self.scope_version(platform)
+            snapshot = self._platform_snapshots.get(platform)
+            if snapshot is not None and snapshot.version == version:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            async with AsyncDatabase() as db:
+                items = await self._platform_items(db, platform)
+            payload = {
+                "success": True,
+                "data": items,
+                "epoch": self.versions.epoch,
+                "version": version,
+                "timestamp": datetime.now().isoformat(),
+            }
+            snapshot = StatusSnapshot(version, self._encode(payload), self.etag(platform, version))
+            self._platform_snapshots[platform] = snapshot
+            return snapshot
+
+    async def item_status(self, platform: str, item_id: str) -> StatusSnapshot:
+        key = (platform, item_id)
+        version = self.scope_version(platform)
+        snapshot = self._items.get(key)
+        if snapshot is not None and snapshot.version == version:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return snapshot
+        self.misses += 1
+        async with AsyncDatabase() as db:
+            _, sql = _PLATFORM_SELECT[platform]
+            rows = await db.execute_query(sql, {"pk": item_id})
+        if rows:
+            payload = {
+                "success": True,
+                "data": _row_to_item(platform, rows[0]),
+                "epoch": self.versions.epoch,
+                "version": version,
+                "timestamp": datetime.now().isoformat(),
+            }
+            status_code = 200
+        else:
+            payload = {"error": "未找到该资源"}
+            status_code = 404
+        snapshot = StatusSnapshot(
+            version,
+            self._encode(payload),
+            self.etag(f"{platform}:{item_id}", version),
+            status_code,
+        )
+        self._items[key] = snapshot
+        self._items.move_to_end(key)
+        while len(self._items) > STATUS_ITEM_CACHE_SIZE:
+            self._items.popitem(last=False)
+        return snapshot
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self.versions.version,
+            "cached_items": len(self._items),
+        }
+
+
+_status_cache: MonitorStatusCache | None = None
+
+
+def get_monitor_status_cache() -> MonitorStatusCache:
+    """获取进程级监控状态快照缓存。"""
+    global _status_cache
+    if _status_cache is None:
+        _status_cache = MonitorStatusCache()
+    return _status_cache
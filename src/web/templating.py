@@ -3,8 +3,7 @@
 from fastapi.templating import Jinja2Templates
 
 from src.core.paths import WEB_UI_TEMPLATES_DIR
-
-STATIC_ASSET_VERSION = "1"
+from src.web.static_files import static_url
 
 templates = Jinja2Templates(directory=str(WEB_UI_TEMPLATES_DIR))
-templates.env.globals["static_version"] = STATIC_ASSET_VERSION
+templates.env.globals["static_url"] = static_url
@@ -487,7 +487,8 @@ document.addEventListener('DOMContentLoaded', async function() {
         'app', 'mysql', 'quiet_hours', 'push_channel', 'plugins'
     ];
     const FALLBACK_SWITCH_IDS = [
-        'quiet_hours_enable', 'mysql_enabled', 'rainyun_auto_renew', 'weibo_enable',
+        'quiet_hours_enable', 'mysql_enabled', 'rainyun_auto_renew', 'app_loop_watchdog_enable',
+        'app_adaptive_polling_enable', 'weibo_enable',
         'weibo_cookie_refresh_enable',
         'weibo_chaohua_enable', 'huya_enable', 'bilibili_enable',
         'douyin_enable', 'douyu_enable', 'xhs_enable', 'checkin_enable',
@@ -532,14 +533,18 @@ document.addEventListener('DOMContentLoaded', async function() {
     }
 
     function getSwitchIdsFromMetadata() {
-        const switchIds = new Set(['quiet_hours_enable', 'mysql_enabled', 'rainyun_auto_renew']);
+        const baseSwitchIds = [
+            'quiet_hours_enable', 'mysql_enabled', 'rainyun_auto_renew', 'app_loop_watchdog_enable',
+            'app_adaptive_polling_enable'
+        ];
+        const switchIds = new Set(baseSwitchIds);
         getTaskMetadata().forEach(task => {
             if (task.enable_field) {
                 switchIds.add(task.enable_field);
             }
         });
 
-        return switchIds.size > 2 ? Array.from(switchIds) : FALLBACK_SWITCH_IDS;
+        return switchIds.size > baseSwitchIds.length ? Array.from(switchIds) : FALLBACK_SWITCH_IDS;
     }
 
     function bindSwitchLabel(inputId) {
@@ -1407,6 +1412,32 @@ document.addEventListener('DOMContentLoaded', async function() {
                 if (input) {
                     input.value = appSection.base_url != null ? String(appSection.base_url).trim() : '';
                 }
+                const watchdogEnable = document.getElementById('app_loop_watchdog_enable');
+                if (watchdogEnable) {
+                    watchdogEnable.checked = appSection.loop_watchdog_enable === true
+                        || appSection.loop_watchdog_enable === 'true';
+                    const label = document.getElementById('app_loop_watchdog_enable_label');
+                    if (label) label.textContent = watchdogEnable.checked ? '开启' : '关闭';
+                }
+                const watchdogThreshold = document.getElementById('app_loop_watchdog_threshold_ms');
+                if (watchdogThreshold) {
+                    watchdogThreshold.value = appSection.loop_watchdog_threshold_ms ?? 200;
+                }
+                const adaptiveEnable = document.getElementById('app_adaptive_polling_enable');
+                if (adaptiveEnable) {
+                    adaptiveEnable.checked = appSection.adaptive_polling_enable === true
+                        || appSection.adaptive_polling_enable === 'true';
+                    const label = document.getElementById('app_adaptive_polling_enable_label');
+                    if (label) label.textContent = adaptiveEnable.checked ? '开启' : '关闭';
+                }
+                const adaptiveMax = document.getElementById('app_adaptive_polling_max_interval_seconds');
+                if (adaptiveMax) {
+                    adaptiveMax.value = appSection.adaptive_polling_max_interval_seconds ?? 1800;
+                }
+                const adaptiveRate = document.getElementById('app_adaptive_polling_requests_per_second');
+                if (adaptiveRate) {
+                    adaptiveRate.value = appSection.adaptive_polling_requests_per_second ?? 5;
+                }
                 break;
             }
             case 'mysql': {
@@ -2066,6 +2097,17 @@ document.addEventListener('DOMContentLoaded', async function() {
                 const baseUrlInput = document.getElementById('app_base_url');
                 config.app = {
                     base_url: (baseUrlInput?.value || '').trim(),
+                    loop_watchdog_enable: document.getElementById('app_loop_watchdog_enable')?.checked || false,
+                    loop_watchdog_threshold_ms: parseInt(
+                        document.getElementById('app_loop_watchdog_threshold_ms')?.value || '200', 10
+                    ),
+                    adaptive_polling_enable: document.getElementById('app_adaptive_polling_enable')?.checked || false,
+                    adaptive_polling_max_interval_seconds: parseInt(
+                        document.getElementById('app_adaptive_polling_max_interval_seconds')?.value || '1800', 10
+                    ),
+                    adaptive_polling_requests_per_second: parseFloat(
+                        document.getElementById('app_adaptive_polling_requests_per_second')?.value || '5'
+                    ),
                 };
                 break;
             }
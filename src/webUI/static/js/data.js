@@ -21,6 +21,17 @@ const LIGHTBOX_ZOOM_STEP = 0.25;
 const LIGHTBOX_SWIPE_MIN_DISTANCE = 48;
 const LIGHTBOX_SWIPE_MAX_DURATION_MS = 900;
 const LIGHTBOX_SWIPE_VERTICAL_TOLERANCE = 0.75;
+// 各数据表主键字段（与后端 PLATFORM_PRIMARY_KEY 一致），用于把变更事件对应到卡片
+const TABLE_KEY_FIELDS = {
+    weibo: 'UID',
+    huya: 'room',
+    bilibili_live: 'uid',
+    bilibili_dynamic: 'uid',
+    douyin: 'douyin_id',
+    douyu: 'room',
+    xhs: 'profile_id',
+};
+const CHANGE_EVENT_TYPES = ['live_start', 'live_end', 'new_post', 'target_added', 'target_updated'];
 
 function getPageSize() {
     return currentTable === 'weibo' ? WEIBO_PAGE_SIZE : DEFAULT_PAGE_SIZE;
@@ -65,6 +76,8 @@ document.addEventListener('DOMContentLoaded', function () {
     let activeLazyImageLoads = 0;
     let pendingLazyObserverEntries = [];
     let lazyObserverRaf = 0;
+    let currentRows = [];
+    let changeSource = null;
 
     // 切换标签页
     tabButtons.forEach((btn) => {
@@ -78,6 +91,7 @@ document.addEventListener('DOMContentLoaded', function () {
             currentTable = this.dataset.table;
             currentPage = 1;
             loadTableData();
+            openChangeStream();
         });
     });
 
@@ -106,6 +120,7 @@ document.addEventListener('DOMContentLoaded', function () {
             if (currentTable !== 'weibo') {
                 rows = applySavedOrder(rows);
             }
+            currentRows = rows;
             renderCards(rows);
             renderPagination(data.total_pages, data.total);
 
@@ -1383,6 +1398,14 @@ document.addEventListener('DOMContentLoaded', function () {
             return;
         }
 
+        dataTableContainer.innerHTML = buildCardsHtml(rows);
+        enhanceDataCardLinks();
+        initLazyImages();
+        initSortable();
+    }
+
+    // 生成卡片网格 HTML（外层 grid + 每行一张卡片）
+    function buildCardsHtml(rows) {
         let html = '';
 
         if (currentTable === 'weibo') {
@@ -1391,7 +1414,7 @@ document.addEventListener('DOMContentLoaded', function () {
                 const cardId = escapeAttr(getCardId(row, idx));
                 const safeName = sanitizeUsername(row.用户名);
                 const encodedDir = encodeURIComponent(safeName);
-                const avatarUrl = `/weibo_img/${encodedDir}/profile_image.jpg`;
+                const avatarUrl = `/weibo_img/${encodedDir}/profile_image.jpg?w=96&fmt=webp`;
                 const url =
                     row.url ||
                     (row.mid
@@ -1663,10 +1686,7 @@ document.addEventListener('DOMContentLoaded', function () {
             html += '</div>';
         }
 
-        dataTableContainer.innerHTML = html;
-        enhanceDataCardLinks();
-        initLazyImages();
-        initSortable();
+        return html;
     }
 
     // 属性转义（用于 data-href 等）
@@ -1721,6 +1741,87 @@ document.addEventListener('DOMContentLoaded', function () {
         loadTableData();
     }
 
+    // 实时变更：订阅当前数据表的状态变更事件，只替换/插入受影响的卡片
+    function openChangeStream() {
+        if (typeof EventSource === 'undefined') return;
+        if (changeSource) changeSource.close();
+        const table = currentTable;
+        changeSource = new EventSource(`/api/changes/stream?platforms=${encodeURIComponent(table)}`);
+        CHANGE_EVENT_TYPES.forEach((type) => {
+            changeSource.addEventListener(type, (event) => {
+                if (table !== currentTable) return;
+                try {
+                    applyChange(JSON.parse(event.data));
+                } catch (e) {
+                    console.warn('变更事件解析失败:', e);
+                }
+            });
+        });
+        // 服务重启或缓冲区溢出：无法补发，整体重新加载当前页
+        changeSource.addEventListener('resync', () => {
+            if (table === currentTable) loadTableData();
+        });
+    }
+
+    async function applyChange(change) {
+        const keyField = TABLE_KEY_FIELDS[currentTable];
+        if (!keyField || change.platform !== currentTable || !change.key) return;
+        const index = currentRows.findIndex((row) => String(row[keyField]) === change.key);
+        // 不在当前页的条目只在第一页插入（新录入或微博新动态）
+        if (index < 0 && currentPage !== 1) return;
+
+        const response = await fetch(
+            `/api/data/${encodeURIComponent(currentTable)}/${encodeURIComponent(change.key)}`,
+        );
+        if (!response.ok) return;
+        const payload = await response.json();
+        const row = payload.data;
+        if (!row || change.platform !== currentTable) return;
+
+        const template = document.createElement('template');
+        template.innerHTML = buildCardsHtml([row]).trim();
+        const newCard = template.content.querySelector('.data-card');
+        const grid = dataTableContainer.querySelector('.data-card-grid');
+        if (!newCard) return;
+        if (!grid) {
+            currentRows = [row];
+            renderCards(currentRows);
+            return;
+        }
+
+        // 卡片可能已被拖拽重排，按 data-id 定位而非位置
+        const oldId = index >= 0 ? getCardId(currentRows[index], index) : null;
+        const oldCard =
+            oldId === null
+                ? null
+                : Array.from(grid.querySelectorAll('.data-card[data-id]')).find(
+                      (card) => card.getAttribute('data-id') === oldId,
+                  );
+        // 微博按发布时间倒序：新动态移到最前
+        const moveToTop = currentTable === 'weibo' && change.type === 'new_post' && currentPage === 1;
+        if (oldCard && !moveToTop) {
+            currentRows[index] = row;
+            oldCard.replaceWith(newCard);
+        } else {
+            if (oldCard) {
+                currentRows.splice(index, 1);
+                oldCard.remove();
+            }
+            if (currentTable === 'weibo') {
+                currentRows.unshift(row);
+                grid.prepend(newCard);
+            } else {
+                currentRows.push(row);
+                grid.append(newCard);
+            }
+        }
+        enhanceDataCardLinks();
+        initLazyImages();
+        initSortable();
+        if (currentTable === 'huya') loadHuyaImages([row]);
+    }
+
     // 初始加载
     loadTableData();
+    openChangeStream();
 });
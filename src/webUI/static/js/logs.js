@@ -17,6 +17,11 @@ let consecutiveFailures = 0; // 连续失败次数
 let lastSuccessTime = Date.now(); // 上次成功请求的时间
 let cachedLogs = null; // 缓存上一次成功加载的日志内容
 let cachedLogsTime = null; // 缓存日志的时间戳
+const MAX_LOG_LINES = 500; // 页面上最多保留的日志行数
+let logCursor = null; // 增量读取游标（字节偏移），null 表示需要重新拉取尾部
+let logFile = null; // 游标所属的日志文件名，跨天轮转后文件名变化
+let logStream = null; // 实时日志流（EventSource）
+let streamActive = false; // 实时流连接正常时暂停轮询
 
 document.addEventListener('DOMContentLoaded', function() {
     const logsContainer = document.getElementById('logsContainer');
@@ -52,7 +57,12 @@ document.addEventListener('DOMContentLoaded', function() {
         logSourceSelect.addEventListener('change', function() {
             currentLogTask = this.value || '';
             cachedLogs = null; // 切换任务时清除缓存，避免显示错误日志
-            loadLogs(true, true);
+            logCursor = null;
+            logFile = null;
+            openLogStream();
+            if (!streamActive) {
+                loadLogs(true, true);
+            }
         });
     }
 
@@ -68,11 +78,8 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         }, timeout);
 
-        // 添加请求时间戳，避免缓存问题（特别是手机端）
-        const separator = url.includes('?') ? '&' : '?';
-        const urlWithTimestamp = url + separator + '_t=' + Date.now() + '&_r=' + Math.random();
-
-        const fetchPromise = fetch(urlWithTimestamp, {
+        // 服务端返回 Cache-Control: no-store，增量请求的游标也保证 URL 不重复
+        const fetchPromise = fetch(url, {
             ...options,
             signal: signal,
             // 添加更多请求头，提高兼容性
@@ -137,9 +144,14 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         }
 
-        const logsUrl = currentLogTask
-            ? '/api/logs?lines=500&task=' + encodeURIComponent(currentLogTask)
-            : '/api/logs?lines=500';
+        let logsUrl = '/api/logs?lines=' + MAX_LOG_LINES;
+        if (currentLogTask) {
+            logsUrl += '&task=' + encodeURIComponent(currentLogTask);
+        }
+        const incremental = !forceRefresh && logCursor !== null && logFile !== null;
+        if (incremental) {
+            logsUrl += '&cursor=' + logCursor + '&file=' + encodeURIComponent(logFile);
+        }
         try {
             const { promise: fetchPromise } = fetchWithTimeout(logsUrl, {
                 method: 'GET',
@@ -178,16 +190,17 @@ document.addEventListener('DOMContentLoaded', function() {
                 return;
             }
 
-            if (data.logs && data.logs.length > 0) {
-                // 保存到缓存
-                cachedLogs = data.logs;
-                cachedLogsTime = Date.now();
-                renderLogs(data.logs);
+            logCursor = typeof data.cursor === 'number' ? data.cursor : null;
+            logFile = data.file || null;
+            const newLines = data.logs || [];
+            if (incremental && !data.reset) {
+                // 只有新增行时才重绘
+                if (newLines.length === 0 && cachedLogs) {
+                    return;
+                }
+                showLogs((cachedLogs || []).concat(newLines));
             } else {
-                // 空日志也保存到缓存
-                cachedLogs = [];
-                cachedLogsTime = Date.now();
-                logsContainer.innerHTML = '<div class="logs-empty">今日暂无日志</div>';
+                showLogs(newLines);
             }
         } catch (error) {
             // 如果请求被取消或已被新请求替代，不处理错误（静默失败）
@@ -274,6 +287,61 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // 更新缓存并渲染（超过上限时只保留最新的行）
+    function showLogs(lines) {
+        cachedLogs = lines.length > MAX_LOG_LINES ? lines.slice(-MAX_LOG_LINES) : lines;
+        cachedLogsTime = Date.now();
+        if (cachedLogs.length > 0) {
+            renderLogs(cachedLogs);
+        } else {
+            logsContainer.innerHTML = '<div class="logs-empty">今日暂无日志</div>';
+        }
+    }
+
+    // 实时日志流：连接正常时由服务端推送新增行，断开期间回退到增量轮询
+    function openLogStream() {
+        if (logStream) {
+            logStream.close();
+            logStream = null;
+        }
+        streamActive = false;
+        if (!window.EventSource) return;
+
+        let streamUrl = '/api/logs/stream?lines=' + MAX_LOG_LINES;
+        if (currentLogTask) {
+            streamUrl += '&task=' + encodeURIComponent(currentLogTask);
+        }
+        const stream = new EventSource(streamUrl);
+        logStream = stream;
+
+        stream.addEventListener('snapshot', function(e) {
+            const data = JSON.parse(e.data);
+            streamActive = true;
+            consecutiveFailures = 0;
+            // 快照不带游标，流断开后的首次轮询重新拉取尾部
+            logCursor = null;
+            logFile = data.file || null;
+            showLogs(data.logs || []);
+        });
+        stream.addEventListener('lines', function(e) {
+            const data = JSON.parse(e.data);
+            showLogs((cachedLogs || []).concat(data.logs || []));
+        });
+        stream.addEventListener('rotate', function(e) {
+            const data = JSON.parse(e.data);
+            logFile = data.file || null;
+            showLogs([]);
+        });
+        stream.addEventListener('reset', function() {
+            // 推送积压被丢弃，重新建立连接以获取完整快照
+            openLogStream();
+        });
+        stream.onerror = function() {
+            // EventSource 会自动重连，重连成功后会重新收到快照
+            streamActive = false;
+        };
+    }
+
     // 渲染日志
     function renderLogs(logs, isCached = false) {
         let html = '';
@@ -375,8 +443,8 @@ document.addEventListener('DOMContentLoaded', function() {
         
         // 设置新的定时器
         refreshInterval = setTimeout(function() {
-            // 如果请求不在进行中，执行刷新
-            if (!isRequestInProgress) {
+            // 实时流正常或请求进行中时跳过轮询
+            if (!streamActive && !isRequestInProgress) {
                 loadLogs(false, false);
             }
             // 递归调用，继续下一次刷新
@@ -387,9 +455,12 @@ document.addEventListener('DOMContentLoaded', function() {
     // 启动智能刷新
     scheduleNextRefresh();
 
-    // 初始加载：先加载任务列表，再加载日志
+    // 初始加载：先加载任务列表，再建立实时流；不支持 EventSource 时直接轮询
     loadLogTasks();
-    loadLogs();
+    openLogStream();
+    if (!logStream) {
+        loadLogs();
+    }
 
     // 页面可见性变化时重新加载（移动端切换应用后回来时）
     document.addEventListener('visibilitychange', function() {
@@ -397,8 +468,8 @@ document.addEventListener('DOMContentLoaded', function() {
             // 页面变为可见时，重置失败计数并立即刷新
             consecutiveFailures = 0;
             retryCount = 0;
-            // 如果请求不在进行，立即刷新一次日志
-            if (!isRequestInProgress) {
+            // 实时流断开且请求不在进行时，立即刷新一次日志
+            if (!streamActive && !isRequestInProgress) {
                 loadLogs(true, false);
             }
         }
@@ -410,6 +481,10 @@ document.addEventListener('DOMContentLoaded', function() {
             clearTimeout(refreshInterval);
             refreshInterval = null;
         }
+        if (logStream) {
+            logStream.close();
+            logStream = null;
+        }
         // 取消正在进行的请求
         if (currentRequestController) {
             currentRequestController.abort();
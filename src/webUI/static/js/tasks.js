@@ -5,8 +5,9 @@ let currentFilter = 'all';
 let currentSearch = '';
 let allTasks = [];
 
-// 任务运行状态
-const runningTasks = new Set();
+// 任务运行状态：job_id -> run_id（手动运行在后台执行，轮询运行状态）
+const runningTasks = new Map();
+const RUN_POLL_INTERVAL_MS = 1500;
 
 // 加载任务列表
 async function loadTasks(triggerButton = null) {
@@ -23,6 +24,13 @@ async function loadTasks(triggerButton = null) {
         }
 
         allTasks = data.tasks || [];
+        // 页面刷新前已触发、仍在后台运行的任务继续跟踪
+        allTasks.forEach(task => {
+            if (task.active_run_id && !runningTasks.has(task.job_id)) {
+                runningTasks.set(task.job_id, task.active_run_id);
+                pollTaskRun(task.job_id, task.active_run_id);
+            }
+        });
         renderTasks(allTasks);
     } catch (error) {
         console.error('加载任务失败:', error);
@@ -90,6 +98,7 @@ function renderTasks(tasks) {
                     <div class="task-id">${taskId}</div>
                     <div class="task-meta">
                         <span class="task-trigger">触发方式: ${task.trigger === 'interval' ? '间隔执行' : 'Cron定时'}</span>
+                        ${renderTaskRunStats(task.stats)}
                     </div>
                 </div>
                 <div class="task-actions">
@@ -125,6 +134,27 @@ function renderTasks(tasks) {
     });
 }
 
+const SKIP_REASON_LABELS = {
+    max_instances: '上一轮未结束',
+    misfire: '错过触发',
+    disabled: '未启用',
+    already_run_today: '当天已运行',
+};
+
+// 执行统计：跳过（按原因）、超过间隔与排队次数，全部为 0 时不显示
+function renderTaskRunStats(stats) {
+    if (!stats) return '';
+    const parts = [];
+    const skipped = Object.entries(stats.skipped || {})
+        .filter(([, count]) => count > 0)
+        .map(([reason, count]) => `${SKIP_REASON_LABELS[reason] || reason} ${count}`);
+    if (skipped.length) parts.push(`跳过: ${skipped.join('、')}`);
+    if (stats.overruns) parts.push(`超过间隔 ${stats.overruns} 次`);
+    if (stats.queued) parts.push(`排队 ${stats.queued} 次`);
+    if (!parts.length) return '';
+    return `<span class="task-trigger task-run-stats">${escapeHtml(parts.join(' · '))}</span>`;
+}
+
 function updateTaskCount(count) {
     const badge = document.getElementById('taskCountBadge');
     if (badge) {
@@ -212,37 +242,80 @@ function getFilterLabel(filter) {
     return labels[filter] || '';
 }
 
-// 运行任务
+function getRunButton(jobId) {
+    return document.querySelector(`.run-task-btn[data-job-id="${CSS.escape(jobId)}"]`);
+}
+
+function finishTaskRun(jobId) {
+    runningTasks.delete(jobId);
+    const btn = getRunButton(jobId);
+    if (btn) {
+        btn.classList.remove('running');
+        setButtonLoading(btn, false);
+    }
+}
+
+// 运行任务：接口立即返回 run_id，之后轮询运行状态
 async function runTask(jobId) {
     if (runningTasks.has(jobId)) {
         return;
     }
 
-    const btn = document.querySelector(`.run-task-btn[data-job-id="${jobId}"]`);
+    const btn = getRunButton(jobId);
     if (!btn) return;
 
-    runningTasks.add(jobId);
+    runningTasks.set(jobId, null);
     btn.classList.add('running');
     setButtonLoading(btn, true, '运行中...');
 
     try {
-        const response = await fetch(`/api/tasks/${jobId}/run`, {
+        const response = await fetch(`/api/tasks/${encodeURIComponent(jobId)}/run`, {
             method: 'POST',
         });
         const data = await response.json();
 
-        if (data.success) {
-            showToast(`任务 ${jobId} 执行成功`, 'success');
-        } else {
-            showToast(data.message || `任务 ${jobId} 执行失败`, 'error');
+        if (!response.ok || !data.run_id) {
+            throw new Error(data.error || data.message || `任务 ${jobId} 启动失败`);
+        }
+        if (data.deduplicated) {
+            showToast(`任务 ${jobId} 已在运行中`, 'info');
         }
+        runningTasks.set(jobId, data.run_id);
+        pollTaskRun(jobId, data.run_id);
     } catch (error) {
         console.error('运行任务失败:', error);
         showToast(`运行任务失败: ${error.message}`, 'error');
-    } finally {
-        runningTasks.delete(jobId);
-        btn.classList.remove('running');
-        setButtonLoading(btn, false);
+        finishTaskRun(jobId);
+    }
+}
+
+async function pollTaskRun(jobId, runId) {
+    while (runningTasks.get(jobId) === runId) {
+        await new Promise(resolve => setTimeout(resolve, RUN_POLL_INTERVAL_MS));
+        let run;
+        try {
+            const response = await fetch(`/api/tasks/runs/${encodeURIComponent(runId)}`);
+            const data = await response.json();
+            if (!response.ok) throw new Error(data.error || '查询运行状态失败');
+            run = data.run;
+        } catch (error) {
+            console.warn('查询任务运行状态失败:', error);
+            continue;
+        }
+
+        const btn = getRunButton(jobId);
+        if (run.active) {
+            const lastLine = run.recent_logs[run.recent_logs.length - 1] || '';
+            if (btn) btn.title = lastLine;
+            continue;
+        }
+
+        if (btn) btn.removeAttribute('title');
+        const seconds = run.duration != null ? `（${run.duration.toFixed(1)} 秒）` : '';
+        const level = run.status === 'succeeded' ? 'success' : 'error';
+        showToast(`${run.message || `任务 ${jobId} ${run.status}`}${seconds}`, level);
+        finishTaskRun(jobId);
+        return;
     }
 }
 
@@ -259,8 +332,82 @@ function updateTitle(filter) {
 }
 
 // 页面初始化
+// 加载事件循环卡顿记录
+async function loadLoopStalls(triggerButton = null) {
+    const container = document.getElementById('loopStallsContainer');
+    if (!container) return;
+    if (triggerButton) setButtonLoading(triggerButton, true, '刷新中...');
+
+    try {
+        const response = await fetch('/api/diagnostics/loop-stalls', { cache: 'no-store' });
+        const data = await response.json();
+        if (!response.ok) {
+            throw new Error(data.error || '加载卡顿记录失败');
+        }
+        renderLoopStalls(container, data);
+    } catch (error) {
+        console.error('加载卡顿记录失败:', error);
+        container.innerHTML = `
+            <div class="empty-state">
+                <p>加载卡顿记录失败: ${escapeHtml(error.message)}</p>
+            </div>
+        `;
+    } finally {
+        if (triggerButton) setButtonLoading(triggerButton, false);
+    }
+}
+
+function renderLoopStalls(container, data) {
+    const stalls = data.stalls || [];
+    if (stalls.length === 0) {
+        const hint = data.enabled
+            ? `看门狗运行中（阈值 ${data.threshold_ms} ms），暂未发现卡顿`
+            : '看门狗未开启，可在「配置管理 → 应用基础配置」中开启';
+        container.innerHTML = `<div class="empty-state"><p>${escapeHtml(hint)}</p></div>`;
+        return;
+    }
+
+    const status = data.enabled ? `阈值 ${data.threshold_ms} ms` : '看门狗已关闭';
+    let html = `<div class="task-meta loop-stall-summary">
+        <span class="task-trigger">${escapeHtml(status)} · 共记录 ${data.stall_count} 次，显示最近 ${stalls.length} 次</span>
+    </div><div class="task-list">`;
+    stalls.forEach(stall => {
+        const detectedAt = new Date(stall.detected_at * 1000).toLocaleString();
+        const duration = stall.ongoing ? '卡顿中' : `${stall.duration_ms} ms`;
+        const taskLabel = stall.task
+            ? `${stall.task}${stall.coroutine ? ` (${stall.coroutine})` : ''}`
+            : '事件循环回调';
+        html += `
+            <div class="task-item loop-stall-item">
+                <div class="task-info">
+                    <div class="task-header">
+                        <span class="task-type-badge task-type-task">${escapeHtml(duration)}</span>
+                        <span class="task-title">${escapeHtml(stall.location || '未知位置')}</span>
+                    </div>
+                    <div class="task-id">${escapeHtml(taskLabel)}</div>
+                    <div class="task-meta">
+                        <span class="task-trigger">${escapeHtml(detectedAt)}</span>
+                    </div>
+                    <details class="loop-stall-details">
+                        <summary>调用栈</summary>
+                        <pre class="loop-stall-stack">${escapeHtml(stall.stack.join('\n'))}</pre>
+                    </details>
+                </div>
+            </div>
+        `;
+    });
+    html += '</div>';
+    container.innerHTML = html;
+}
+
 document.addEventListener('DOMContentLoaded', function() {
     loadTasks();
+    loadLoopStalls();
+
+    const refreshLoopStallsBtn = document.getElementById('refreshLoopStallsBtn');
+    if (refreshLoopStallsBtn) {
+        refreshLoopStallsBtn.addEventListener('click', () => loadLoopStalls(refreshLoopStallsBtn));
+    }
 
     const refreshBtn = document.getElementById('refreshBtn');
     if (refreshBtn) {